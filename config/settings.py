@@ -115,6 +115,18 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# 건강 정보, 주간 루틴 일정 캐시는 DB의 유저별 버전(UserCacheVersion)을 키에 포함하므로 프로세스 내 캐시에서도 무효화가 모든 프로세스에 반영된다.
+# Redis 등 공유 캐시 백엔드로 변경하면 캐시된 값도 프로세스 간에 공유된다.
+# 운동 정보 카탈로그 버전은 캐시가 아닌 DB(ExercisesCatalogVersion)에 저장되므로 캐시 백엔드와 관계없이 공유된다.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -193,3 +205,33 @@ SIMPLE_JWT = {
 }
 
 CORS_ALLOW_ALL_ORIGINS = True
+
+# MirroredRoutine 렌더링 결과 캐시의 최대 크기 (bytes)
+MIRRORED_ROUTINE_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# 루틴 수정 시 구독자 need_update 변경을 요청 안에서 처리할 최대 구독자 수
+# 이보다 많으면 백그라운드 작업으로 나누어 처리
+SUBSCRIBER_FAN_OUT_SYNC_THRESHOLD = 1000
+SUBSCRIBER_FAN_OUT_BATCH_SIZE = 1000
+# 실행 중인 구독자 업데이트 작업이 이 시간(초) 동안 진행되지 않았다면 중단된 것으로 보고 다시 실행
+SUBSCRIBER_FAN_OUT_STALE_AFTER = 10 * 60
+
+# True라면 백그라운드 작업을 큐에 넣지 않고 즉시 실행 (테스트용)
+BACKGROUND_TASKS_EAGER = False
+
+# 고아 MirroredRoutine 정리 작업의 배치 크기와, 요청에서 정리 작업을 예약하는 최소 간격 (초)
+ORPHANED_ROUTINE_GC_BATCH_SIZE = 500
+ORPHANED_ROUTINE_GC_INTERVAL = 60 * 60
+
+# 유저별 건강 정보 조회 결과 캐시의 유지 시간 (초)
+HEALTH_INFO_CACHE_TIMEOUT = 60 * 60 * 24
+
+# 유저별 주간 루틴 일정 캐시의 유지 시간 (초)
+WEEKLY_SCHEDULE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# 동기화 삭제 기록의 보관 기간 (일), 이보다 오래된 토큰은 전체 동기화로 처리
+SYNC_TOMBSTONE_RETENTION_DAYS = 30
+
+# 동기화 토큰의 기준 시각을 조회 시작 시각보다 앞당기는 시간 (초)
+# 조회 중에 커밋된 트랜잭션의 변경을 다음 동기화에서 놓치지 않기 위함
+SYNC_TOKEN_OVERLAP = 5
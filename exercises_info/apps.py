@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ExercisesInfoConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "exercises_info"
+
+    def ready(self):
+        import exercises_info.signals  # noqa: F401
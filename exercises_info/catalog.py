@@ -0,0 +1,126 @@
+import hashlib
+import threading
+from contextvars import ContextVar
+
+from django.db import transaction
+from django.db.models import F
+from rest_framework.renderers import JSONRenderer
+
+from exercises_info.models import ExercisesCatalogVersion
+
+# 요청 동안 읽은 카탈로그 버전 (요청 밖에서는 None이므로 매번 DB에서 읽음)
+_request_version = ContextVar("exercises_catalog_request_version", default=None)
+
+
+class CatalogSnapshot:
+    """
+    특정 버전의 운동 정보 목록을 직렬화한 결과
+
+    version: 스냅샷을 만들 때의 카탈로그 버전
+    body: JSON으로 인코딩된 응답 본문
+    etag: 본문의 SHA-256 해시로 만든 강한 ETag
+    """
+
+    def __init__(self, version, body):
+        self.version = version
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+class ExercisesCatalog:
+    """
+    직렬화된 운동 정보 목록을 버전별로 보관하는 프로세스 내 스냅샷
+
+    - 운동 정보는 관리자만 수정하고 모든 클라이언트가 읽으므로, 목록을 한 번 직렬화하여
+      JSON bytes와 ETag를 보관하고 버전이 바뀔 때만 다시 만든다.
+    - 버전은 DB의 ExercisesCatalogVersion 행이며, 관리자의 수정이 커밋된 후 bump()로 증가시킨다.
+      여러 프로세스(gunicorn worker)가 같은 행을 보므로 한 프로세스에서의 수정이
+      모든 프로세스의 스냅샷을 무효화한다.
+    - 버전은 요청마다 한 번만 읽어 요청이 끝날 때까지 재사용한다 (start_request/finish_request).
+    - 커밋 전에 버전을 올리면 다른 프로세스가 수정 전 데이터로 새 버전의 스냅샷을 만들 수 있으므로,
+      버전은 반드시 transaction.on_commit으로 올린다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self.builds = 0
+
+    def start_request(self):
+        """
+        요청이 시작될 때 호출, 요청 동안 읽은 버전을 저장할 공간을 만든다.
+        """
+        _request_version.set({})
+
+    def finish_request(self):
+        _request_version.set(None)
+
+    def get_version(self):
+        """
+        현재 카탈로그 버전을 반환하는 메서드
+
+        요청 안에서는 처음 읽은 버전을 재사용하므로, 요청마다 최대 한 번만 DB를 조회한다.
+        """
+        memo = _request_version.get()
+        if memo is not None and "version" in memo:
+            return memo["version"]
+
+        version = (
+            ExercisesCatalogVersion.objects.filter(pk=1)
+            .values_list("version", flat=True)
+            .first()
+        )
+        if version is None:
+            version = ExercisesCatalogVersion.objects.get_or_create(pk=1)[0].version
+
+        if memo is not None:
+            memo["version"] = version
+        return version
+
+    def bump(self):
+        """
+        카탈로그 버전을 1 증가시키는 메서드
+
+        동시에 여러 프로세스에서 호출되어도 증가가 누락되지 않도록 F("version") + 1로 갱신한다.
+        """
+        versions = ExercisesCatalogVersion.objects.filter(pk=1)
+        if not versions.update(version=F("version") + 1):
+            ExercisesCatalogVersion.objects.get_or_create(pk=1)
+            versions.update(version=F("version") + 1)
+
+        memo = _request_version.get()
+        if memo is not None:
+            memo.pop("version", None)
+
+    def bump_on_commit(self):
+        transaction.on_commit(self.bump)
+
+    def get_snapshot(self, render):
+        """
+        현재 버전의 스냅샷을 반환, 없거나 버전이 바뀌었다면 render()의 결과로 새로 만들어 반환
+
+        render()가 실행되는 동안 버전이 바뀌었다면 스냅샷에는 이전 버전이 기록되므로,
+        다음 요청에서 새 버전으로 다시 만들어진다.
+        """
+        version = self.get_version()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.version == version:
+                return snapshot
+
+            snapshot = CatalogSnapshot(version, JSONRenderer().render(render()))
+            self._snapshot = snapshot
+            self.builds += 1
+
+        return snapshot
+
+    def clear(self):
+        with self._lock:
+            self._snapshot = None
+
+
+exercises_catalog = ExercisesCatalog()
@@ -0,0 +1,63 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+
+from exercises_info.models import ExercisesInfo
+from exercises_info.search import ExercisesSearchIndex
+
+
+class Command(BaseCommand):
+    """
+    운동 정보 n-gram 역색인 검색과 icontains 조회의 속도를 비교하는 명령어
+
+    usage: python manage.py benchmark_exercises_search [QUERY ...] [--repeat N]
+
+    1. 현재 카탈로그로 역색인을 만들고 생성 시간을 출력
+    2. 검색어마다 역색인 검색과 title/description icontains 조회를 repeat번 실행
+    3. 검색어별 평균 시간(ms)과 결과 수를 출력
+       (icontains는 공백을 무시하지 않으므로 띄어쓰기가 다른 검색어는 결과 수가 다를 수 있음)
+    """
+
+    help = "운동 정보 n-gram 역색인 검색과 icontains 조회의 속도를 비교합니다."
+
+    default_queries = ["스쿼트", "프레스", "벤치", "덤벨 컬", "런지"]
+
+    def add_arguments(self, parser):
+        parser.add_argument("queries", nargs="*", help="비교할 검색어")
+        parser.add_argument(
+            "--repeat", type=int, default=100, help="검색어마다 반복할 횟수"
+        )
+
+    def handle(self, *args, **options):
+        repeat = options["repeat"]
+        if repeat <= 0:
+            raise CommandError("--repeat must be a positive integer")
+
+        index = ExercisesSearchIndex()
+        started = time.perf_counter()
+        index.refresh()
+        self.stdout.write(
+            f"Built index of {len(index)} exercises in "
+            f"{(time.perf_counter() - started) * 1000:.2f}ms"
+        )
+
+        for query in options["queries"] or self.default_queries:
+            started = time.perf_counter()
+            for _ in range(repeat):
+                ranked = index.search(query, k=len(index))
+            index_ms = (time.perf_counter() - started) * 1000 / repeat
+
+            started = time.perf_counter()
+            for _ in range(repeat):
+                matched = list(
+                    ExercisesInfo.objects.filter(
+                        Q(title__icontains=query) | Q(description__icontains=query)
+                    ).values_list("id", flat=True)
+                )
+            icontains_ms = (time.perf_counter() - started) * 1000 / repeat
+
+            self.stdout.write(
+                f"{query}: index {index_ms:.3f}ms ({len(ranked)} results), "
+                f"icontains {icontains_ms:.3f}ms ({len(matched)} results)"
+            )
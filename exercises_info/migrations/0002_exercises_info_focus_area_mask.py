@@ -0,0 +1,42 @@
+# Generated by Django 5.0.4 on 2026-10-18 05:48
+
+from django.db import migrations, models
+
+from utils.enums import FocusAreaEnum
+
+
+def fill_focus_area_mask(apps, schema_editor):
+    """
+    기존 운동 정보의 focus_areas로 focus_area_mask를 계산한다.
+    """
+    ExercisesInfo = apps.get_model("exercises_info", "ExercisesInfo")
+
+    masks = {}
+    for exercise_id, focus_area in ExercisesInfo.objects.values_list(
+        "id", "focus_areas__focus_area"
+    ):
+        masks.setdefault(exercise_id, 0)
+        try:
+            masks[exercise_id] |= FocusAreaEnum(focus_area).bit
+        except ValueError:
+            pass
+
+    for exercise_id, mask in masks.items():
+        if mask:
+            ExercisesInfo.objects.filter(id=exercise_id).update(focus_area_mask=mask)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exercises_info", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exercisesinfo",
+            name="focus_area_mask",
+            field=models.PositiveSmallIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(fill_focus_area_mask, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.0.4 on 2026-10-18 06:33
+
+from django.db import migrations, models
+
+
+def create_catalog_version(apps, schema_editor):
+    """
+    카탈로그 버전 행(pk=1)을 만든다.
+    """
+    ExercisesCatalogVersion = apps.get_model(
+        "exercises_info", "ExercisesCatalogVersion"
+    )
+    ExercisesCatalogVersion.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exercises_info", "0002_exercises_info_focus_area_mask"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExercisesCatalogVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("version", models.PositiveBigIntegerField(default=1)),
+            ],
+        ),
+        migrations.RunPython(create_catalog_version, migrations.RunPython.noop),
+    ]
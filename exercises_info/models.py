@@ -1,6 +1,9 @@
+from collections import defaultdict
+
 from django.db import models
 
 from account.models import CustomUser as User
+from utils.enums import FocusAreaEnum
 
 
 class FocusArea(models.Model):
@@ -21,6 +24,41 @@ class ExercisesAttribute(models.Model):
         return f"NeedSet: {self.need_set}\nNeedRep: {self.need_rep}\nNeedWeight: {self.need_weight}\nNeedDuration: {self.need_duration}\nNeedSpeed: {self.need_speed}"
 
 
+class ExercisesInfoQuerySet(models.QuerySet):
+    def refresh_focus_area_mask(self):
+        """
+        쿼리셋의 운동 정보마다 focus_areas로부터 focus_area_mask를 다시 계산하여 저장
+
+        운동 부위 조회 한 번과, 서로 다른 마스크 값마다 update 한 번(최대 128번)으로 처리한다.
+        """
+        masks = {}
+        for exercise_id, focus_area in self.values_list(
+            "id", "focus_areas__focus_area"
+        ):
+            masks.setdefault(exercise_id, 0)
+            try:
+                masks[exercise_id] |= FocusAreaEnum(focus_area).bit
+            except ValueError:
+                pass
+
+        exercise_ids_by_mask = defaultdict(list)
+        for exercise_id, mask in masks.items():
+            exercise_ids_by_mask[mask].append(exercise_id)
+
+        for mask, exercise_ids in exercise_ids_by_mask.items():
+            self.model.objects.filter(id__in=exercise_ids).update(focus_area_mask=mask)
+
+    def filter_focus_areas(self, mask, match="any"):
+        """
+        운동 부위 마스크로 필터링 (any: 하나라도 포함, all: 모두 포함)
+
+        비트 연산 대신 일치하는 마스크 값의 IN 조건을 사용하여 focus_area_mask 인덱스를 사용한다.
+        """
+        return self.filter(
+            focus_area_mask__in=FocusAreaEnum.matching_masks(mask, match)
+        )
+
+
 class ExercisesInfo(models.Model):
     author = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="exercises_info"
@@ -41,9 +79,30 @@ class ExercisesInfo(models.Model):
         related_name="exercises_info",
     )
 
+    # focus_areas를 FocusAreaEnum 순서의 비트로 표현한 값 (M2M JOIN 없이 부위로 필터링하기 위함)
+    # focus_areas가 변경되면 signal로 다시 계산된다.
+    focus_area_mask = models.PositiveSmallIntegerField(default=0, db_index=True)
+
+    objects = ExercisesInfoQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.title}"
 
     def delete(self, *args, **kwargs):
         self.exercises_attribute.delete()
         super().delete(*args, **kwargs)
+
+
+class ExercisesCatalogVersion(models.Model):
+    """
+    운동 정보 카탈로그의 버전을 저장하는 단일 행(pk=1) 테이블
+
+    모든 프로세스(gunicorn worker)가 같은 DB 행을 읽으므로, 한 프로세스에서의 수정이
+    모든 프로세스의 카탈로그 스냅샷과 검색 인덱스를 무효화한다.
+    버전은 exercises_info.catalog.ExercisesCatalog.bump()에서 F("version") + 1로만 증가시킨다.
+    """
+
+    version = models.PositiveBigIntegerField(default=1)
+
+    def __str__(self):
+        return f"{self.version}"
@@ -0,0 +1,356 @@
+import bisect
+import heapq
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+
+from exercises_info.catalog import exercises_catalog
+from exercises_info.models import ExercisesInfo
+
+# 공백과 문장 부호는 검색에 사용하지 않음 ("백 스쿼트"와 "백스쿼트"를 같게 취급)
+separator_pattern = re.compile(r"[\W_]+")
+
+# 완성형 한글 음절의 초성, 중성, 종성 (호환용 자모, 겹모음, 겹받침은 키보드 입력 순서대로 분해)
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏ ㅐ ㅑ ㅒ ㅓ ㅔ ㅕ ㅖ ㅗ ㅗㅏ ㅗㅐ ㅗㅣ ㅛ ㅜ ㅜㅓ ㅜㅔ ㅜㅣ ㅠ ㅡ ㅡㅣ ㅣ".split()
+JONGSUNG = [""] + (
+    "ㄱ ㄲ ㄱㅅ ㄴ ㄴㅈ ㄴㅎ ㄷ ㄹ ㄹㄱ ㄹㅁ ㄹㅂ ㄹㅅ ㄹㅌ ㄹㅍ ㄹㅎ ㅁ ㅂ ㅂㅅ ㅅ ㅆ ㅇ ㅈ ㅊ ㅋ ㅌ ㅍ ㅎ"
+).split()
+# 키보드로 한 번에 입력하는 겹모음, 겹받침 호환용 자모를 분해
+COMPOUND_JAMO = dict(
+    zip(
+        "ㅘㅙㅚㅝㅞㅟㅢㄳㄵㄶㄺㄻㄼㄽㄾㄿㅀㅄ",
+        "ㅗㅏ ㅗㅐ ㅗㅣ ㅜㅓ ㅜㅔ ㅜㅣ ㅡㅣ ㄱㅅ ㄴㅈ ㄴㅎ ㄹㄱ ㄹㅁ ㄹㅂ ㄹㅅ ㄹㅌ ㄹㅍ ㄹㅎ ㅂㅅ".split(),
+    )
+)
+
+
+def normalize_text(text):
+    """
+    문자열을 NFKC 정규화, 소문자 변환 후 공백과 문장 부호를 제거하여 반환하는 함수
+
+    NFKC 정규화로 전각 문자와 조합형 한글 자모가 완성형으로 통일된다.
+    """
+    return separator_pattern.sub("", unicodedata.normalize("NFKC", text or "").lower())
+
+
+def split_typed_words(text):
+    """
+    입력 중인 문자열을 NFC 정규화, 소문자 변환 후 단어 리스트로 분리하는 함수
+
+    NFKC는 호환용 자모("ㅅㅋ")를 첫가끝 자모로 바꾸므로, 호환용 자모를 제외한 글자에만 적용한다.
+    """
+    text = "".join(
+        char if "\u3131" <= char <= "\u318e" else unicodedata.normalize("NFKC", char)
+        for char in unicodedata.normalize("NFC", text or "")
+    )
+    return [word for word in separator_pattern.split(text.lower()) if word]
+
+
+def decompose_jamo(text):
+    """
+    한글 음절을 키보드 입력 순서의 자모로 분해한 문자열을 반환하는 함수 (한글이 아닌 글자는 그대로)
+
+    예: "스쿼트" -> "ㅅㅡㅋㅜㅓㅌㅡ"
+    입력 중인 "슼", "스ㅋ"도 "ㅅㅡㅋ"이 되므로 자모 단위 접두사로 비교할 수 있다.
+    """
+    jamo = []
+    for char in text:
+        code = ord(char) - HANGUL_BASE
+        if 0 <= code <= HANGUL_LAST - HANGUL_BASE:
+            jamo.append(CHOSUNG[code // 588])
+            jamo.append(JUNGSUNG[code % 588 // 28])
+            jamo.append(JONGSUNG[code % 28])
+        else:
+            jamo.append(COMPOUND_JAMO.get(char, char))
+    return "".join(jamo)
+
+
+def extract_chosung(text):
+    """
+    한글 음절을 초성으로 바꾼 문자열을 반환하는 함수 (한글이 아닌 글자는 그대로)
+
+    예: "스쿼트" -> "ㅅㅋㅌ"
+    """
+    return "".join(
+        (
+            CHOSUNG[(ord(char) - HANGUL_BASE) // 588]
+            if HANGUL_BASE <= ord(char) <= HANGUL_LAST
+            else char
+        )
+        for char in text
+    )
+
+
+def is_chosung_query(text):
+    return all(char in CHOSUNG for char in text)
+
+
+def make_grams(text, sizes=(1, 2, 3)):
+    """
+    정규화된 문자열의 글자 n-gram 집합을 반환하는 함수
+    """
+    return {text[i : i + size] for size in sizes for i in range(len(text) - size + 1)}
+
+
+def make_query_grams(query):
+    """
+    정규화된 검색어를 후보 문서에 모두 포함되어야 하는 n-gram 리스트로 반환하는 함수
+
+    세 글자 이상이면 trigram, 두 글자면 bigram, 한 글자면 unigram을 사용한다.
+    """
+    size = min(len(query), 3)
+    return list({query[i : i + size] for i in range(len(query) - size + 1)})
+
+
+class CatalogIndex:
+    """
+    운동 정보 카탈로그로 만드는 프로세스 내 인덱스의 기반 클래스
+
+    - 운동 정보는 관리자만 수정하므로 카탈로그 버전(exercises_catalog)마다 인덱스를 한 번 만든다.
+      관리자의 수정이 커밋되면 카탈로그 버전이 올라가며, 다음 조회에서 refresh()가 새 인덱스를 만든다.
+    - 하위 클래스는 fields의 값 목록으로 build()를 구현하고, 인덱스를 self._data 튜플 하나로 교체한다.
+      따라서 다른 스레드의 조회는 잠금 없이 이전 또는 새 인덱스 중 하나를 온전히 본다.
+      (self._data의 첫 번째 값은 운동 id 리스트)
+    """
+
+    fields = ["id", "title"]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self.builds = 0
+        self.reset()
+
+    def __len__(self):
+        return len(self._data[0])
+
+    def reset(self):
+        raise NotImplementedError
+
+    def build(self, rows):
+        raise NotImplementedError
+
+    def refresh(self):
+        """
+        카탈로그 버전이 바뀌었다면 DB에서 운동 정보를 다시 읽어 인덱스를 만드는 메서드
+        """
+        version = exercises_catalog.get_version()
+        if self._version == version:
+            return
+
+        with self._lock:
+            if self._version == version:
+                return
+
+            self.build(ExercisesInfo.objects.values_list(*self.fields))
+            self.builds += 1
+            self._version = version
+
+    def clear(self):
+        with self._lock:
+            self.reset()
+            self._version = None
+
+
+class ExercisesSearchIndex(CatalogIndex):
+    """
+    운동 정보의 제목, 설명에 대한 글자 n-gram(1~3글자) 역색인
+
+    - 한국어 운동 이름은 "바벨 백 스쿼트"처럼 단어가 붙거나 떨어져 쓰이므로,
+      공백을 제거한 문자열의 n-gram으로 부분 문자열을 찾는다.
+    - 제목과 설명의 posting(n-gram을 포함하는 문서 번호 집합)을 따로 두고,
+      검색어의 n-gram posting을 작은 것부터 교집합하여 후보를 구한 뒤
+      후보 문자열에 검색어가 실제로 포함되는지 확인한다. (trigram이 모두 있어도 부분 문자열이 아닐 수 있음)
+    - 순위 점수: 제목에 포함 2점, 제목이 검색어로 시작하면 1점 추가, 설명에 포함 1점
+      점수가 같다면 제목이 짧은 운동, id가 작은 운동 순으로 정렬한다.
+      문서 번호를 이 순서대로 매기므로, 설명에만 포함하는 운동(1점)은 앞에서부터 k개만 확인한다.
+    - 카탈로그 버전마다 인덱스를 한 번 만들며(CatalogIndex), 검색은 DB를 조회하지 않고 메모리에서만 수행된다.
+    """
+
+    fields = ["id", "title", "description"]
+    title_score = 2
+    title_prefix_score = 1
+    description_score = 1
+
+    def reset(self):
+        self._data = ([], [], [], {}, {})
+
+    def build(self, rows):
+        """
+        (id, 제목, 설명) 목록으로 역색인을 만드는 메서드
+
+        문서 번호는 정규화한 제목의 길이, id 순으로 매긴다.
+        """
+        documents = sorted(
+            (
+                (normalize_text(title), exercise_id, normalize_text(description))
+                for exercise_id, title, description in rows
+            ),
+            key=lambda document: (len(document[0]), document[1]),
+        )
+
+        title_postings = defaultdict(set)
+        description_postings = defaultdict(set)
+        for doc, (title, _, description) in enumerate(documents):
+            for gram in make_grams(title):
+                title_postings[gram].add(doc)
+            for gram in make_grams(description):
+                description_postings[gram].add(doc)
+
+        self._data = (
+            [exercise_id for _, exercise_id, _ in documents],
+            [title for title, _, _ in documents],
+            [description for _, _, description in documents],
+            {gram: frozenset(docs) for gram, docs in title_postings.items()},
+            {gram: frozenset(docs) for gram, docs in description_postings.items()},
+        )
+
+    def search(self, query, k=20):
+        """
+        검색어를 제목, 설명에 포함하는 운동 k개를 (운동 id, 점수) 리스트로 반환하는 메서드
+
+        1. 검색어를 정규화하여 n-gram으로 분해
+        2. 제목 후보 중 검색어를 포함하는 운동의 점수를 계산하여 정렬
+        3. k개가 되지 않았다면, 설명 후보 중 제목에 포함하지 않는 운동을 문서 번호 순으로 k개까지 추가
+        """
+        query = normalize_text(query)
+        if not query or k <= 0:
+            return []
+
+        ids, titles, descriptions, title_postings, description_postings = self._data
+        grams = make_query_grams(query)
+
+        ranked = []
+        title_matches = set()
+        for doc in self.candidates(title_postings, grams):
+            title = titles[doc]
+            if query not in title:
+                continue
+
+            title_matches.add(doc)
+            score = self.title_score
+            if title.startswith(query):
+                score += self.title_prefix_score
+            if query in descriptions[doc]:
+                score += self.description_score
+            ranked.append((-score, doc))
+
+        ranked.sort()
+        results = [(ids[doc], -score) for score, doc in ranked[:k]]
+
+        if len(results) < k:
+            for doc in sorted(
+                self.candidates(description_postings, grams) - title_matches
+            ):
+                if query in descriptions[doc]:
+                    results.append((ids[doc], self.description_score))
+                    if len(results) == k:
+                        break
+
+        return results
+
+    def candidates(self, postings, grams):
+        """
+        n-gram을 모두 포함하는 문서 번호 집합을 반환하는 메서드
+        """
+        gram_postings = sorted(
+            (postings.get(gram, frozenset()) for gram in grams), key=len
+        )
+        candidates = set(gram_postings[0])
+        for docs in gram_postings[1:]:
+            if not candidates:
+                break
+            candidates &= docs
+        return candidates
+
+
+class ExercisesAutocomplete(CatalogIndex):
+    """
+    운동 정보 제목의 접두사 자동 완성 인덱스
+
+    - 제목의 각 단어부터 끝까지의 문자열(공백 제거)을 키로 사용한다.
+      따라서 "바벨 백 스쿼트"는 "바벨백스쿼트", "백스쿼트", "스쿼트" 세 키로 찾을 수 있다.
+    - 키는 자모 분해 문자열과 초성 문자열 두 가지이며, 각각 정렬된 배열에 저장하여
+      bisect로 접두사가 같은 구간만 조회한다.
+      - 자모: 입력 중인 "슼", "스ㅋ"이 "스쿼트"와 자모 단위로 접두사가 같으므로 일치한다.
+      - 초성: 검색어가 자음으로만 이루어졌다면 초성 키도 조회하여 "ㅅㅋ"가 "스쿼트"와 일치한다.
+    - 순위: 제목의 첫 단어부터 일치하는 운동, 제목이 짧은 운동, id가 작은 운동 순
+    """
+
+    def reset(self):
+        self._data = ([], [], [], [], [], [])
+
+    def build(self, rows):
+        """
+        (id, 제목) 목록으로 정렬된 자모, 초성 키 배열을 만드는 메서드
+
+        문서 번호는 공백을 제거한 제목의 길이, id 순으로 매긴다.
+        """
+        documents = sorted(
+            (
+                (split_typed_words(title), exercise_id, title)
+                for exercise_id, title in rows
+            ),
+            key=lambda document: (len("".join(document[0])), document[1]),
+        )
+
+        jamo_entries = []
+        chosung_entries = []
+        for doc, (words, _, _) in enumerate(documents):
+            for position in range(len(words)):
+                key = "".join(words[position:])
+                rank = (position > 0, doc)
+                jamo_entries.append((decompose_jamo(key), rank))
+                chosung_entries.append((extract_chosung(key), rank))
+
+        jamo_entries.sort()
+        chosung_entries.sort()
+        self._data = (
+            [exercise_id for _, exercise_id, _ in documents],
+            [title for _, _, title in documents],
+            [key for key, _ in jamo_entries],
+            [rank for _, rank in jamo_entries],
+            [key for key, _ in chosung_entries],
+            [rank for _, rank in chosung_entries],
+        )
+
+    def complete(self, query, k=10):
+        """
+        제목이 검색어로 시작하는 운동 k개를 (운동 id, 제목) 리스트로 반환하는 메서드
+
+        1. 검색어를 정규화하여 자모로 분해하고, 자모 키 배열에서 접두사가 같은 구간을 조회
+        2. 검색어가 자음으로만 이루어졌다면 초성 키 배열에서도 조회
+        3. 운동마다 가장 좋은 순위만 남기고, 순위가 높은 k개를 반환
+        """
+        query = "".join(split_typed_words(query))
+        if not query or k <= 0:
+            return []
+
+        ids, titles, jamo_keys, jamo_ranks, chosung_keys, chosung_ranks = self._data
+
+        ranks = {}
+        lookups = [(jamo_keys, jamo_ranks, decompose_jamo(query))]
+        if is_chosung_query(query):
+            lookups.append((chosung_keys, chosung_ranks, query))
+
+        for keys, key_ranks, prefix in lookups:
+            i = bisect.bisect_left(keys, prefix)
+            while i < len(keys) and keys[i].startswith(prefix):
+                rank = key_ranks[i]
+                doc = rank[1]
+                if doc not in ranks or rank < ranks[doc]:
+                    ranks[doc] = rank
+                i += 1
+
+        return [
+            (ids[rank[1]], titles[rank[1]])
+            for rank in heapq.nsmallest(k, ranks.values())
+        ]
+
+
+exercises_search_index = ExercisesSearchIndex()
+exercises_autocomplete = ExercisesAutocomplete()
@@ -49,3 +49,66 @@ class ExercisesInfoSerializer(WritableNestedModelSerializer):
             "exercises_attribute",
         ]
         read_only_fields = ["id", "author", "username"]
+
+    @staticmethod
+    def setup_eager_loading(queryset, prefix=""):
+        """
+        ExercisesInfoSerializer가 사용하는 모든 관계를 미리 불러오는 메서드
+
+        author, exercises_attribute는 JOIN으로, focus_areas(M2M)는 별도의 쿼리 하나로 불러와
+        운동 개수와 관계없이 쿼리 수가 일정하게 유지된다.
+        다른 모델의 쿼리셋에서 운동 정보를 중첩하여 직렬화한다면 prefix(예: "exercise__")를 지정한다.
+        """
+        return queryset.select_related(
+            f"{prefix}author", f"{prefix}exercises_attribute"
+        ).prefetch_related(f"{prefix}focus_areas")
+
+
+class FocusAreaFilterSerializer(serializers.Serializer):
+    """
+    운동 부위 필터의 query parameter를 다루는 Serializer
+
+    필드:
+    - focus_area: 쉼표로 구분된 운동 부위 이름 (예: 가슴,등), 검증 후 비트 마스크로 변환
+    - focus_area_match: any(하나라도 포함, 기본값) 또는 all(모두 포함)
+    """
+
+    focus_area = serializers.CharField()
+    focus_area_match = serializers.ChoiceField(choices=["any", "all"], default="any")
+
+    def validate_focus_area(self, value):
+        names = [name.strip() for name in value.split(",") if name.strip()]
+        if not names:
+            raise ValidationError("focus_area is required.")
+
+        for name in names:
+            if name not in [enum.value for enum in FocusAreaEnum]:
+                raise ValidationError(f"{name} is not a valid focus area.")
+
+        return FocusAreaEnum.to_mask(names)
+
+
+class ExercisesSearchQuerySerializer(serializers.Serializer):
+    """
+    운동 정보 검색의 query parameter를 다루는 Serializer
+
+    필드:
+    - q: 검색어 (제목, 설명의 부분 문자열, 공백 무시)
+    - limit: 반환할 운동 수 (1 ~ 50, 기본값 20)
+    """
+
+    q = serializers.CharField(max_length=100)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=20)
+
+
+class ExercisesAutocompleteQuerySerializer(serializers.Serializer):
+    """
+    운동 정보 제목 자동 완성의 query parameter를 다루는 Serializer
+
+    필드:
+    - q: 입력 중인 제목의 앞부분 (초성, 입력 중인 자모 포함, 예: ㅅㅋ, 스ㅋ)
+    - limit: 반환할 운동 수 (1 ~ 50, 기본값 10)
+    """
+
+    q = serializers.CharField(max_length=100)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=10)
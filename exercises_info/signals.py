@@ -0,0 +1,99 @@
+from django.core.signals import request_finished, request_started
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from account.models import CustomUser as User
+from exercises_info.catalog import exercises_catalog
+from exercises_info.models import ExercisesAttribute, ExercisesInfo, FocusArea
+
+
+@receiver(post_save, sender=ExercisesInfo)
+@receiver(post_delete, sender=ExercisesInfo)
+@receiver(post_save, sender=ExercisesAttribute)
+@receiver(post_save, sender=FocusArea)
+@receiver(m2m_changed, sender=ExercisesInfo.focus_areas.through)
+def bump_exercises_catalog_version(sender, **kwargs):
+    """
+    운동 정보가 생성, 수정, 삭제되면 트랜잭션 커밋 후 카탈로그 버전을 올림
+    """
+    exercises_catalog.bump_on_commit()
+
+
+@receiver(post_save, sender=User)
+def bump_exercises_catalog_version_of_author(
+    sender, instance, created, update_fields=None, **kwargs
+):
+    """
+    운동 정보 작성자의 username이 변경될 수 있는 저장이라면 카탈로그 버전을 올림
+
+    카탈로그에는 작성자의 username이 포함되기 때문이며, username이 포함되지 않은 부분 저장은 생략한다.
+    """
+    if created or (update_fields is not None and "username" not in update_fields):
+        return
+
+    if ExercisesInfo.objects.filter(author=instance).exists():
+        exercises_catalog.bump_on_commit()
+
+
+@receiver(m2m_changed, sender=ExercisesInfo.focus_areas.through)
+def refresh_focus_area_mask(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    운동 정보의 focus_areas가 변경되면 해당 운동 정보의 focus_area_mask를 다시 계산
+
+    FocusArea 쪽에서 변경했다면(reverse) pk_set이 운동 정보 id 목록이며,
+    clear는 pk_set이 없으므로 pre_clear에서 대상 운동 정보 id를 기록해 둔다.
+    """
+    if not reverse:
+        if action in ["post_add", "post_remove", "post_clear"]:
+            ExercisesInfo.objects.filter(id=instance.id).refresh_focus_area_mask()
+        return
+
+    if action == "pre_clear":
+        instance._cleared_exercise_ids = list(
+            instance.exercises_info.values_list("id", flat=True)
+        )
+    elif action in ["post_add", "post_remove"]:
+        ExercisesInfo.objects.filter(id__in=pk_set).refresh_focus_area_mask()
+    elif action == "post_clear":
+        ExercisesInfo.objects.filter(
+            id__in=getattr(instance, "_cleared_exercise_ids", [])
+        ).refresh_focus_area_mask()
+
+
+@receiver(post_save, sender=FocusArea)
+def refresh_focus_area_mask_of_renamed_focus_area(sender, instance, created, **kwargs):
+    """
+    FocusArea의 이름이 변경되면 연결된 운동 정보의 focus_area_mask를 다시 계산
+    """
+    if not created:
+        ExercisesInfo.objects.filter(focus_areas=instance).refresh_focus_area_mask()
+
+
+@receiver(pre_delete, sender=FocusArea)
+def remember_exercises_of_deleted_focus_area(sender, instance, **kwargs):
+    instance._deleted_exercise_ids = list(
+        instance.exercises_info.values_list("id", flat=True)
+    )
+
+
+@receiver(post_delete, sender=FocusArea)
+def refresh_focus_area_mask_of_deleted_focus_area(sender, instance, **kwargs):
+    """
+    FocusArea가 삭제되면 연결되어 있던 운동 정보의 focus_area_mask를 다시 계산
+    """
+    ExercisesInfo.objects.filter(
+        id__in=getattr(instance, "_deleted_exercise_ids", [])
+    ).refresh_focus_area_mask()
+
+
+@receiver(request_started)
+def start_exercises_catalog_request(sender, **kwargs):
+    """
+    요청마다 카탈로그 버전을 한 번만 DB에서 읽도록 요청 범위의 버전 저장 공간을 만듦
+    """
+    exercises_catalog.start_request()
+
+
+@receiver(request_finished)
+def finish_exercises_catalog_request(sender, **kwargs):
+    exercises_catalog.finish_request()
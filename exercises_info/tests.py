@@ -1,9 +1,27 @@
-from django.test import Client
+import threading
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, TransactionTestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
 from account.models import CustomUser as User
-from exercises_info.models import ExercisesAttribute, ExercisesInfo
+from exercises_info.catalog import ExercisesCatalog, exercises_catalog
+from exercises_info.models import (
+    ExercisesAttribute,
+    ExercisesCatalogVersion,
+    ExercisesInfo,
+    FocusArea,
+)
+from exercises_info.search import (
+    exercises_autocomplete,
+    exercises_search_index,
+    normalize_text,
+)
+from utils.enums import FocusAreaEnum
 from utils.fake_data import FakeExercisesInfo, FakeUser
 import json
 
@@ -639,3 +657,856 @@ class ExercisesAttributeTestCase(APITestCase):
         self.assertFalse(
             ExercisesAttribute.objects.filter(id=exercise_attribute_id).exists()
         )
+
+
+class ExercisesCatalogTestCase(APITestCase):
+    """
+    목적: 운동 정보 목록의 카탈로그 스냅샷과 ETag 테스트
+
+    Test cases:
+    1. 운동 정보 목록에 ETag가 포함되고, 같은 ETag로 요청하면 버전 조회 외의 쿼리 없이 304를 리턴하는지 확인
+    2. 운동 정보가 변경되지 않았다면 스냅샷을 다시 만들지 않는지 확인
+    3. 관리자가 운동 정보를 수정하면 새 ETag와 수정된 목록을 리턴하는지 확인
+    4. 다른 프로세스의 스냅샷도 공유 버전 카운터로 무효화되는지 확인
+    5. 한 카탈로그에서 올린 버전을 새로 만든 카탈로그에서 읽을 수 있는지 확인
+    """
+
+    def setUp(self):
+        """
+        사전 설정
+
+        1. 카탈로그 스냅샷 초기화
+        2. 관리자 계정 생성
+        3. 관리자 계정으로 운동 정보 2개 생성
+        """
+        exercises_catalog.clear()
+
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.exercise1 = FakeExercisesInfo()
+        self.exercise1.create_instance(user_instance=self.admin.instance)
+
+        self.exercise2 = FakeExercisesInfo()
+        self.exercise2.create_instance(user_instance=self.admin.instance)
+
+    def update_exercise_title(self, title):
+        """관리자 계정으로 첫 번째 운동 정보의 제목을 수정하고 커밋 후 콜백을 실행"""
+        self.admin.login(self.client)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                reverse(
+                    "exercises-info-detail",
+                    kwargs={"pk": self.exercise1.instance.id},
+                ),
+                data=json.dumps({"title": title}),
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_not_modified_with_same_etag(self):
+        """
+        운동 정보 목록에 ETag가 포함되고, 같은 ETag로 요청하면 버전 조회 외의 쿼리 없이 304를 리턴하는지 확인
+
+        reverse_url : exercises-info-list
+        HTTP method : GET
+
+        테스트 시나리오:
+        1. 서버에 GET 요청을 보내고 응답의 ETag를 저장
+        2. If-None-Match에 ETag를 넣어 다시 GET 요청을 보냄
+        3. 카탈로그 버전 조회 쿼리만 실행되고 응답 코드가 304이며 본문이 없는지 확인
+        """
+        response = self.client.get(reverse("exercises-info-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), 2)
+        etag = response.headers["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("exercises-info-list"), HTTP_IF_NONE_MATCH=etag
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.headers["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_snapshot_is_reused_until_changed(self):
+        """
+        운동 정보가 변경되지 않았다면 스냅샷을 다시 만들지 않는지 확인
+
+        reverse_url : exercises-info-list
+        HTTP method : GET
+
+        테스트 시나리오:
+        1. 서버에 GET 요청을 두 번 보냄
+        2. 두 번째 요청에서 카탈로그 버전 조회 쿼리만 실행되고 같은 본문과 ETag를 리턴하는지 확인
+        3. 스냅샷이 한 번만 만들어졌는지 확인
+        """
+        builds = exercises_catalog.builds
+
+        first_response = self.client.get(reverse("exercises-info-list"))
+
+        with self.assertNumQueries(1):
+            second_response = self.client.get(reverse("exercises-info-list"))
+
+        self.assertEqual(second_response.content, first_response.content)
+        self.assertEqual(
+            second_response.headers["ETag"], first_response.headers["ETag"]
+        )
+        self.assertEqual(exercises_catalog.builds, builds + 1)
+
+    def test_new_etag_after_admin_update(self):
+        """
+        관리자가 운동 정보를 수정하면 새 ETag와 수정된 목록을 리턴하는지 확인
+
+        reverse_url : exercises-info-list, exercises-info-detail
+        HTTP method : GET, PATCH
+
+        테스트 시나리오:
+        1. 서버에 GET 요청을 보내고 응답의 ETag를 저장
+        2. 관리자 계정으로 첫 번째 운동 정보의 제목을 수정
+        3. 이전 ETag로 GET 요청을 보내면 응답 코드가 200인지 확인
+        4. ETag가 바뀌었고 수정된 제목이 목록에 포함되어 있는지 확인
+        """
+        etag = self.client.get(reverse("exercises-info-list")).headers["ETag"]
+
+        self.update_exercise_title("수정된 운동")
+
+        response = self.client.get(
+            reverse("exercises-info-list"), HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertIn(
+            "수정된 운동", [exercise["title"] for exercise in response.json()]
+        )
+
+    def test_other_process_snapshot_is_invalidated(self):
+        """
+        다른 프로세스의 스냅샷도 공유 버전 카운터로 무효화되는지 확인
+
+        테스트 시나리오:
+        1. 다른 프로세스의 카탈로그를 대신하는 ExercisesCatalog를 만들어 스냅샷 생성
+        2. 관리자 계정으로 첫 번째 운동 정보의 제목을 수정
+        3. 다른 카탈로그의 스냅샷 버전이 바뀌고 수정된 제목이 포함되는지 확인
+        """
+        other_catalog = ExercisesCatalog()
+
+        def render():
+            return list(ExercisesInfo.objects.values("id", "title"))
+
+        snapshot = other_catalog.get_snapshot(render)
+
+        self.update_exercise_title("다른 프로세스")
+
+        new_snapshot = other_catalog.get_snapshot(render)
+
+        self.assertNotEqual(new_snapshot.version, snapshot.version)
+        self.assertNotEqual(new_snapshot.etag, snapshot.etag)
+        self.assertIn("다른 프로세스".encode(), new_snapshot.body)
+
+    def test_version_is_shared_with_fresh_catalog(self):
+        """
+        한 카탈로그에서 올린 버전을 새로 만든 카탈로그에서 읽을 수 있는지 확인
+
+        테스트 시나리오:
+        1. 카탈로그 A에서 버전을 읽은 뒤 버전을 올림
+        2. 새로 만든 카탈로그 B가 올라간 버전을 읽는지 확인
+        3. 버전이 DB의 ExercisesCatalogVersion 행에 저장되어 있는지 확인
+        """
+        catalog = ExercisesCatalog()
+        version = catalog.get_version()
+
+        catalog.bump()
+
+        self.assertEqual(ExercisesCatalog().get_version(), version + 1)
+        self.assertEqual(ExercisesCatalogVersion.objects.get(pk=1).version, version + 1)
+
+
+class ExercisesCatalogConcurrencyTestCase(TransactionTestCase):
+    """
+    목적: 다른 DB 연결(다른 프로세스)에서 올린 카탈로그 버전이 공유되는지 테스트
+
+    Test cases:
+    1. 다른 연결에서 버전을 올리면 새 카탈로그와 기존 스냅샷 모두 새 버전을 보는지 확인
+    """
+
+    def setUp(self):
+        """
+        사전 설정
+
+        1. 카탈로그 스냅샷 초기화
+        2. 관리자 계정으로 운동 정보 1개 생성
+        """
+        exercises_catalog.clear()
+
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.exercise1 = FakeExercisesInfo()
+        self.exercise1.create_instance(user_instance=self.admin.instance)
+
+    @skipUnlessDBFeature("test_db_allows_multiple_connections")
+    def test_bump_from_other_connection(self):
+        """
+        다른 연결에서 버전을 올리면 새 카탈로그와 기존 스냅샷 모두 새 버전을 보는지 확인
+
+        테스트 시나리오:
+        1. 카탈로그로 스냅샷을 만듦
+        2. 다른 스레드(다른 DB 연결)에서 다른 프로세스의 카탈로그를 대신하는 ExercisesCatalog로
+           운동 정보의 제목을 수정하고 버전을 올림
+        3. 새로 만든 카탈로그가 올라간 버전을 읽는지 확인
+        4. 기존 카탈로그의 스냅샷이 수정된 제목으로 다시 만들어지는지 확인
+        """
+
+        def render():
+            return list(ExercisesInfo.objects.values("id", "title"))
+
+        snapshot = exercises_catalog.get_snapshot(render)
+
+        def update_in_other_process():
+            try:
+                ExercisesInfo.objects.filter(id=self.exercise1.instance.id).update(
+                    title="다른 연결"
+                )
+                ExercisesCatalog().bump()
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=update_in_other_process)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(ExercisesCatalog().get_version(), snapshot.version + 1)
+
+        new_snapshot = exercises_catalog.get_snapshot(render)
+
+        self.assertEqual(new_snapshot.version, snapshot.version + 1)
+        self.assertIn("다른 연결".encode(), new_snapshot.body)
+
+
+class ExercisesInfoQueryCountTestCase(APITestCase):
+    """
+    목적: 운동 정보 직렬화의 쿼리 수가 운동 개수와 관계없이 일정한지 테스트
+
+    Test cases:
+    1. 운동 정보 목록 조회 시 운동 10개와 1000개의 쿼리 수가 같은지 확인
+    2. 운동 정보 상세 조회 시 운동 부위 수와 관계없이 쿼리 수가 일정한지 확인
+    """
+
+    def setUp(self):
+        """
+        사전 설정
+
+        1. 카탈로그 스냅샷 초기화
+        2. 관리자 계정 생성
+        3. 운동 부위 3개 생성
+        """
+        exercises_catalog.clear()
+
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.focus_areas = [
+            FocusArea.objects.create(focus_area=focus_area)
+            for focus_area in ["가슴", "등", "하체"]
+        ]
+
+    def create_exercises(self, count):
+        """운동 속성, 운동 부위를 가진 운동 정보 count개를 bulk_create로 생성"""
+        attributes = ExercisesAttribute.objects.bulk_create(
+            [ExercisesAttribute(need_set=True) for _ in range(count)]
+        )
+        exercises = ExercisesInfo.objects.bulk_create(
+            [
+                ExercisesInfo(
+                    author=self.admin.instance,
+                    title=f"운동 {i}",
+                    description="설명",
+                    video="https://example.com",
+                    exercises_attribute=attribute,
+                )
+                for i, attribute in enumerate(attributes)
+            ]
+        )
+        ExercisesInfo.focus_areas.through.objects.bulk_create(
+            [
+                ExercisesInfo.focus_areas.through(
+                    exercisesinfo_id=exercise.id, focusarea_id=focus_area.id
+                )
+                for exercise in exercises
+                for focus_area in self.focus_areas
+            ]
+        )
+        exercises_catalog.clear()
+        return exercises
+
+    def count_list_queries(self):
+        """운동 정보 목록을 조회하고 실행된 쿼리 수와 응답 데이터를 반환"""
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("exercises-info-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries), response.json()
+
+    def test_list_query_count_is_constant(self):
+        """
+        운동 정보 목록 조회 시 운동 10개와 1000개의 쿼리 수가 같은지 확인
+
+        reverse_url : exercises-info-list
+        HTTP method : GET
+
+        테스트 시나리오:
+        1. 운동 10개를 생성하고 목록을 조회하여 쿼리 수를 기록
+        2. 운동 990개를 추가로 생성하고 목록을 조회하여 쿼리 수를 기록
+        3. 두 쿼리 수가 같고, 운동 1000개의 작성자, 운동 속성, 운동 부위가 모두 직렬화되었는지 확인
+        """
+        self.create_exercises(10)
+        small_count, data = self.count_list_queries()
+        self.assertEqual(len(data), 10)
+
+        self.create_exercises(990)
+        large_count, data = self.count_list_queries()
+
+        self.assertEqual(large_count, small_count)
+        self.assertEqual(len(data), 1000)
+        for exercise in data:
+            self.assertEqual(exercise["username"], self.admin.instance.username)
+            self.assertTrue(exercise["exercises_attribute"]["need_set"])
+            self.assertEqual(len(exercise["focus_areas"]), 3)
+
+    def test_retrieve_query_count_is_constant(self):
+        """
+        운동 정보 상세 조회 시 운동 부위 수와 관계없이 쿼리 수가 일정한지 확인
+
+        reverse_url : exercises-info-detail
+        HTTP method : GET
+
+        테스트 시나리오:
+        1. 운동 1개를 생성
+        2. 상세 조회 시 운동 정보(작성자, 운동 속성 JOIN)와 운동 부위를 2개의 쿼리로 조회하는지 확인
+        """
+        exercise = self.create_exercises(1)[0]
+
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse("exercises-info-detail", kwargs={"pk": exercise.id})
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["focus_areas"]), 3)
+
+
+class ExercisesInfoFocusAreaFilterTestCase(APITestCase):
+    """
+    목적: 운동 부위 비트 마스크(focus_area_mask)와 운동 부위 필터 테스트
+
+    Test cases:
+    1. 운동 정보 생성, 운동 부위 수정 시 focus_area_mask가 갱신되는지 확인
+    2. focus_area_match=any로 운동 부위 중 하나라도 포함하는 운동만 조회되는지 확인
+    3. focus_area_match=all로 운동 부위를 모두 포함하는 운동만 조회되는지 확인
+    4. 존재하지 않는 운동 부위로 필터링하면 에러가 발생하는지 확인
+    5. 운동 부위 필터가 운동 부위 M2M 테이블을 JOIN하지 않는지 확인
+    """
+
+    def setUp(self):
+        """
+        사전 설정
+
+        1. 관리자 계정 생성 후 로그인
+        2. 운동 부위가 정해진 운동 정보 3개 생성 (가슴 / 가슴, 등 / 하체)
+        """
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+        self.admin.login(self.client)
+
+        self.chest = self.create_exercise(["가슴"])
+        self.chest_back = self.create_exercise(["가슴", "등"])
+        self.lower_body = self.create_exercise(["하체"])
+
+    def create_exercise(self, focus_areas):
+        """주어진 운동 부위로 운동 정보를 생성하고 응답 데이터를 반환"""
+        request_data = FakeExercisesInfo().request_create()
+        request_data["focus_areas"] = [
+            {"focus_area": focus_area} for focus_area in focus_areas
+        ]
+
+        response = self.client.post(
+            reverse("exercises-info-list"),
+            data=json.dumps(request_data),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.json()
+
+    def filter_ids(self, focus_area, match=None):
+        """운동 부위로 필터링한 운동 정보 id 집합을 반환"""
+        params = {"focus_area": focus_area}
+        if match:
+            params["focus_area_match"] = match
+
+        response = self.client.get(reverse("exercises-info-list"), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {exercise["id"] for exercise in response.json()}
+
+    def test_focus_area_mask_follows_focus_areas(self):
+        """
+        운동 정보 생성, 운동 부위 수정 시 focus_area_mask가 갱신되는지 확인
+
+        reverse_url : exercises-info-detail
+        HTTP method : PATCH
+
+        테스트 시나리오:
+        1. 생성된 운동 정보의 focus_area_mask가 운동 부위의 비트 합과 같은지 확인
+        2. 운동 부위를 어깨, 코어로 수정
+        3. focus_area_mask가 수정된 운동 부위의 비트 합으로 바뀌었는지 확인
+        """
+        exercise = ExercisesInfo.objects.get(id=self.chest_back["id"])
+        self.assertEqual(
+            exercise.focus_area_mask, FocusAreaEnum.CHEST.bit | FocusAreaEnum.BACK.bit
+        )
+
+        response = self.client.patch(
+            reverse("exercises-info-detail", kwargs={"pk": exercise.id}),
+            data=json.dumps(
+                {"focus_areas": [{"focus_area": "어깨"}, {"focus_area": "코어"}]}
+            ),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        exercise.refresh_from_db()
+        self.assertEqual(
+            exercise.focus_area_mask,
+            FocusAreaEnum.SHOULDER.bit | FocusAreaEnum.CORE.bit,
+        )
+
+    def test_filter_any_focus_area(self):
+        """
+        focus_area_match=any로 운동 부위 중 하나라도 포함하는 운동만 조회되는지 확인
+
+        reverse_url : exercises-info-list
+        HTTP method : GET
+
+        테스트 시나리오:
+        1. ?focus_area=가슴,등 으로 조회 (focus_area_match 기본값 any)
+        2. 가슴 또는 등을 포함하는 운동 2개만 조회되는지 확인
+        3. ?focus_area=하체 로 조회하면 하체 운동만 조회되는지 확인
+        """
+        self.assertEqual(
+            self.filter_ids("가슴,등"), {self.chest["id"], self.chest_back["id"]}
+        )
+        self.assertEqual(self.filter_ids("하체", "any"), {self.lower_body["id"]})
+
+    def test_filter_all_focus_areas(self):
+        """
+        focus_area_match=all로 운동 부위를 모두 포함하는 운동만 조회되는지 확인
+
+        reverse_url : exercises-info-list
+        HTTP method : GET
+
+        테스트 시나리오:
+        1. ?focus_area=가슴,등&focus_area_match=all 로 조회
+        2. 가슴과 등을 모두 포함하는 운동 1개만 조회되는지 확인
+        3. ?focus_area=가슴,하체&focus_area_match=all 로 조회하면 빈 목록인지 확인
+        """
+        self.assertEqual(self.filter_ids("가슴,등", "all"), {self.chest_back["id"]})
+        self.assertEqual(self.filter_ids("가슴,하체", "all"), set())
+
+    def test_filter_with_invalid_focus_area(self):
+        """
+        존재하지 않는 운동 부위로 필터링하면 에러가 발생하는지 확인
+
+        reverse_url : exercises-info-list
+        HTTP method : GET
+
+        테스트 시나리오:
+        1. ?focus_area=가슴,꼬리 로 조회
+        2. 응답 코드가 400이고 focus_area 에러가 반환되는지 확인
+        3. focus_area_match가 any, all이 아니라면 400이 반환되는지 확인
+        """
+        response = self.client.get(
+            reverse("exercises-info-list"), {"focus_area": "가슴,꼬리"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("focus_area", response.json())
+
+        response = self.client.get(
+            reverse("exercises-info-list"),
+            {"focus_area": "가슴", "focus_area_match": "some"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_filter_does_not_join_focus_areas(self):
+        """
+        운동 부위 필터가 운동 부위 M2M 테이블을 JOIN하지 않는지 확인
+
+        reverse_url : exercises-info-list
+        HTTP method : GET
+
+        테스트 시나리오:
+        1. ?focus_area=가슴,등&focus_area_match=all 로 조회하며 실행된 쿼리를 기록
+        2. 운동 정보를 조회하는 쿼리가 focus_area_mask 조건을 사용하고 운동 부위 M2M 테이블을 사용하지 않는지 확인
+        """
+        with CaptureQueriesContext(connection) as context:
+            self.filter_ids("가슴,등", "all")
+
+        exercise_table = ExercisesInfo._meta.db_table
+        filter_sql = next(
+            query["sql"]
+            for query in context.captured_queries
+            if f'FROM "{exercise_table}"' in query["sql"]
+        )
+        self.assertIn("focus_area_mask", filter_sql)
+        self.assertNotIn(ExercisesInfo.focus_areas.through._meta.db_table, filter_sql)
+
+
+class ExercisesSearchTestCase(APITestCase):
+    """
+    목적: 운동 정보 n-gram 역색인 검색 테스트
+
+    Test cases:
+    1. 제목, 설명의 부분 문자열로 검색하면 관련도 순으로 조회되는지 확인
+    2. 띄어쓰기가 다른 검색어로도 검색되는지 확인
+    3. 관리자가 운동 정보를 수정하면 다음 검색에 반영되는지 확인
+    4. 역색인 검색 결과가 전체 문자열 비교 결과와 같고, DB를 조회하지 않는지 확인
+    5. 검색어가 없다면 에러가 발생하는지 확인
+    6. 역색인과 icontains 비교 명령어가 실행되는지 확인
+    """
+
+    def setUp(self):
+        """
+        사전 설정
+
+        1. 검색 인덱스 초기화
+        2. 관리자 계정 생성
+        3. 제목, 설명이 정해진 운동 정보 4개 생성
+        """
+        exercises_search_index.clear()
+
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.back_squat = self.create_exercise(
+            "바벨 백 스쿼트", "바벨을 등에 메고 앉기"
+        )
+        self.squat = self.create_exercise("스쿼트", "맨몸으로 앉았다 일어나기")
+        self.leg_press = self.create_exercise(
+            "레그 프레스", "스쿼트 대신 하는 기구 운동"
+        )
+        self.bench_press = self.create_exercise("벤치 프레스", "가슴 운동")
+
+    def create_exercise(self, title, description):
+        """주어진 제목, 설명으로 운동 정보를 생성하여 반환"""
+        fake_exercise = FakeExercisesInfo()
+        fake_exercise.base_attr["title"] = title
+        fake_exercise.base_attr["description"] = description
+        return fake_exercise.create_instance(user_instance=self.admin.instance)
+
+    def search(self, query, **params):
+        """검색 API를 호출하고 응답 데이터를 반환"""
+        response = self.client.get(
+            reverse("exercises-info-search"), {"q": query, **params}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_search_ranked_by_relevance(self):
+        """
+        제목, 설명의 부분 문자열로 검색하면 관련도 순으로 조회되는지 확인
+
+        reverse_url : exercises-info-search
+        HTTP method : GET
+
+        테스트 시나리오:
+        1. ?q=스쿼트 로 검색
+        2. 제목이 검색어로 시작하는 운동, 제목에 포함하는 운동, 설명에만 포함하는 운동 순으로 조회되는지 확인
+        3. limit만큼만 조회되는지 확인
+        """
+        data = self.search("스쿼트")
+
+        self.assertEqual(
+            [exercise["id"] for exercise in data],
+            [self.squat.id, self.back_squat.id, self.leg_press.id],
+        )
+        self.assertEqual([exercise["score"] for exercise in data], [3, 2, 1])
+        self.assertEqual(data[0]["title"], "스쿼트")
+
+        data = self.search("프레스", limit=1)
+        self.assertEqual([exercise["id"] for exercise in data], [self.leg_press.id])
+
+    def test_search_ignores_spaces(self):
+        """
+        띄어쓰기가 다른 검색어로도 검색되는지 확인
+
+        reverse_url : exercises-info-search
+        HTTP method : GET
+
+        테스트 시나리오:
+        1. ?q=백스쿼트, ?q=벤 치 로 검색
+        2. 띄어쓰기가 다른 제목의 운동이 조회되는지 확인
+        """
+        self.assertEqual(
+            [exercise["id"] for exercise in self.search("백스쿼트")],
+            [self.back_squat.id],
+        )
+        self.assertEqual(
+            [exercise["id"] for exercise in self.search("벤 치")],
+            [self.bench_press.id],
+        )
+
+    def test_search_reflects_admin_update(self):
+        """
+        관리자가 운동 정보를 수정하면 다음 검색에 반영되는지 확인
+
+        reverse_url : exercises-info-detail, exercises-info-search
+        HTTP method : PATCH, GET
+
+        테스트 시나리오:
+        1. ?q=데드리프트 로 검색하면 빈 목록인지 확인
+        2. 관리자 계정으로 스쿼트의 제목을 루마니안 데드리프트로 수정 (커밋 후 콜백 실행)
+        3. ?q=데드리프트 로 검색하면 수정된 운동이 조회되는지 확인
+        """
+        self.assertEqual(self.search("데드리프트"), [])
+        builds = exercises_search_index.builds
+
+        self.admin.login(self.client)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                reverse("exercises-info-detail", kwargs={"pk": self.squat.id}),
+                data=json.dumps({"title": "루마니안 데드리프트"}),
+                content_type="application/json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = self.search("데드리프트")
+        self.assertEqual([exercise["id"] for exercise in data], [self.squat.id])
+        self.assertEqual(exercises_search_index.builds, builds + 1)
+
+    def test_index_matches_full_scan_without_queries(self):
+        """
+        역색인 검색 결과가 전체 문자열 비교 결과와 같고, DB를 조회하지 않는지 확인
+
+        테스트 시나리오:
+        1. 임의의 제목, 설명을 가진 운동 정보 100개를 추가로 생성하고 역색인을 만듦
+        2. 운동 제목, 설명의 여러 부분 문자열로 쿼리 없이 검색
+        3. 검색 결과가 정규화한 제목, 설명에 검색어를 포함하는 운동 전체와 같은지 확인
+        """
+        for _ in range(100):
+            FakeExercisesInfo().create_instance(user_instance=self.admin.instance)
+
+        exercises_search_index.refresh()
+        documents = {
+            exercise_id: normalize_text(title) + "\n" + normalize_text(description)
+            for exercise_id, title, description in ExercisesInfo.objects.values_list(
+                "id", "title", "description"
+            )
+        }
+
+        queries = ["스", "프레", "바벨백", "x"]
+        for exercise in ExercisesInfo.objects.order_by("id")[:20]:
+            text = normalize_text(exercise.title)
+            queries += [text[:2], text[1:4], text[-5:]]
+
+        with self.assertNumQueries(0):
+            for query in queries:
+                ranked = exercises_search_index.search(
+                    query, k=len(exercises_search_index)
+                )
+                self.assertEqual(
+                    {exercise_id for exercise_id, _ in ranked},
+                    {
+                        exercise_id
+                        for exercise_id, text in documents.items()
+                        if normalize_text(query) in text
+                    },
+                )
+
+    def test_search_without_query(self):
+        """
+        검색어가 없다면 에러가 발생하는지 확인
+
+        reverse_url : exercises-info-search
+        HTTP method : GET
+
+        테스트 시나리오:
+        1. q 없이 검색 API를 호출
+        2. 응답 코드가 400이고 q 에러가 반환되는지 확인
+        """
+        response = self.client.get(reverse("exercises-info-search"))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("q", response.json())
+
+    def test_benchmark_command(self):
+        """
+        역색인과 icontains 비교 명령어가 실행되는지 확인
+
+        테스트 시나리오:
+        1. 검색어 스쿼트로 benchmark_exercises_search 명령어를 실행
+        2. 역색인과 icontains의 결과 수가 함께 출력되는지 확인
+        """
+        out = StringIO()
+        call_command(
+            "benchmark_exercises_search", "스쿼트", "--repeat", "3", stdout=out
+        )
+
+        output = out.getvalue()
+        self.assertIn("Built index of 4 exercises", output)
+        self.assertIn("index", output)
+        self.assertIn("(3 results), icontains", output)
+
+
+class ExercisesAutocompleteTestCase(APITestCase):
+    """
+    목적: 운동 정보 제목 자동 완성 테스트
+
+    Test cases:
+    1. 제목의 앞부분, 중간 단어의 앞부분으로 자동 완성되는지 확인
+    2. 초성과 입력 중인 자모로 자동 완성되는지 확인
+    3. 제목의 첫 단어부터 일치하는 운동이 먼저 조회되고 limit만큼만 조회되는지 확인
+    4. 관리자가 운동 정보를 추가하면 다음 자동 완성에 반영되고, 변경이 없다면 인덱스를 다시 만들지 않는지 확인
+    5. 검색어가 없다면 에러가 발생하는지 확인
+    """
+
+    def setUp(self):
+        """
+        사전 설정
+
+        1. 자동 완성 인덱스 초기화
+        2. 관리자 계정 생성
+        3. 제목이 정해진 운동 정보 4개 생성
+        """
+        exercises_autocomplete.clear()
+
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.back_squat = self.create_exercise("바벨 백 스쿼트")
+        self.squat = self.create_exercise("스쿼트")
+        self.sumo_deadlift = self.create_exercise("스모 데드리프트")
+        self.leg_extension = self.create_exercise("레그 익스텐션")
+
+    def create_exercise(self, title):
+        """주어진 제목으로 운동 정보를 생성하여 반환"""
+        fake_exercise = FakeExercisesInfo()
+        fake_exercise.base_attr["title"] = title
+        return fake_exercise.create_instance(user_instance=self.admin.instance)
+
+    def complete(self, query, **params):
+        """자동 완성 API를 호출하고 운동 id 리스트를 반환"""
+        response = self.client.get(
+            reverse("exercises-info-autocomplete"), {"q": query, **params}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [exercise["id"] for exercise in response.json()]
+
+    def test_complete_with_prefix(self):
+        """
+        제목의 앞부분, 중간 단어의 앞부분으로 자동 완성되는지 확인
+
+        reverse_url : exercises-info-autocomplete
+        HTTP method : GET
+
+        테스트 시나리오:
+        1. ?q=바벨 로 조회하면 바벨 백 스쿼트만 id, 제목과 함께 조회되는지 확인
+        2. ?q=백스 로 조회하면 중간 단어부터 일치하는 바벨 백 스쿼트가 조회되는지 확인
+        3. ?q=프레스 로 조회하면 빈 목록인지 확인
+        """
+        response = self.client.get(
+            reverse("exercises-info-autocomplete"), {"q": "바벨"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(), [{"id": self.back_squat.id, "title": "바벨 백 스쿼트"}]
+        )
+        self.assertEqual(self.complete("백스"), [self.back_squat.id])
+        self.assertEqual(self.complete("프레스"), [])
+
+    def test_complete_with_chosung_and_jamo(self):
+        """
+        초성과 입력 중인 자모로 자동 완성되는지 확인
+
+        reverse_url : exercises-info-autocomplete
+        HTTP method : GET
+
+        테스트 시나리오:
+        1. ?q=ㅅㅋ 로 조회하면 스쿼트, 바벨 백 스쿼트가 조회되는지 확인
+        2. 입력 중인 ?q=슼, ?q=스ㅋ 로 조회해도 같은 결과인지 확인
+        3. ?q=ㄷㄷㄹ 로 조회하면 스모 데드리프트가 조회되는지 확인
+        """
+        expected = [self.squat.id, self.back_squat.id]
+
+        self.assertEqual(self.complete("ㅅㅋ"), expected)
+        self.assertEqual(self.complete("슼"), expected)
+        self.assertEqual(self.complete("스ㅋ"), expected)
+        self.assertEqual(self.complete("ㄷㄷㄹ"), [self.sumo_deadlift.id])
+
+    def test_complete_ranked_and_limited(self):
+        """
+        제목의 첫 단어부터 일치하는 운동이 먼저 조회되고 limit만큼만 조회되는지 확인
+
+        reverse_url : exercises-info-autocomplete
+        HTTP method : GET
+
+        테스트 시나리오:
+        1. ?q=ㅅ 로 조회
+        2. 첫 단어부터 일치하는 운동(제목이 짧은 순) 뒤에 중간 단어가 일치하는 운동이 조회되는지 확인
+        3. limit=1이라면 첫 번째 운동만 조회되는지 확인
+        """
+        self.assertEqual(
+            self.complete("ㅅ"),
+            [self.squat.id, self.sumo_deadlift.id, self.back_squat.id],
+        )
+        self.assertEqual(self.complete("ㅅ", limit=1), [self.squat.id])
+
+    def test_complete_reflects_admin_create(self):
+        """
+        관리자가 운동 정보를 추가하면 다음 자동 완성에 반영되고, 변경이 없다면 인덱스를 다시 만들지 않는지 확인
+
+        reverse_url : exercises-info-list, exercises-info-autocomplete
+        HTTP method : POST, GET
+
+        테스트 시나리오:
+        1. ?q=ㅅㅋ 로 조회하여 인덱스를 만든 뒤, 다시 조회할 때 카탈로그 버전 조회 쿼리만 실행되는지 확인
+        2. 관리자 계정으로 점프 스쿼트를 생성 (커밋 후 콜백 실행)
+        3. ?q=ㅈㅍ 로 조회하면 새 운동이 조회되는지 확인
+        """
+        self.complete("ㅅㅋ")
+        with self.assertNumQueries(1):
+            self.complete("ㅅㅋ")
+
+        request_data = FakeExercisesInfo().request_create()
+        request_data["title"] = "점프 스쿼트"
+
+        self.admin.login(self.client)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("exercises-info-list"),
+                data=json.dumps(request_data),
+                content_type="application/json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.assertEqual(self.complete("ㅈㅍ"), [response.json()["id"]])
+
+    def test_complete_without_query(self):
+        """
+        검색어가 없다면 에러가 발생하는지 확인
+
+        reverse_url : exercises-info-autocomplete
+        HTTP method : GET
+
+        테스트 시나리오:
+        1. q 없이 자동 완성 API를 호출
+        2. 응답 코드가 400이고 q 에러가 반환되는지 확인
+        """
+        response = self.client.get(reverse("exercises-info-autocomplete"))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("q", response.json())
@@ -1,20 +1,141 @@
+from django.http import HttpResponse, HttpResponseNotModified
 from django.shortcuts import get_object_or_404
+from django.utils.http import parse_etags
 from rest_framework import permissions, viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from exercises_info.catalog import exercises_catalog
 from exercises_info.models import ExercisesInfo, FocusArea
-from exercises_info.serializers import ExercisesInfoSerializer, FocusAreaSerializer
+from exercises_info.serializers import (
+    ExercisesAutocompleteQuerySerializer,
+    ExercisesInfoSerializer,
+    ExercisesSearchQuerySerializer,
+    FocusAreaFilterSerializer,
+    FocusAreaSerializer,
+)
+from exercises_info.search import exercises_autocomplete, exercises_search_index
 
 
 class ExercisesInfoViewSet(viewsets.ModelViewSet):
     queryset = ExercisesInfo.objects.all()
     serializer_class = ExercisesInfoSerializer
 
+    def get_queryset(self):
+        return ExercisesInfoSerializer.setup_eager_loading(super().get_queryset())
+
     def get_permissions(self):
         if self.action in ["create", "partial_update", "destroy"]:
             return [permissions.IsAdminUser()]
         return [permissions.AllowAny()]
 
+    def filter_queryset(self, queryset):
+        """
+        query parameter focus_area가 있다면 운동 부위 마스크로 필터링
+
+        예: ?focus_area=가슴,등&focus_area_match=all
+        """
+        queryset = super().filter_queryset(queryset)
+
+        if "focus_area" not in self.request.query_params:
+            return queryset
+
+        filter_serializer = FocusAreaFilterSerializer(data=self.request.query_params)
+        filter_serializer.is_valid(raise_exception=True)
+
+        return queryset.filter_focus_areas(
+            filter_serializer.validated_data["focus_area"],
+            filter_serializer.validated_data["focus_area_match"],
+        )
+
+    def list(self, request, *args, **kwargs):
+        """
+        운동 정보 목록을 카탈로그 스냅샷으로 반환
+
+        1. focus_area 필터가 있다면 DB에서 필터링하여 직렬화 (스냅샷 사용 안 함)
+        2. 현재 카탈로그 버전의 스냅샷을 가져옴 (버전이 바뀌었을 때만 다시 직렬화)
+        3. If-None-Match가 스냅샷의 ETag와 일치한다면 본문 없이 304 반환
+        4. 아니라면 미리 인코딩된 JSON 본문을 ETag와 함께 반환
+        """
+        if "focus_area" in request.query_params:
+            return super().list(request, *args, **kwargs)
+
+        snapshot = exercises_catalog.get_snapshot(self.render_catalog)
+        headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match:
+            etags = [etag.removeprefix("W/") for etag in parse_etags(if_none_match)]
+            if "*" in etags or snapshot.etag in etags:
+                return HttpResponseNotModified(headers=headers)
+
+        return HttpResponse(
+            snapshot.body, content_type="application/json", headers=headers
+        )
+
+    def render_catalog(self):
+        serializer = self.get_serializer(self.get_queryset(), many=True)
+        return serializer.data
+
+    @action(detail=False, methods=["get"], url_path="search", url_name="search")
+    def search(self, request, *args, **kwargs):
+        """
+        제목, 설명에 검색어를 포함하는 운동 정보를 관련도 순으로 반환
+
+        예: ?q=스쿼트&limit=10
+
+        1. 카탈로그 버전이 바뀌었다면 n-gram 역색인을 다시 만듦
+        2. 역색인에서 관련도가 높은 운동 limit개의 id를 구함
+        3. 해당 운동들을 한 번에 조회하여 순서대로 score와 함께 직렬화
+        """
+        query_serializer = ExercisesSearchQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        exercises_search_index.refresh()
+        ranked = exercises_search_index.search(
+            query_serializer.validated_data["q"],
+            k=query_serializer.validated_data["limit"],
+        )
+
+        exercises = self.get_queryset().in_bulk(
+            [exercise_id for exercise_id, _ in ranked]
+        )
+
+        return Response(
+            [
+                {**self.get_serializer(exercises[exercise_id]).data, "score": score}
+                for exercise_id, score in ranked
+                if exercise_id in exercises
+            ]
+        )
+
+    @action(
+        detail=False, methods=["get"], url_path="autocomplete", url_name="autocomplete"
+    )
+    def autocomplete(self, request, *args, **kwargs):
+        """
+        입력 중인 제목의 앞부분으로 운동 정보의 id, 제목을 반환
+
+        예: ?q=ㅅㅋ&limit=5
+
+        1. 카탈로그 버전이 바뀌었다면 자동 완성 인덱스를 다시 만듦
+        2. 제목의 단어 시작이 검색어(자모, 초성 포함)와 일치하는 운동 limit개를 DB 조회 없이 반환
+        """
+        query_serializer = ExercisesAutocompleteQuerySerializer(
+            data=request.query_params
+        )
+        query_serializer.is_valid(raise_exception=True)
+
+        exercises_autocomplete.refresh()
+        completions = exercises_autocomplete.complete(
+            query_serializer.validated_data["q"],
+            k=query_serializer.validated_data["limit"],
+        )
+
+        return Response(
+            [{"id": exercise_id, "title": title} for exercise_id, title in completions]
+        )
+
     def perform_create(self, serializer):
         serializer.save(author=self.request.user)
 
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class MyHealthInfoConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "my_health_info"
+
+    def ready(self):
+        import my_health_info.signals  # noqa: F401
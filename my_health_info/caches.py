@@ -0,0 +1,275 @@
+import json
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F
+
+from my_health_info.models import UserCacheVersion
+
+
+class RenderedJSONCache:
+    """
+    직렬화가 끝난 JSON bytes를 키별로 보관하는 프로세스 내 LRU 캐시
+
+    - 값은 JSON으로 인코딩된 bytes로 저장하고, 조회 시 새 객체로 디코딩하여
+      호출자가 결과를 수정해도 캐시가 오염되지 않도록 한다.
+    - 저장된 bytes의 총합이 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 제거한다.
+    - 여러 스레드에서 동시에 접근할 수 있도록 Lock으로 보호한다.
+    - sync_version()으로 캐시된 값이 의존하는 외부 버전을 알려주면, 버전이 바뀔 때 모든 항목을 비운다.
+      set()에 version을 넘기면 렌더링하는 동안 버전이 바뀐 값은 저장하지 않는다.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._version = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def size(self):
+        return self._size
+
+    def get(self, key):
+        """
+        key에 해당하는 값을 디코딩하여 반환, 없다면 None 반환
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return json.loads(payload)
+
+    def sync_version(self, version):
+        """
+        캐시된 값이 의존하는 버전을 갱신, 이전과 다르다면 모든 항목을 비움
+        """
+        with self._lock:
+            if self._version != version:
+                self._entries.clear()
+                self._size = 0
+                self._version = version
+
+    def set(self, key, value, version=None):
+        """
+        value를 JSON bytes로 인코딩하여 저장하고, 저장된 값을 디코딩하여 반환
+
+        단일 값이 max_bytes보다 크거나, version이 주어졌는데 현재 버전과 다르다면 저장하지 않는다.
+        """
+        payload = json.dumps(
+            value, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+        with self._lock:
+            self._discard(key)
+            if len(payload) <= self.max_bytes and version in (None, self._version):
+                self._entries[key] = payload
+                self._size += len(payload)
+                while self._size > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._size -= len(evicted)
+
+        return json.loads(payload)
+
+    def get_or_set(self, key, render, version=None):
+        """
+        캐시된 값이 있다면 반환하고, 없다면 render()의 결과를 저장 후 반환
+        """
+        value = self.get(key)
+        if value is None:
+            value = self.set(key, render(), version)
+        return value
+
+    def delete(self, key):
+        with self._lock:
+            self._discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _discard(self, key):
+        payload = self._entries.pop(key, None)
+        if payload is not None:
+            self._size -= len(payload)
+
+
+# MirroredRoutine은 생성 이후 title, author_name, 운동 트리가 바뀌지 않으므로
+# mirrored_routine id를 키로 렌더링 결과를 보관한다.
+# 운동 트리에 포함된 운동 정보는 관리자가 수정할 수 있으므로, 운동 정보 카탈로그 버전(DB에 공유)으로
+# 동기화하여 다른 프로세스에서의 수정도 반영한다. (my_health_info.serializers 참고)
+mirrored_routine_cache = RenderedJSONCache(
+    max_bytes=settings.MIRRORED_ROUTINE_CACHE_MAX_BYTES
+)
+
+
+class UserVersionedCache:
+    """
+    유저별 버전을 키에 포함하여 Django 캐시(settings.CACHES)에 값을 저장하는 캐시의 기반 클래스
+
+    - 버전은 DB의 UserCacheVersion 행(version_field 컬럼)에 저장하고, 조회할 때마다 읽어 키에 포함한다.
+    - 데이터가 변경되면 invalidate()로 버전을 F() + 1로 올리므로, 프로세스 내 캐시(LocMemCache)를 사용하더라도
+      모든 프로세스가 다음 조회부터 새 키를 사용한다. (이전 버전의 값은 timeout이 지나면 제거됨)
+    - 버전은 데이터가 변경된 후 올리므로, 이전 버전으로 렌더링한 값이 새 버전의 키에 저장되지 않는다.
+    - hits, misses는 현재 프로세스에서의 캐시 적중/실패 횟수이다.
+    """
+
+    key_prefix = None
+    version_field = None
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_version(self, user_id):
+        """
+        유저의 현재 캐시 버전을 반환 (행이 없다면 0)
+        """
+        version = (
+            UserCacheVersion.objects.filter(user_id=user_id)
+            .values_list(self.version_field, flat=True)
+            .first()
+        )
+        return version or 0
+
+    def invalidate(self, user_id):
+        """
+        유저의 캐시 버전을 올려 모든 프로세스에서 캐시된 값을 무효화
+
+        동시에 여러 프로세스에서 호출되어도 증가가 누락되지 않도록 F() + 1로 갱신한다.
+        """
+        versions = UserCacheVersion.objects.filter(user_id=user_id)
+        increment = {self.version_field: F(self.version_field) + 1}
+        if not versions.update(**increment):
+            UserCacheVersion.objects.get_or_create(user_id=user_id)
+            versions.update(**increment)
+
+    def make_key(self, user_id, version, *names):
+        return ":".join(map(str, [self.key_prefix, user_id, version, *names]))
+
+    def record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+class HealthInfoCache(UserVersionedCache):
+    """
+    유저별 건강 정보 조회 결과(최근 기간 목록, 가장 최근 건강 정보)를 보관하는 캐시
+
+    - 건강 정보는 유저당 하루에 한 번만 생성되므로, 조회 결과를 캐시하고
+      생성, 수정, 삭제될 때 유저의 버전을 올려 무효화한다. (signals.invalidate_health_info_cache)
+    - 새로 생성된 건강 정보는 새 버전의 가장 최근 건강 정보로 바로 저장한다. (write-through)
+    - 최근 기간 목록은 기간의 시작일(since)과 함께 저장하고, 날짜가 바뀌어
+      시작일이 달라졌다면 캐시가 없는 것으로 본다.
+    """
+
+    key_prefix = "health_info"
+    version_field = "health_info"
+
+    def get_recent(self, user_id, since, render):
+        """
+        since 이후의 건강 정보 목록을 반환, 캐시에 없다면 render()의 결과를 저장 후 반환
+        """
+        key = self.make_key(user_id, self.get_version(user_id), "recent")
+        since = since.isoformat()
+
+        cached = cache.get(key)
+        if cached is not None and cached["since"] == since:
+            self.record(hit=True)
+            return cached["data"]
+
+        self.record(hit=False)
+        data = render()
+        cache.set(key, {"since": since, "data": data}, self.timeout)
+        return data
+
+    def get_last(self, user_id, render):
+        """
+        가장 최근의 건강 정보를 반환, 캐시에 없다면 render()의 결과를 저장 후 반환
+
+        render()가 None을 반환한다면(건강 정보가 없다면) 저장하지 않는다.
+        """
+        key = self.make_key(user_id, self.get_version(user_id), "last")
+
+        data = cache.get(key)
+        if data is not None:
+            self.record(hit=True)
+            return data
+
+        self.record(hit=False)
+        data = render()
+        if data is not None:
+            cache.set(key, data, self.timeout)
+        return data
+
+    def set_last(self, user_id, data):
+        """
+        새로 생성된 건강 정보를 현재 버전의 가장 최근 건강 정보로 저장 (write-through)
+
+        건강 정보가 저장되며 버전이 올라간 후에 호출해야 한다.
+        """
+        key = self.make_key(user_id, self.get_version(user_id), "last")
+        cache.set(key, data, self.timeout)
+
+
+health_info_cache = HealthInfoCache(timeout=settings.HEALTH_INFO_CACHE_TIMEOUT)
+
+
+class WeeklyScheduleCache(UserVersionedCache):
+    """
+    유저별 주간 루틴 일정(요일별 UsersRoutine, MirroredRoutine id)을 보관하는 캐시
+
+    - 값은 day_index(0: 월요일 ~ 6: 일요일)를 인덱스로 하는 7칸 리스트이며,
+      루틴이 없는 요일은 None이다.
+    - 운동 트리는 저장하지 않고 mirrored_routine id만 저장한다.
+      MirroredRoutine은 생성 이후 바뀌지 않으므로 운동 트리는 mirrored_routine_cache에서 읽는다.
+    - 주간 루틴이 변경되거나 UsersRoutine이 수정, 삭제되면 유저의 버전을 올려 모든 프로세스에서 일정을 무효화한다.
+    """
+
+    key_prefix = "weekly_schedule"
+    version_field = "weekly_schedule"
+    days = 7
+
+    def get_schedule(self, user_id, render):
+        """
+        유저의 7칸 주간 일정을 반환, 캐시에 없다면 render()의 결과를 저장 후 반환
+        """
+        key = self.make_key(user_id, self.get_version(user_id))
+
+        schedule = cache.get(key)
+        if schedule is not None:
+            self.record(hit=True)
+            return schedule
+
+        self.record(hit=False)
+        schedule = render()
+        cache.set(key, schedule, self.timeout)
+        return schedule
+
+
+weekly_schedule_cache = WeeklyScheduleCache(
+    timeout=settings.WEEKLY_SCHEDULE_CACHE_TIMEOUT
+)
@@ -0,0 +1,100 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from my_health_info.models import (
+    ExerciseInRoutine,
+    ExerciseInRoutineAttribute,
+    MirroredRoutine,
+    RoutineStreak,
+    UsersRoutine,
+)
+
+
+class OrphanedRoutineCollector:
+    """
+    어디에서도 참조하지 않는 MirroredRoutine과 그 운동 트리를 정리하는 클래스
+
+    아래 조건을 모두 만족하는 MirroredRoutine을 고아로 판단한다.
+    - 원본 루틴의 현재 스냅샷이 아님 (original_routine이 None)
+    - 이 스냅샷을 사용하는 UsersRoutine이 없음
+    - 이 스냅샷을 수행 기록으로 가진 RoutineStreak이 없음
+
+    조건은 NOT EXISTS 서브쿼리(anti-join)로 한 번에 판단하고,
+    id 순으로 batch_size개씩 나누어 짧은 트랜잭션 안에서 삭제한다.
+    각 배치는 후보 행을 SELECT ... FOR UPDATE SKIP LOCKED로 잠근 뒤 삭제하므로,
+    동시에 구독되거나 재사용되는 중인 스냅샷은 건너뛰고 다음 실행 때 다시 판단한다.
+    """
+
+    def __init__(self, batch_size=None, max_batches=None):
+        self.batch_size = batch_size or settings.ORPHANED_ROUTINE_GC_BATCH_SIZE
+        self.max_batches = max_batches
+
+    def get_orphans(self):
+        """
+        고아 MirroredRoutine 쿼리셋을 반환하는 메서드
+        """
+        return MirroredRoutine.objects.filter(
+            ~Exists(UsersRoutine.objects.filter(mirrored_routine=OuterRef("pk"))),
+            ~Exists(RoutineStreak.objects.filter(mirrored_routine=OuterRef("pk"))),
+            original_routine__isnull=True,
+        )
+
+    def count(self):
+        """
+        삭제 대상 행 수를 모델별로 세어 반환하는 메서드 (삭제하지 않음)
+        """
+        orphans = self.get_orphans()
+        exercises_in_routine = ExerciseInRoutine.objects.filter(
+            mirrored_routine__in=orphans
+        )
+
+        return {
+            "mirrored_routines": orphans.count(),
+            "exercises_in_routine": exercises_in_routine.count(),
+            "exercise_attributes": ExerciseInRoutineAttribute.objects.filter(
+                exercise_in_routine__in=exercises_in_routine
+            ).count(),
+        }
+
+    def collect(self):
+        """
+        고아 MirroredRoutine 트리를 배치 단위로 삭제하고, 삭제된 행 수를 반환하는 메서드
+
+        1. 마지막으로 처리한 id 이후의 고아 MirroredRoutine id를 batch_size개 잠금
+        2. 잠근 MirroredRoutine을 삭제 (ExerciseInRoutine, ExerciseInRoutineAttribute는 CASCADE로 함께 삭제)
+        3. 더 이상 고아가 없거나 max_batches만큼 처리할 때까지 반복
+        """
+        result = {
+            "batches": 0,
+            "mirrored_routines": 0,
+            "exercises_in_routine": 0,
+            "exercise_attributes": 0,
+        }
+        last_id = 0
+
+        while self.max_batches is None or result["batches"] < self.max_batches:
+            with transaction.atomic():
+                batch_ids = list(
+                    self.get_orphans()
+                    .filter(id__gt=last_id)
+                    .order_by("id")
+                    .select_for_update(skip_locked=True)
+                    .values_list("id", flat=True)[: self.batch_size]
+                )
+                if not batch_ids:
+                    break
+
+                _, deleted = self.get_orphans().filter(id__in=batch_ids).delete()
+
+            last_id = batch_ids[-1]
+            result["batches"] += 1
+            result["mirrored_routines"] += deleted.get(MirroredRoutine._meta.label, 0)
+            result["exercises_in_routine"] += deleted.get(
+                ExerciseInRoutine._meta.label, 0
+            )
+            result["exercise_attributes"] += deleted.get(
+                ExerciseInRoutineAttribute._meta.label, 0
+            )
+
+        return result
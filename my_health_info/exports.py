@@ -0,0 +1,136 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from my_health_info.models import HealthInfo, RoutineStreak
+
+
+class EchoBuffer:
+    """
+    csv.writer가 쓴 한 줄을 그대로 반환하는 버퍼
+
+    파일에 쓰지 않고 한 줄씩 문자열로 만들어 generator에서 바로 내보내기 위해 사용한다.
+    """
+
+    def write(self, value):
+        return value
+
+
+class HistoryExporter:
+    """
+    기록 테이블을 CSV 또는 NDJSON으로 한 줄씩 내보내는 클래스
+
+    - values_list(...).iterator(chunk_size)로 DB에서 chunk_size개씩 읽어
+      (PostgreSQL에서는 server-side cursor 사용) 전체 행을 메모리에 올리지 않는다.
+    - iter_rows()는 generator이므로 StreamingHttpResponse나 파일 쓰기에 그대로 사용할 수 있다.
+
+    하위 클래스에서 model, fields를 지정하고, 필요하다면 get_row로 값을 가공한다.
+    """
+
+    model = None
+    fields = []
+    name = None
+    formats = {
+        "csv": "text/csv",
+        "ndjson": "application/x-ndjson",
+    }
+    chunk_size = 2000
+
+    def __init__(self, user=None, export_format="csv", chunk_size=None):
+        self.user = user
+        self.export_format = export_format
+        self.chunk_size = chunk_size or self.chunk_size
+
+    @property
+    def content_type(self):
+        return self.formats[self.export_format]
+
+    @property
+    def filename(self):
+        return f"{self.name}.{self.export_format}"
+
+    def get_queryset(self):
+        """
+        내보낼 행의 쿼리셋을 반환하는 메서드
+
+        user가 주어졌다면 해당 유저의 기록만, 아니라면 전체 기록을 (user, date) 순으로 반환한다.
+        """
+        queryset = self.model.objects.order_by("user_id", "date")
+        if self.user is not None:
+            queryset = queryset.filter(user=self.user)
+        return queryset
+
+    def get_columns(self):
+        return self.fields
+
+    def get_row(self, values):
+        return values
+
+    def iter_rows(self):
+        """
+        선택한 형식으로 인코딩된 행을 하나씩 반환하는 generator
+        """
+        if self.export_format == "csv":
+            return self.iter_csv()
+        return self.iter_ndjson()
+
+    def iter_values(self):
+        queryset = self.get_queryset().values_list(*self.fields)
+        for values in queryset.iterator(chunk_size=self.chunk_size):
+            yield self.get_row(values)
+
+    def iter_csv(self):
+        writer = csv.writer(EchoBuffer())
+        yield writer.writerow(self.get_columns())
+        for row in self.iter_values():
+            yield writer.writerow(row)
+
+    def iter_ndjson(self):
+        columns = self.get_columns()
+        for row in self.iter_values():
+            yield (
+                json.dumps(
+                    dict(zip(columns, row)),
+                    cls=DjangoJSONEncoder,
+                    ensure_ascii=False,
+                )
+                + "\n"
+            )
+
+
+class HealthInfoExporter(HistoryExporter):
+    """
+    건강 정보(HealthInfo)를 내보내는 클래스
+
+    열: user_id, date, age, height, weight, bmi
+    """
+
+    model = HealthInfo
+    fields = ["user_id", "date", "age", "height", "weight"]
+    name = "health_info"
+
+    def get_columns(self):
+        return self.fields + ["bmi"]
+
+    def get_row(self, values):
+        weight, height = values[4], values[3]
+        return (*values, round(weight / ((height / 100) ** 2), 2))
+
+
+class RoutineStreakExporter(HistoryExporter):
+    """
+    루틴 수행 기록(RoutineStreak)을 내보내는 클래스
+
+    열: user_id, date, mirrored_routine_id
+    """
+
+    model = RoutineStreak
+    fields = ["user_id", "date", "mirrored_routine_id"]
+    name = "routine_streak"
+
+
+exporters = {
+    HealthInfoExporter.name: HealthInfoExporter,
+    RoutineStreakExporter.name: RoutineStreakExporter,
+}
@@ -0,0 +1,69 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from my_health_info.collectors import OrphanedRoutineCollector
+
+
+class Command(BaseCommand):
+    """
+    고아 MirroredRoutine 트리를 정리하는 명령어
+
+    usage: python manage.py collect_orphaned_routines [--batch-size N] [--max-batches N] [--dry-run]
+
+    1. --dry-run이라면 삭제 대상 행 수만 출력
+    2. 아니라면 OrphanedRoutineCollector로 배치 단위 삭제 후 삭제된 행 수를 출력
+    """
+
+    help = (
+        "어디에서도 참조하지 않는 MirroredRoutine과 운동 트리를 배치 단위로 삭제합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="한 트랜잭션에서 삭제할 MirroredRoutine 수",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="이번 실행에서 처리할 최대 배치 수",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="삭제하지 않고 삭제 대상 행 수만 출력",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        max_batches = options["max_batches"]
+        if batch_size is not None and batch_size <= 0:
+            raise CommandError("--batch-size must be a positive integer")
+        if max_batches is not None and max_batches <= 0:
+            raise CommandError("--max-batches must be a positive integer")
+
+        collector = OrphanedRoutineCollector(
+            batch_size=batch_size, max_batches=max_batches
+        )
+
+        if options["dry_run"]:
+            counts = collector.count()
+            self.stdout.write(
+                "Orphaned rows: "
+                f"mirrored_routines={counts['mirrored_routines']}, "
+                f"exercises_in_routine={counts['exercises_in_routine']}, "
+                f"exercise_attributes={counts['exercise_attributes']}"
+            )
+            return
+
+        result = collector.collect()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Reclaimed rows in {result['batches']} batch(es): "
+                f"mirrored_routines={result['mirrored_routines']}, "
+                f"exercises_in_routine={result['exercises_in_routine']}, "
+                f"exercise_attributes={result['exercise_attributes']}"
+            )
+        )
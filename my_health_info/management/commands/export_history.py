@@ -0,0 +1,73 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from account.models import CustomUser as User
+from my_health_info.exports import exporters
+
+
+class Command(BaseCommand):
+    """
+    건강 정보, 루틴 수행 기록을 CSV 또는 NDJSON으로 내보내는 명령어
+
+    usage: python manage.py export_history {health_info,routine_streak}
+           [--format csv|ndjson] [--user ID] [--output PATH] [--chunk-size N]
+
+    1. --user가 있다면 해당 유저의 기록만, 없다면 전체 유저의 기록을 내보냄
+    2. exporter의 generator에서 한 줄씩 받아 --output 파일 또는 표준 출력에 씀
+    """
+
+    help = (
+        "HealthInfo 또는 RoutineStreak 기록을 CSV/NDJSON으로 스트리밍하여 내보냅니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("table", choices=sorted(exporters))
+        parser.add_argument(
+            "--format",
+            choices=["csv", "ndjson"],
+            default="csv",
+            dest="export_format",
+            help="내보낼 형식",
+        )
+        parser.add_argument("--user", type=int, help="내보낼 유저 id")
+        parser.add_argument("--output", help="저장할 파일 경로 (없다면 표준 출력)")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=None,
+            help="DB에서 한 번에 읽을 행 수",
+        )
+
+    def handle(self, *args, **options):
+        user = None
+        if options["user"] is not None:
+            try:
+                user = User.objects.get(id=options["user"])
+            except User.DoesNotExist:
+                raise CommandError(f"User {options['user']} does not exist")
+
+        chunk_size = options["chunk_size"]
+        if chunk_size is not None and chunk_size <= 0:
+            raise CommandError("--chunk-size must be a positive integer")
+
+        exporter = exporters[options["table"]](
+            user=user,
+            export_format=options["export_format"],
+            chunk_size=chunk_size,
+        )
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8", newline="") as output:
+                lines = self.write_lines(exporter, output.write)
+        else:
+            lines = self.write_lines(
+                exporter, lambda line: self.stdout.write(line, ending="")
+            )
+
+        self.stderr.write(f"Exported {lines} line(s) of {exporter.name}")
+
+    def write_lines(self, exporter, write):
+        lines = 0
+        for line in exporter.iter_rows():
+            write(line)
+            lines += 1
+        return lines
@@ -0,0 +1,40 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from my_health_info.sync import prune_sync_tombstones
+
+
+class Command(BaseCommand):
+    """
+    오래된 동기화 삭제 기록(SyncTombstone)을 정리하는 명령어
+
+    usage: python manage.py prune_sync_tombstones [--days N]
+
+    1. --days(기본값은 SYNC_TOMBSTONE_RETENTION_DAYS)일보다 오래된 삭제 기록을 삭제
+    2. 이보다 오래된 토큰은 전체 동기화로 처리되므로 삭제 기록이 더 이상 필요하지 않음
+    """
+
+    help = "보관 기간이 지난 동기화 삭제 기록을 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.SYNC_TOMBSTONE_RETENTION_DAYS,
+            help="삭제 기록을 보관할 기간 (일)",
+        )
+
+    def handle(self, *args, **options):
+        days = options["days"]
+        if days < settings.SYNC_TOMBSTONE_RETENTION_DAYS:
+            raise CommandError(
+                "--days must not be shorter than SYNC_TOMBSTONE_RETENTION_DAYS"
+            )
+
+        deleted = prune_sync_tombstones(
+            before=timezone.now() - datetime.timedelta(days=days)
+        )
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} sync tombstones"))
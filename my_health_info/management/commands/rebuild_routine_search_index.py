@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from my_health_info.search import routine_search_index
+
+
+class Command(BaseCommand):
+    """
+    모든 루틴의 검색 문서와 전문 검색 인덱스를 다시 만드는 명령어
+
+    usage: python manage.py rebuild_routine_search_index
+
+    1. 모든 루틴의 검색 문서를 batch_size개씩 다시 계산하여 저장
+    2. SQLite라면 검색 문서 테이블에서 FTS5 인덱스를 다시 생성
+    """
+
+    help = "Routine 검색 문서와 전문 검색 인덱스를 다시 만듭니다."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rebuilt = routine_search_index.rebuild()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {rebuilt} routine search documents")
+        )
@@ -0,0 +1,93 @@
+from itertools import groupby
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from my_health_info.models import RoutineStreak, RoutineStreakSummary
+from my_health_info.services import RoutineStreakSummaryService
+
+
+class Command(BaseCommand):
+    """
+    루틴 수행 기록 요약을 전체 기록에서 다시 계산하는 명령어
+
+    usage: python manage.py rebuild_routine_streak_summaries [--user ID ...] [--batch-size N]
+
+    1. 유저 id, 날짜 순으로 정렬된 루틴 수행 기록을 chunk 단위로 순회
+    2. 유저별로 RoutineStreakSummaryService.summarize로 요약을 계산
+    3. batch_size개씩 모아 bulk_create(update_conflicts=True)로 저장
+    4. 전체를 다시 계산한 경우, 수행 기록이 없는 유저의 요약은 삭제
+    """
+
+    help = "RoutineStreak 전체 기록에서 유저별 RoutineStreakSummary를 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="요약을 다시 계산할 유저 id (여러 번 지정 가능)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 저장할 요약 수",
+        )
+
+    def handle(self, *args, **options):
+        user_ids = options["user_ids"]
+        batch_size = options["batch_size"]
+        if batch_size <= 0:
+            raise CommandError("--batch-size must be a positive integer")
+
+        routine_streaks = RoutineStreak.objects.order_by("user_id", "date")
+        summaries = RoutineStreakSummary.objects.all()
+        if user_ids:
+            routine_streaks = routine_streaks.filter(user_id__in=user_ids)
+            summaries = summaries.filter(user_id__in=user_ids)
+
+        rows = routine_streaks.values_list("user_id", "date").iterator(
+            chunk_size=batch_size
+        )
+
+        rebuilt = 0
+        batch = []
+        with transaction.atomic():
+            for user_id, user_rows in groupby(rows, key=lambda row: row[0]):
+                batch.append(
+                    RoutineStreakSummary(
+                        user_id=user_id,
+                        **RoutineStreakSummaryService.summarize(
+                            date for _, date in user_rows
+                        ),
+                    )
+                )
+                if len(batch) >= batch_size:
+                    rebuilt += self.save_summaries(batch)
+                    batch = []
+
+            rebuilt += self.save_summaries(batch)
+
+            deleted, _ = summaries.exclude(
+                user_id__in=routine_streaks.values("user_id")
+            ).delete()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {rebuilt} routine streak summaries, deleted {deleted}"
+            )
+        )
+
+    def save_summaries(self, summaries):
+        if not summaries:
+            return 0
+
+        RoutineStreakSummary.objects.bulk_create(
+            summaries,
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=RoutineStreakSummaryService.summary_fields,
+        )
+        return len(summaries)
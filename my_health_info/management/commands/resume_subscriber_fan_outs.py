@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from my_health_info.tasks import resume_subscriber_fan_out_jobs
+
+
+class Command(BaseCommand):
+    """
+    중단되거나 실패한 구독자 업데이트 작업(SubscriberFanOutJob)을 다시 실행하는 명령어
+
+    usage: python manage.py resume_subscriber_fan_outs
+
+    1. PENDING, FAILED 작업과 SUBSCRIBER_FAN_OUT_STALE_AFTER초 동안 진행되지 않은 RUNNING 작업을 찾음
+    2. 작업마다 실행 권한을 얻은 뒤 last_processed_id 이후의 구독자부터 이어서 처리
+
+    메모리 큐의 작업은 프로세스가 재시작되면 사라지므로, 배포 후와 주기적으로(cron 등) 실행한다.
+    """
+
+    help = "중단되거나 실패한 SubscriberFanOutJob을 이어서 실행합니다."
+
+    def handle(self, *args, **options):
+        resumed, failed = resume_subscriber_fan_out_jobs()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Resumed {resumed} subscriber fan-out jobs ({failed} failed)"
+            )
+        )
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.4 on 2026-10-18 04:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("my_health_info", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="routine",
+            index=models.Index(
+                fields=["is_deleted", "like_count", "created_at"],
+                name="routine_feed_like_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="routine",
+            index=models.Index(
+                fields=["is_deleted", "created_at"], name="routine_feed_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations
+from django.db.models import Count
+
+
+def recount_like_count(apps, schema_editor):
+    """
+    이전 좋아요 로직은 like_count를 저장하지 않아 값이 어긋나 있으므로
+    liked_users의 실제 개수로 like_count를 다시 계산한다.
+    """
+    Routine = apps.get_model("my_health_info", "Routine")
+
+    routines = Routine.objects.annotate(liked_users_count=Count("liked_users"))
+    for routine in routines.iterator(chunk_size=1000):
+        if routine.like_count != routine.liked_users_count:
+            Routine.objects.filter(id=routine.id).update(
+                like_count=routine.liked_users_count
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("my_health_info", "0002_routine_feed_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(recount_like_count, migrations.RunPython.noop),
+    ]
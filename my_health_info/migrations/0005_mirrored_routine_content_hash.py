@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-18 04:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("my_health_info", "0004_subscriber_fan_out_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mirroredroutine",
+            name="content_hash",
+            field=models.CharField(max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.0.4 on 2026-10-18 05:07
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("my_health_info", "0006_routine_streak_summary"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("model", models.CharField(max_length=30)),
+                ("object_id", models.PositiveBigIntegerField()),
+                ("deleted_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="healthinfo",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="routinestreak",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="usersroutine",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="weeklyroutine",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name="healthinfo",
+            index=models.Index(
+                fields=["user", "updated_at"], name="my_health_i_user_id_30a3cf_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="routinestreak",
+            index=models.Index(
+                fields=["user", "updated_at"], name="my_health_i_user_id_a228af_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="usersroutine",
+            index=models.Index(
+                fields=["user", "updated_at"], name="my_health_i_user_id_792ebf_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="weeklyroutine",
+            index=models.Index(
+                fields=["user", "updated_at"], name="my_health_i_user_id_ec61fd_idx"
+            ),
+        ),
+        migrations.AddField(
+            model_name="synctombstone",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="synctombstone",
+            index=models.Index(
+                fields=["user", "deleted_at"], name="my_health_i_user_id_a939d6_idx"
+            ),
+        ),
+    ]
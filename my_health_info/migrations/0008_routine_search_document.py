@@ -0,0 +1,138 @@
+# Generated by Django 5.0.4 on 2026-10-18 05:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+FTS_TABLE = "my_health_info_routine_search_fts"
+DOCUMENT_TABLE = "my_health_info_routinesearchdocument"
+COLUMNS = "title_terms, author_terms, exercise_terms"
+VECTOR = (
+    "(setweight(array_to_tsvector(string_to_array(title_terms, ' ')), 'A')"
+    " || setweight(array_to_tsvector(string_to_array(author_terms, ' ')), 'B')"
+    " || setweight(array_to_tsvector(string_to_array(exercise_terms, ' ')), 'C'))"
+)
+
+
+def create_search_index(apps, schema_editor):
+    """
+    DB에 맞는 전문 검색 인덱스를 생성한다.
+
+    - SQLite: 검색 문서 테이블을 content로 사용하는 FTS5 가상 테이블과 동기화 트리거
+      (검색어는 미리 n-gram으로 분해되어 있으므로 unicode61 토크나이저는 공백으로만 나눈다.)
+    - PostgreSQL: 가중치 tsvector 식에 대한 GIN 인덱스
+    """
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        new_values = (
+            "new.routine_id, new.title_terms, new.author_terms, new.exercise_terms"
+        )
+        old_values = (
+            "old.routine_id, old.title_terms, old.author_terms, old.exercise_terms"
+        )
+        delete_old = (
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {COLUMNS})"
+            f" VALUES ('delete', {old_values});"
+        )
+        insert_new = f"INSERT INTO {FTS_TABLE}(rowid, {COLUMNS}) VALUES ({new_values});"
+
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5({COLUMNS},"
+            f" content='{DOCUMENT_TABLE}', content_rowid='routine_id',"
+            " tokenize='unicode61 remove_diacritics 0')"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {DOCUMENT_TABLE}"
+            f" BEGIN {insert_new} END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {DOCUMENT_TABLE}"
+            f" BEGIN {delete_old} END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE ON {DOCUMENT_TABLE}"
+            f" BEGIN {delete_old} {insert_new} END"
+        )
+    elif vendor == "postgresql":
+        schema_editor.execute(
+            f"CREATE INDEX routine_search_vector_idx ON {DOCUMENT_TABLE}"
+            f" USING GIN ({VECTOR})"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        for suffix in ["ai", "ad", "au"]:
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    elif vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS routine_search_vector_idx")
+
+
+def index_existing_routines(apps, schema_editor):
+    """
+    기존 루틴의 검색 문서를 생성한다. (이후에는 루틴 생성, 수정 시 갱신)
+    """
+    from my_health_info.search import make_document_terms
+
+    Routine = apps.get_model("my_health_info", "Routine")
+    ExerciseInRoutine = apps.get_model("my_health_info", "ExerciseInRoutine")
+    RoutineSearchDocument = apps.get_model("my_health_info", "RoutineSearchDocument")
+
+    exercise_titles = {}
+    rows = (
+        ExerciseInRoutine.objects.filter(routine__isnull=False)
+        .order_by("routine_id", "order")
+        .values_list("routine_id", "exercise__title")
+    )
+    for routine_id, title in rows.iterator(chunk_size=2000):
+        exercise_titles.setdefault(routine_id, []).append(title)
+
+    documents = []
+    for routine in Routine.objects.select_related("author").iterator(chunk_size=1000):
+        documents.append(
+            RoutineSearchDocument(
+                routine=routine,
+                title_terms=make_document_terms(routine.title),
+                author_terms=make_document_terms(
+                    routine.author.username if routine.author else ""
+                ),
+                exercise_terms=make_document_terms(
+                    " ".join(exercise_titles.get(routine.id, []))
+                ),
+            )
+        )
+    RoutineSearchDocument.objects.bulk_create(documents, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("my_health_info", "0007_sync_updated_at_tombstone"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RoutineSearchDocument",
+            fields=[
+                (
+                    "routine",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="my_health_info.routine",
+                    ),
+                ),
+                ("title_terms", models.TextField(blank=True)),
+                ("author_terms", models.TextField(blank=True)),
+                ("exercise_terms", models.TextField(blank=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(index_existing_routines, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.4 on 2026-10-18 05:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("my_health_info", "0008_routine_search_document"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="routine",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name="routine",
+            index=models.Index(fields=["updated_at"], name="routine_updated_idx"),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.4 on 2026-10-18 06:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("my_health_info", "0009_routine_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="subscriberfanoutjob",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name="subscriberfanoutjob",
+            index=models.Index(
+                fields=["status", "updated_at"], name="fan_out_status_idx"
+            ),
+        ),
+    ]
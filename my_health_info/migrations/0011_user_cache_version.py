@@ -0,0 +1,32 @@
+# Generated by Django 5.0.4 on 2026-10-18 06:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("my_health_info", "0010_subscriber_fan_out_job_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserCacheVersion",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="cache_version",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("health_info", models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-18 07:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("my_health_info", "0011_user_cache_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="usercacheversion",
+            name="weekly_schedule",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
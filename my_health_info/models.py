@@ -1,9 +1,35 @@
 from django.db import models
+from django.utils import timezone
 
 from account.models import CustomUser as User
 from exercises_info.models import ExercisesInfo
 
 
+class SyncTrackedQuerySet(models.QuerySet):
+    """
+    동기화 대상 모델(sync_name이 있는 모델)의 QuerySet
+
+    - update()는 updated_at을 함께 갱신한다. (auto_now는 save()에서만 갱신되기 때문)
+    - delete()는 삭제되는 행의 SyncTombstone을 한 번의 INSERT로 남긴다.
+      행마다 post_delete 시그널에서 남기지 않으므로 삭제하는 행 수와 관계없이 쿼리 수가 일정하다.
+    """
+
+    def update(self, **kwargs):
+        kwargs.setdefault("updated_at", timezone.now())
+        return super().update(**kwargs)
+
+    def delete(self):
+        tombstones = [
+            SyncTombstone(
+                user_id=user_id, model=self.model.sync_name, object_id=object_id
+            )
+            for object_id, user_id in self.values_list("id", "user_id")
+        ]
+        deleted = super().delete()
+        SyncTombstone.objects.bulk_create(tombstones)
+        return deleted
+
+
 class HealthInfo(models.Model):
     """
     유저의 건강 정보를 저장하는 모델
@@ -13,6 +39,7 @@ class HealthInfo(models.Model):
     height: 키
     weight: 몸무게
     date: 건강 정보 생성일
+    updated_at: 마지막 수정 시각 (동기화용)
     """
 
     user = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -20,9 +47,14 @@ class HealthInfo(models.Model):
     height = models.FloatField()
     weight = models.FloatField()
     date = models.DateField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = SyncTrackedQuerySet.as_manager()
+    sync_name = "health_info"
 
     class Meta:
         unique_together = ["user", "date"]
+        indexes = [models.Index(fields=["user", "updated_at"])]
 
     def __str__(self):
         return f"{self.user.username}의 건강 정보"
@@ -35,6 +67,7 @@ class Routine(models.Model):
     author: 루틴의 작성자
     title: 루틴 제목
     created_at: 루틴 생성일
+    updated_at: 루틴 제목, 운동, 삭제 여부가 마지막으로 변경된 시각 (좋아요 수 변경은 포함하지 않음)
     liked_users: 루틴을 좋아하는 유저
     like_count: 루틴 좋아요 수
     """
@@ -44,6 +77,7 @@ class Routine(models.Model):
     )
     title = models.CharField(max_length=50)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     is_deleted = models.BooleanField(default=False)
     liked_users = models.ManyToManyField(
         User,
@@ -51,6 +85,19 @@ class Routine(models.Model):
     )
     like_count = models.PositiveIntegerField(default=0)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["is_deleted", "like_count", "created_at"],
+                name="routine_feed_like_idx",
+            ),
+            models.Index(
+                fields=["is_deleted", "created_at"],
+                name="routine_feed_created_idx",
+            ),
+            models.Index(fields=["updated_at"], name="routine_updated_idx"),
+        ]
+
     def __str__(self):
         return f"{self.author.username}이 작성한 루틴: {self.title}, 좋아요 수: {self.like_count}"
 
@@ -65,6 +112,8 @@ class MirroredRoutine(models.Model):
     title: 루틴 제목
     author_name: 루틴 작성자 이름
     original_routine: 원본 루틴
+    content_hash: 원본 루틴 id, 제목, 작성자 이름, 순서대로 정렬된 운동과 수행 정보로 계산한 해시
+                  (같은 내용의 스냅샷을 중복 생성하지 않고 재사용하기 위해 사용)
     """
 
     title = models.CharField(max_length=50)
@@ -72,6 +121,7 @@ class MirroredRoutine(models.Model):
     original_routine = models.OneToOneField(
         Routine, related_name="mirrored_routine", on_delete=models.SET_NULL, null=True
     )
+    content_hash = models.CharField(max_length=64, unique=True, null=True)
 
     def __str__(self):
         return f"{self.author_name}의 루틴: {self.title}"
@@ -153,6 +203,7 @@ class UsersRoutine(models.Model):
     routine: 루틴
     mirrored_routine: 복제된 루틴
     need_update: 루틴 업데이트 필요 여부
+    updated_at: 마지막 수정 시각 (동기화용)
     """
 
     user = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -169,9 +220,14 @@ class UsersRoutine(models.Model):
         on_delete=models.CASCADE,
     )
     need_update = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = SyncTrackedQuerySet.as_manager()
+    sync_name = "users_routine"
 
     class Meta:
         unique_together = (("user", "routine"), ("user", "mirrored_routine"))
+        indexes = [models.Index(fields=["user", "updated_at"])]
 
     def __str__(self):
         if self.routine:
@@ -187,14 +243,20 @@ class WeeklyRoutine(models.Model):
     user: 유저
     users_routine: 유저가 소유한 루틴
     day_index: 요일 인덱스(0: 월요일, 1: 화요일, ..., 6: 일요일)
+    updated_at: 마지막 수정 시각 (동기화용)
     """
 
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     users_routine = models.ForeignKey(UsersRoutine, on_delete=models.CASCADE)
     day_index = models.PositiveIntegerField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = SyncTrackedQuerySet.as_manager()
+    sync_name = "weekly_routine"
 
     class Meta:
         unique_together = ["user", "day_index"]
+        indexes = [models.Index(fields=["user", "updated_at"])]
 
     def __str__(self):
         return f"{self.user.username}의 {self.day_index}번째 요일 루틴: {self.users_routine.mirrored_routine.title}"
@@ -207,6 +269,7 @@ class RoutineStreak(models.Model):
     user: 유저
     date: 날짜
     mirrored_routine: 해당 날짜에 수행된 복제된 루틴
+    updated_at: 마지막 수정 시각 (동기화용)
     """
 
     user = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -214,9 +277,165 @@ class RoutineStreak(models.Model):
     mirrored_routine = models.ForeignKey(
         MirroredRoutine, on_delete=models.SET_NULL, null=True
     )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = SyncTrackedQuerySet.as_manager()
+    sync_name = "routine_streak"
 
     class Meta:
         unique_together = ["user", "date"]
+        indexes = [models.Index(fields=["user", "updated_at"])]
 
     def __str__(self):
         return f"{self.user.username}가 {self.date}날짜에 {self.mirrored_routine.title} 루틴 수행"
+
+
+class RoutineStreakSummary(models.Model):
+    """
+    유저의 루틴 수행 기록을 요약하여 저장하는 모델
+
+    설계 목적: 루틴 수행 기록이 생성될 때마다 점진적으로 갱신하여,
+    전체 기록을 조회하지 않고 하나의 행으로 연속 수행 일수를 확인하기 위함
+
+    user: 유저
+    current_streak: last_date까지 연속으로 루틴을 수행한 일수
+    longest_streak: 가장 길게 연속으로 루틴을 수행한 일수
+    last_date: 마지막으로 루틴을 수행한 날짜
+    total_days: 루틴을 수행한 총 일수
+    """
+
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, related_name="routine_streak_summary"
+    )
+    current_streak = models.PositiveIntegerField(default=0)
+    longest_streak = models.PositiveIntegerField(default=0)
+    last_date = models.DateField(null=True)
+    total_days = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user.username}의 루틴 수행 요약: 연속 {self.current_streak}일, 최장 {self.longest_streak}일"
+
+
+class SubscriberFanOutJob(models.Model):
+    """
+    루틴이 수정되었을 때 구독자들의 need_update를 변경하는 작업의 진행 상황을 저장하는 모델
+
+    routine: 수정된 루틴
+    excluded_users_routine: 변경 대상에서 제외할 작성자의 UsersRoutine id
+    status: 작업 상태
+    total: 변경 대상 구독자 수
+    processed: 변경이 완료된 구독자 수
+    last_processed_id: 마지막으로 처리한 UsersRoutine id
+    created_at: 작업 생성일
+    updated_at: 작업 상태, 진행 상황의 마지막 변경일 (실행 중인 작업이 중단되었는지 판단하는 데 사용)
+    finished_at: 작업 완료일
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        RUNNING = "running"
+        DONE = "done"
+        FAILED = "failed"
+
+    routine = models.ForeignKey(
+        Routine, related_name="fan_out_jobs", on_delete=models.CASCADE
+    )
+    excluded_users_routine = models.PositiveBigIntegerField(null=True)
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    last_processed_id = models.PositiveBigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "updated_at"], name="fan_out_status_idx")
+        ]
+
+    def __str__(self):
+        return f"{self.routine_id}번 루틴 구독자 업데이트: {self.processed}/{self.total} ({self.status})"
+
+
+class SyncTombstone(models.Model):
+    """
+    동기화 대상 모델의 삭제 기록을 저장하는 모델
+
+    설계 목적: 삭제된 행은 updated_at으로 추적할 수 없으므로,
+    삭제 시점에 남긴 기록으로 클라이언트에 삭제된 id를 전달하기 위함
+
+    user: 삭제된 행의 유저
+    model: 삭제된 행의 모델 이름 (health_info, users_routine, weekly_routine, routine_streak)
+    object_id: 삭제된 행의 id
+    deleted_at: 삭제 시각
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    model = models.CharField(max_length=30)
+    object_id = models.PositiveBigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["user", "deleted_at"])]
+
+    def __str__(self):
+        return f"{self.user_id}번 유저의 {self.model} {self.object_id} 삭제 기록"
+
+
+class RoutineSearchDocument(models.Model):
+    """
+    루틴 검색에 사용할 검색어 문서를 저장하는 모델
+
+    설계 목적: 루틴 제목, 작성자 username, 현재 스냅샷에 포함된 운동 제목을
+    미리 n-gram으로 분해하여 저장하고, DB의 전문 검색 인덱스로 조회하기 위함
+    (SQLite는 FTS5 가상 테이블, PostgreSQL은 tsvector GIN 인덱스를 사용하며 마이그레이션에서 생성)
+
+    routine: 검색 대상 루틴
+    title_terms: 루틴 제목의 검색어 (공백으로 구분)
+    author_terms: 작성자 username의 검색어 (공백으로 구분)
+    exercise_terms: 루틴에 포함된 운동 제목의 검색어 (공백으로 구분)
+    updated_at: 마지막으로 색인된 시각
+    """
+
+    routine = models.OneToOneField(
+        Routine,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="search_document",
+    )
+    title_terms = models.TextField(blank=True)
+    author_terms = models.TextField(blank=True)
+    exercise_terms = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.routine_id}번 루틴의 검색 문서"
+
+
+class UserCacheVersion(models.Model):
+    """
+    유저별 캐시의 버전을 저장하는 모델
+
+    설계 목적: 캐시 키에 버전을 포함하고 데이터가 변경될 때 버전을 올려,
+    프로세스 내 캐시(LocMemCache)를 사용하더라도 모든 프로세스가 이전 버전의 캐시를 읽지 않도록 하기 위함
+    (버전은 my_health_info.caches.UserVersionedCache에서 F() + 1로만 증가시킴)
+
+    user: 유저
+    health_info: 건강 정보 캐시(health_info_cache)의 버전
+    weekly_schedule: 주간 루틴 일정 캐시(weekly_schedule_cache)의 버전
+    """
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="cache_version",
+    )
+    health_info = models.PositiveBigIntegerField(default=0)
+    weekly_schedule = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user_id}번 유저의 캐시 버전"
@@ -0,0 +1,188 @@
+import base64
+import datetime
+import json
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import FloatField, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    정렬 키의 마지막 값을 커서로 사용하는 Keyset 페이지네이션
+
+    OFFSET 대신 마지막 행의 정렬 키 튜플(예: like_count, created_at, id)을
+    커서로 인코딩하고, 다음 페이지는 해당 튜플 "이후"의 행만 WHERE 조건으로 조회한다.
+    정렬 키에 맞는 인덱스가 있다면 N 번째 페이지도 첫 페이지와 같은 비용으로 조회된다.
+
+    응답 본문은 기존과 같은 리스트 형태를 유지하고,
+    다음 페이지의 주소는 Link 헤더(rel="next")로 전달한다.
+    """
+
+    page_size = 20
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    tiebreaker_field = "id"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        쿼리셋에서 커서 이후의 한 페이지를 잘라 반환
+
+        1. 쿼리셋의 정렬 기준 뒤에 tiebreaker(-id)를 붙여 정렬 키를 고유하게 만듦
+        2. 커서가 있다면 디코딩하여 정렬 키 튜플 이후의 행만 필터링
+        3. page_size + 1개를 조회하여 다음 페이지 존재 여부를 판단
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+
+        queryset = queryset.order_by(*self.ordering)
+
+        encoded_cursor = request.query_params.get(self.cursor_query_param)
+        if encoded_cursor:
+            values = self.decode_cursor(encoded_cursor, queryset.model)
+            queryset = queryset.filter(self.get_keyset_filter(values))
+
+        results = list(queryset[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+
+        return self.page
+
+    def get_paginated_response(self, data):
+        headers = {}
+        next_link = self.get_next_link()
+        if next_link:
+            headers["Link"] = f'<{next_link}>; rel="next"'
+
+        return Response(data, headers=headers)
+
+    def get_page_size(self, request):
+        page_size = request.query_params.get(self.page_size_query_param)
+        if not page_size:
+            return self.page_size
+
+        try:
+            page_size = int(page_size)
+        except ValueError:
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, queryset):
+        """
+        쿼리셋의 정렬 기준을 가져와 tiebreaker를 붙인 정렬 키를 반환
+        """
+        ordering = list(queryset.query.order_by) or [f"-{self.tiebreaker_field}"]
+
+        if not any(field.lstrip("-") == self.tiebreaker_field for field in ordering):
+            descending = ordering[-1].startswith("-")
+            ordering.append(f"{'-' if descending else ''}{self.tiebreaker_field}")
+
+        return ordering
+
+    def get_keyset_filter(self, values):
+        """
+        정렬 키 튜플 (v1, v2, ..., vn) 이후의 행을 찾는 Q 객체를 반환
+
+        (f1 > v1) OR (f1 = v1 AND f2 > v2) OR ... 형태로 확장하며,
+        내림차순 필드는 > 대신 < 를 사용한다.
+        """
+        keyset_filter = Q()
+        equal_filter = {}
+
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+
+            keyset_filter |= Q(**equal_filter, **{f"{name}__{lookup}": value})
+            equal_filter[name] = value
+
+        return keyset_filter
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        last_row = self.page[-1]
+        values = [getattr(last_row, field.lstrip("-")) for field in self.ordering]
+
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.page_size)
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(values)
+        )
+
+    def encode_cursor(self, values):
+        """
+        정렬 키 값 리스트를 커서 문자열로 인코딩
+
+        DjangoJSONEncoder는 datetime을 밀리초까지만 남기므로, 같은 밀리초에 생성된 행이
+        페이지 경계에서 누락되지 않도록 datetime은 마이크로초까지 isoformat()으로 인코딩한다.
+        """
+        values = [
+            value.isoformat() if isinstance(value, datetime.datetime) else value
+            for value in values
+        ]
+        payload = json.dumps(
+            {"o": self.ordering, "v": values},
+            cls=DjangoJSONEncoder,
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, encoded_cursor, model):
+        """
+        커서를 디코딩하여 정렬 키 값 리스트를 반환
+
+        커서가 만들어질 때의 정렬 기준과 현재 정렬 기준이 다르거나
+        값을 해석할 수 없다면 404 에러를 발생시킨다.
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded_cursor.encode()))
+            if payload["o"] != self.ordering:
+                raise NotFound(self.invalid_cursor_message)
+
+            return [
+                self.get_cursor_field(model, field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, payload["v"], strict=True)
+            ]
+        except (TypeError, ValueError, KeyError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_cursor_field(self, model, name):
+        """
+        커서 값을 해석할 필드를 반환 (annotate한 값으로 정렬한다면 하위 클래스에서 지정)
+        """
+        return model._meta.get_field(name)
+
+
+class RoutineCursorPagination(KeysetCursorPagination):
+    """
+    루틴 피드(-like_count, -created_at, -id 정렬)를 위한 페이지네이션
+    """
+
+    page_size = 20
+
+
+class RoutineSearchCursorPagination(KeysetCursorPagination):
+    """
+    루틴 검색 결과(-search_rank, -id 정렬)를 위한 페이지네이션
+
+    search_rank는 모델 필드가 아닌 검색 순위 annotation이므로 커서 값을 float로 해석한다.
+    """
+
+    page_size = 20
+
+    def get_cursor_field(self, model, name):
+        if name == "search_rank":
+            return FloatField()
+        return super().get_cursor_field(model, name)
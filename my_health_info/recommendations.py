@@ -0,0 +1,225 @@
+import datetime
+import threading
+from collections import defaultdict
+
+import numpy as np
+from django.utils import timezone
+
+from exercises_info.models import ExercisesInfo
+from my_health_info.models import ExerciseInRoutine, Routine, UsersRoutine
+
+
+class RoutineVectorIndex:
+    """
+    루틴의 현재 MirroredRoutine을 운동, 운동 부위 벡터로 표현하여 유사한 루틴을 찾는 프로세스 내 인덱스
+
+    - 특성(열)은 ExercisesInfo id와 FocusArea id이며, 처음 등장할 때 열을 추가한다.
+      운동 특성의 값은 루틴에 포함된 횟수, 운동 부위 특성의 값은 해당 부위 운동 수 x focus_weight이다.
+    - 각 행은 L2 정규화되어 있으므로 행렬과 질의 벡터의 곱 한 번으로 전체 루틴과의 코사인 유사도를 구한다.
+      (10만 개 루틴 x 수백 개 특성도 행렬-벡터 곱 한 번이므로 수 ms 안에 계산된다.)
+    - 행렬은 용량이 부족할 때마다 두 배로 늘리고, 삭제된 루틴의 행은 0으로 비워 재사용한다.
+    - 각 프로세스(gunicorn worker)는 질의 전에 refresh()로 마지막 동기화 이후 updated_at이 바뀐 루틴만 다시 계산한다.
+      따라서 다른 프로세스에서 생성, 수정된 루틴도 다음 질의에 반영된다.
+      조회 중에 커밋된 트랜잭션을 놓치지 않도록 sync_overlap만큼 겹쳐서 조회한다.
+    - 삭제된 루틴은 updated_at으로 찾을 수 없으므로, 결과를 DB에서 조회할 때 없는 루틴을 discard()로 제거한다.
+    """
+
+    focus_weight = 0.5
+    initial_capacity = 1024
+    batch_size = 2000
+    sync_overlap = datetime.timedelta(seconds=5)
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.clear()
+
+    def __len__(self):
+        return len(self.rows)
+
+    def clear(self):
+        with self._lock:
+            self.columns = {}
+            self.matrix = np.zeros((self.initial_capacity, 64), dtype=np.float32)
+            self.routine_ids = np.zeros(self.initial_capacity, dtype=np.int64)
+            self.rows = {}
+            self.free_rows = []
+            self.size = 0
+            self.synced_at = None
+
+    def refresh(self):
+        """
+        마지막 동기화 이후 변경된 루틴만 다시 계산하는 메서드 (처음이라면 전체 루틴)
+
+        변경된 루틴이 없다면 updated_at 인덱스를 사용하는 쿼리 한 번으로 끝난다.
+        """
+        with self._lock:
+            started_at = timezone.now()
+            routines = Routine.objects.order_by("id")
+            if self.synced_at is not None:
+                routines = routines.filter(
+                    updated_at__gte=self.synced_at - self.sync_overlap
+                )
+
+            routine_ids = list(routines.values_list("id", flat=True))
+            for start in range(0, len(routine_ids), self.batch_size):
+                self.update(routine_ids[start : start + self.batch_size])
+
+            self.synced_at = started_at
+
+    def update(self, routine_ids):
+        """
+        주어진 루틴들의 벡터를 다시 계산하여 행렬에 반영하는 메서드
+
+        1. 삭제되지 않은 루틴의 현재 MirroredRoutine에 포함된 운동 id를 한 번에 조회
+        2. 운동들의 운동 부위 id를 한 번에 조회
+        3. 루틴별 특성 벡터를 만들어 L2 정규화 후 행에 저장 (운동이 없거나 삭제된 루틴은 제거)
+        """
+        routine_ids = list(routine_ids)
+
+        exercises = defaultdict(list)
+        rows = ExerciseInRoutine.objects.filter(
+            mirrored_routine__original_routine_id__in=routine_ids,
+            mirrored_routine__original_routine__is_deleted=False,
+        ).values_list("mirrored_routine__original_routine_id", "exercise_id")
+        for routine_id, exercise_id in rows:
+            exercises[routine_id].append(exercise_id)
+
+        focus_areas = defaultdict(list)
+        exercise_ids = {
+            exercise_id for ids in exercises.values() for exercise_id in ids
+        }
+        rows = ExercisesInfo.focus_areas.through.objects.filter(
+            exercisesinfo_id__in=exercise_ids
+        ).values_list("exercisesinfo_id", "focusarea_id")
+        for exercise_id, focus_area_id in rows:
+            focus_areas[exercise_id].append(focus_area_id)
+
+        with self._lock:
+            for routine_id in routine_ids:
+                if routine_id not in exercises:
+                    self.discard([routine_id])
+                    continue
+
+                features = defaultdict(float)
+                for exercise_id in exercises[routine_id]:
+                    features[("exercise", exercise_id)] += 1.0
+                    for focus_area_id in focus_areas[exercise_id]:
+                        features[("focus_area", focus_area_id)] += self.focus_weight
+
+                self.set_row(routine_id, self.to_vector(features))
+
+    def discard(self, routine_ids):
+        """
+        주어진 루틴들의 행을 비우고 재사용할 수 있도록 반환하는 메서드
+        """
+        with self._lock:
+            for routine_id in routine_ids:
+                row = self.rows.pop(routine_id, None)
+                if row is not None:
+                    self.matrix[row] = 0
+                    self.routine_ids[row] = 0
+                    self.free_rows.append(row)
+
+    def similar(self, routine_id, k=10):
+        """
+        routine_id와 가장 유사한 루틴 k개를 (루틴 id, 유사도) 리스트로 반환하는 메서드
+        """
+        with self._lock:
+            row = self.rows.get(routine_id)
+            if row is None:
+                return []
+            return self.nearest(self.matrix[row].copy(), k, exclude=[routine_id])
+
+    def recommend(self, user, k=10):
+        """
+        유저가 보유한 루틴들의 벡터 합과 가장 유사한 루틴 k개를 (루틴 id, 유사도) 리스트로 반환하는 메서드
+
+        이미 보유한 루틴(작성, 구독)은 결과에서 제외한다.
+        """
+        owned_ids = set(
+            UsersRoutine.objects.filter(user=user, routine__isnull=False).values_list(
+                "routine_id", flat=True
+            )
+        )
+
+        with self._lock:
+            rows = [
+                self.rows[owned_id] for owned_id in owned_ids if owned_id in self.rows
+            ]
+            if not rows:
+                return []
+            profile = self.matrix[rows].sum(axis=0)
+            return self.nearest(profile, k, exclude=owned_ids)
+
+    def nearest(self, vector, k, exclude=()):
+        """
+        질의 벡터와 코사인 유사도가 가장 높은 루틴 k개를 반환하는 메서드
+
+        1. 정규화된 전체 행렬과 질의 벡터를 한 번에 곱하여 유사도 계산
+        2. 제외할 루틴과 유사도가 0 이하인 행을 제거
+        3. argpartition으로 상위 k개만 고른 뒤 유사도, id 순으로 정렬
+        """
+        norm = np.linalg.norm(vector)
+        if norm == 0 or k <= 0:
+            return []
+
+        scores = self.matrix[: self.size] @ (vector / norm)
+        for routine_id in exclude:
+            row = self.rows.get(routine_id)
+            if row is not None:
+                scores[row] = 0
+
+        candidates = np.flatnonzero(scores > 1e-6)
+        if len(candidates) > k:
+            top = np.argpartition(-scores[candidates], k - 1)[:k]
+            candidates = candidates[top]
+
+        ranked = sorted(
+            candidates,
+            key=lambda row: (-scores[row], -self.routine_ids[row]),
+        )
+        return [(int(self.routine_ids[row]), float(scores[row])) for row in ranked]
+
+    def to_vector(self, features):
+        """
+        특성 dict를 L2 정규화된 벡터로 변환하는 메서드 (처음 등장한 특성은 열을 추가)
+        """
+        vector = np.zeros(self.matrix.shape[1], dtype=np.float32)
+        for feature, value in features.items():
+            column = self.columns.get(feature)
+            if column is None:
+                column = self.add_column(feature)
+                if column >= len(vector):
+                    vector = np.pad(vector, (0, self.matrix.shape[1] - len(vector)))
+            vector[column] = value
+
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def add_column(self, feature):
+        column = len(self.columns)
+        if column >= self.matrix.shape[1]:
+            self.matrix = np.pad(self.matrix, ((0, 0), (0, self.matrix.shape[1])))
+        self.columns[feature] = column
+        return column
+
+    def set_row(self, routine_id, vector):
+        row = self.rows.get(routine_id)
+        if row is None:
+            if self.free_rows:
+                row = self.free_rows.pop()
+            else:
+                row = self.size
+                self.size += 1
+                if row >= len(self.matrix):
+                    self.matrix = np.pad(self.matrix, ((0, len(self.matrix)), (0, 0)))
+                    self.routine_ids = np.pad(
+                        self.routine_ids, (0, len(self.routine_ids))
+                    )
+            self.rows[routine_id] = row
+            self.routine_ids[row] = routine_id
+
+        self.matrix[row] = vector
+
+
+routine_vector_index = RoutineVectorIndex()
@@ -0,0 +1,225 @@
+import re
+import unicodedata
+from collections import defaultdict
+
+from django.db import connection
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+from my_health_info.models import ExerciseInRoutine, Routine, RoutineSearchDocument
+
+# 마이그레이션(0008_routine_search_document)에서 생성하는 검색 인덱스 이름
+SQLITE_FTS_TABLE = "my_health_info_routine_search_fts"
+POSTGRESQL_VECTOR = (
+    "(setweight(array_to_tsvector(string_to_array(title_terms, ' ')), 'A')"
+    " || setweight(array_to_tsvector(string_to_array(author_terms, ' ')), 'B')"
+    " || setweight(array_to_tsvector(string_to_array(exercise_terms, ' ')), 'C'))"
+)
+
+# 문자, 숫자가 연속된 구간을 하나의 단어로 취급 (밑줄은 구분자)
+word_pattern = re.compile(r"[^\W_]+")
+
+
+def split_words(text):
+    """
+    문자열을 NFKC 정규화, 소문자 변환 후 단어 리스트로 분리하는 함수
+
+    NFKC 정규화로 전각 문자와 조합형 한글 자모가 완성형으로 통일된다.
+    """
+    return word_pattern.findall(unicodedata.normalize("NFKC", text or "").lower())
+
+
+def make_document_terms(text):
+    """
+    문서에 저장할 검색어를 공백으로 구분된 문자열로 반환하는 함수
+
+    한국어는 공백 단위 토큰화로는 "벤치프레스"에서 "프레스"를 찾을 수 없으므로,
+    단어마다 모든 글자(unigram)와 인접한 두 글자(bigram)를 검색어로 저장한다.
+    """
+    terms = []
+    for word in split_words(text):
+        terms += list(word)
+        terms += [word[i : i + 2] for i in range(len(word) - 1)]
+    return " ".join(terms)
+
+
+def make_query_terms(text, max_terms=32):
+    """
+    검색어 문자열을 문서에서 모두 찾아야 하는 검색어 리스트로 반환하는 함수
+
+    한 글자 단어는 unigram으로, 두 글자 이상인 단어는 bigram들로 분해하며
+    중복은 제거하고 최대 max_terms개까지만 사용한다.
+    """
+    terms = []
+    for word in split_words(text):
+        if len(word) == 1:
+            candidates = [word]
+        else:
+            candidates = [word[i : i + 2] for i in range(len(word) - 1)]
+
+        for term in candidates:
+            if term not in terms:
+                terms.append(term)
+
+    return terms[:max_terms]
+
+
+class RoutineSearchIndex:
+    """
+    루틴 전문 검색 인덱스를 관리하고 조회하는 클래스
+
+    - update(routine_ids)로 주어진 루틴의 검색 문서만 다시 계산하여 upsert 한다.
+      루틴 생성, 수정 시 호출되며 루틴 개수와 관계없이 일정한 수의 쿼리로 동작한다.
+    - 전문 검색 인덱스는 DB에 따라 다르게 동작한다.
+      - SQLite: RoutineSearchDocument를 content 테이블로 사용하는 FTS5 가상 테이블 (트리거로 동기화)
+        bm25(title 10, author 5, exercise 1 가중치)로 순위를 계산한다.
+      - PostgreSQL: 검색 문서의 가중치 tsvector에 대한 GIN 인덱스, ts_rank로 순위를 계산한다.
+      - 그 외: 검색어 포함 여부로만 필터링하며 순위는 모두 같다.
+    - filter(queryset, query)는 Routine 쿼리셋에 검색 조건과 search_rank(클수록 관련도가 높음)를 추가한다.
+    """
+
+    rank_annotation = "search_rank"
+    batch_size = 500
+
+    def document_for(self, routine, exercise_titles):
+        return RoutineSearchDocument(
+            routine=routine,
+            title_terms=make_document_terms(routine.title),
+            author_terms=make_document_terms(
+                routine.author.username if routine.author else ""
+            ),
+            exercise_terms=make_document_terms(" ".join(exercise_titles)),
+        )
+
+    def update(self, routine_ids):
+        """
+        주어진 루틴들의 검색 문서를 다시 계산하여 저장하는 메서드
+
+        1. 루틴과 작성자를 한 번에 조회
+        2. 루틴에 현재 연결된 ExerciseInRoutine의 운동 제목을 한 번에 조회
+        3. 검색 문서를 bulk_create(update_conflicts=True)로 저장
+           (SQLite에서는 트리거가 FTS5 인덱스도 함께 갱신)
+        """
+        routine_ids = list(routine_ids)
+        updated = 0
+
+        for start in range(0, len(routine_ids), self.batch_size):
+            batch_ids = routine_ids[start : start + self.batch_size]
+            routines = Routine.objects.filter(id__in=batch_ids).select_related("author")
+
+            exercise_titles = defaultdict(list)
+            rows = (
+                ExerciseInRoutine.objects.filter(routine_id__in=batch_ids)
+                .order_by("routine_id", "order")
+                .values_list("routine_id", "exercise__title")
+            )
+            for routine_id, title in rows:
+                exercise_titles[routine_id].append(title)
+
+            documents = [
+                self.document_for(routine, exercise_titles[routine.id])
+                for routine in routines
+            ]
+            RoutineSearchDocument.objects.bulk_create(
+                documents,
+                update_conflicts=True,
+                unique_fields=["routine"],
+                update_fields=[
+                    "title_terms",
+                    "author_terms",
+                    "exercise_terms",
+                    "updated_at",
+                ],
+            )
+            updated += len(documents)
+
+        return updated
+
+    def rebuild(self):
+        """
+        모든 루틴의 검색 문서를 다시 계산하는 메서드
+
+        SQLite에서는 검색 문서 테이블에서 FTS5 인덱스를 다시 만들어,
+        트리거 밖에서 변경된 행이 있더라도 인덱스가 문서와 일치하도록 한다.
+        """
+        updated = self.update(
+            Routine.objects.order_by("id").values_list("id", flat=True)
+        )
+
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')"
+                )
+
+        return updated
+
+    def filter(self, queryset, query):
+        """
+        Routine 쿼리셋을 검색어와 일치하는 루틴으로 필터링하고 search_rank를 추가하는 메서드
+
+        검색어를 make_query_terms로 분해하여 모든 검색어를 포함하는 루틴만 반환한다.
+        """
+        terms = make_query_terms(query)
+        if not terms:
+            return queryset.none()
+
+        if connection.vendor == "sqlite":
+            return self.filter_sqlite(queryset, terms)
+        if connection.vendor == "postgresql":
+            return self.filter_postgresql(queryset, terms)
+        return self.filter_fallback(queryset, terms)
+
+    def filter_sqlite(self, queryset, terms):
+        expression = " ".join(f'"{term}"' for term in terms)
+        routine_table = Routine._meta.db_table
+
+        matched_ids = RawSQL(
+            f"SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s",
+            [expression],
+        )
+        rank = RawSQL(
+            f"SELECT -bm25({SQLITE_FTS_TABLE}, 10.0, 5.0, 1.0) FROM {SQLITE_FTS_TABLE}"
+            f" WHERE {SQLITE_FTS_TABLE} MATCH %s"
+            f' AND rowid = "{routine_table}"."id"',
+            [expression],
+            output_field=FloatField(),
+        )
+        return queryset.filter(id__in=matched_ids).annotate(
+            **{self.rank_annotation: rank}
+        )
+
+    def filter_postgresql(self, queryset, terms):
+        expression = " & ".join(f"'{term}'" for term in terms)
+        document_table = RoutineSearchDocument._meta.db_table
+        routine_table = Routine._meta.db_table
+
+        matched_ids = RawSQL(
+            f"SELECT routine_id FROM {document_table}"
+            f" WHERE {POSTGRESQL_VECTOR} @@ %s::tsquery",
+            [expression],
+        )
+        rank = RawSQL(
+            f"SELECT ts_rank({POSTGRESQL_VECTOR}, %s::tsquery) FROM {document_table}"
+            f' WHERE routine_id = "{routine_table}"."id"',
+            [expression],
+            output_field=FloatField(),
+        )
+        return queryset.filter(id__in=matched_ids).annotate(
+            **{self.rank_annotation: rank}
+        )
+
+    def filter_fallback(self, queryset, terms):
+        condition = Q()
+        for term in terms:
+            condition &= (
+                Q(search_document__title_terms__contains=term)
+                | Q(search_document__author_terms__contains=term)
+                | Q(search_document__exercise_terms__contains=term)
+            )
+        return queryset.filter(condition).annotate(
+            **{self.rank_annotation: Value(0.0, output_field=FloatField())}
+        )
+
+
+routine_search_index = RoutineSearchIndex()
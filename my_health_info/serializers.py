@@ -1,19 +1,29 @@
+import datetime
+from collections import defaultdict
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Prefetch
+from django.utils.functional import cached_property
 from django.utils import timezone
 from drf_writable_nested import WritableNestedModelSerializer
 from rest_framework import serializers
 
+from exercises_info.catalog import exercises_catalog
 from exercises_info.models import ExercisesInfo
 from exercises_info.serializers import ExercisesInfoSerializer
+from my_health_info.caches import mirrored_routine_cache
 from my_health_info.models import (
     ExerciseInRoutine,
     HealthInfo,
     MirroredRoutine,
     Routine,
     RoutineStreak,
+    RoutineStreakSummary,
     UsersRoutine,
     WeeklyRoutine,
     ExerciseInRoutineAttribute,
 )
+from my_health_info.search import make_query_terms
 
 
 class HealthInfoSerializer(serializers.ModelSerializer):
@@ -61,6 +71,172 @@ class HealthInfoSerializer(serializers.ModelSerializer):
         return data
 
 
+class HealthInfoTimeSeriesQuerySerializer(serializers.Serializer):
+    """
+    건강 정보 시계열 조회의 query parameter를 다루는 Serializer
+
+    필드:
+    - start: 조회 시작일, 기본값은 end의 365일 전
+    - end: 조회 종료일, 기본값은 오늘
+    - bucket: 집계 단위 (day, week, month), 기본값은 day
+    - window: 이동 평균을 계산할 구간 수 (1 ~ 365), 기본값은 7
+    """
+
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    bucket = serializers.ChoiceField(choices=["day", "week", "month"], default="day")
+    window = serializers.IntegerField(min_value=1, max_value=365, default=7)
+
+    default_days = 365
+
+    def validate(self, data):
+        """
+        유효성 검사를 수행하는 메서드
+
+        - start, end가 없다면 기본값으로 채움
+        - start가 end보다 이후라면 에러 발생
+        """
+        data.setdefault("end", timezone.localdate())
+        data.setdefault(
+            "start", data["end"] - datetime.timedelta(days=self.default_days)
+        )
+
+        if data["start"] > data["end"]:
+            raise serializers.ValidationError("start는 end보다 이후일 수 없습니다.")
+        return data
+
+
+class HistoryExportQuerySerializer(serializers.Serializer):
+    """
+    기록 내보내기의 query parameter를 다루는 Serializer
+
+    필드:
+    - export_format: 내보낼 형식 (csv, ndjson), 기본값은 csv
+    - scope: 내보낼 범위 (me: 내 기록, all: 전체 유저의 기록, 관리자만 가능), 기본값은 me
+    """
+
+    export_format = serializers.ChoiceField(choices=["csv", "ndjson"], default="csv")
+    scope = serializers.ChoiceField(choices=["me", "all"], default="me")
+
+
+class DashboardQuerySerializer(serializers.Serializer):
+    """
+    대시보드 조회의 query parameter를 다루는 Serializer
+
+    필드:
+    - include: 쉼표로 구분된 포함할 섹션 목록, 기본값은 전체 섹션
+      (health_info, routine_streak, weekly_routine, users_routine)
+    """
+
+    sections = ["health_info", "routine_streak", "weekly_routine", "users_routine"]
+
+    include = serializers.CharField(required=False)
+
+    def validate_include(self, value):
+        """
+        include를 섹션 목록으로 변환하는 메서드
+
+        - 존재하지 않는 섹션이 포함되어 있다면 에러 발생
+        """
+        include = [section.strip() for section in value.split(",") if section.strip()]
+
+        invalid = sorted(set(include) - set(self.sections))
+        if invalid:
+            raise serializers.ValidationError(
+                f"존재하지 않는 섹션입니다: {', '.join(invalid)}"
+            )
+        return include
+
+    def validate(self, data):
+        """
+        include가 없다면 전체 섹션으로 채움
+        """
+        data.setdefault("include", self.sections)
+        return data
+
+
+class SyncQuerySerializer(serializers.Serializer):
+    """
+    동기화의 query parameter를 다루는 Serializer
+
+    필드:
+    - token: 이전 동기화 응답의 토큰, 없다면 전체 동기화
+    """
+
+    token = serializers.CharField(required=False)
+
+
+class RoutineSearchQuerySerializer(serializers.Serializer):
+    """
+    루틴 검색의 query parameter를 다루는 Serializer
+
+    필드:
+    - q: 검색어 (루틴 제목, 작성자 username, 루틴에 포함된 운동 제목에서 검색)
+    """
+
+    q = serializers.CharField(max_length=100)
+
+    def validate_q(self, value):
+        if not make_query_terms(value):
+            raise serializers.ValidationError("검색할 수 있는 단어가 없습니다.")
+        return value
+
+
+class RoutineRecommendationQuerySerializer(serializers.Serializer):
+    """
+    유사한 루틴, 추천 루틴 조회의 query parameter를 다루는 Serializer
+
+    필드:
+    - limit: 반환할 루틴 수 (1 ~ 50, 기본값 10)
+    """
+
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=10)
+
+
+class RoutineBatchSubscriptionSerializer(serializers.Serializer):
+    """
+    여러 루틴을 한 번에 구독, 구독 취소하는 요청을 다루는 Serializer
+
+    필드:
+    - subscribe: 구독할 루틴 id 목록 (최대 max_batch_size개)
+    - unsubscribe: 구독 취소할 루틴 id 목록 (최대 max_batch_size개)
+    """
+
+    max_batch_size = 50
+
+    subscribe = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        max_length=max_batch_size,
+        default=list,
+    )
+    unsubscribe = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        max_length=max_batch_size,
+        default=list,
+    )
+
+    def validate(self, data):
+        """
+        유효성 검사를 수행하는 메서드
+
+        - 중복된 루틴 id는 처음 한 번만 남김
+        - 구독, 구독 취소할 루틴이 하나도 없다면 에러 발생
+        - 같은 루틴을 구독하면서 구독 취소한다면 에러 발생
+        """
+        data["subscribe"] = list(dict.fromkeys(data["subscribe"]))
+        data["unsubscribe"] = list(dict.fromkeys(data["unsubscribe"]))
+
+        if not data["subscribe"] and not data["unsubscribe"]:
+            raise serializers.ValidationError(
+                "구독 또는 구독 취소할 루틴이 필요합니다."
+            )
+        if set(data["subscribe"]) & set(data["unsubscribe"]):
+            raise serializers.ValidationError(
+                "같은 루틴을 구독하면서 구독 취소할 수 없습니다."
+            )
+        return data
+
+
 class ExerciseInRoutineAttributeSerializer(serializers.ModelSerializer):
     """
     ExerciseInRoutineSerializer에 사용되는 운동 정보 필드를 다루는 Serializer
@@ -107,12 +283,77 @@ class ExerciseInRoutineAttributeSerializer(serializers.ModelSerializer):
             return data
 
 
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    ListSerializer가 미리 조회해둔 객체로 DB 조회 없이 PK를 객체로 변환하는 필드
+
+    prefetched가 None이라면(미리 조회하지 않았다면) 기존처럼 queryset에서 조회하고,
+    딕셔너리라면 그 안에서만 찾아 없는 PK는 존재하지 않는 것으로 처리한다.
+    따라서 ListSerializer가 권한 등의 조건으로 걸러서 조회한 객체만 허용할 수 있다.
+    PK는 모델의 PK 필드로 변환하여 비교하므로, 문자열 PK("1")도 queryset 조회와 같이 허용된다.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.prefetched = None
+
+    def prefetch(self, queryset, values):
+        """
+        values 중 PK로 변환할 수 있는 값의 객체를 queryset에서 한 번의 쿼리로 조회하여 저장
+        """
+        pks = set()
+        for value in values:
+            try:
+                pks.add(self.to_pk(value))
+            except (TypeError, ValueError, DjangoValidationError):
+                continue
+        self.prefetched = queryset.in_bulk(pks)
+
+    def to_pk(self, data):
+        if isinstance(data, bool):
+            raise TypeError("bool is not a valid primary key")
+        return self.get_queryset().model._meta.pk.to_python(data)
+
+    def to_internal_value(self, data):
+        if self.prefetched is None or isinstance(data, bool):
+            return super().to_internal_value(data)
+
+        try:
+            pk = self.to_pk(data)
+        except (TypeError, ValueError, DjangoValidationError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+        try:
+            return self.prefetched[pk]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+
+
+class ExerciseInRoutineListSerializer(serializers.ListSerializer):
+    """
+    ExerciseInRoutine 목록을 검증하는 ListSerializer
+
+    요청에 포함된 운동 정보를 운동 속성과 함께 한 번의 쿼리로 미리 조회하여,
+    운동마다 조회 쿼리가 발생하지 않도록 한다.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            self.child.fields["exercise"].prefetch(
+                ExercisesInfo.objects.select_related("exercises_attribute"),
+                [item.get("exercise") for item in data if isinstance(item, dict)],
+            )
+
+        return super().to_internal_value(data)
+
+
 class ExerciseInRoutineSerializer(WritableNestedModelSerializer):
     """
     루틴에 포함된 운동 정보를 다루는 Serializer
     """
 
     exercise_attribute = ExerciseInRoutineAttributeSerializer()
+    exercise = PrefetchedPrimaryKeyRelatedField(queryset=ExercisesInfo.objects.all())
 
     class Meta:
         """
@@ -136,6 +377,7 @@ class ExerciseInRoutineSerializer(WritableNestedModelSerializer):
             "exercise_attribute",
         ]
         read_only_fields = ["routine", "mirrored_routine"]
+        list_serializer_class = ExerciseInRoutineListSerializer
 
     def validate(self, data):
         """
@@ -148,14 +390,44 @@ class ExerciseInRoutineSerializer(WritableNestedModelSerializer):
         return data
 
     def to_representation(self, instance):
-        """인스턴스를 반환하기 전에 호출되는 메서드, 커스텀 출력을 위해 오버라이드"""
+        """
+        인스턴스를 반환하기 전에 호출되는 메서드, 커스텀 출력을 위해 오버라이드
+
+        운동 정보는 ExercisesInfoSerializer 하나를 재사용하여 직렬화한다.
+        (many=True에서는 같은 child가 모든 행을 직렬화하므로 운동마다 Serializer를 만들지 않는다.)
+        """
         ret = super().to_representation(instance)
 
-        ret["exercise"] = ExercisesInfoSerializer(instance.exercise).data
-        import json
+        ret["exercise"] = self.exercise_serializer.to_representation(instance.exercise)
 
         return ret
 
+    @cached_property
+    def exercise_serializer(self):
+        return ExercisesInfoSerializer(context=self.context)
+
+    @staticmethod
+    def get_eager_queryset():
+        """
+        ExerciseInRoutine과 운동 정보, 운동 속성, 작성자, 수행 정보는 JOIN으로,
+        운동 부위(M2M)는 별도의 쿼리 하나로 불러오는 쿼리셋을 반환하는 메서드
+        """
+        return ExercisesInfoSerializer.setup_eager_loading(
+            ExerciseInRoutine.objects.select_related("exercise_attribute"),
+            prefix="exercise__",
+        )
+
+    @staticmethod
+    def get_prefetch(lookup="exercises_in_routine"):
+        """
+        중첩된 운동 트리를 한 번에 불러오는 Prefetch 객체를 반환하는 메서드
+
+        루틴의 개수와 관계없이 쿼리 수가 일정하게 유지된다.
+        """
+        return Prefetch(
+            lookup, queryset=ExerciseInRoutineSerializer.get_eager_queryset()
+        )
+
 
 class RoutineSerializer(WritableNestedModelSerializer):
     """
@@ -172,6 +444,7 @@ class RoutineSerializer(WritableNestedModelSerializer):
         모델: Routine
 
         필드:
+        - id: 루틴의 PK, read_only
         - author: 루틴 작성자
         - username: 루틴 작성자의 username
         - title: 루틴 제목
@@ -183,6 +456,7 @@ class RoutineSerializer(WritableNestedModelSerializer):
 
         model = Routine
         fields = [
+            "id",
             "author",
             "username",
             "title",
@@ -192,6 +466,7 @@ class RoutineSerializer(WritableNestedModelSerializer):
             "exercises_in_routine",
         ]
         read_only_fields = [
+            "id",
             "author",
             "username",
             "created_at",
@@ -202,6 +477,17 @@ class RoutineSerializer(WritableNestedModelSerializer):
     def get_username(self, obj):
         return obj.author.username
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        RoutineSerializer가 사용하는 모든 관계를 미리 불러오는 메서드
+
+        author는 JOIN으로, exercises_in_routine 트리는 Prefetch로 불러온다.
+        """
+        return queryset.select_related("author").prefetch_related(
+            ExerciseInRoutineSerializer.get_prefetch()
+        )
+
 
 class MirroredRoutineSerializer(serializers.ModelSerializer):
     """
@@ -232,6 +518,112 @@ class MirroredRoutineSerializer(serializers.ModelSerializer):
             "exercises_in_routine",
         ]
 
+    def to_representation(self, instance):
+        """
+        캐시된 스냅샷에 original_routine만 현재 값으로 채워 반환
+
+        original_routine은 루틴이 수정되면 None으로 바뀌므로 캐시하지 않는다.
+        """
+        snapshot = get_mirrored_routine_snapshot(instance.id, lambda: instance)
+
+        return {
+            "title": snapshot["title"],
+            "author_name": snapshot["author_name"],
+            "original_routine": instance.original_routine_id,
+            "exercises_in_routine": snapshot["exercises_in_routine"],
+        }
+
+
+def render_mirrored_routine_snapshot(mirrored_routine, exercises_in_routine=None):
+    """
+    MirroredRoutine의 변하지 않는 부분(title, author_name, 운동 트리)을 직렬화하는 함수
+
+    exercises_in_routine이 주어지지 않았다면 운동 트리를 직접 조회한다.
+    """
+    if exercises_in_routine is None:
+        exercises_in_routine = ExerciseInRoutineSerializer.get_eager_queryset().filter(
+            mirrored_routine=mirrored_routine
+        )
+
+    return {
+        "title": mirrored_routine.title,
+        "author_name": mirrored_routine.author_name,
+        "exercises_in_routine": ExerciseInRoutineSerializer(
+            exercises_in_routine, many=True
+        ).data,
+    }
+
+
+def sync_mirrored_routine_cache():
+    """
+    스냅샷 캐시를 현재 운동 정보 카탈로그 버전과 동기화하고 버전을 반환하는 함수
+
+    운동 정보가 다른 프로세스에서 수정되어 버전이 바뀌었다면 이 프로세스의 스냅샷도 모두 비워진다.
+    버전은 요청마다 한 번만 DB에서 읽는다.
+    """
+    version = exercises_catalog.get_version()
+    mirrored_routine_cache.sync_version(version)
+    return version
+
+
+def get_mirrored_routine_snapshot(mirrored_routine_id, get_mirrored_routine):
+    """
+    mirrored_routine_id에 해당하는 스냅샷을 캐시에서 읽어 반환하는 함수
+
+    캐시에 없을 때만 get_mirrored_routine()으로 인스턴스를 가져와 렌더링 후 저장한다.
+    """
+    version = sync_mirrored_routine_cache()
+    return mirrored_routine_cache.get_or_set(
+        mirrored_routine_id,
+        lambda: render_mirrored_routine_snapshot(get_mirrored_routine()),
+        version,
+    )
+
+
+def warm_mirrored_routine_snapshot(mirrored_routine):
+    """
+    새로 생성된 MirroredRoutine의 스냅샷을 미리 렌더링하여 캐시에 저장하는 함수
+    """
+    version = sync_mirrored_routine_cache()
+    return mirrored_routine_cache.set(
+        mirrored_routine.id, render_mirrored_routine_snapshot(mirrored_routine), version
+    )
+
+
+def warm_mirrored_routine_snapshots(mirrored_routines):
+    """
+    캐시에 없는 MirroredRoutine들의 스냅샷을 한 번에 렌더링하여 캐시에 저장하는 함수
+
+    운동 트리는 MirroredRoutine의 개수와 관계없이 일정한 수의 쿼리로 불러온다.
+    """
+    version = sync_mirrored_routine_cache()
+    missing = {
+        mirrored_routine.id: mirrored_routine
+        for mirrored_routine in mirrored_routines
+        if mirrored_routine.id not in mirrored_routine_cache
+    }
+    if not missing:
+        return
+
+    exercises_in_routine = defaultdict(list)
+    for exercise_in_routine in (
+        ExerciseInRoutineSerializer.get_eager_queryset()
+        .filter(mirrored_routine_id__in=missing)
+        .order_by("id")
+    ):
+        exercises_in_routine[exercise_in_routine.mirrored_routine_id].append(
+            exercise_in_routine
+        )
+
+    for mirrored_routine_id, mirrored_routine in missing.items():
+        mirrored_routine_cache.set(
+            mirrored_routine_id,
+            render_mirrored_routine_snapshot(
+                mirrored_routine, exercises_in_routine[mirrored_routine_id]
+            ),
+            version,
+        )
+
 
 class UsersRoutineSerializer(serializers.ModelSerializer):
     """
@@ -280,30 +672,72 @@ class UsersRoutineSerializer(serializers.ModelSerializer):
         return data
 
     def get_author(self, obj):
-        return obj.routine.author.id
+        return obj.routine.author_id
 
     def get_author_name(self, obj):
         return obj.mirrored_routine.author_name
 
     def to_representation(self, instance):
-        """인스턴스를 반환하기 전에 호출되는 메서드, 커스텀 출력을 위해 오버라이드"""
+        """
+        인스턴스를 반환하기 전에 호출되는 메서드, 커스텀 출력을 위해 오버라이드
+
+        title과 exercises_in_routine은 캐시된 MirroredRoutine 스냅샷에서 읽는다.
+        """
         ret = super().to_representation(instance)
 
-        ret["title"] = (
-            instance.mirrored_routine.title if instance.mirrored_routine else None
+        snapshot = get_mirrored_routine_snapshot(
+            instance.mirrored_routine_id, lambda: instance.mirrored_routine
         )
-        ret["exercises_in_routine"] = ExerciseInRoutineSerializer(
-            instance.mirrored_routine.exercises_in_routine, many=True
-        ).data
+        ret["title"] = snapshot["title"]
+        ret["exercises_in_routine"] = snapshot["exercises_in_routine"]
 
         return ret
 
 
+class WeeklyRoutineListSerializer(serializers.ListSerializer):
+    """
+    주간 루틴 정보 목록을 검증하는 ListSerializer
+
+    요청에 포함된 UsersRoutine을 한 번의 쿼리로 미리 조회하여 요일마다 조회 쿼리가 발생하지 않도록 하고,
+    context에 request가 있다면 요청한 유저가 소유한 UsersRoutine만 허용한다.
+    users_routine은 PK 필드로 변환하여 조회하므로 문자열 PK("1")도 허용된다.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            users_routines = UsersRoutine.objects.all()
+            request = self.context.get("request")
+            if request is not None:
+                users_routines = users_routines.filter(user=request.user)
+
+            self.child.fields["users_routine"].prefetch(
+                users_routines,
+                [item.get("users_routine") for item in data if isinstance(item, dict)],
+            )
+
+        return super().to_internal_value(data)
+
+    def validate(self, data):
+        """
+        유효성 검사를 수행하는 메서드
+
+        - 같은 day_index가 두 번 이상 포함되어 있는지 확인
+        """
+        day_indices = [item["day_index"] for item in data]
+        if len(day_indices) != len(set(day_indices)):
+            raise serializers.ValidationError("day_index가 중복되었습니다.")
+        return data
+
+
 class WeeklyRoutineSerializer(serializers.ModelSerializer):
     """
     주간 루틴 정보를 다루는 Serializer
     """
 
+    users_routine = PrefetchedPrimaryKeyRelatedField(
+        queryset=UsersRoutine.objects.all()
+    )
+
     class Meta:
         """
         WeeklyRoutineSerializer의 Meta 클래스
@@ -319,6 +753,7 @@ class WeeklyRoutineSerializer(serializers.ModelSerializer):
         model = WeeklyRoutine
         fields = ["user", "users_routine", "day_index"]
         read_only_fields = ["user"]
+        list_serializer_class = WeeklyRoutineListSerializer
 
     def validate(self, data):
         """
@@ -335,8 +770,14 @@ class WeeklyRoutineSerializer(serializers.ModelSerializer):
 class RoutineStreakSerializer(serializers.ModelSerializer):
     """
     루틴 수행 여부를 다루는 Serializer
+
+    유저의 요일별 mirrored_routine id(day_index -> mirrored_routine_id)를 한 번만 조회하여
+    serializer context에 보관하고, 모든 행에서 재사용한다.
+    따라서 여러 개의 루틴 수행 여부를 직렬화해도 WeeklyRoutine 조회는 유저당 한 번만 일어난다.
     """
 
+    weekly_mirrored_routines_context_key = "weekly_mirrored_routines"
+
     mirrored_routine = serializers.SerializerMethodField()
 
     class Meta:
@@ -356,10 +797,89 @@ class RoutineStreakSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "mirrored_routine", "date"]
 
     def get_mirrored_routine(self, obj):
+        weekly_mirrored_routines = self.get_weekly_mirrored_routines(obj.user_id)
+
         try:
-            weekly_routine = WeeklyRoutine.objects.get(
-                day_index=obj.date.weekday(), user=obj.user
-            )
-        except WeeklyRoutine.DoesNotExist:
+            return weekly_mirrored_routines[obj.date.weekday()]
+        except KeyError:
             raise serializers.ValidationError("해당 요일의 루틴이 존재하지 않습니다.")
-        return weekly_routine.users_routine.mirrored_routine.id
+
+    def get_weekly_mirrored_routines(self, user_id):
+        """
+        유저의 day_index -> mirrored_routine_id 딕셔너리를 반환하는 메서드
+
+        serializer context에 유저별로 보관된 값이 있다면 재사용하고,
+        없다면 한 번의 쿼리로 조회하여 context에 저장한다.
+        """
+        weekly_mirrored_routines = self.context.setdefault(
+            self.weekly_mirrored_routines_context_key, {}
+        )
+
+        if user_id not in weekly_mirrored_routines:
+            weekly_mirrored_routines[user_id] = dict(
+                WeeklyRoutine.objects.filter(user_id=user_id).values_list(
+                    "day_index", "users_routine__mirrored_routine_id"
+                )
+            )
+
+        return weekly_mirrored_routines[user_id]
+
+
+class RoutineStreakSyncSerializer(serializers.ModelSerializer):
+    """
+    동기화에 사용되는 루틴 수행 여부 Serializer
+
+    RoutineStreakSerializer와 달리 현재 주간 루틴에서 다시 계산하지 않고,
+    수행 당시 저장된 mirrored_routine을 그대로 반환한다.
+    """
+
+    class Meta:
+        """
+        RoutineStreakSyncSerializer의 Meta 클래스
+
+        모델: RoutineStreak
+
+        필드:
+        - id: 루틴 수행 여부의 PK, read_only
+        - mirrored_routine: 수행된 복제된 루틴, read_only
+        - date: 날짜, read_only
+        """
+
+        model = RoutineStreak
+        fields = ["id", "mirrored_routine", "date"]
+        read_only_fields = ["id", "mirrored_routine", "date"]
+
+
+class RoutineStreakSummarySerializer(serializers.ModelSerializer):
+    """
+    유저의 루틴 수행 기록 요약을 다루는 Serializer
+
+    저장된 current_streak은 last_date 기준의 값이므로,
+    last_date가 어제보다 이전이라면 연속 수행이 끊긴 것으로 보고 0을 반환한다.
+    """
+
+    current_streak = serializers.SerializerMethodField()
+
+    class Meta:
+        """
+        RoutineStreakSummarySerializer의 Meta 클래스
+
+        모델: RoutineStreakSummary
+
+        필드:
+        - current_streak: 오늘 또는 어제까지 연속으로 루틴을 수행한 일수, read_only
+        - longest_streak: 가장 길게 연속으로 루틴을 수행한 일수, read_only
+        - last_date: 마지막으로 루틴을 수행한 날짜, read_only
+        - total_days: 루틴을 수행한 총 일수, read_only
+        """
+
+        model = RoutineStreakSummary
+        fields = ["current_streak", "longest_streak", "last_date", "total_days"]
+        read_only_fields = fields
+
+    def get_current_streak(self, obj):
+        if obj.last_date is None:
+            return 0
+        if (timezone.localdate() - obj.last_date).days > 1:
+            return 0
+        return obj.current_streak
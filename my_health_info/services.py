@@ -1,11 +1,31 @@
+import hashlib
+import json
+
+import numpy as np
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
 from account.models import CustomUser as User
-from my_health_info.models import Routine, UsersRoutine
+from exercises_info.models import ExercisesAttribute, ExercisesInfo
+from my_health_info.models import (
+    ExerciseInRoutine,
+    ExerciseInRoutineAttribute,
+    HealthInfo,
+    MirroredRoutine,
+    Routine,
+    RoutineStreak,
+    RoutineStreakSummary,
+    SubscriberFanOutJob,
+    UsersRoutine,
+)
 from my_health_info.serializers import (
     RoutineSerializer,
     MirroredRoutineSerializer,
     UsersRoutineSerializer,
+    warm_mirrored_routine_snapshot,
 )
-from my_health_info.models import MirroredRoutine
+from my_health_info.tasks import background_tasks, run_subscriber_fan_out
 
 
 class UsersRoutineManagementService:
@@ -51,3 +71,637 @@ class UsersRoutineManagementService:
         )
 
         return users_routine
+
+
+class RoutineSubscriptionBatchService:
+    """
+    여러 루틴을 한 번에 구독하거나 구독 취소하는 서비스 클래스
+
+    루틴 개수와 관계없이 일정한 수의 쿼리로 처리하고, 루틴마다 처리 결과를 반환한다.
+
+    구독 결과(status):
+    - subscribed: 새로 구독함
+    - already_subscribed: 이미 구독 중인 루틴
+    - own_routine: 자신이 작성한 루틴
+    - not_found: 존재하지 않거나 삭제된 루틴
+
+    구독 취소 결과(status):
+    - unsubscribed: 구독을 취소함
+    - not_subscribed: 구독하지 않은 루틴
+    - own_routine: 자신이 작성한 루틴 (루틴 삭제는 UsersRoutine 삭제로만 가능)
+    """
+
+    def __init__(self, user):
+        self.user = user
+
+    @transaction.atomic
+    def subscribe(self, routine_ids):
+        """
+        routine_ids의 루틴들을 한 번에 구독하는 메서드
+
+        1. 루틴들을 한 번의 쿼리로 조회 (삭제된 루틴 제외)
+        2. 이미 구독 중인 루틴 id를 한 번의 쿼리로 조회
+        3. 구독 가능한 루틴 id에서 이미 구독 중인 루틴 id를 집합 차로 제외
+        4. 남은 루틴들의 UsersRoutine을 bulk_create로 생성 (동시에 생성된 행은 무시)
+        5. 새로 구독한 UsersRoutine을 다시 조회하여 루틴별 결과와 함께 반환
+        """
+        if not routine_ids:
+            return []
+
+        routines = (
+            Routine.objects.filter(is_deleted=False, mirrored_routine__isnull=False)
+            .select_related("mirrored_routine")
+            .in_bulk(routine_ids)
+        )
+
+        subscribed_ids = set(
+            UsersRoutine.objects.filter(
+                user=self.user, routine_id__in=routine_ids
+            ).values_list("routine_id", flat=True)
+        )
+
+        available_ids = {
+            routine.id
+            for routine in routines.values()
+            if routine.author_id != self.user.id
+        }
+        to_subscribe_ids = available_ids - subscribed_ids
+
+        UsersRoutine.objects.bulk_create(
+            [
+                UsersRoutine(
+                    user=self.user,
+                    routine=routines[routine_id],
+                    mirrored_routine=routines[routine_id].mirrored_routine,
+                )
+                for routine_id in sorted(to_subscribe_ids)
+            ],
+            ignore_conflicts=True,
+        )
+
+        users_routines = {
+            users_routine.routine_id: users_routine
+            for users_routine in UsersRoutine.objects.filter(
+                user=self.user, routine_id__in=to_subscribe_ids
+            ).select_related("routine", "mirrored_routine")
+        }
+
+        results = []
+        for routine_id in routine_ids:
+            if routine_id in users_routines:
+                results.append(
+                    {
+                        "routine": routine_id,
+                        "status": "subscribed",
+                        "users_routine": users_routines[routine_id],
+                    }
+                )
+            elif routine_id in routines and routine_id not in available_ids:
+                results.append({"routine": routine_id, "status": "own_routine"})
+            elif routine_id in subscribed_ids:
+                results.append({"routine": routine_id, "status": "already_subscribed"})
+            else:
+                results.append({"routine": routine_id, "status": "not_found"})
+
+        return results
+
+    @transaction.atomic
+    def unsubscribe(self, routine_ids):
+        """
+        routine_ids의 루틴들의 구독을 한 번에 취소하는 메서드
+
+        1. 유저의 UsersRoutine 중 routine_ids에 해당하는 행을 한 번의 쿼리로 조회
+        2. 작성자가 아닌 UsersRoutine을 한 번에 삭제 (주간 루틴은 CASCADE로 함께 삭제)
+        3. 구독자가 없어진 MirroredRoutine은 고아 MirroredRoutine 정리 작업에서 삭제
+        4. 루틴별 결과를 반환
+        """
+        if not routine_ids:
+            return []
+
+        users_routines = dict(
+            UsersRoutine.objects.filter(
+                user=self.user, routine_id__in=routine_ids
+            ).values_list("routine_id", "is_author")
+        )
+
+        unsubscribed_ids = {
+            routine_id
+            for routine_id, is_author in users_routines.items()
+            if not is_author
+        }
+        if unsubscribed_ids:
+            UsersRoutine.objects.filter(
+                user=self.user, routine_id__in=unsubscribed_ids
+            ).delete()
+
+        results = []
+        for routine_id in routine_ids:
+            if routine_id in unsubscribed_ids:
+                status = "unsubscribed"
+            elif routine_id in users_routines:
+                status = "own_routine"
+            else:
+                status = "not_subscribed"
+            results.append({"routine": routine_id, "status": status})
+
+        return results
+
+
+class RoutineLikeService:
+    """
+    루틴의 좋아요와 좋아요 수를 동시성 문제 없이 관리하는 서비스 클래스
+
+    좋아요 여부는 liked_users의 중간 테이블이 가진 (routine, user) unique 제약으로 보장하고,
+    like_count는 F 표현식으로 DB에서 원자적으로 증감시킨다.
+    중간 테이블에 행이 실제로 추가/삭제된 경우에만 like_count를 변경하므로
+    동시에 여러 요청이 들어와도 좋아요 수가 어긋나지 않는다.
+    """
+
+    def __init__(self, user, routine):
+        self.user = user
+        self.routine = routine
+        self.like_model = Routine.liked_users.through
+
+    def like(self):
+        """
+        유저가 루틴에 좋아요를 누르는 메서드
+
+        만약 이미 좋아요를 누른 루틴이라면, 이미 좋아요를 누른 루틴이라는 에러를 발생시킨다.
+        """
+        try:
+            with transaction.atomic():
+                self.like_model.objects.create(
+                    routine_id=self.routine.id, customuser_id=self.user.id
+                )
+                Routine.objects.filter(id=self.routine.id).update(
+                    like_count=F("like_count") + 1
+                )
+        except IntegrityError:
+            raise ValueError("이미 좋아요를 누른 루틴입니다.")
+
+        return self.get_like_count()
+
+    def unlike(self):
+        """
+        유저가 루틴의 좋아요를 취소하는 메서드
+
+        만약 좋아요를 누르지 않은 루틴이라면, 좋아요를 누르지 않은 루틴이라는 에러를 발생시킨다.
+        """
+        with transaction.atomic():
+            deleted, _ = self.like_model.objects.filter(
+                routine_id=self.routine.id, customuser_id=self.user.id
+            ).delete()
+            if not deleted:
+                raise ValueError("좋아요를 누르지 않은 루틴입니다.")
+
+            Routine.objects.filter(id=self.routine.id, like_count__gt=0).update(
+                like_count=F("like_count") - 1
+            )
+
+        return self.get_like_count()
+
+    def get_like_count(self):
+        return Routine.objects.values_list("like_count", flat=True).get(
+            id=self.routine.id
+        )
+
+
+class RoutineBuilderService:
+    """
+    루틴의 스냅샷(MirroredRoutine)과 운동 트리를 일괄로 생성하는 서비스 클래스
+
+    루틴 생성과 수정에서 공통으로 사용하며, 운동 수와 관계없이
+    일정한 수의 쿼리로 MirroredRoutine, ExerciseInRoutine, ExerciseInRoutineAttribute를 생성한다.
+    """
+
+    attribute_fields = {
+        "set_count": "need_set",
+        "rep_count": "need_rep",
+        "weight": "need_weight",
+        "duration": "need_duration",
+        "speed": "need_speed",
+    }
+
+    def __init__(self, user, routine):
+        self.user = user
+        self.routine = routine
+
+    @transaction.atomic
+    def build_mirrored_routine(self, title, exercises_in_routine):
+        """
+        MirroredRoutine과 운동 트리를 하나의 트랜잭션 안에서 생성하는 메서드
+
+        1. 참조된 운동들의 ExercisesAttribute를 한 번에 조회
+        2. 운동 속성에서 필요로 하는 값만 남긴 수행 정보로 스냅샷의 content_hash를 계산
+        3. 같은 content_hash를 가진 MirroredRoutine이 있다면 새로 생성하지 않고 재사용
+           (재사용할 행을 잠가 OrphanedRoutineCollector가 동시에 삭제하지 못하도록 함)
+        4. 없다면 routine을 original_routine으로 갖는 새 MirroredRoutine 생성
+           (동시에 같은 내용이 생성되어 unique 제약에 걸리면 먼저 생성된 것을 재사용)
+        5. ExerciseInRoutine들을 bulk_create로 생성
+        6. ExerciseInRoutineAttribute들을 bulk_create로 생성
+        7. 새 MirroredRoutine의 스냅샷을 캐시에 미리 렌더링
+        """
+        exercises_attributes = self.get_exercises_attributes(
+            [data["exercise"] for data in exercises_in_routine]
+        )
+        attribute_values = [
+            (
+                self.get_attribute_values(
+                    data["exercise_attribute"],
+                    exercises_attributes[data["exercise"].id],
+                )
+                if data.get("exercise_attribute")
+                else None
+            )
+            for data in exercises_in_routine
+        ]
+
+        content_hash = self.compute_content_hash(
+            title, exercises_in_routine, attribute_values
+        )
+
+        mirrored_routine = (
+            MirroredRoutine.objects.select_for_update()
+            .filter(content_hash=content_hash)
+            .first()
+        )
+        if mirrored_routine:
+            return self.reuse_mirrored_routine(mirrored_routine)
+
+        try:
+            with transaction.atomic():
+                mirrored_routine = MirroredRoutine.objects.create(
+                    title=title,
+                    author_name=self.user.username,
+                    original_routine=self.routine,
+                    content_hash=content_hash,
+                )
+        except IntegrityError:
+            return self.reuse_mirrored_routine(
+                MirroredRoutine.objects.get(content_hash=content_hash)
+            )
+
+        exercise_in_routine_objs = ExerciseInRoutine.objects.bulk_create(
+            [
+                ExerciseInRoutine(
+                    routine=self.routine,
+                    mirrored_routine=mirrored_routine,
+                    exercise=data["exercise"],
+                    order=data["order"],
+                )
+                for data in exercises_in_routine
+            ]
+        )
+
+        ExerciseInRoutineAttribute.objects.bulk_create(
+            [
+                ExerciseInRoutineAttribute(
+                    exercise_in_routine=exercise_in_routine_obj, **values
+                )
+                for exercise_in_routine_obj, values in zip(
+                    exercise_in_routine_objs, attribute_values
+                )
+                if values is not None
+            ]
+        )
+
+        warm_mirrored_routine_snapshot(mirrored_routine)
+
+        return mirrored_routine
+
+    def reuse_mirrored_routine(self, mirrored_routine):
+        """
+        내용이 같은 기존 MirroredRoutine을 routine에 다시 연결하여 반환하는 메서드
+
+        1. routine에 연결된 다른 MirroredRoutine과 ExerciseInRoutine의 연결을 해제
+        2. 기존 MirroredRoutine의 original_routine을 routine으로 변경
+        3. 기존 MirroredRoutine의 ExerciseInRoutine들을 routine에 다시 연결
+        4. 스냅샷을 캐시에 미리 렌더링
+        """
+        MirroredRoutine.objects.filter(original_routine=self.routine).exclude(
+            id=mirrored_routine.id
+        ).update(original_routine=None)
+        ExerciseInRoutine.objects.filter(routine=self.routine).exclude(
+            mirrored_routine=mirrored_routine
+        ).update(routine=None)
+
+        if mirrored_routine.original_routine_id != self.routine.id:
+            mirrored_routine.original_routine = self.routine
+            mirrored_routine.save(update_fields=["original_routine"])
+        mirrored_routine.exercises_in_routine.exclude(routine=self.routine).update(
+            routine=self.routine
+        )
+
+        warm_mirrored_routine_snapshot(mirrored_routine)
+
+        return mirrored_routine
+
+    def compute_content_hash(self, title, exercises_in_routine, attribute_values):
+        """
+        스냅샷의 내용을 정규화한 JSON의 SHA-256 해시를 반환하는 메서드
+
+        MirroredRoutine의 original_routine은 OneToOne 관계이므로 서로 다른 루틴이
+        하나의 스냅샷을 공유할 수 없어, 원본 루틴 id를 해시에 포함한다.
+        운동은 order 순으로 정렬하고, 수행 정보는 모델 필드 타입으로 변환하여
+        같은 내용이라면 요청 형태와 관계없이 같은 해시가 계산되도록 한다.
+        """
+        exercises = sorted(
+            (
+                [data["order"], data["exercise"].id, values]
+                for data, values in zip(exercises_in_routine, attribute_values)
+            ),
+            key=lambda exercise: exercise[0],
+        )
+        payload = json.dumps(
+            {
+                "routine": self.routine.id,
+                "title": title,
+                "author_name": self.user.username,
+                "exercises": exercises,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_exercises_attributes(self, exercises):
+        """
+        운동 id를 키로, 해당 운동의 ExercisesAttribute를 값으로 하는 딕셔너리를 반환하는 메서드
+
+        이미 불러온 운동 속성은 그대로 사용하고, 불러오지 않은 운동 속성만 한 번에 조회한다.
+        """
+        missing_ids = [
+            exercise.exercises_attribute_id
+            for exercise in exercises
+            if not ExercisesInfo.exercises_attribute.is_cached(exercise)
+        ]
+        fetched = ExercisesAttribute.objects.in_bulk(missing_ids) if missing_ids else {}
+
+        return {
+            exercise.id: (
+                exercise.exercises_attribute
+                if ExercisesInfo.exercises_attribute.is_cached(exercise)
+                else fetched[exercise.exercises_attribute_id]
+            )
+            for exercise in exercises
+        }
+
+    def get_attribute_values(self, exercise_attr_request, exercises_attribute):
+        """
+        운동 속성에서 필요로 하는 값만 채운 ExerciseInRoutineAttribute 필드 값 딕셔너리를 반환하는 메서드
+        """
+        return {
+            field: ExerciseInRoutineAttribute._meta.get_field(field).to_python(
+                exercise_attr_request.get(field, 0)
+                if getattr(exercises_attribute, need_field)
+                else 0
+            )
+            for field, need_field in self.attribute_fields.items()
+        }
+
+
+class SubscriberFanOutService:
+    """
+    루틴이 수정되었을 때 구독자들의 need_update를 True로 변경하는 서비스 클래스
+
+    구독자 수가 SUBSCRIBER_FAN_OUT_SYNC_THRESHOLD 이하라면 하나의 UPDATE 문으로 즉시 처리하고,
+    그보다 많다면 SubscriberFanOutJob을 생성하여 백그라운드 작업으로 나누어 처리한다.
+    """
+
+    def __init__(self, routine, excluded_users_routine=None):
+        self.routine = routine
+        self.excluded_users_routine = excluded_users_routine
+
+    def get_subscribers(self):
+        subscribers = UsersRoutine.objects.filter(routine=self.routine)
+        if self.excluded_users_routine:
+            subscribers = subscribers.exclude(id=self.excluded_users_routine.id)
+        return subscribers
+
+    def fan_out(self):
+        """
+        구독자들의 need_update를 True로 변경하는 메서드
+
+        즉시 처리했다면 None을, 백그라운드 작업으로 넘겼다면 SubscriberFanOutJob을 반환한다.
+        """
+        subscribers = self.get_subscribers()
+        total = subscribers.count()
+
+        if total <= settings.SUBSCRIBER_FAN_OUT_SYNC_THRESHOLD:
+            subscribers.update(need_update=True)
+            return None
+
+        job = SubscriberFanOutJob.objects.create(
+            routine=self.routine,
+            excluded_users_routine=(
+                self.excluded_users_routine.id if self.excluded_users_routine else None
+            ),
+            total=total,
+        )
+        background_tasks.enqueue(run_subscriber_fan_out, job.id)
+
+        return job
+
+
+class RoutineStreakSummaryService:
+    """
+    유저의 루틴 수행 기록 요약(RoutineStreakSummary)을 관리하는 서비스 클래스
+
+    연속 수행 일수는 하루도 빠짐없이 루틴을 수행한 날짜의 수로 계산한다.
+    새 수행 기록은 마지막 수행 날짜와만 비교하여 요약을 O(1)로 갱신하고,
+    요약이 어긋났을 때는 전체 기록에서 다시 계산할 수 있다.
+    """
+
+    summary_fields = ["current_streak", "longest_streak", "last_date", "total_days"]
+
+    def __init__(self, user):
+        self.user = user
+
+    @transaction.atomic
+    def record(self, date):
+        """
+        date에 루틴을 수행했을 때 요약을 점진적으로 갱신하는 메서드 (date의 RoutineStreak은 이미 저장되어 있어야 함)
+
+        1. 유저의 요약 행을 잠금
+           (없다면 생성 후 전체 기록에서 계산, 요약 도입 이전의 수행 기록이 있는 유저도 올바른 요약을 갖도록 함)
+        2. 이미 반영된 날짜라면 그대로 반환
+        3. 마지막 수행 날짜보다 이전 날짜라면 전체 기록에서 다시 계산
+        4. 마지막 수행 날짜의 다음 날이라면 연속 일수를 1 증가, 아니라면 1로 초기화
+        5. 최장 연속 일수, 마지막 수행 날짜, 총 수행 일수 갱신
+        """
+        _, created = RoutineStreakSummary.objects.get_or_create(user=self.user)
+        if created:
+            return self.rebuild()
+
+        summary = RoutineStreakSummary.objects.select_for_update().get(user=self.user)
+
+        if summary.last_date == date:
+            return summary
+        if summary.last_date and date < summary.last_date:
+            return self.rebuild()
+
+        if summary.last_date and (date - summary.last_date).days == 1:
+            summary.current_streak += 1
+        else:
+            summary.current_streak = 1
+
+        summary.longest_streak = max(summary.longest_streak, summary.current_streak)
+        summary.last_date = date
+        summary.total_days += 1
+        summary.save(update_fields=self.summary_fields)
+
+        return summary
+
+    def rebuild(self):
+        """
+        유저의 전체 루틴 수행 기록에서 요약을 다시 계산하여 저장하는 메서드
+        """
+        dates = RoutineStreak.objects.filter(user=self.user).order_by("date")
+        summary, _ = RoutineStreakSummary.objects.update_or_create(
+            user=self.user,
+            defaults=self.summarize(dates.values_list("date", flat=True)),
+        )
+        return summary
+
+    @staticmethod
+    def summarize(dates):
+        """
+        오름차순으로 정렬된 날짜들에서 요약 값을 계산하여 딕셔너리로 반환하는 메서드
+        """
+        current_streak = longest_streak = total_days = 0
+        last_date = None
+
+        for date in dates:
+            if date == last_date:
+                continue
+
+            if last_date and (date - last_date).days == 1:
+                current_streak += 1
+            else:
+                current_streak = 1
+
+            longest_streak = max(longest_streak, current_streak)
+            last_date = date
+            total_days += 1
+
+        return {
+            "current_streak": current_streak,
+            "longest_streak": longest_streak,
+            "last_date": last_date,
+            "total_days": total_days,
+        }
+
+
+class HealthInfoTimeSeriesService:
+    """
+    유저의 건강 정보(몸무게, BMI)를 기간별로 집계하는 서비스 클래스
+
+    기간 내 건강 정보를 values_list 쿼리 한 번으로 불러와 NumPy 배열로 만든 뒤,
+    day/week/month 단위 구간으로 나누어 평균, 최솟값, 최댓값, 이동 평균을 벡터 연산으로 계산한다.
+    건강 정보가 없는 구간은 응답에 포함하지 않는다.
+
+    이동 평균(rolling_mean)은 각 구간을 끝으로 하는 최근 window개 구간(빈 구간 포함)에
+    속한 모든 측정값의 평균이다.
+    """
+
+    buckets = ["day", "week", "month"]
+
+    def __init__(self, user, start, end, bucket="day", window=7):
+        self.user = user
+        self.start = start
+        self.end = end
+        self.bucket = bucket
+        self.window = window
+
+    def build(self):
+        """
+        구간별 집계 결과를 리스트로 반환하는 메서드
+
+        1. 기간 내 건강 정보의 (date, weight, height)를 날짜순으로 한 번에 조회
+        2. 날짜를 구간 시작일과 구간 번호로 변환
+        3. 구간별 개수, 평균, 최솟값, 최댓값을 reduceat으로 계산
+        4. 구간별 합계와 개수의 누적합으로 이동 평균을 계산
+        """
+        rows = list(
+            HealthInfo.objects.filter(
+                user=self.user, date__gte=self.start, date__lte=self.end
+            )
+            .order_by("date")
+            .values_list("date", "weight", "height")
+        )
+        if not rows:
+            return []
+
+        dates, weights, heights = zip(*rows)
+        dates = np.array(dates, dtype="datetime64[D]")
+        weights = np.array(weights, dtype=np.float64)
+        heights = np.array(heights, dtype=np.float64)
+        bmis = weights / (heights / 100) ** 2
+
+        bucket_starts, bucket_indices = self.get_buckets(dates)
+        first_rows = np.flatnonzero(
+            np.concatenate(([True], bucket_indices[1:] != bucket_indices[:-1]))
+        )
+        counts = np.diff(np.append(first_rows, len(dates)))
+        positions = bucket_indices[first_rows]
+
+        series = {"date": bucket_starts[first_rows].astype(str).tolist()}
+        series["count"] = counts.tolist()
+        for name, values in [("weight", weights), ("bmi", bmis)]:
+            sums = np.add.reduceat(values, first_rows)
+            series[f"{name}_mean"] = self.round(sums / counts)
+            series[f"{name}_min"] = self.round(np.minimum.reduceat(values, first_rows))
+            series[f"{name}_max"] = self.round(np.maximum.reduceat(values, first_rows))
+            series[f"{name}_rolling_mean"] = self.round(
+                self.rolling_mean(positions, sums, counts)
+            )
+
+        return [dict(zip(series, values)) for values in zip(*series.values())]
+
+    def get_buckets(self, dates):
+        """
+        각 날짜가 속한 구간의 시작일과, 첫 구간부터 센 구간 번호를 반환하는 메서드
+
+        - day: 날짜 그대로
+        - week: 해당 주의 월요일 (1970-01-01은 목요일이므로 3을 더해 요일을 계산)
+        - month: 해당 월의 1일
+        """
+        if self.bucket == "month":
+            months = dates.astype("datetime64[M]")
+            bucket_starts = months.astype("datetime64[D]")
+            bucket_indices = (months - months[0]).astype(np.int64)
+        elif self.bucket == "week":
+            weekdays = (dates.astype(np.int64) + 3) % 7
+            bucket_starts = dates - weekdays.astype("timedelta64[D]")
+            bucket_indices = (bucket_starts - bucket_starts[0]).astype(np.int64) // 7
+        else:
+            bucket_starts = dates
+            bucket_indices = (dates - dates[0]).astype(np.int64)
+
+        return bucket_starts, bucket_indices
+
+    def rolling_mean(self, positions, sums, counts):
+        """
+        각 구간을 끝으로 하는 최근 window개 구간의 측정값 평균을 반환하는 메서드
+
+        구간 번호 순으로 합계와 개수의 누적합을 만들어 두고,
+        (구간 번호 + 1)과 (구간 번호 + 1 - window) 위치의 누적합 차이로 구간 합을 구한다.
+        """
+        dense_sums = np.zeros(positions[-1] + 1)
+        dense_counts = np.zeros(positions[-1] + 1)
+        dense_sums[positions] = sums
+        dense_counts[positions] = counts
+
+        cumulative_sums = np.concatenate(([0.0], np.cumsum(dense_sums)))
+        cumulative_counts = np.concatenate(([0.0], np.cumsum(dense_counts)))
+
+        ends = positions + 1
+        starts = np.maximum(ends - self.window, 0)
+        return (cumulative_sums[ends] - cumulative_sums[starts]) / (
+            cumulative_counts[ends] - cumulative_counts[starts]
+        )
+
+    @staticmethod
+    def round(values):
+        return np.round(values, 2).tolist()
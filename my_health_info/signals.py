@@ -0,0 +1,164 @@
+from django.db.models import QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from account.models import CustomUser as User
+from exercises_info.models import ExercisesAttribute, ExercisesInfo
+from my_health_info.caches import (
+    health_info_cache,
+    mirrored_routine_cache,
+    weekly_schedule_cache,
+)
+from my_health_info.models import (
+    ExerciseInRoutine,
+    HealthInfo,
+    MirroredRoutine,
+    Routine,
+    RoutineStreak,
+    SyncTombstone,
+    UsersRoutine,
+    WeeklyRoutine,
+)
+from my_health_info.recommendations import routine_vector_index
+from my_health_info.search import routine_search_index
+
+
+@receiver(post_save, sender=MirroredRoutine)
+@receiver(post_delete, sender=MirroredRoutine)
+def evict_mirrored_routine_snapshot(sender, instance, **kwargs):
+    """
+    MirroredRoutine이 생성, 저장, 삭제되면 해당 id의 캐시된 스냅샷을 제거
+
+    생성 시점에는 아직 운동 트리가 없으므로, 스냅샷은 운동 트리가 모두 생성된 후
+    warm_mirrored_routine_snapshot으로 다시 채운다.
+    """
+    mirrored_routine_cache.delete(instance.id)
+
+
+@receiver(post_save, sender=ExercisesInfo)
+@receiver(post_delete, sender=ExercisesInfo)
+@receiver(post_save, sender=ExercisesAttribute)
+@receiver(m2m_changed, sender=ExercisesInfo.focus_areas.through)
+def clear_mirrored_routine_snapshots(sender, **kwargs):
+    """
+    스냅샷에 포함된 운동 정보가 관리자에 의해 변경되면 모든 스냅샷 캐시를 비움
+
+    이 프로세스의 캐시만 비우며, 다른 프로세스의 캐시는 커밋 후 올라간 운동 정보 카탈로그 버전을
+    다음 조회에서 읽을 때 비워진다. (sync_mirrored_routine_cache)
+    """
+    mirrored_routine_cache.clear()
+
+
+def is_deleted_with_user(origin):
+    """
+    삭제가 유저 삭제로 인한 CASCADE 삭제인지 반환
+    """
+    if isinstance(origin, QuerySet):
+        return origin.model is User
+    return isinstance(origin, User)
+
+
+@receiver(post_save, sender=HealthInfo)
+@receiver(post_delete, sender=HealthInfo)
+def invalidate_health_info_cache(sender, instance, origin=None, **kwargs):
+    """
+    HealthInfo가 생성, 저장, 삭제되면 해당 유저의 건강 정보 캐시 버전을 올려 모든 프로세스에서 무효화
+
+    유저 삭제로 인한 CASCADE 삭제라면 캐시 버전도 함께 삭제되므로 올리지 않는다.
+    """
+    if is_deleted_with_user(origin):
+        return
+
+    health_info_cache.invalidate(instance.user_id)
+
+
+@receiver(post_save, sender=UsersRoutine)
+@receiver(post_delete, sender=UsersRoutine)
+def invalidate_weekly_schedule_cache(sender, instance, origin=None, **kwargs):
+    """
+    UsersRoutine이 수정(루틴 편집으로 mirrored_routine 변경), 삭제되면 해당 유저의 주간 일정 캐시 버전을 올려
+    모든 프로세스에서 무효화
+
+    UsersRoutine이 삭제되면 이를 사용하는 WeeklyRoutine도 CASCADE로 함께 삭제된다.
+    유저 삭제로 인한 CASCADE 삭제라면 캐시 버전도 함께 삭제되므로 올리지 않는다.
+    """
+    if is_deleted_with_user(origin):
+        return
+
+    weekly_schedule_cache.invalidate(instance.user_id)
+
+
+@receiver(post_delete, sender=HealthInfo)
+@receiver(post_delete, sender=UsersRoutine)
+@receiver(post_delete, sender=WeeklyRoutine)
+@receiver(post_delete, sender=RoutineStreak)
+def record_sync_tombstone(sender, instance, origin=None, **kwargs):
+    """
+    동기화 대상 행이 삭제되면 SyncTombstone에 삭제 기록을 남김
+
+    - 같은 모델의 QuerySet.delete()로 삭제되었다면 SyncTrackedQuerySet이 이미 한 번에 남겼으므로 생략한다.
+    - 유저 삭제로 인한 CASCADE 삭제라면 동기화할 유저가 없으므로 남기지 않는다.
+    """
+    if isinstance(origin, QuerySet):
+        if origin.model is sender:
+            return
+        origin_model = origin.model
+    else:
+        origin_model = type(origin)
+
+    if origin_model is User:
+        return
+
+    SyncTombstone.objects.create(
+        user_id=instance.user_id, model=sender.sync_name, object_id=instance.id
+    )
+
+
+@receiver(pre_delete, sender=Routine)
+def touch_subscribers_of_deleted_routine(sender, instance, **kwargs):
+    """
+    Routine이 삭제되면 구독자의 UsersRoutine.routine이 SET_NULL로 변경되므로,
+    변경이 동기화되도록 구독자들의 updated_at을 갱신
+    """
+    UsersRoutine.objects.filter(routine=instance).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=User)
+def reindex_routines_of_author(sender, instance, created, update_fields=None, **kwargs):
+    """
+    작성자의 username이 변경될 수 있는 저장이라면 작성자의 루틴 검색 문서를 갱신
+
+    로그인 시 last_login만 저장하는 경우처럼 username이 포함되지 않은 부분 저장은 생략한다.
+    """
+    if created or (update_fields is not None and "username" not in update_fields):
+        return
+
+    routine_search_index.update(
+        Routine.objects.filter(author=instance).values_list("id", flat=True)
+    )
+
+
+@receiver(post_save, sender=ExercisesInfo)
+def reindex_routines_of_exercise(sender, instance, created, **kwargs):
+    """
+    운동 정보가 수정되면 해당 운동을 현재 포함하고 있는 루틴의 검색 문서를 갱신
+    """
+    if created:
+        return
+
+    routine_search_index.update(
+        ExerciseInRoutine.objects.filter(exercise=instance, routine__isnull=False)
+        .values_list("routine_id", flat=True)
+        .distinct()
+    )
+
+
+@receiver(post_delete, sender=Routine)
+def discard_routine_vector(sender, instance, **kwargs):
+    """
+    Routine이 삭제되면 현재 프로세스의 추천 벡터 인덱스에서 제거
+
+    다른 프로세스의 인덱스에서는 추천 결과를 조회할 때 제거된다.
+    """
+    routine_vector_index.discard([instance.id])
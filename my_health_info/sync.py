@@ -0,0 +1,148 @@
+import datetime
+
+from django.conf import settings
+from django.core import signing
+from django.utils import timezone
+
+from my_health_info.models import (
+    HealthInfo,
+    RoutineStreak,
+    SyncTombstone,
+    UsersRoutine,
+    WeeklyRoutine,
+)
+from my_health_info.serializers import (
+    HealthInfoSerializer,
+    RoutineStreakSyncSerializer,
+    UsersRoutineSerializer,
+    WeeklyRoutineSerializer,
+    warm_mirrored_routine_snapshots,
+)
+
+# 동기화 대상 모델 이름 -> 모델
+sync_models = {
+    model.sync_name: model
+    for model in [HealthInfo, UsersRoutine, WeeklyRoutine, RoutineStreak]
+}
+
+
+class DeltaSync:
+    """
+    유저의 my_health_info 기록 중 변경 토큰 이후에 생성, 수정, 삭제된 행만 반환하는 클래스
+
+    - 생성, 수정된 행은 각 모델의 updated_at으로, 삭제된 행은 SyncTombstone으로 찾는다.
+      (user, updated_at), (user, deleted_at) 인덱스를 사용하므로 비용은 전체 기록이 아니라 변경량에 비례한다.
+    - 토큰은 유저 id와 기준 시각을 서명한 문자열이며, 클라이언트는 내용을 해석하지 않고 그대로 돌려준다.
+    - 새 토큰의 기준 시각은 조회 시작 시각에서 SYNC_TOKEN_OVERLAP초를 뺀 값이다.
+      조회 중에 커밋된 트랜잭션의 행을 놓치지 않기 위함이며, 겹치는 구간의 행은 다시 전달될 수 있으므로
+      클라이언트는 id 기준으로 덮어쓴다.
+    - 토큰이 없거나 SYNC_TOMBSTONE_RETENTION_DAYS보다 오래되었다면(삭제 기록이 정리되었을 수 있음)
+      전체 행을 반환하고 full을 True로 설정한다. 이때 클라이언트는 로컬 데이터를 모두 교체한다.
+    """
+
+    salt = "my_health_info.sync"
+    serializer_classes = {
+        "health_info": HealthInfoSerializer,
+        "users_routine": UsersRoutineSerializer,
+        "weekly_routine": WeeklyRoutineSerializer,
+        "routine_streak": RoutineStreakSyncSerializer,
+    }
+
+    def __init__(self, user, token=None):
+        self.user = user
+        self.token = token
+
+    def sync(self):
+        """
+        변경된 행과 새 토큰을 반환하는 메서드
+
+        1. 토큰을 검증하여 기준 시각을 구함 (없거나 만료되었다면 전체 동기화)
+        2. 모델별로 기준 시각 이후에 수정된 행을 직렬화
+        3. 기준 시각 이후의 삭제 기록을 모델별 id 목록으로 정리
+        4. 조회 시작 시각으로 새 토큰을 만들어 함께 반환
+        """
+        started_at = timezone.now()
+        since = self.decode_token(self.token) if self.token else None
+
+        full = since is None or since < started_at - datetime.timedelta(
+            days=settings.SYNC_TOMBSTONE_RETENTION_DAYS
+        )
+        if full:
+            since = None
+
+        changes = {
+            name: {"updated": self.render_updated(name, since), "deleted": []}
+            for name in sync_models
+        }
+
+        if since is not None:
+            tombstones = SyncTombstone.objects.filter(
+                user=self.user, deleted_at__gt=since
+            ).values_list("model", "object_id")
+            for name, object_id in tombstones:
+                if name in changes:
+                    changes[name]["deleted"].append(object_id)
+
+        return {
+            "token": self.encode_token(
+                started_at - datetime.timedelta(seconds=settings.SYNC_TOKEN_OVERLAP)
+            ),
+            "full": full,
+            "changes": changes,
+        }
+
+    def render_updated(self, name, since):
+        """
+        since 이후에 수정된 name 모델의 행을 직렬화하여 반환하는 메서드 (since가 None이라면 전체 행)
+        """
+        queryset = sync_models[name].objects.filter(user=self.user).order_by("id")
+        if since is not None:
+            queryset = queryset.filter(updated_at__gt=since)
+
+        if name == "users_routine":
+            queryset = list(queryset.select_related("routine", "mirrored_routine"))
+            warm_mirrored_routine_snapshots(
+                users_routine.mirrored_routine for users_routine in queryset
+            )
+
+        serializer_class = self.serializer_classes[name]
+        return [
+            {"id": instance.id, **serializer_class(instance).data}
+            for instance in queryset
+        ]
+
+    def encode_token(self, since):
+        return signing.dumps(
+            {"user": self.user.id, "since": since.isoformat()}, salt=self.salt
+        )
+
+    def decode_token(self, token):
+        """
+        토큰을 검증하여 기준 시각을 반환하는 메서드
+
+        서명이 올바르지 않거나 다른 유저의 토큰이라면 ValueError를 발생시킨다.
+        """
+        try:
+            payload = signing.loads(token, salt=self.salt)
+        except signing.BadSignature:
+            raise ValueError("올바르지 않은 동기화 토큰입니다.")
+
+        if payload.get("user") != self.user.id:
+            raise ValueError("올바르지 않은 동기화 토큰입니다.")
+
+        return datetime.datetime.fromisoformat(payload["since"])
+
+
+def prune_sync_tombstones(before=None):
+    """
+    before(기본값은 SYNC_TOMBSTONE_RETENTION_DAYS일 전)보다 오래된 삭제 기록을 삭제하고, 삭제된 행 수를 반환하는 함수
+
+    이보다 오래된 토큰은 전체 동기화로 처리되므로 삭제 기록이 더 이상 필요하지 않다.
+    """
+    if before is None:
+        before = timezone.now() - datetime.timedelta(
+            days=settings.SYNC_TOMBSTONE_RETENTION_DAYS
+        )
+
+    deleted, _ = SyncTombstone.objects.filter(deleted_at__lt=before).delete()
+    return deleted
@@ -0,0 +1,216 @@
+import datetime
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from my_health_info.collectors import OrphanedRoutineCollector
+from my_health_info.models import SubscriberFanOutJob, UsersRoutine
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundTaskQueue:
+    """
+    프로세스 내에서 동작하는 간단한 백그라운드 작업 큐
+
+    요청을 처리하는 스레드는 작업을 큐에 넣고 바로 반환하며,
+    데몬 워커 스레드가 큐에서 작업을 꺼내 순서대로 실행한다.
+    작업은 트랜잭션이 커밋된 이후에 큐에 들어가므로, 워커는 항상 커밋된 데이터를 읽는다.
+
+    settings.BACKGROUND_TASKS_EAGER가 True라면 작업을 즉시 실행한다.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, func, *args, **kwargs):
+        """
+        현재 트랜잭션이 커밋되면 func(*args, **kwargs)를 실행하도록 예약
+        """
+        if settings.BACKGROUND_TASKS_EAGER:
+            func(*args, **kwargs)
+            return
+
+        transaction.on_commit(lambda: self._put(func, args, kwargs))
+
+    def join(self):
+        """큐에 들어간 모든 작업이 끝날 때까지 대기"""
+        self._queue.join()
+
+    def _put(self, func, args, kwargs):
+        self._ensure_worker()
+        self._queue.put((func, args, kwargs))
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="background-tasks", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            func, args, kwargs = self._queue.get()
+            try:
+                close_old_connections()
+                func(*args, **kwargs)
+            except Exception:
+                logger.exception("Background task %s failed", func.__name__)
+            finally:
+                connection.close()
+                self._queue.task_done()
+
+
+background_tasks = BackgroundTaskQueue()
+
+
+def resumable_subscriber_fan_out_jobs():
+    """
+    다시 실행할 수 있는 SubscriberFanOutJob의 QuerySet을 반환하는 함수
+
+    - PENDING: 큐에 들어가기 전이거나, 큐에 있던 중 프로세스가 종료되어 실행되지 않은 작업
+    - FAILED: 실행 중 예외가 발생한 작업
+    - RUNNING: settings.SUBSCRIBER_FAN_OUT_STALE_AFTER초 동안 진행되지 않은 작업 (실행 중 프로세스가 종료됨)
+    """
+    stale_before = timezone.now() - datetime.timedelta(
+        seconds=settings.SUBSCRIBER_FAN_OUT_STALE_AFTER
+    )
+    return SubscriberFanOutJob.objects.filter(
+        Q(
+            status__in=[
+                SubscriberFanOutJob.Status.PENDING,
+                SubscriberFanOutJob.Status.FAILED,
+            ]
+        )
+        | Q(status=SubscriberFanOutJob.Status.RUNNING, updated_at__lt=stale_before)
+    )
+
+
+def claim_subscriber_fan_out_job(job_id):
+    """
+    작업을 RUNNING으로 변경하여 실행 권한을 얻는 함수
+
+    다시 실행할 수 있는 상태일 때만 하나의 UPDATE 문으로 변경하므로,
+    큐의 워커와 resume_subscriber_fan_outs 명령어가 같은 작업을 동시에 실행하지 않는다.
+    실행 권한을 얻었다면 True를 반환한다.
+    """
+    claimed = (
+        resumable_subscriber_fan_out_jobs()
+        .filter(id=job_id)
+        .update(status=SubscriberFanOutJob.Status.RUNNING, updated_at=timezone.now())
+    )
+    return claimed == 1
+
+
+def run_subscriber_fan_out(job_id):
+    """
+    SubscriberFanOutJob을 실행하는 백그라운드 작업
+
+    UsersRoutine id 순으로 batch_size개씩 need_update를 True로 변경하고,
+    배치마다 진행 상황(processed, last_processed_id)을 저장한다.
+    작업이 중간에 실패하거나 프로세스가 종료되더라도 resume_subscriber_fan_out_jobs()가
+    last_processed_id부터 다시 실행한다.
+    이미 다른 곳에서 실행 중이거나 완료된 작업이라면 실행하지 않고 False를 반환한다.
+    """
+    if not claim_subscriber_fan_out_job(job_id):
+        return False
+
+    job = SubscriberFanOutJob.objects.get(id=job_id)
+    subscribers = UsersRoutine.objects.filter(routine_id=job.routine_id).exclude(
+        id=job.excluded_users_routine
+    )
+    batch_size = settings.SUBSCRIBER_FAN_OUT_BATCH_SIZE
+
+    try:
+        while True:
+            batch_ids = list(
+                subscribers.filter(id__gt=job.last_processed_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not batch_ids:
+                break
+
+            with transaction.atomic():
+                UsersRoutine.objects.filter(id__in=batch_ids).update(need_update=True)
+                job.processed += len(batch_ids)
+                job.last_processed_id = batch_ids[-1]
+                job.save(update_fields=["processed", "last_processed_id", "updated_at"])
+    except Exception:
+        job.status = SubscriberFanOutJob.Status.FAILED
+        job.save(update_fields=["status", "updated_at"])
+        raise
+
+    job.status = SubscriberFanOutJob.Status.DONE
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "finished_at", "updated_at"])
+    return True
+
+
+def resume_subscriber_fan_out_jobs():
+    """
+    중단되거나 실패한 SubscriberFanOutJob을 last_processed_id부터 다시 실행하는 함수
+
+    프로세스가 재시작되면 메모리 큐에 있던 작업은 사라지므로, 배포 후와 주기적으로
+    resume_subscriber_fan_outs 명령어로 호출한다.
+    (완료한 작업 수, 다시 실패한 작업 수)를 반환한다.
+    """
+    job_ids = list(
+        resumable_subscriber_fan_out_jobs().order_by("id").values_list("id", flat=True)
+    )
+
+    resumed = failed = 0
+    for job_id in job_ids:
+        try:
+            if run_subscriber_fan_out(job_id):
+                resumed += 1
+        except Exception:
+            failed += 1
+            logger.exception("Subscriber fan-out job %s failed again", job_id)
+
+    return resumed, failed
+
+
+def run_orphaned_routine_collection():
+    """
+    고아 MirroredRoutine 트리를 정리하는 백그라운드 작업
+    """
+    result = OrphanedRoutineCollector().collect()
+    logger.info("Collected orphaned routines: %s", result)
+    return result
+
+
+_orphaned_routine_collection_lock = threading.Lock()
+_last_orphaned_routine_collection = None
+
+
+def schedule_orphaned_routine_collection():
+    """
+    고아 MirroredRoutine 정리 작업을 백그라운드 큐에 예약하는 함수
+
+    요청마다 호출되어도 settings.ORPHANED_ROUTINE_GC_INTERVAL초에 한 번만 예약한다.
+    예약되었다면 True, 건너뛰었다면 False를 반환한다.
+    """
+    global _last_orphaned_routine_collection
+
+    with _orphaned_routine_collection_lock:
+        now = time.monotonic()
+        if (
+            _last_orphaned_routine_collection is not None
+            and now - _last_orphaned_routine_collection
+            < settings.ORPHANED_ROUTINE_GC_INTERVAL
+        ):
+            return False
+        _last_orphaned_routine_collection = now
+
+    background_tasks.enqueue(run_orphaned_routine_collection)
+    return True
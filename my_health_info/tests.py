@@ -1,8 +1,23 @@
+import csv
 import json
+import os
 import random
+import tempfile
+import threading
 from datetime import datetime, timedelta
-
-from django.test import TestCase
+from io import StringIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import close_old_connections, connection
+from django.test import (
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+    skipUnlessDBFeature,
+)
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from freezegun import freeze_time
@@ -11,17 +26,44 @@ from rest_framework.test import APIClient, APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from account.models import CustomUser as User
-from exercises_info.models import ExercisesInfo
+from exercises_info.catalog import ExercisesCatalog
+from exercises_info.models import ExercisesInfo, FocusArea
 from my_health_info.models import (
     ExerciseInRoutine,
+    ExerciseInRoutineAttribute,
     HealthInfo,
     MirroredRoutine,
     Routine,
     RoutineStreak,
+    RoutineStreakSummary,
+    SubscriberFanOutJob,
+    SyncTombstone,
+    UserCacheVersion,
     UsersRoutine,
     WeeklyRoutine,
 )
-from my_health_info.services import UsersRoutineManagementService
+from my_health_info.caches import (
+    HealthInfoCache,
+    RenderedJSONCache,
+    WeeklyScheduleCache,
+    health_info_cache,
+    mirrored_routine_cache,
+    weekly_schedule_cache,
+)
+from my_health_info.collectors import OrphanedRoutineCollector
+from my_health_info.recommendations import RoutineVectorIndex, routine_vector_index
+from my_health_info.search import routine_search_index
+from my_health_info.serializers import (
+    RoutineBatchSubscriptionSerializer,
+    render_mirrored_routine_snapshot,
+)
+from my_health_info.services import (
+    RoutineLikeService,
+    RoutineStreakSummaryService,
+    UsersRoutineManagementService,
+)
+from my_health_info.tasks import resume_subscriber_fan_out_jobs
+from my_health_info.views import DashboardView
 from utils.fake_data import (
     FakeExerciseInRoutine,
     FakeExercisesInfo,
@@ -37,6 +79,8 @@ class MyHealthInfoTestCase(APITestCase):
     @freeze_time("2020-01-01")
     def setUp(self):
         """초기설정"""
+        cache.clear()
+
         self.user1 = FakeUser()
         self.user1.create_instance()
 
@@ -180,6 +224,103 @@ class MyHealthInfoTestCase(APITestCase):
 
         self.assert_equal_health_info(response.json(), new_health_info)
 
+    def test_get_my_health_info_from_cache(self):
+        """같은 유저가 건강 정보 목록과 가장 최근 건강 정보를 다시 조회할 때 캐시 버전 외에 DB를 조회하지 않는지 테스트"""
+        new_health_info = FakeHealthInfo()
+        new_health_info.create_instance(user_instance=self.user1.instance)
+
+        self.client.force_authenticate(user=self.user1.instance)
+
+        first_responses = {
+            "list": self.client.get(reverse("my-health-info-list")),
+            "last": self.client.get(reverse("my-health-info-last")),
+        }
+        hits, misses = health_info_cache.hits, health_info_cache.misses
+
+        for action, first_response in first_responses.items():
+            with self.subTest(action=action):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(reverse(f"my-health-info-{action}"))
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.json(), first_response.json())
+                self.assertEqual(len(queries), 1)
+                self.assertIn("usercacheversion", queries[0]["sql"])
+
+        self.assertEqual(health_info_cache.hits, hits + 2)
+        self.assertEqual(health_info_cache.misses, misses)
+
+    def test_refresh_my_health_info_cache_when_post(self):
+        """건강 정보를 생성하면 캐시된 목록은 무효화되고 가장 최근 건강 정보는 갱신되는지 테스트"""
+        self.client.force_authenticate(user=self.user1.instance)
+
+        self.assertEqual(self.client.get(reverse("my-health-info-list")).json(), [])
+        self.assertEqual(
+            self.client.get(reverse("my-health-info-last")).json().get("date"),
+            "2020-01-01",
+        )
+
+        new_health_info = FakeHealthInfo()
+        response = self.client.post(
+            reverse("my-health-info-list"),
+            data=json.dumps(new_health_info.request_create()),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("my-health-info-last"))
+        self.assertEqual(len(queries), 1)
+        self.assert_equal_health_info(response.json(), new_health_info)
+
+        response = self.client.get(reverse("my-health-info-list"))
+        self.assertEqual(len(response.json()), 1)
+        self.assert_equal_health_info(response.json()[0], new_health_info)
+
+    def test_invalidate_my_health_info_cache_from_other_process(self):
+        """다른 프로세스에서 건강 정보 캐시를 무효화하면 DB의 버전으로 이 프로세스의 캐시도 무효화되는지 테스트"""
+        self.client.force_authenticate(user=self.user1.instance)
+
+        self.assertEqual(self.client.get(reverse("my-health-info-list")).json(), [])
+
+        # 다른 프로세스를 대신하여 signal 없이 건강 정보를 생성하고, 새로 만든 캐시로 무효화
+        HealthInfo.objects.bulk_create(
+            [HealthInfo(user=self.user1.instance, age=30, height=175.0, weight=70.0)]
+        )
+        self.assertEqual(self.client.get(reverse("my-health-info-list")).json(), [])
+
+        user_id = self.user1.instance.id
+        old_key = health_info_cache.make_key(
+            user_id, health_info_cache.get_version(user_id), "recent"
+        )
+        HealthInfoCache(timeout=60).invalidate(user_id)
+
+        # 이 프로세스의 캐시에는 이전 값이 남아 있지만, DB의 버전이 바뀌어 읽지 않음
+        self.assertIsNotNone(cache.get(old_key))
+        self.assertEqual(
+            UserCacheVersion.objects.get(user_id=user_id).health_info,
+            health_info_cache.get_version(user_id),
+        )
+
+        response = self.client.get(reverse("my-health-info-list"))
+        self.assertEqual(len(response.json()), 1)
+
+    def test_get_my_health_info_last_not_found_is_not_cached(self):
+        """건강 정보가 없는 유저의 가장 최근 건강 정보 조회 결과(404)는 캐시하지 않는지 테스트"""
+        new_user = FakeUser()
+        new_user.create_instance()
+        self.client.force_authenticate(user=new_user.instance)
+
+        response = self.client.get(reverse("my-health-info-last"))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        new_health_info = FakeHealthInfo()
+        new_health_info.create_instance(user_instance=new_user.instance)
+
+        response = self.client.get(reverse("my-health-info-last"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assert_equal_health_info(response.json(), new_health_info)
+
     def test_retrieve_my_health_info(self):
         """GET 요청으로 특정 건강 정보를 조회하는지 테스트"""
         self.user1.login(self.client)
@@ -246,6 +387,201 @@ class MyHealthInfoTestCase(APITestCase):
                 )
 
 
+class HealthInfoTimeSeriesTestCase(APITestCase):
+    """
+    목적: 건강 정보를 구간별로 집계하는 시계열 조회에 대한 테스트를 진행합니다.
+
+    Test cases:
+    1. 일 단위 집계 결과와 이동 평균이 직접 계산한 값과 같은지 테스트
+    2. 주, 월 단위 집계 결과가 직접 계산한 값과 같은지 테스트
+    3. 기간 내 건강 정보 수와 관계없이 한 번의 쿼리로 조회하는지 테스트
+    4. 잘못된 query parameter로 요청 시 400 에러를 반환하는지 테스트
+    5. 비로그인 유저가 요청 시 401 에러를 반환하는지 테스트
+    """
+
+    def setUp(self):
+        """
+        초기 설정
+
+        1. 유저 1, 유저 2 생성
+        2. 유저 1의 건강 정보를 2024-01-01부터 90일 동안 격일로 생성
+        3. 유저 2의 건강 정보를 같은 기간에 생성 (집계에 포함되지 않아야 함)
+        """
+        self.user1 = FakeUser()
+        self.user1.create_instance()
+
+        self.user2 = FakeUser()
+        self.user2.create_instance()
+
+        self.start = datetime(2024, 1, 1).date()
+        self.health_infos = []
+        for days in range(0, 90, 2):
+            with freeze_time(self.start + timedelta(days=days)):
+                self.health_infos.append(
+                    HealthInfo.objects.create(
+                        user=self.user1.instance,
+                        age=30,
+                        height=170 + days % 3,
+                        weight=70 + (days % 7) * 0.5,
+                    )
+                )
+                HealthInfo.objects.create(
+                    user=self.user2.instance, age=30, height=180, weight=100
+                )
+
+    def get_time_series(self, **params):
+        self.client.force_authenticate(user=self.user1.instance)
+        return self.client.get(reverse("my-health-info-time-series"), params)
+
+    def aggregate(self, health_infos):
+        """몸무게, BMI의 평균, 최솟값, 최댓값을 직접 계산"""
+        weights = [health_info.weight for health_info in health_infos]
+        bmis = [
+            health_info.weight / (health_info.height / 100) ** 2
+            for health_info in health_infos
+        ]
+        return {
+            "count": len(health_infos),
+            "weight_mean": round(sum(weights) / len(weights), 2),
+            "weight_min": round(min(weights), 2),
+            "weight_max": round(max(weights), 2),
+            "bmi_mean": round(sum(bmis) / len(bmis), 2),
+            "bmi_min": round(min(bmis), 2),
+            "bmi_max": round(max(bmis), 2),
+        }
+
+    def test_get_time_series_by_day(self):
+        """
+        일 단위 집계 결과와 이동 평균이 직접 계산한 값과 같은지 테스트
+
+        reverse_url: my-health-info-time-series
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 2024-01-01 ~ 2024-03-31 기간을 일 단위, window=7로 조회합니다.
+        2. 응답 코드가 200인지 확인합니다.
+        3. 유저 1의 건강 정보 수만큼 구간이 있는지 확인합니다.
+        4. 각 구간의 값과 최근 7일의 이동 평균이 직접 계산한 값과 같은지 확인합니다.
+        """
+        response = self.get_time_series(
+            start="2024-01-01", end="2024-03-31", bucket="day", window=7
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        series = response.json().get("series")
+        self.assertEqual(len(series), len(self.health_infos))
+
+        for point, health_info in zip(series, self.health_infos):
+            expected = self.aggregate([health_info])
+            in_window = [
+                other
+                for other in self.health_infos
+                if 0 <= (health_info.date - other.date).days < 7
+            ]
+            rolling = self.aggregate(in_window)
+
+            self.assertEqual(point["date"], health_info.date.isoformat())
+            for key, value in expected.items():
+                self.assertAlmostEqual(point[key], value)
+            self.assertAlmostEqual(point["weight_rolling_mean"], rolling["weight_mean"])
+            self.assertAlmostEqual(point["bmi_rolling_mean"], rolling["bmi_mean"])
+
+    def test_get_time_series_by_week_and_month(self):
+        """
+        주, 월 단위 집계 결과가 직접 계산한 값과 같은지 테스트
+
+        reverse_url: my-health-info-time-series
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 같은 기간을 주 단위, 월 단위로 각각 조회합니다.
+        2. 구간 시작일이 주의 월요일, 월의 1일인지 확인합니다.
+        3. 각 구간의 개수, 평균, 최솟값, 최댓값이 직접 계산한 값과 같은지 확인합니다.
+        """
+        bucket_keys = {
+            "week": lambda date: date - timedelta(days=date.weekday()),
+            "month": lambda date: date.replace(day=1),
+        }
+
+        for bucket, bucket_key in bucket_keys.items():
+            with self.subTest(bucket=bucket):
+                response = self.get_time_series(
+                    start="2024-01-01", end="2024-03-31", bucket=bucket
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+                expected = {}
+                for health_info in self.health_infos:
+                    expected.setdefault(bucket_key(health_info.date), []).append(
+                        health_info
+                    )
+
+                series = response.json().get("series")
+                self.assertEqual(
+                    [point["date"] for point in series],
+                    [date.isoformat() for date in expected],
+                )
+                for point, health_infos in zip(series, expected.values()):
+                    for key, value in self.aggregate(health_infos).items():
+                        self.assertAlmostEqual(point[key], value)
+
+    def test_get_time_series_in_single_query(self):
+        """
+        기간 내 건강 정보 수와 관계없이 한 번의 쿼리로 조회하는지 테스트
+
+        reverse_url: my-health-info-time-series
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 건강 정보가 없는 기간과 있는 기간을 각각 조회합니다.
+        2. 두 요청 모두 쿼리가 한 번만 실행되는지 확인합니다.
+        """
+        for start, end in [("2023-01-01", "2023-12-31"), ("2024-01-01", "2024-12-31")]:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.get_time_series(start=start, end=end, bucket="week")
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(queries), 1)
+
+    def test_get_time_series_with_invalid_params(self):
+        """
+        잘못된 query parameter로 요청 시 400 에러를 반환하는지 테스트
+
+        reverse_url: my-health-info-time-series
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 지원하지 않는 bucket, 범위를 벗어난 window, start가 end보다 이후인 요청을 보냅니다.
+        2. 모두 응답 코드가 400인지 확인합니다.
+        """
+        invalid_params = [
+            {"bucket": "year"},
+            {"window": 0},
+            {"start": "2024-02-01", "end": "2024-01-01"},
+            {"start": "not-a-date"},
+        ]
+
+        for params in invalid_params:
+            with self.subTest(params=params):
+                response = self.get_time_series(**params)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_time_series_not_authenticated(self):
+        """
+        비로그인 유저가 요청 시 401 에러를 반환하는지 테스트
+
+        reverse_url: my-health-info-time-series
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 로그인하지 않고 요청을 보냅니다.
+        2. 응답 코드가 401인지 확인합니다.
+        """
+        response = self.client.get(reverse("my-health-info-time-series"))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
 class RoutineTestCase(APITestCase):
     """
     목적: Routine 모델과 /routine/ API에 대한 테스트를 진행합니다.
@@ -259,6 +595,10 @@ class RoutineTestCase(APITestCase):
     6. 이미 좋아요를 누른 루틴에 좋아요를 누르는 요청 시 405 에러를 리턴하는지 테스트
     7. 루틴 목록에서 제작자로 검색하여 조회할 수 있는지 테스트
     8. 비로그인 유저가 루틴에 좋아요를 누르는 요청이 401 에러를 리턴하는지 테스트
+    9. 루틴 목록 조회 시 루틴 수와 관계없이 쿼리 수가 일정한지 테스트
+    10. 루틴의 좋아요를 취소하는 요청이 올바르게 처리되는지 테스트
+    11. 좋아요를 누르지 않은 루틴의 좋아요를 취소하는 요청 시 405 에러를 리턴하는지 테스트
+    12. 루틴 목록을 루틴에 포함된 운동의 운동 부위로 필터링하여 조회할 수 있는지 테스트
     """
 
     def setUp(self):
@@ -480,6 +820,55 @@ class RoutineTestCase(APITestCase):
         for routine in data:
             self.assertEqual(routine.get("username"), self.user1.instance.username)
 
+    def test_filter_routine_by_focus_area(self):
+        """
+        루틴 목록을 루틴에 포함된 운동의 운동 부위로 필터링하여 조회할 수 있는지 테스트
+
+        reverse_url: routine-list
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 운동 부위를 운동1: 가슴, 운동2: 등, 운동3~5: 하체로 설정합니다.
+        2. ?focus_area=가슴 으로 조회하면 운동1을 포함하는 루틴1만 조회되는지 확인합니다.
+        3. ?focus_area=가슴,등&focus_area_match=all 로 조회하면
+           서로 다른 운동으로 가슴, 등을 모두 포함하는 루틴1만 조회되는지 확인합니다.
+        4. ?focus_area=등,하체&focus_area_match=all 로 조회하면 루틴3만 조회되는지 확인합니다.
+        5. 존재하지 않는 운동 부위로 조회하면 400 에러를 리턴하는지 확인합니다.
+        """
+        focus_areas = {
+            self.exercise1: "가슴",
+            self.exercise2: "등",
+            self.exercise3: "하체",
+            self.exercise4: "하체",
+            self.exercise5: "하체",
+        }
+        for exercise, focus_area in focus_areas.items():
+            exercise.instance.focus_areas.set(
+                [FocusArea.objects.create(focus_area=focus_area)]
+            )
+
+        self.user1.login(self.client)
+
+        def filter_ids(params):
+            response = self.client.get(reverse("routine-list"), params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return {routine["id"] for routine in response.json()}
+
+        self.assertEqual(
+            filter_ids({"focus_area": "가슴"}), {self.routine1.instance.id}
+        )
+        self.assertEqual(
+            filter_ids({"focus_area": "가슴,등", "focus_area_match": "all"}),
+            {self.routine1.instance.id},
+        )
+        self.assertEqual(
+            filter_ids({"focus_area": "등,하체", "focus_area_match": "all"}),
+            {self.routine3.instance.id},
+        )
+
+        response = self.client.get(reverse("routine-list"), {"focus_area": "꼬리"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_like_routine_not_authenticated(self):
         """
         비로그인 유저가 루틴에 좋아요를 누르는 요청이 401 에러를 리턴하는지 테스트
@@ -497,537 +886,770 @@ class RoutineTestCase(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    def test_unlike_routine(self):
+        """
+        루틴의 좋아요를 취소하는 요청이 올바르게 처리되는지 테스트
 
-class ExerciseInRoutineTestCase(APITestCase):
-    """
-    목적: Routine 모델과 연결되어 루틴에 포함된 운동들을 관리하는 ExerciseInRoutine 모델에 대한 테스트를 진행합니다.
-
-    Test cases:
-    1. 루틴을 조회할 때 루틴에 포함된 운동들을 함께 조회하는지 테스트
-    2. 루틴을 생성할 때 주어진 운동에 대한 정보를 함께 생성하는지 테스트
-    3. 루틴을 업데이트할 때 주어진 운동에 대한 정보를 함께 업데이트하는지 테스트
-    4. 루틴을 삭제할 때 함께 생성된 운동에 대한 정보도 함께 삭제하는지 테스트
-    """
+        reverse_url: routine-like, routine-unlike
+        HTTP method: POST
 
-    def setUp(self):
+        테스트 시나리오:
+        1. 로그인한 유저가 /routine/<pk>/like/에 POST 요청을 보냅니다.
+        2. 좋아요 수가 1 증가하여 DB에 저장되었는지 확인합니다.
+        3. /routine/<pk>/unlike/에 POST 요청을 보냅니다.
+        4. 좋아요 수가 원래대로 돌아오고 좋아요한 유저 목록에서 제거되었는지 확인합니다.
         """
-        초기 설정
+        self.user1.login(self.client)
 
-        1. 어드민 유저 생성
-        2. 운동을 5 개 생성
-        3. 유저 2 명 생성
-        4. 유저 1과 2가 각각 루틴을 생성
-        """
-        self.admin = FakeUser()
-        self.admin.create_instance(is_staff=True)
+        routine = self.routine2.instance
+        like_count = routine.like_count
 
-        self.exercise1 = FakeExercisesInfo()
-        self.exercise1.create_instance(self.admin.instance)
+        response = self.client.post(reverse("routine-like", kwargs={"pk": routine.pk}))
 
-        self.exercise2 = FakeExercisesInfo()
-        self.exercise2.create_instance(self.admin.instance)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json().get("like_count"), f"{like_count + 1}")
+        routine.refresh_from_db()
+        self.assertEqual(routine.like_count, like_count + 1)
 
-        self.exercise3 = FakeExercisesInfo()
-        self.exercise3.create_instance(self.admin.instance)
+        response = self.client.post(
+            reverse("routine-unlike", kwargs={"pk": routine.pk})
+        )
 
-        self.exercise4 = FakeExercisesInfo()
-        self.exercise4.create_instance(self.admin.instance)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json().get("like_count"), f"{like_count}")
+        routine.refresh_from_db()
+        self.assertEqual(routine.like_count, like_count)
+        self.assertFalse(routine.liked_users.filter(id=self.user1.instance.id).exists())
 
-        self.exercise5 = FakeExercisesInfo()
-        self.exercise5.create_instance(self.admin.instance)
+    def test_unlike_routine_not_liked(self):
+        """
+        좋아요를 누르지 않은 루틴의 좋아요를 취소하는 요청 시 405 에러를 리턴하는지 테스트
 
-        self.user1 = FakeUser()
-        self.user1.create_instance()
+        reverse_url: routine-unlike
+        HTTP method: POST
 
-        self.routine1 = FakeRoutine([self.exercise1, self.exercise2, self.exercise3])
-        self.routine1.create_instance(user_instance=self.user1.instance)
+        테스트 시나리오:
+        1. 로그인한 유저가 좋아요를 누르지 않은 루틴의 /routine/<pk>/unlike/에 POST 요청을 보냅니다.
+        2. 405 에러를 리턴하고 좋아요 수가 변하지 않았는지 확인합니다.
+        """
+        self.user1.login(self.client)
 
-        self.user2 = FakeUser()
-        self.user2.create_instance()
+        routine = self.routine2.instance
+        like_count = routine.like_count
 
-        self.routine2 = FakeRoutine([self.exercise4, self.exercise5])
-        self.routine2.create_instance(user_instance=self.user2.instance)
+        response = self.client.post(
+            reverse("routine-unlike", kwargs={"pk": routine.pk})
+        )
 
-    def test_get_exercise_in_ExerciseInRoutine(self):
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+        routine.refresh_from_db()
+        self.assertEqual(routine.like_count, like_count)
+
+    def test_list_routine_query_count_is_constant(self):
         """
-        루틴을 조회할 때 루틴에 포함된 운동들을 함께 조회하는지 테스트
+        루틴 목록 조회 시 루틴 수와 관계없이 쿼리 수가 일정한지 테스트
 
-        reverse_url: routine-detail
+        reverse_url: routine-list, routine-detail
         HTTP method: GET
 
         테스트 시나리오:
-        1. routine1에 포함된 운동들을 조회합니다.
-        2. 그 수를 확인하고 배열에 저장합니다.
-        3. /routine/<pk>/에 GET 요청을 보냅니다.
-        4. Response의 운동들 수가 같은지 확인합니다.
-        5. 미리 저장한 배열과 Response의 운동들이 같은지 확인합니다.
+        1. 로그인한 유저가 /routine/에 GET 요청을 보내고 쿼리 수를 기록합니다.
+        2. 새로운 루틴 10개를 생성합니다.
+        3. 다시 /routine/에 GET 요청을 보내고 쿼리 수를 기록합니다.
+        4. 두 쿼리 수가 같고 정해진 예산 이내인지 확인합니다.
+        5. /routine/<pk>/에 GET 요청을 보낼 때도 같은 예산 이내인지 확인합니다.
         """
-        self.user.login(self.client)
+        query_budget = 4
 
-        pk = self.routine1.instance.pk
+        self.user1.login(self.client)
 
-        exercises = self.routine1.instance.exercises_in_routine.all()
-        exercise_count = exercises.count()
+        with CaptureQueriesContext(connection) as small_list_queries:
+            response = self.client.get(reverse("routine-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        response = self.client.get(reverse("routine-detail", kwargs={"pk": pk}))
+        exercises = [self.exercise1, self.exercise2, self.exercise3, self.exercise4]
+        for _ in range(10):
+            new_routine = FakeRoutine(random.sample(exercises, 3))
+            new_routine.create_instance(user_instance=self.user2.instance)
 
+        with CaptureQueriesContext(connection) as large_list_queries:
+            response = self.client.get(reverse("routine-list"))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), Routine.objects.count())
 
-        data = response.json()
+        self.assertEqual(len(small_list_queries), len(large_list_queries))
+        self.assertLessEqual(len(large_list_queries), query_budget)
 
-        self.assertTrue(len(data.get("exercises_in_routine")), exercise_count)
-        for exercise, response_exercise in zip(
-            exercises, data.get("exercises_in_routine")
-        ):
-            self.assertEqual(
-                exercise.exercise.title,
-                response_exercise.get("exercise_info").get("title"),
-            )
+        pk = self.routine2.instance.pk
+        with self.assertNumQueries(len(large_list_queries)):
+            response = self.client.get(reverse("routine-detail", kwargs={"pk": pk}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-    def test_create_exercise_in_ExerciseInRoutine(self):
-        """
-        루틴을 생성할 때 주어진 운동에 대한 정보를 함께 생성하는지 테스트
 
-        reverse_url: routine-list
-        HTTP method: POST
+class RoutineLikeConcurrencyTestCase(TransactionTestCase):
+    """
+    목적: 여러 유저가 동시에 좋아요를 누를 때 좋아요 수가 정확한지 테스트를 진행합니다.
 
-        테스트 시나리오:
-        1. 새로운 운동을 생성합니다.
-        2. 새로운 루틴을 생성하고 생성된 운동들을 루틴에 추가합니다.
-        3. /routine/에 POST 요청을 보냅니다.
-        4. Response의 운동들이 생성된 운동들과 같은지 확인합니다.
+    Test cases:
+    1. 여러 스레드가 동시에 좋아요를 누르고 같은 유저가 중복 요청해도 좋아요 수가 정확한지 테스트
+    """
+
+    def setUp(self):
         """
-        new_exercise1 = FakeExercisesInfo()
-        new_exercise1.create_instance(self.admin.instance)
+        초기 설정
 
-        new_exercise2 = FakeExercisesInfo()
-        new_exercise2.create_instance(self.admin.instance)
+        1. 관리자 유저와 운동 1개 생성
+        2. 유저 1이 루틴 1개 생성
+        3. 좋아요를 누를 유저 8명 생성
+        """
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
 
-        new_routine = FakeRoutine([new_exercise1, new_exercise2])
+        self.exercise1 = FakeExercisesInfo()
+        self.exercise1.create_instance(self.admin.instance)
 
-        new_exercises_in_routine = new_routine.related_fake_models.get(
-            "exercises_in_routine"
-        )
+        self.user1 = FakeUser()
+        self.user1.create_instance()
 
-        self.user1.login(self.client)
+        self.routine1 = FakeRoutine([self.exercise1])
+        self.routine1.create_instance(user_instance=self.user1.instance)
 
-        response = self.client.post(
-            reverse("routine-list"),
-            data=new_routine.request_create(),
-            content_type="application/json",
-        )
+        self.likers = [FakeUser() for _ in range(8)]
+        for liker in self.likers:
+            liker.create_instance()
 
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+    @skipUnlessDBFeature("test_db_allows_multiple_connections")
+    def test_concurrent_likes_keep_exact_count(self):
+        """
+        여러 스레드가 동시에 좋아요를 누르고 같은 유저가 중복 요청해도 좋아요 수가 정확한지 테스트
 
-        data = response.json()
+        테스트 시나리오:
+        1. 유저마다 좋아요 요청 2개씩을 스레드로 만들어 동시에 실행합니다.
+        2. 유저마다 정확히 하나의 요청만 성공했는지 확인합니다.
+        3. 루틴의 like_count가 좋아요를 누른 유저 수와 같은지 확인합니다.
+        """
+        routine = self.routine1.instance
+        barrier = threading.Barrier(len(self.likers) * 2)
+        results = []
+
+        def like(user):
+            barrier.wait()
+            try:
+                RoutineLikeService(user=user, routine=routine).like()
+                results.append((user.id, True))
+            except ValueError:
+                results.append((user.id, False))
+            finally:
+                close_old_connections()
+                connection.close()
+
+        threads = [
+            threading.Thread(target=like, args=(liker.instance,))
+            for liker in self.likers
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
 
-        for exercise, response_exercise in zip(
-            new_exercises_in_routine, data.get("exercises_in_routine")
-        ):
+        for liker in self.likers:
             self.assertEqual(
-                exercise.related_fake_models.get("exercises_info").instance.title,
-                response_exercise.get("exercise_info").get("title"),
+                [ok for user_id, ok in results if user_id == liker.instance.id].count(
+                    True
+                ),
+                1,
             )
 
-    def test_update_exercise_in_ExerciseInRoutine(self):
+        routine.refresh_from_db()
+        self.assertEqual(routine.like_count, len(self.likers))
+        self.assertEqual(routine.liked_users.count(), len(self.likers))
+
+
+class RoutinePaginationTestCase(APITestCase):
+    """
+    목적: /routine/ 목록의 커서 기반 페이지네이션에 대한 테스트를 진행합니다.
+
+    Test cases:
+    1. Link 헤더를 따라 모든 페이지를 조회하면 중복, 누락 없이 정렬된 전체 루틴을 얻는지 테스트
+    2. 좋아요 순 정렬에서도 페이지를 넘겨 정렬된 전체 루틴을 얻는지 테스트
+    3. 잘못된 커서로 요청 시 404 에러를 리턴하는지 테스트
+    4. 같은 밀리초 안에 생성된 루틴들도 페이지 경계에서 누락되지 않는지 테스트
+    """
+
+    def setUp(self):
         """
-        루틴을 업데이트할 때 주어진 운동에 대한 정보를 함께 업데이트하는지 테스트
+        초기 설정
 
-        reverse_url: routine-detail
-        HTTP method: PATCH
+        1. 관리자 유저와 운동 2개 생성
+        2. 유저 1 생성
+        3. 유저 1이 좋아요 수가 겹치는 루틴 23개 생성
+        """
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
 
-        테스트 시나리오:
-        1. 새로운 운동을 생성합니다.
-        2. 새 운동에 대한 정보와 순서가 담긴 ExerciseInRoutine 배열을 생성합니다.
-        3. /routine/<pk>/에 PATCH 요청을 보냅니다.
-        4. Response의 운동들이 예상한 운동들과 같은지 확인합니다.
+        self.exercise1 = FakeExercisesInfo()
+        self.exercise1.create_instance(self.admin.instance)
+
+        self.exercise2 = FakeExercisesInfo()
+        self.exercise2.create_instance(self.admin.instance)
+
+        self.user1 = FakeUser()
+        self.user1.create_instance()
+
+        for i in range(23):
+            routine = FakeRoutine([self.exercise1, self.exercise2])
+            routine.create_instance(user_instance=self.user1.instance)
+            routine.instance.like_count = i % 4
+            routine.instance.save()
+
+    def collect_pages(self, url):
+        """Link 헤더의 next 주소를 따라가며 모든 페이지의 루틴 id와 페이지 수를 반환"""
+        routine_ids = []
+        page_count = 0
+
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            data = response.json()
+            self.assertLessEqual(len(data), 5)
+            routine_ids += [routine.get("id") for routine in data]
+            page_count += 1
+
+            link = response.headers.get("Link")
+            url = link[1 : link.index(">")] if link else None
+
+        return routine_ids, page_count
+
+    def test_list_routine_pages_follow_cursor(self):
         """
-        new_exercise1 = FakeExercisesInfo()
-        new_exercise1.create_instance(self.admin.instance)
+        Link 헤더를 따라 모든 페이지를 조회하면 중복, 누락 없이 정렬된 전체 루틴을 얻는지 테스트
 
-        new_exercise2 = FakeExercisesInfo()
-        new_exercise2.create_instance(self.admin.instance)
+        reverse_url: routine-list
+        HTTP method: GET
 
-        new_exercise_in_routine1 = FakeExerciseInRoutine(
-            order=1, fake_exercises_info=new_exercise1
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. page_size=5로 /routine/에 GET 요청을 보내고 Link 헤더를 따라 모든 페이지를 조회합니다.
+        3. 페이지 수가 5인지 확인합니다.
+        4. 조회된 루틴 id가 -created_at, -id 순으로 정렬한 루틴 id와 같은지 확인합니다.
+        """
+        self.user1.login(self.client)
+
+        routine_ids, page_count = self.collect_pages(
+            reverse("routine-list") + "?page_size=5"
         )
-        new_exercise_in_routine2 = FakeExerciseInRoutine(
-            order=2, fake_exercises_info=new_exercise2
+
+        expected_ids = list(
+            Routine.objects.order_by("-created_at", "-id").values_list("id", flat=True)
         )
 
-        existed_exercise_in_routines = self.routine1.instance.exercises_in_routine.all()
+        self.assertEqual(page_count, 5)
+        self.assertEqual(routine_ids, expected_ids)
 
-        request_update = [
-            new_exercise_in_routine1.request_create(),
-            new_exercise_in_routine2.request_create(),
-        ]
+    def test_list_routine_pages_sorted_by_like(self):
+        """
+        좋아요 순 정렬에서도 페이지를 넘겨 정렬된 전체 루틴을 얻는지 테스트
 
-        pk = self.routine1.instance.pk
+        reverse_url: routine-list
+        HTTP method: GET
 
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. ordering=-like_count, page_size=5로 모든 페이지를 조회합니다.
+        3. 조회된 루틴 id가 -like_count, -created_at, -id 순으로 정렬한 루틴 id와 같은지 확인합니다.
+        """
         self.user1.login(self.client)
 
-        response = self.client.patch(
-            reverse("routine-detail", kwargs={"pk": pk}),
-            data={"exercises_in_routine": request_update},
-            content_type="application/json",
+        routine_ids, _ = self.collect_pages(
+            reverse("routine-list") + "?ordering=-like_count&page_size=5"
         )
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-        data = response.json()
-
-        for exercise, response_exercise in zip(
-            request_update, data.get("exercises_in_routine")
-        ):
-            self.assertEqual(
-                ExercisesInfo.objects.get(pk=exercise.get("exercise")).title,
-                response_exercise.get("exercise_info").get("title"),
+        expected_ids = list(
+            Routine.objects.order_by("-like_count", "-created_at", "-id").values_list(
+                "id", flat=True
             )
+        )
 
-    def test_delete_exercise_in_ExerciseInRoutine(self):
+        self.assertEqual(routine_ids, expected_ids)
+
+    def test_list_routine_with_invalid_cursor(self):
         """
-        루틴을 삭제할 때 함께 생성된 운동에 대한 정보는 삭제되지 않는지 테스트
+        잘못된 커서로 요청 시 404 에러를 리턴하는지 테스트
 
-        reverse_url: routine-detail
-        HTTP method: DELETE
+        reverse_url: routine-list
+        HTTP method: GET
 
         테스트 시나리오:
-        1. routine1에 포함된 운동들을 조회합니다.
-        2. 그 id를 배열에 저장합니다.
-        3. /routine/<pk>/에 DELETE 요청을 보냅니다.
-        4. response가 204를 리턴하는지 확인합니다.
-        5. 해당 루틴이 삭제되었는지 확인합니다.
-        6. 해당 루틴 내의 운동이 삭제되지 않았는지 확인합니다.
-        7. 해당 루틴 내의 운동들이 삭제되지 않았는지 확인합니다.
+        1. 유저 1이 로그인합니다.
+        2. 디코딩할 수 없는 커서로 /routine/에 GET 요청을 보냅니다.
+        3. 404 에러를 리턴하는지 확인합니다.
         """
         self.user1.login(self.client)
 
-        pk = self.routine1.instance.pk
+        response = self.client.get(reverse("routine-list") + "?cursor=invalid")
 
-        exercise_in_routines = self.routine1.instance.exercises_in_routine.all()
-        exercise_in_routine_ids = [
-            exercise_in_routine.pk for exercise_in_routine in exercise_in_routines
-        ]
-        exercise_ids = [
-            exercise_in_routine.exercise.pk
-            for exercise_in_routine in exercise_in_routines
-        ]
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
-        response = self.client.delete(reverse("routine-detail", kwargs={"pk": pk}))
+    def test_list_routine_pages_within_same_millisecond(self):
+        """
+        같은 밀리초 안에 생성된 루틴들도 페이지 경계에서 누락되지 않는지 테스트
 
-        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        self.assertFalse(Routine.objects.filter(pk=pk).exists())
+        reverse_url: routine-list
+        HTTP method: GET
 
-        for id in exercise_in_routine_ids:
-            self.assertTrue(ExerciseInRoutine.objects.filter(pk=id).exists())
+        테스트 시나리오:
+        1. 모든 루틴의 created_at을 같은 밀리초 안의 서로 다른 마이크로초로 변경합니다.
+        2. 유저 1이 로그인합니다.
+        3. page_size=2로 모든 페이지를 조회합니다.
+        4. 조회된 루틴 id가 -created_at, -id 순으로 정렬한 루틴 id와 같은지 확인합니다.
+        """
+        created_at = timezone.now().replace(microsecond=123000)
+        for i, routine in enumerate(Routine.objects.order_by("id")):
+            Routine.objects.filter(id=routine.id).update(
+                created_at=created_at + timedelta(microseconds=(i * 7) % 1000)
+            )
 
-        for id in exercise_ids:
-            self.assertTrue(ExercisesInfo.objects.filter(pk=id).exists())
+        self.user1.login(self.client)
 
+        routine_ids, _ = self.collect_pages(reverse("routine-list") + "?page_size=2")
 
-class UsersRoutineTestCase(APITestCase):
+        expected_ids = list(
+            Routine.objects.order_by("-created_at", "-id").values_list("id", flat=True)
+        )
+
+        self.assertEqual(len(routine_ids), 23)
+        self.assertEqual(routine_ids, expected_ids)
+
+
+class RoutineSearchTestCase(APITestCase):
     """
-    목적: 유저가 보유한 루틴을 관리하는 UsersRoutine 모델에 대한 테스트를 진행합니다.
+    목적: 루틴 전문 검색(/routine/search/)에 대한 테스트를 진행합니다.
 
     Test cases:
-    1. 유저가 보유한 루틴을 조회하는지 테스트
-    2. 유저가 UsersRoutine을 생성할 때 Routine이 함께 생성되는지 테스트
-    3. 유저가 루틴을 구독했을 시 UsersRoutine이 생성되는지 테스트
-    4. 유저가 생성한 루틴이 업데이트되었을 시 작성자와 구독자의 SideEffect가 제대로 작동하는지 테스트
-    5. 유저가 자신이 작성한 UsersRoutine을 삭제했을때 SideEffect가 잘 작동하는지 테스트
-    6. 유저가 구독중인 UsersRoutine을 삭제했을 시 SideEffect가 잘 작동했는지 테스트
+    1. 한국어 제목의 일부로 루틴을 검색하는지 테스트
+    2. 작성자 username, 운동 제목으로도 검색되고 제목 일치가 더 높은 순위인지 테스트
+    3. 루틴 수정 시 검색 인덱스가 새 제목, 운동으로 갱신되는지 테스트
+    4. Link 헤더를 따라 모든 검색 결과를 순위 순으로 조회하는지 테스트
+    5. 삭제된 루틴은 검색되지 않고, 검색할 단어가 없으면 400 에러를 리턴하는지 테스트
     """
 
     def setUp(self):
         """
         초기 설정
 
-        1. 관리자 유저 생성
-        2. 운동 4개 생성
-        3. 유저 2명 생성
-        4. 유저 1이 루틴 1개 생성
-        5. 유저 2가 루틴 1개 생성
-        6. 유저 1이 유저 2의 루틴을 구독
-        7. 유저 2가 유저 1의 루틴을 구독
+        1. 관리자 유저와 운동 2개(데드리프트, 스쿼트) 생성
+        2. username이 "헬스왕철수"인 유저 1 생성
+        3. 유저 1이 제목이 "벤치프레스 루틴", "하체 집중 루틴", "데드리프트 챌린지"인 루틴 생성
+        4. 유저 1이 데드리프트를 포함하는 "기본 루틴" 생성
+        5. 모든 루틴의 검색 문서를 생성
         """
-        self.client = APIClient()
-
         self.admin = FakeUser()
         self.admin.create_instance(is_staff=True)
 
-        self.exercise1 = FakeExercisesInfo()
-        self.exercise1.create_instance(self.admin.instance)
-
-        self.exercise2 = FakeExercisesInfo()
-        self.exercise2.create_instance(self.admin.instance)
-
-        self.exercise3 = FakeExercisesInfo()
-        self.exercise3.create_instance(self.admin.instance)
+        self.deadlift = FakeExercisesInfo()
+        self.deadlift.base_attr["title"] = "데드리프트"
+        self.deadlift.create_instance(self.admin.instance)
 
-        self.exercise4 = FakeExercisesInfo()
-        self.exercise4.create_instance(self.admin.instance)
+        self.squat = FakeExercisesInfo()
+        self.squat.base_attr["title"] = "스쿼트"
+        self.squat.create_instance(self.admin.instance)
 
         self.user1 = FakeUser()
+        self.user1.base_attr["username"] = "헬스왕철수"
         self.user1.create_instance()
 
-        self.routine1 = FakeRoutine([self.exercise1, self.exercise2])
-        self.routine1.create_instance(user_instance=self.user1.instance)
+        self.routines = {}
+        for title, exercises in [
+            ("벤치프레스 루틴", [self.squat]),
+            ("하체 집중 루틴", [self.squat]),
+            ("데드리프트 챌린지", [self.squat]),
+            ("기본 루틴", [self.deadlift, self.squat]),
+        ]:
+            routine = FakeRoutine(exercises)
+            routine.base_attr["title"] = title
+            self.routines[title] = routine.create_instance(
+                user_instance=self.user1.instance
+            )
 
-        self.user2 = FakeUser()
-        self.user2.create_instance()
+        routine_search_index.rebuild()
 
-        self.routine2 = FakeRoutine([self.exercise3, self.exercise4])
-        self.routine2.create_instance(user_instance=self.user2.instance)
+    def search(self, query, **params):
+        return self.client.get(reverse("routine-search"), {"q": query, **params})
 
-        self.routine3 = FakeRoutine([self.exercise1, self.exercise2])
-        self.routine3.create_instance(user_instance=self.user2.instance)
+    def test_search_routine_by_korean_title(self):
+        """
+        한국어 제목의 일부로 루틴을 검색하는지 테스트
 
-        service = UsersRoutineManagementService(
-            routine=self.routine2.instance, user=self.user1.instance
+        reverse_url: routine-search
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. 단어 중간부터 시작하는 "프레스"로 검색하여 "벤치프레스 루틴"만 조회되는지 확인합니다.
+        3. "루틴"으로 검색하여 제목에 루틴이 포함된 3개의 루틴이 조회되는지 확인합니다.
+        4. 전각 문자가 포함된 "하체　집중"으로 검색하여 "하체 집중 루틴"이 조회되는지 확인합니다.
+        """
+        self.user1.login(self.client)
+
+        response = self.search("프레스")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [routine["id"] for routine in response.json()],
+            [self.routines["벤치프레스 루틴"].id],
         )
 
-        self.user1_routine_written_by_user2 = service.user_subscribe_routine()
+        response = self.search("루틴")
+        self.assertEqual(
+            {routine["id"] for routine in response.json()},
+            {
+                self.routines[title].id
+                for title in ["벤치프레스 루틴", "하체 집중 루틴", "기본 루틴"]
+            },
+        )
 
-        service = UsersRoutineManagementService(
-            routine=self.routine1.instance, user=self.user2.instance
+        response = self.search("하체　집중")
+        self.assertEqual(
+            [routine["title"] for routine in response.json()], ["하체 집중 루틴"]
         )
-        self.user2_routine_written_by_user1 = service.user_subscribe_routine()
 
-    def test_get_users_routine(self):
+    def test_search_routine_by_author_and_exercise(self):
         """
-        유저가 보유한 루틴을 조회하는지 테스트
+        작성자 username, 운동 제목으로도 검색되고 제목 일치가 더 높은 순위인지 테스트
 
-        reverse_url: routine-users-routine-list
+        reverse_url: routine-search
         HTTP method: GET
 
         테스트 시나리오:
-        1. 유저 1이 보유한 루틴을 조회합니다.
-        2. 그 수를 확인하고 배열에 저장합니다.
-        3. /users-routine/에 GET 요청을 보냅니다.
-        4. Response의 루틴들 수가 같은지 확인합니다.
-        5. 미리 저장한 배열과 Response의 루틴들이 같은지 확인합니다.
+        1. 유저 1이 로그인합니다.
+        2. username의 일부인 "철수"로 검색하여 유저 1의 모든 루틴이 조회되는지 확인합니다.
+        3. "데드리프트"로 검색하여 제목이 일치하는 루틴이 운동만 포함하는 루틴보다 앞에 오는지 확인합니다.
         """
         self.user1.login(self.client)
 
-        user1_routines = UsersRoutine.objects.filter(user=self.user1.instance)
-
-        routine_count = user1_routines.count()
-
-        response = self.client.get(reverse("users-routine-list"))
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-        data = response.json()
+        response = self.search("철수")
+        self.assertEqual(len(response.json()), 4)
 
-        self.assertEqual(len(data), routine_count)
-        for user1_routine, response_routine in zip(user1_routines, data):
-            self.assertEqual(user1_routine.routine.id, response_routine.get("routine"))
+        response = self.search("데드리프트")
+        self.assertEqual(
+            [routine["id"] for routine in response.json()],
+            [self.routines["데드리프트 챌린지"].id, self.routines["기본 루틴"].id],
+        )
 
-    def test_create_routine_when_create_users_routine(self):
+    def test_search_index_updated_when_routine_updated(self):
         """
-        유저가 새 UsersRoutine을 생성할 때 Routine이 함께 생성되는지 테스트
+        루틴 수정 시 검색 인덱스가 새 제목, 운동으로 갱신되는지 테스트
 
-        reverse_url: users-routine-list
-        HTTP method: POST
+        reverse_url: users-routine-detail, routine-search
+        HTTP method: PATCH, GET
 
         테스트 시나리오:
-        1. Routine의 개수를 저장합니다.
-        2. 유저 2가 로그인합니다.
-        3. users-routine-list에 post 요청을 보냅니다.
-        4. 응답 코드가 201인지 확인합니다.
-        5. Routine의 개수가 1 증가했는지 확인합니다.
-        6. 가장 최근에 생성된 UsersRoutine의 정보와 응답 데이터의 정보를 비교합니다.
+        1. 유저 1이 로그인합니다.
+        2. "벤치프레스 루틴"의 제목을 "풀업 루틴"으로, 운동을 데드리프트로 수정합니다.
+        3. "벤치프레스"로는 검색되지 않고 "풀업", "데드리프트"로는 검색되는지 확인합니다.
         """
+        self.user1.login(self.client)
 
-        routine_count = Routine.objects.count()
-
-        new_routine = FakeRoutine([self.exercise1, self.exercise2])
+        routine = self.routines["벤치프레스 루틴"]
+        users_routine = UsersRoutine.objects.get(
+            user=self.user1.instance, routine=routine
+        )
 
-        self.user2.login(self.client)
+        new_routine = FakeRoutine([self.deadlift])
+        new_routine.base_attr["title"] = "풀업 루틴"
 
-        response = self.client.post(
-            reverse("users-routine-list"),
+        response = self.client.patch(
+            reverse("users-routine-detail", kwargs={"pk": users_routine.pk}),
             data=json.dumps(new_routine.request_create()),
             content_type="application/json",
         )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        self.assertEqual(self.search("벤치프레스").json(), [])
+        self.assertEqual(
+            [routine_data["id"] for routine_data in self.search("풀업").json()],
+            [routine.id],
+        )
+        self.assertIn(
+            routine.id,
+            [routine_data["id"] for routine_data in self.search("데드리프트").json()],
+        )
 
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+    def test_search_routine_pages_follow_cursor(self):
+        """
+        Link 헤더를 따라 모든 검색 결과를 순위 순으로 조회하는지 테스트
 
-        self.assertEqual(Routine.objects.count(), routine_count + 1)
-
-    def test_create_users_routine_when_subscribe_routine(self):
-        """
-        유저가 루틴을 구독했을 시 UsersRoutine이 생성되는지 테스트
-
-        reverse_url: routine-subscribe
-        HTTP method: POST
+        reverse_url: routine-search
+        HTTP method: GET
 
         테스트 시나리오:
-        1. 유저 2로 로그인합니다.
-        2. 유저 1이 생성한 루틴을 구독합니다.
-        3. 응답 코드가 201인지 확인합니다.
-        4. 구독한 루틴이 응답 데이터에 포함된 루틴과 같은지 확인합니다.
+        1. 유저 1이 로그인합니다.
+        2. "철수"로 page_size=3으로 검색하고 Link 헤더를 따라 모든 페이지를 조회합니다.
+        3. 페이지 수가 2이고, 조회된 루틴이 중복, 누락 없이 유저 1의 루틴 전체인지 확인합니다.
+        4. 첫 페이지와 같은 순서로 정렬되어 있는지 확인합니다.
         """
-        pk = self.routine3.instance.pk
-
         self.user1.login(self.client)
 
-        response = self.client.post(reverse("routine-subscribe", kwargs={"pk": pk}))
+        full_ids = [routine["id"] for routine in self.search("철수").json()]
 
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        routine_ids = []
+        page_count = 0
+        response = self.search("철수", page_size=3)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            routine_ids += [routine["id"] for routine in response.json()]
+            page_count += 1
 
-        data = response.json()
+            link = response.headers.get("Link")
+            if not link:
+                break
+            response = self.client.get(link[1 : link.index(">")])
 
-        self.assertEqual(self.routine3.instance.pk, data.get("routine"))
+        self.assertEqual(page_count, 2)
+        self.assertEqual(routine_ids, full_ids)
+        self.assertEqual(
+            set(routine_ids), {routine.id for routine in self.routines.values()}
+        )
 
-    def test_update_users_routine_if_author(self):
+    def test_search_excludes_deleted_routine_and_rejects_empty_query(self):
         """
-        유저가 생성한 루틴이 업데이트되었을 시 SideEffect가 제대로 작동하는지 테스트
+        삭제된 루틴은 검색되지 않고, 검색할 단어가 없으면 400 에러를 리턴하는지 테스트
 
-        reverse_url: users-routine-detail
-        HTTP method: PATCH
+        reverse_url: routine-search
+        HTTP method: GET
 
         테스트 시나리오:
         1. 유저 1이 로그인합니다.
-        2. 유저 1이 생성한 UsersRoutine을 업데이트합니다.
-        3. 응답 코드가 200인지 확인합니다.
-        4. Routine의 정보가 업데이트되었는지 확인합니다.
-        5. 업데이트된 Routine의 mirrored_routine이 UsersRoutine의 mirrored_routine과 같은지 확인합니다.
-        6. UsersRoutine의 need_update가 False인지 확인합니다.
-        7. 유저 2의 users_routine을 비교해서 mirrored_routine이 응답 데이터와 다른지 확인합니다.
-        8. 유저 2의 users_routine의 need_update가 True인지 확인합니다.
+        2. "하체 집중 루틴"의 is_deleted를 True로 변경하고 "하체"로 검색하여 결과가 없는지 확인합니다.
+        3. 기호로만 이루어진 검색어로 검색 시 400 에러를 리턴하는지 확인합니다.
         """
-
         self.user1.login(self.client)
 
-        user1_routine = UsersRoutine.objects.filter(user=self.user1.instance).first()
-        user2_routine = UsersRoutine.objects.filter(
-            user=self.user2.instance, routine=user1_routine.routine
-        ).first()
+        routine = self.routines["하체 집중 루틴"]
+        routine.is_deleted = True
+        routine.save()
 
-        pk = user1_routine.pk
+        response = self.search("하체")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), [])
 
-        new_routine = FakeRoutine([self.exercise3, self.exercise4])
+        response = self.search("!!!")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
-        response = self.client.patch(
-            reverse("users-routine-detail", kwargs={"pk": pk}),
-            data=json.dumps(new_routine.request_create()),
-            content_type="application/json",
-        )
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        user1_routine.refresh_from_db()
-        user2_routine.refresh_from_db()
+class RoutineRecommendationTestCase(APITestCase):
+    """
+    목적: 유사한 루틴, 추천 루틴 조회에 대한 테스트를 진행합니다.
 
-        data = response.json()
-        print(json.dumps(data, indent=2))
-        self.assertEqual(
-            user1_routine.mirrored_routine.id, data.get("mirrored_routine")
+    Test cases:
+    1. 운동 구성이 같은 루틴이 가장 유사한 루틴으로 조회되는지 테스트
+    2. 보유한 루틴과 유사한 루틴을 추천하고 보유한 루틴은 제외하는지 테스트
+    3. 루틴 생성, 수정, 삭제가 다음 조회의 벡터 인덱스에 반영되는지 테스트
+    4. 변경된 루틴이 없다면 한 번의 쿼리로 인덱스를 갱신하고, 용량을 넘으면 행렬이 늘어나는지 테스트
+    """
+
+    def setUp(self):
+        """
+        초기 설정
+
+        1. 관리자 유저와 운동 4개 생성
+        2. 유저 2명 생성
+        3. 유저 1이 운동 1, 2로 루틴 A, B를, 운동 3, 4로 루틴 C를 생성
+        4. 유저 2가 루틴 A를 구독
+        5. 추천 벡터 인덱스를 비움
+        """
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.exercises = []
+        for _ in range(4):
+            exercise = FakeExercisesInfo()
+            exercise.create_instance(self.admin.instance)
+            self.exercises.append(exercise)
+
+        self.user1 = FakeUser()
+        self.user1.create_instance()
+        self.user2 = FakeUser()
+        self.user2.create_instance()
+
+        self.routine_a = FakeRoutine(self.exercises[:2]).create_instance(
+            user_instance=self.user1.instance
+        )
+        self.routine_b = FakeRoutine(self.exercises[:2]).create_instance(
+            user_instance=self.user1.instance
+        )
+        self.routine_c = FakeRoutine(self.exercises[2:]).create_instance(
+            user_instance=self.user1.instance
         )
-        self.assertEqual(user1_routine.routine.id, data.get("routine"))
-        self.assertEqual(new_routine.base_attr.get("title"), data.get("title"))
-        self.assertFalse(data.get("need_update"))
 
-        self.assertNotEqual(
-            user2_routine.mirrored_routine.id, data.get("mirrored_routine")
+        UsersRoutineManagementService(
+            user=self.user2.instance, routine=self.routine_a
+        ).user_subscribe_routine()
+
+        routine_vector_index.clear()
+
+    def get_similar(self, routine):
+        response = self.client.get(
+            reverse("routine-similar", kwargs={"pk": routine.id})
         )
-        self.assertTrue(user2_routine.need_update)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
 
-    def test_delete_users_routine_if_author(self):
+    def test_similar_routine(self):
         """
-        유저가 자신이 작성한 UsersRoutine을 삭제했을때 SideEffect가 잘 작동하는지 테스트
+        운동 구성이 같은 루틴이 가장 유사한 루틴으로 조회되는지 테스트
 
-        reverse_url: users-routine-detail
-        HTTP method: DELETE
+        reverse_url: routine-similar
+        HTTP method: GET
 
         테스트 시나리오:
         1. 유저 1이 로그인합니다.
-        2. 유저 1이 생성한 UsersRoutine을 삭제합니다.
-        3. 응답 코드가 204인지 확인합니다.
-        4. UsersRoutine이 삭제되었는지 확인합니다.
-        5. 기존에 UsersRoutine과 연결된 Routine이 삭제되었는지 확인합니다.
-        6. UsersRoutine에 연결됬던 MirroredRoutine이 삭제되지 않았는지 확인합니다.
+        2. 루틴 A와 유사한 루틴을 조회합니다.
+        3. 첫 번째 결과가 유사도 1의 루틴 B이고, 루틴 A 자신은 포함되지 않는지 확인합니다.
+        4. limit=1로 조회 시 한 개만 반환하는지 확인합니다.
         """
-
         self.user1.login(self.client)
 
-        user1_routine = UsersRoutine.objects.filter(user=self.user1.instance).first()
-        user1_routine_routine_pk = user1_routine.routine.pk
-        user1_routine_mirrored_routine_pk = user1_routine.mirrored_routine.pk
+        data = self.get_similar(self.routine_a)
 
-        pk = user1_routine.pk
+        self.assertEqual(data[0]["id"], self.routine_b.id)
+        self.assertAlmostEqual(data[0]["similarity"], 1.0, places=3)
+        self.assertEqual(data[0]["title"], self.routine_b.title)
+        self.assertNotIn(self.routine_a.id, [routine["id"] for routine in data])
 
-        response = self.client.delete(
-            reverse("users-routine-detail", kwargs={"pk": pk})
+        response = self.client.get(
+            reverse("routine-similar", kwargs={"pk": self.routine_a.id}),
+            {"limit": 1},
         )
+        self.assertEqual(len(response.json()), 1)
 
-        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+    def test_recommended_routine(self):
+        """
+        보유한 루틴과 유사한 루틴을 추천하고 보유한 루틴은 제외하는지 테스트
 
-        self.assertFalse(UsersRoutine.objects.filter(pk=pk).exists())
-        self.assertFalse(Routine.objects.filter(pk=user1_routine_routine_pk).exists())
-        self.assertTrue(
-            MirroredRoutine.objects.filter(
-                pk=user1_routine_mirrored_routine_pk
-            ).exists()
-        )
+        reverse_url: routine-recommended
+        HTTP method: GET
 
-    def test_delete_users_routine_if_not_author(self):
+        테스트 시나리오:
+        1. 루틴 A를 구독한 유저 2가 로그인합니다.
+        2. 추천 루틴을 조회하여 첫 번째 결과가 루틴 B이고 루틴 A는 포함되지 않는지 확인합니다.
+        3. 보유한 루틴이 없는 관리자 유저로 조회 시 빈 리스트를 반환하는지 확인합니다.
+        4. limit이 범위를 벗어나면 400 에러를 리턴하는지 확인합니다.
         """
-        구독중인 UsersRoutine을 삭제했을 시 SideEffect가 잘 작동하는지 테스트
+        self.user2.login(self.client)
 
-        reverse_url: users-routine-detail
-        HTTP method: DELETE
+        response = self.client.get(reverse("routine-recommended"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        테스트 시나리오:
-        1. 유저 1이 구독중인 user1_routine_written_by_user2를 삭제합니다.
-        2. 응답 코드가 204인지 확인합니다.
-        3. UsersRoutine이 삭제되었는지 확인합니다.
-        4. Routine이 삭제되지 않았는지 확인합니다.
-        5. MirroredRoutine이 삭제되지 않았는지 확인합니다.
+        data = response.json()
+        self.assertEqual(data[0]["id"], self.routine_b.id)
+        self.assertNotIn(self.routine_a.id, [routine["id"] for routine in data])
+
+        self.admin.login(self.client)
+        response = self.client.get(reverse("routine-recommended"))
+        self.assertEqual(response.json(), [])
+
+        response = self.client.get(reverse("routine-recommended"), {"limit": 0})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_vector_index_follows_routine_changes(self):
         """
+        루틴 생성, 수정, 삭제가 다음 조회의 벡터 인덱스에 반영되는지 테스트
+
+        reverse_url: routine-similar, users-routine-list, users-routine-detail
+        HTTP method: GET, POST, PATCH, DELETE
 
+        테스트 시나리오:
+        1. 유저 1이 로그인하고 루틴 A와 유사한 루틴을 조회하여 인덱스를 만듭니다.
+        2. 루틴 C를 운동 1, 2로 수정하고, 운동 1, 2로 새 루틴을 생성합니다.
+        3. 루틴 A와 유사한 루틴에 루틴 C와 새 루틴이 유사도 1로 포함되는지 확인합니다.
+        4. 루틴 B를 삭제한 후 루틴 A와 유사한 루틴에서 루틴 B가 제외되는지 확인합니다.
+        """
         self.user1.login(self.client)
+        self.get_similar(self.routine_a)
 
-        pk = self.user1_routine_written_by_user2.pk
+        users_routine_c = UsersRoutine.objects.get(
+            user=self.user1.instance, routine=self.routine_c
+        )
+        response = self.client.patch(
+            reverse("users-routine-detail", kwargs={"pk": users_routine_c.pk}),
+            data=json.dumps(FakeRoutine(self.exercises[:2]).request_create()),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        response = self.client.delete(
-            reverse("users-routine-detail", kwargs={"pk": pk})
+        response = self.client.post(
+            reverse("users-routine-list"),
+            data=json.dumps(FakeRoutine(self.exercises[:2]).request_create()),
+            content_type="application/json",
         )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        new_routine_id = response.json()["routine"]
 
-        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        similarities = {
+            routine["id"]: routine["similarity"]
+            for routine in self.get_similar(self.routine_a)
+        }
+        self.assertAlmostEqual(similarities[self.routine_c.id], 1.0, places=3)
+        self.assertAlmostEqual(similarities[new_routine_id], 1.0, places=3)
 
-        self.assertFalse(UsersRoutine.objects.filter(pk=pk).exists())
-        self.assertTrue(Routine.objects.filter(pk=self.routine2.instance.pk).exists())
-        self.assertTrue(
-            MirroredRoutine.objects.filter(
-                pk=self.routine2.instance.mirrored_routine.pk
-            ).exists()
+        users_routine_b = UsersRoutine.objects.get(
+            user=self.user1.instance, routine=self.routine_b
         )
+        response = self.client.delete(
+            reverse("users-routine-detail", kwargs={"pk": users_routine_b.pk})
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
 
+        routine_ids = [routine["id"] for routine in self.get_similar(self.routine_a)]
+        self.assertNotIn(self.routine_b.id, routine_ids)
+        self.assertIn(self.routine_c.id, routine_ids)
 
-class WeeklyRoutineTestCase(APITestCase):
+    def test_vector_index_refresh_and_growth(self):
+        """
+        변경된 루틴이 없다면 한 번의 쿼리로 인덱스를 갱신하고, 용량을 넘으면 행렬이 늘어나는지 테스트
+
+        테스트 시나리오:
+        1. 초기 용량이 2인 인덱스를 만들고 1분 후 전체 루틴으로 갱신합니다.
+        2. 3개의 루틴이 모두 인덱스에 포함되고 행렬의 행 수가 늘어났는지 확인합니다.
+        3. 변경된 루틴 없이 2분 후 다시 갱신할 때 쿼리가 한 번만 실행되는지 확인합니다.
+        """
+        index = RoutineVectorIndex()
+        index.initial_capacity = 2
+        index.clear()
+
+        with freeze_time(timezone.now() + timedelta(minutes=1)):
+            index.refresh()
+
+        self.assertEqual(len(index), 3)
+        self.assertGreaterEqual(len(index.matrix), 3)
+        self.assertEqual(index.similar(self.routine_a.id, k=1)[0][0], self.routine_b.id)
+
+        with freeze_time(timezone.now() + timedelta(minutes=2)):
+            with self.assertNumQueries(1):
+                index.refresh()
+
+
+class ExerciseInRoutineTestCase(APITestCase):
     """
-    목적: 유저의 한 주에 대한 루틴을 관리하는 WeeklyRoutine 모델에 대한 테스트를 진행합니다.
+    목적: Routine 모델과 연결되어 루틴에 포함된 운동들을 관리하는 ExerciseInRoutine 모델에 대한 테스트를 진행합니다.
 
     Test cases:
-    1. 유저가 현재 설정된 주간 루틴을 조회하는지 테스트
-    2. 유저가 새로운 정보로 주간 루틴을 생성하는지 테스트
-    3. 이미 루틴을 생성한 유저가 새로운 정보로 주간 루틴을 생성에 실패하는지 테스트
-    4. 잘못된 day_index가 포함된 request로 주간 루틴을 생성에 실패하는지 테스트
-    5. 유저가 주간 루틴을 변경하는것에 성공하는지 테스트
-    6. 유저가 주간 루틴을 삭제하는것에 성공하는지 테스트
+    1. 루틴을 조회할 때 루틴에 포함된 운동들을 함께 조회하는지 테스트
+    2. 루틴을 생성할 때 주어진 운동에 대한 정보를 함께 생성하는지 테스트
+    3. 루틴을 업데이트할 때 주어진 운동에 대한 정보를 함께 업데이트하는지 테스트
+    4. 루틴을 삭제할 때 함께 생성된 운동에 대한 정보도 함께 삭제하는지 테스트
     """
 
     def setUp(self):
         """
-        초기 설정:
+        초기 설정
 
-        1. 관리자 유저 생성
-        2. 운동 5개 생성
-        3. 유저 1 생성
-        4. 유저 1이 루틴 4개 생성
+        1. 어드민 유저 생성
+        2. 운동을 5 개 생성
+        3. 유저 2 명 생성
+        4. 유저 1과 2가 각각 루틴을 생성
         """
         self.admin = FakeUser()
         self.admin.create_instance(is_staff=True)
@@ -1050,122 +1672,81 @@ class WeeklyRoutineTestCase(APITestCase):
         self.user1 = FakeUser()
         self.user1.create_instance()
 
-        self.routine1 = FakeRoutine([self.exercise1, self.exercise2])
+        self.routine1 = FakeRoutine([self.exercise1, self.exercise2, self.exercise3])
         self.routine1.create_instance(user_instance=self.user1.instance)
 
-        self.routine2 = FakeRoutine([self.exercise3, self.exercise4])
-        self.routine2.create_instance(user_instance=self.user1.instance)
-
-        self.routine3 = FakeRoutine([self.exercise1, self.exercise5])
-        self.routine3.create_instance(user_instance=self.user1.instance)
+        self.user2 = FakeUser()
+        self.user2.create_instance()
 
-        self.routine4 = FakeRoutine([self.exercise2, self.exercise3])
-        self.routine4.create_instance(user_instance=self.user1.instance)
+        self.routine2 = FakeRoutine([self.exercise4, self.exercise5])
+        self.routine2.create_instance(user_instance=self.user2.instance)
 
-    def test_get_weekly_routine(self):
+    def test_get_exercise_in_ExerciseInRoutine(self):
         """
-        유저가 현재 설정된 주간 루틴을 조회하는지 테스트
+        루틴을 조회할 때 루틴에 포함된 운동들을 함께 조회하는지 테스트
 
-        reverse_url: weekly-routine
+        reverse_url: routine-detail
         HTTP method: GET
 
         테스트 시나리오:
-        1. 유저 1이 현재 생성된 루틴으로 WeeklyRoutine 인스턴스를 생성합니다.
-        2. 유저 1이 로그인합니다.
-        3. /weekly-routine/에 GET 요청을 보냅니다.
-        4. 상태 코드가 200인지 확인합니다.
-        5. 응답의 길이를 확인합니다.
-        6. 응답의 WeeklyRoutine의 id가 유저 1이 생성한 루틴의 id와 같은지 확인합니다.
-        7. 응답의 WeeklyRoutine들의 day_index가 유저 1이 생성한 WeeklyRoutine들의 day_index 순서와 같은지 확인합니다.
+        1. routine1에 포함된 운동들을 조회합니다.
+        2. 그 수를 확인하고 배열에 저장합니다.
+        3. /routine/<pk>/에 GET 요청을 보냅니다.
+        4. Response의 운동들 수가 같은지 확인합니다.
+        5. 미리 저장한 배열과 Response의 운동들이 같은지 확인합니다.
         """
+        self.user.login(self.client)
 
-        user1_users_routine_instances = [
-            self.routine3.instance.subscribers.get(user=self.user1.instance),
-            self.routine2.instance.subscribers.get(user=self.user1.instance),
-            self.routine4.instance.subscribers.get(user=self.user1.instance),
-            self.routine1.instance.subscribers.get(user=self.user1.instance),
-        ]
-
-        random_day_indices = [0, 5, 3, 2]
-
-        fake_weekly_routines = [
-            FakeWeeklyRoutine(
-                day_index=random_day_index, users_routine=users_routine_instance
-            )
-            for random_day_index, users_routine_instance in zip(
-                random_day_indices, user1_users_routine_instances
-            )
-        ]
-
-        for fake_weekly_routine in fake_weekly_routines:
-            fake_weekly_routine.create_instance(user_instance=self.user1.instance)
+        pk = self.routine1.instance.pk
 
-        self.user1.login(self.client)
+        exercises = self.routine1.instance.exercises_in_routine.all()
+        exercise_count = exercises.count()
 
-        response = self.client.get(reverse("weekly-routine"))
+        response = self.client.get(reverse("routine-detail", kwargs={"pk": pk}))
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         data = response.json()
 
-        self.assertEqual(len(data), len(fake_weekly_routines))
-
-        for fake_weekly_routine, response_weekly_routine in zip(
-            sorted(fake_weekly_routines, key=lambda x: x.instance.day_index), data
+        self.assertTrue(len(data.get("exercises_in_routine")), exercise_count)
+        for exercise, response_exercise in zip(
+            exercises, data.get("exercises_in_routine")
         ):
             self.assertEqual(
-                fake_weekly_routine.instance.users_routine.id,
-                response_weekly_routine.get("users_routine"),
-            )
-            self.assertEqual(
-                fake_weekly_routine.instance.day_index,
-                response_weekly_routine.get("day_index"),
+                exercise.exercise.title,
+                response_exercise.get("exercise_info").get("title"),
             )
 
-    def test_create_weekly_routine_if_weekly_routines_empty(self):
+    def test_create_exercise_in_ExerciseInRoutine(self):
         """
-        주간 루틴을 보유하지 않은 유저가 새로운 정보로 주간 루틴을 생성하는지 테스트
+        루틴을 생성할 때 주어진 운동에 대한 정보를 함께 생성하는지 테스트
 
-        reverse_url: weekly-routine
+        reverse_url: routine-list
         HTTP method: POST
 
         테스트 시나리오:
-        1. 새로운 FakeWeeklyRoutine 배열을 생성합니다.
-        2. 유저 1이 로그인합니다.
-        3. /weekly-routine/에 POST 요청을 보냅니다.
-        4. 상태 코드가 201인지 확인합니다.
-        5. 응답의 길이를 확인합니다.
-        6. 응답의 각 WeeklyRoutine의 day_index가 생성한 FakeWeeklyRoutine의 day_index와 같은지 확인합니다.
-        7. 응답의 각 WeeklyRoutine의 users_routine이 생성한 FakeWeeklyRoutine의 users_routine과 같은지 확인합니다.
+        1. 새로운 운동을 생성합니다.
+        2. 새로운 루틴을 생성하고 생성된 운동들을 루틴에 추가합니다.
+        3. /routine/에 POST 요청을 보냅니다.
+        4. Response의 운동들이 생성된 운동들과 같은지 확인합니다.
         """
-        user1_users_routine_instances = [
-            self.routine3.instance.subscribers.get(user=self.user1.instance),
-            self.routine2.instance.subscribers.get(user=self.user1.instance),
-            self.routine4.instance.subscribers.get(user=self.user1.instance),
-            self.routine1.instance.subscribers.get(user=self.user1.instance),
-        ]
+        new_exercise1 = FakeExercisesInfo()
+        new_exercise1.create_instance(self.admin.instance)
 
-        random_day_indices = [0, 5, 3, 2]
+        new_exercise2 = FakeExercisesInfo()
+        new_exercise2.create_instance(self.admin.instance)
 
-        fake_weekly_routines = [
-            FakeWeeklyRoutine(
-                day_index=random_day_index, users_routine=users_routine_instance
-            )
-            for random_day_index, users_routine_instance in zip(
-                random_day_indices, user1_users_routine_instances
-            )
-        ]
+        new_routine = FakeRoutine([new_exercise1, new_exercise2])
 
-        self.user1.login(self.client)
+        new_exercises_in_routine = new_routine.related_fake_models.get(
+            "exercises_in_routine"
+        )
 
-        create_request = [
-            fake_weekly_routine.create_request()
-            for fake_weekly_routine in fake_weekly_routines
-        ]
+        self.user1.login(self.client)
 
         response = self.client.post(
-            reverse("weekly-routine"),
-            data=json.dumps(create_request),
+            reverse("routine-list"),
+            data=new_routine.request_create(),
             content_type="application/json",
         )
 
@@ -1173,561 +1754,4032 @@ class WeeklyRoutineTestCase(APITestCase):
 
         data = response.json()
 
-        self.assertEqual(len(data), len(fake_weekly_routines))
-
-        for fake_weekly_routine, response_weekly_routine in zip(
-            sorted(fake_weekly_routines, key=lambda x: x.base_attr.get("day_index")),
-            data,
+        for exercise, response_exercise in zip(
+            new_exercises_in_routine, data.get("exercises_in_routine")
         ):
             self.assertEqual(
-                fake_weekly_routine.users_routine.id,
-                response_weekly_routine.get("users_routine"),
-            )
-            self.assertEqual(
-                fake_weekly_routine.base_attr.get("day_index"),
-                response_weekly_routine.get("day_index"),
+                exercise.related_fake_models.get("exercises_info").instance.title,
+                response_exercise.get("exercise_info").get("title"),
             )
 
-    def test_fail_create_weekly_routine_if_weekly_routines_existed(self):
+    def test_update_exercise_in_ExerciseInRoutine(self):
         """
-        이미 루틴을 보유한 유저가 새로운 정보로 주간 루틴을 생성하는것을 실패하는지 테스트
+        루틴을 업데이트할 때 주어진 운동에 대한 정보를 함께 업데이트하는지 테스트
 
-        reverse_url: weekly-routine
-        HTTP method: POST
+        reverse_url: routine-detail
+        HTTP method: PATCH
 
         테스트 시나리오:
-        1. 유저 1이 현재 생성된 루틴으로 WeeklyRoutine 인스턴스를 생성합니다.
-        2. 새로운 FakeWeeklyRoutine 배열을 생성합니다.
-        3. 유저 1이 로그인합니다.
-        4. /weekly-routine/에 POST 요청을 보냅니다.
-        5. 상태 코드가 403인지 확인합니다.
+        1. 새로운 운동을 생성합니다.
+        2. 새 운동에 대한 정보와 순서가 담긴 ExerciseInRoutine 배열을 생성합니다.
+        3. /routine/<pk>/에 PATCH 요청을 보냅니다.
+        4. Response의 운동들이 예상한 운동들과 같은지 확인합니다.
         """
+        new_exercise1 = FakeExercisesInfo()
+        new_exercise1.create_instance(self.admin.instance)
 
-        user1_users_routine_instances = [
-            self.routine3.instance.subscribers.get(user=self.user1.instance),
-            self.routine2.instance.subscribers.get(user=self.user1.instance),
-            self.routine4.instance.subscribers.get(user=self.user1.instance),
-            self.routine1.instance.subscribers.get(user=self.user1.instance),
+        new_exercise2 = FakeExercisesInfo()
+        new_exercise2.create_instance(self.admin.instance)
+
+        new_exercise_in_routine1 = FakeExerciseInRoutine(
+            order=1, fake_exercises_info=new_exercise1
+        )
+        new_exercise_in_routine2 = FakeExerciseInRoutine(
+            order=2, fake_exercises_info=new_exercise2
+        )
+
+        existed_exercise_in_routines = self.routine1.instance.exercises_in_routine.all()
+
+        request_update = [
+            new_exercise_in_routine1.request_create(),
+            new_exercise_in_routine2.request_create(),
         ]
 
-        random_day_indices1 = [1, 3, 5, 2]
+        pk = self.routine1.instance.pk
 
-        fake_weekly_routines1 = [
-            FakeWeeklyRoutine(
-                day_index=random_day_index, users_routine=users_routine_instance
-            )
-            for random_day_index, users_routine_instance in zip(
-                random_day_indices1, user1_users_routine_instances
+        self.user1.login(self.client)
+
+        response = self.client.patch(
+            reverse("routine-detail", kwargs={"pk": pk}),
+            data={"exercises_in_routine": request_update},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+
+        for exercise, response_exercise in zip(
+            request_update, data.get("exercises_in_routine")
+        ):
+            self.assertEqual(
+                ExercisesInfo.objects.get(pk=exercise.get("exercise")).title,
+                response_exercise.get("exercise_info").get("title"),
             )
+
+    def test_delete_exercise_in_ExerciseInRoutine(self):
+        """
+        루틴을 삭제할 때 함께 생성된 운동에 대한 정보는 삭제되지 않는지 테스트
+
+        reverse_url: routine-detail
+        HTTP method: DELETE
+
+        테스트 시나리오:
+        1. routine1에 포함된 운동들을 조회합니다.
+        2. 그 id를 배열에 저장합니다.
+        3. /routine/<pk>/에 DELETE 요청을 보냅니다.
+        4. response가 204를 리턴하는지 확인합니다.
+        5. 해당 루틴이 삭제되었는지 확인합니다.
+        6. 해당 루틴 내의 운동이 삭제되지 않았는지 확인합니다.
+        7. 해당 루틴 내의 운동들이 삭제되지 않았는지 확인합니다.
+        """
+        self.user1.login(self.client)
+
+        pk = self.routine1.instance.pk
+
+        exercise_in_routines = self.routine1.instance.exercises_in_routine.all()
+        exercise_in_routine_ids = [
+            exercise_in_routine.pk for exercise_in_routine in exercise_in_routines
+        ]
+        exercise_ids = [
+            exercise_in_routine.exercise.pk
+            for exercise_in_routine in exercise_in_routines
         ]
 
-        for fake_weekly_routine in fake_weekly_routines1:
-            fake_weekly_routine.create_instance(user_instance=self.user1.instance)
+        response = self.client.delete(reverse("routine-detail", kwargs={"pk": pk}))
 
-        random_day_indices2 = [6, 1, 4, 2]
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Routine.objects.filter(pk=pk).exists())
 
-        fake_weekly_routines2 = [
-            FakeWeeklyRoutine(
-                day_index=random_day_index, users_routine=users_routine_instance
-            )
-            for random_day_index, users_routine_instance in zip(
-                random_day_indices2, user1_users_routine_instances
+        for id in exercise_in_routine_ids:
+            self.assertTrue(ExerciseInRoutine.objects.filter(pk=id).exists())
+
+        for id in exercise_ids:
+            self.assertTrue(ExercisesInfo.objects.filter(pk=id).exists())
+
+
+class ExerciseInRoutineQueryCountTestCase(TestCase):
+    """
+    목적: 루틴에 포함된 운동 정보를 중첩하여 직렬화할 때 쿼리 수가 운동 개수와 관계없이 일정한지 테스트합니다.
+
+    Test cases:
+    1. 운동 10개, 1000개를 포함한 스냅샷을 렌더링할 때 쿼리 수가 같은지 테스트
+    """
+
+    def setUp(self):
+        """
+        초기 설정
+
+        1. 관리자 유저와 운동 5개 생성
+        """
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.exercises = []
+        for _ in range(5):
+            exercise = FakeExercisesInfo()
+            self.exercises.append(exercise.create_instance(self.admin.instance))
+
+    def create_mirrored_routine(self, count):
+        """운동 count개와 수행 정보를 포함한 MirroredRoutine을 bulk_create로 생성"""
+        mirrored_routine = MirroredRoutine.objects.create(
+            title="스냅샷", author_name=self.admin.instance.username
+        )
+        exercises_in_routine = ExerciseInRoutine.objects.bulk_create(
+            [
+                ExerciseInRoutine(
+                    mirrored_routine=mirrored_routine,
+                    exercise=self.exercises[i % len(self.exercises)],
+                    order=i + 1,
+                )
+                for i in range(count)
+            ]
+        )
+        ExerciseInRoutineAttribute.objects.bulk_create(
+            [
+                ExerciseInRoutineAttribute(exercise_in_routine=exercise_in_routine)
+                for exercise_in_routine in exercises_in_routine
+            ]
+        )
+        return mirrored_routine
+
+    def test_render_snapshot_query_count_is_constant(self):
+        """
+        운동 10개, 1000개를 포함한 스냅샷을 렌더링할 때 쿼리 수가 같은지 테스트
+
+        테스트 시나리오:
+        1. 운동 10개, 1000개를 포함한 MirroredRoutine을 각각 생성합니다.
+        2. 각 스냅샷을 렌더링하며 실행된 쿼리 수를 기록합니다.
+        3. 두 쿼리 수가 같고, 1000개의 운동 정보에 작성자와 운동 부위가 직렬화되었는지 확인합니다.
+        """
+        small = self.create_mirrored_routine(10)
+        large = self.create_mirrored_routine(1000)
+
+        with CaptureQueriesContext(connection) as small_context:
+            render_mirrored_routine_snapshot(small)
+        with CaptureQueriesContext(connection) as large_context:
+            snapshot = render_mirrored_routine_snapshot(large)
+
+        self.assertEqual(
+            len(large_context.captured_queries), len(small_context.captured_queries)
+        )
+        self.assertEqual(len(snapshot["exercises_in_routine"]), 1000)
+        for exercise_in_routine in snapshot["exercises_in_routine"]:
+            self.assertEqual(
+                exercise_in_routine["exercise"]["username"],
+                self.admin.instance.username,
             )
-        ]
+            self.assertIn("focus_areas", exercise_in_routine["exercise"])
+
+
+class UsersRoutineTestCase(APITestCase):
+    """
+    목적: 유저가 보유한 루틴을 관리하는 UsersRoutine 모델에 대한 테스트를 진행합니다.
+
+    Test cases:
+    1. 유저가 보유한 루틴을 조회하는지 테스트
+    2. 유저가 UsersRoutine을 생성할 때 Routine이 함께 생성되는지 테스트
+    3. 유저가 루틴을 구독했을 시 UsersRoutine이 생성되는지 테스트
+    4. 유저가 생성한 루틴이 업데이트되었을 시 작성자와 구독자의 SideEffect가 제대로 작동하는지 테스트
+    5. 유저가 자신이 작성한 UsersRoutine을 삭제했을때 SideEffect가 잘 작동하는지 테스트
+    6. 유저가 구독중인 UsersRoutine을 삭제했을 시 SideEffect가 잘 작동했는지 테스트
+    7. 루틴 생성, 수정 시 운동 수와 관계없이 쿼리 수가 일정한지 테스트
+    8. 같은 내용으로 루틴을 수정했을 시 MirroredRoutine이 새로 생성되지 않는지 테스트
+    9. 이전 내용으로 루틴을 되돌렸을 시 기존 MirroredRoutine을 재사용하는지 테스트
+    10. 운동 정보의 PK를 문자열로 보내도 루틴이 생성되고, PK로 해석할 수 없는 값은 400을 반환하는지 테스트
+    """
+
+    def setUp(self):
+        """
+        초기 설정
+
+        1. 관리자 유저 생성
+        2. 운동 4개 생성
+        3. 유저 2명 생성
+        4. 유저 1이 루틴 1개 생성
+        5. 유저 2가 루틴 1개 생성
+        6. 유저 1이 유저 2의 루틴을 구독
+        7. 유저 2가 유저 1의 루틴을 구독
+        """
+        self.client = APIClient()
+
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.exercise1 = FakeExercisesInfo()
+        self.exercise1.create_instance(self.admin.instance)
+
+        self.exercise2 = FakeExercisesInfo()
+        self.exercise2.create_instance(self.admin.instance)
+
+        self.exercise3 = FakeExercisesInfo()
+        self.exercise3.create_instance(self.admin.instance)
+
+        self.exercise4 = FakeExercisesInfo()
+        self.exercise4.create_instance(self.admin.instance)
+
+        self.user1 = FakeUser()
+        self.user1.create_instance()
+
+        self.routine1 = FakeRoutine([self.exercise1, self.exercise2])
+        self.routine1.create_instance(user_instance=self.user1.instance)
+
+        self.user2 = FakeUser()
+        self.user2.create_instance()
+
+        self.routine2 = FakeRoutine([self.exercise3, self.exercise4])
+        self.routine2.create_instance(user_instance=self.user2.instance)
+
+        self.routine3 = FakeRoutine([self.exercise1, self.exercise2])
+        self.routine3.create_instance(user_instance=self.user2.instance)
+
+        service = UsersRoutineManagementService(
+            routine=self.routine2.instance, user=self.user1.instance
+        )
+
+        self.user1_routine_written_by_user2 = service.user_subscribe_routine()
+
+        service = UsersRoutineManagementService(
+            routine=self.routine1.instance, user=self.user2.instance
+        )
+        self.user2_routine_written_by_user1 = service.user_subscribe_routine()
+
+    def test_get_users_routine(self):
+        """
+        유저가 보유한 루틴을 조회하는지 테스트
+
+        reverse_url: routine-users-routine-list
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 유저 1이 보유한 루틴을 조회합니다.
+        2. 그 수를 확인하고 배열에 저장합니다.
+        3. /users-routine/에 GET 요청을 보냅니다.
+        4. Response의 루틴들 수가 같은지 확인합니다.
+        5. 미리 저장한 배열과 Response의 루틴들이 같은지 확인합니다.
+        """
+        self.user1.login(self.client)
+
+        user1_routines = UsersRoutine.objects.filter(user=self.user1.instance)
+
+        routine_count = user1_routines.count()
+
+        response = self.client.get(reverse("users-routine-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+
+        self.assertEqual(len(data), routine_count)
+        for user1_routine, response_routine in zip(user1_routines, data):
+            self.assertEqual(user1_routine.routine.id, response_routine.get("routine"))
+
+    def test_create_routine_when_create_users_routine(self):
+        """
+        유저가 새 UsersRoutine을 생성할 때 Routine이 함께 생성되는지 테스트
+
+        reverse_url: users-routine-list
+        HTTP method: POST
+
+        테스트 시나리오:
+        1. Routine의 개수를 저장합니다.
+        2. 유저 2가 로그인합니다.
+        3. users-routine-list에 post 요청을 보냅니다.
+        4. 응답 코드가 201인지 확인합니다.
+        5. Routine의 개수가 1 증가했는지 확인합니다.
+        6. 가장 최근에 생성된 UsersRoutine의 정보와 응답 데이터의 정보를 비교합니다.
+        """
+
+        routine_count = Routine.objects.count()
+
+        new_routine = FakeRoutine([self.exercise1, self.exercise2])
+
+        self.user2.login(self.client)
+
+        response = self.client.post(
+            reverse("users-routine-list"),
+            data=json.dumps(new_routine.request_create()),
+            content_type="application/json",
+        )
+
+        data = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.assertEqual(Routine.objects.count(), routine_count + 1)
+
+    def test_create_users_routine_when_subscribe_routine(self):
+        """
+        유저가 루틴을 구독했을 시 UsersRoutine이 생성되는지 테스트
+
+        reverse_url: routine-subscribe
+        HTTP method: POST
+
+        테스트 시나리오:
+        1. 유저 2로 로그인합니다.
+        2. 유저 1이 생성한 루틴을 구독합니다.
+        3. 응답 코드가 201인지 확인합니다.
+        4. 구독한 루틴이 응답 데이터에 포함된 루틴과 같은지 확인합니다.
+        """
+        pk = self.routine3.instance.pk
+
+        self.user1.login(self.client)
+
+        response = self.client.post(reverse("routine-subscribe", kwargs={"pk": pk}))
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        data = response.json()
+
+        self.assertEqual(self.routine3.instance.pk, data.get("routine"))
+
+    def test_update_users_routine_if_author(self):
+        """
+        유저가 생성한 루틴이 업데이트되었을 시 SideEffect가 제대로 작동하는지 테스트
+
+        reverse_url: users-routine-detail
+        HTTP method: PATCH
+
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. 유저 1이 생성한 UsersRoutine을 업데이트합니다.
+        3. 응답 코드가 200인지 확인합니다.
+        4. Routine의 정보가 업데이트되었는지 확인합니다.
+        5. 업데이트된 Routine의 mirrored_routine이 UsersRoutine의 mirrored_routine과 같은지 확인합니다.
+        6. UsersRoutine의 need_update가 False인지 확인합니다.
+        7. 유저 2의 users_routine을 비교해서 mirrored_routine이 응답 데이터와 다른지 확인합니다.
+        8. 유저 2의 users_routine의 need_update가 True인지 확인합니다.
+        """
+
+        self.user1.login(self.client)
+
+        user1_routine = UsersRoutine.objects.filter(user=self.user1.instance).first()
+        user2_routine = UsersRoutine.objects.filter(
+            user=self.user2.instance, routine=user1_routine.routine
+        ).first()
+
+        pk = user1_routine.pk
+
+        new_routine = FakeRoutine([self.exercise3, self.exercise4])
+
+        response = self.client.patch(
+            reverse("users-routine-detail", kwargs={"pk": pk}),
+            data=json.dumps(new_routine.request_create()),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        user1_routine.refresh_from_db()
+        user2_routine.refresh_from_db()
+
+        data = response.json()
+        print(json.dumps(data, indent=2))
+        self.assertEqual(
+            user1_routine.mirrored_routine.id, data.get("mirrored_routine")
+        )
+        self.assertEqual(user1_routine.routine.id, data.get("routine"))
+        self.assertEqual(new_routine.base_attr.get("title"), data.get("title"))
+        self.assertFalse(data.get("need_update"))
+
+        self.assertNotEqual(
+            user2_routine.mirrored_routine.id, data.get("mirrored_routine")
+        )
+        self.assertTrue(user2_routine.need_update)
+
+    def test_delete_users_routine_if_author(self):
+        """
+        유저가 자신이 작성한 UsersRoutine을 삭제했을때 SideEffect가 잘 작동하는지 테스트
+
+        reverse_url: users-routine-detail
+        HTTP method: DELETE
+
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. 유저 1이 생성한 UsersRoutine을 삭제합니다.
+        3. 응답 코드가 204인지 확인합니다.
+        4. UsersRoutine이 삭제되었는지 확인합니다.
+        5. 기존에 UsersRoutine과 연결된 Routine이 삭제되었는지 확인합니다.
+        6. UsersRoutine에 연결됬던 MirroredRoutine이 삭제되지 않았는지 확인합니다.
+        """
+
+        self.user1.login(self.client)
+
+        user1_routine = UsersRoutine.objects.filter(user=self.user1.instance).first()
+        user1_routine_routine_pk = user1_routine.routine.pk
+        user1_routine_mirrored_routine_pk = user1_routine.mirrored_routine.pk
+
+        pk = user1_routine.pk
+
+        response = self.client.delete(
+            reverse("users-routine-detail", kwargs={"pk": pk})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertFalse(UsersRoutine.objects.filter(pk=pk).exists())
+        self.assertFalse(Routine.objects.filter(pk=user1_routine_routine_pk).exists())
+        self.assertTrue(
+            MirroredRoutine.objects.filter(
+                pk=user1_routine_mirrored_routine_pk
+            ).exists()
+        )
+
+    def test_delete_users_routine_if_not_author(self):
+        """
+        구독중인 UsersRoutine을 삭제했을 시 SideEffect가 잘 작동하는지 테스트
+
+        reverse_url: users-routine-detail
+        HTTP method: DELETE
+
+        테스트 시나리오:
+        1. 유저 1이 구독중인 user1_routine_written_by_user2를 삭제합니다.
+        2. 응답 코드가 204인지 확인합니다.
+        3. UsersRoutine이 삭제되었는지 확인합니다.
+        4. Routine이 삭제되지 않았는지 확인합니다.
+        5. MirroredRoutine이 삭제되지 않았는지 확인합니다.
+        """
+
+        self.user1.login(self.client)
+
+        pk = self.user1_routine_written_by_user2.pk
+
+        response = self.client.delete(
+            reverse("users-routine-detail", kwargs={"pk": pk})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertFalse(UsersRoutine.objects.filter(pk=pk).exists())
+        self.assertTrue(Routine.objects.filter(pk=self.routine2.instance.pk).exists())
+        self.assertTrue(
+            MirroredRoutine.objects.filter(
+                pk=self.routine2.instance.mirrored_routine.pk
+            ).exists()
+        )
+
+    def test_write_users_routine_query_count_is_constant(self):
+        """
+        루틴 생성, 수정 시 운동 수와 관계없이 쿼리 수가 일정한지 테스트
+
+        reverse_url: users-routine-list, users-routine-detail
+        HTTP method: POST, PATCH
+
+        테스트 시나리오:
+        1. 운동 30개를 생성합니다.
+        2. 유저 1이 운동 3개로 이루어진 루틴을 생성하고 쿼리 수를 기록합니다.
+        3. 유저 1이 운동 30개로 이루어진 루틴을 생성하고 쿼리 수를 기록합니다.
+        4. 두 쿼리 수가 같은지 확인합니다.
+        5. 생성된 루틴의 운동과 수행 정보가 모두 생성되었는지 확인합니다.
+        6. 각 루틴을 같은 수의 운동으로 수정할 때도 쿼리 수가 같은지 확인합니다.
+        """
+        exercises = [FakeExercisesInfo() for _ in range(30)]
+        for exercise in exercises:
+            exercise.create_instance(self.admin.instance)
+
+        self.user1.login(self.client)
+
+        query_counts = {}
+        created = {}
+        for exercise_count in [3, 30]:
+            new_routine = FakeRoutine(exercises[:exercise_count])
+
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(
+                    reverse("users-routine-list"),
+                    data=json.dumps(new_routine.request_create()),
+                    content_type="application/json",
+                )
+
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            query_counts[exercise_count] = len(queries)
+            created[exercise_count] = response.json()
+
+        self.assertEqual(query_counts[3], query_counts[30])
+
+        mirrored_routine = MirroredRoutine.objects.get(
+            pk=created[30].get("mirrored_routine")
+        )
+        self.assertEqual(mirrored_routine.exercises_in_routine.count(), 30)
+        self.assertEqual(
+            ExerciseInRoutineAttribute.objects.filter(
+                exercise_in_routine__mirrored_routine=mirrored_routine
+            ).count(),
+            30,
+        )
+
+        update_query_counts = {}
+        for exercise_count in [3, 30]:
+            new_routine = FakeRoutine(exercises[-exercise_count:])
+            users_routine = UsersRoutine.objects.get(
+                user=self.user1.instance,
+                mirrored_routine=created[exercise_count].get("mirrored_routine"),
+            )
+
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.patch(
+                    reverse("users-routine-detail", kwargs={"pk": users_routine.pk}),
+                    data=json.dumps(new_routine.request_create()),
+                    content_type="application/json",
+                )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            update_query_counts[exercise_count] = len(queries)
+
+        self.assertEqual(update_query_counts[3], update_query_counts[30])
+
+    def test_update_users_routine_with_same_content_reuses_snapshot(self):
+        """
+        같은 내용으로 루틴을 수정했을 시 MirroredRoutine이 새로 생성되지 않는지 테스트
+
+        reverse_url: users-routine-detail
+        HTTP method: PATCH
+
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. 유저 1이 생성한 UsersRoutine을 새 내용으로 수정합니다.
+        3. 유저 2의 구독 루틴을 수정된 MirroredRoutine으로 업데이트합니다.
+        4. 같은 내용으로 한 번 더 수정합니다.
+        5. 응답의 mirrored_routine이 처음 수정했을 때와 같은지 확인합니다.
+        6. MirroredRoutine, ExerciseInRoutine, ExerciseInRoutineAttribute 수가 변하지 않았는지 확인합니다.
+        7. 유저 2의 구독 루틴의 need_update가 False로 유지되는지 확인합니다.
+        """
+        self.user1.login(self.client)
+
+        user1_routine = UsersRoutine.objects.get(
+            user=self.user1.instance, routine=self.routine1.instance
+        )
+        new_routine = FakeRoutine([self.exercise3, self.exercise4])
+
+        response = self.client.patch(
+            reverse("users-routine-detail", kwargs={"pk": user1_routine.pk}),
+            data=json.dumps(new_routine.request_create()),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mirrored_routine_id = response.json().get("mirrored_routine")
+
+        UsersRoutine.objects.filter(pk=self.user2_routine_written_by_user1.pk).update(
+            mirrored_routine=mirrored_routine_id, need_update=False
+        )
+
+        counts = (
+            MirroredRoutine.objects.count(),
+            ExerciseInRoutine.objects.count(),
+            ExerciseInRoutineAttribute.objects.count(),
+        )
+
+        response = self.client.patch(
+            reverse("users-routine-detail", kwargs={"pk": user1_routine.pk}),
+            data=json.dumps(new_routine.request_create()),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json().get("mirrored_routine"), mirrored_routine_id)
+        self.assertEqual(
+            counts,
+            (
+                MirroredRoutine.objects.count(),
+                ExerciseInRoutine.objects.count(),
+                ExerciseInRoutineAttribute.objects.count(),
+            ),
+        )
+
+        self.user2_routine_written_by_user1.refresh_from_db()
+        self.assertFalse(self.user2_routine_written_by_user1.need_update)
+
+    def test_revert_users_routine_reuses_snapshot(self):
+        """
+        이전 내용으로 루틴을 되돌렸을 시 기존 MirroredRoutine을 재사용하는지 테스트
+
+        reverse_url: users-routine-detail
+        HTTP method: PATCH
+
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. 유저 1이 생성한 UsersRoutine을 내용 A로 수정합니다.
+        3. 유저 2의 구독 루틴을 내용 A의 MirroredRoutine으로 업데이트합니다.
+        4. 유저 1이 루틴을 내용 B로 수정합니다.
+        5. 유저 1이 루틴을 다시 내용 A로 수정합니다.
+        6. 응답의 mirrored_routine이 내용 A의 MirroredRoutine과 같은지 확인합니다.
+        7. Routine의 mirrored_routine과 운동들이 내용 A의 MirroredRoutine으로 다시 연결되었는지 확인합니다.
+        8. 구독자가 없는 내용 B의 MirroredRoutine이 삭제되었는지 확인합니다.
+        """
+        self.user1.login(self.client)
+
+        user1_routine = UsersRoutine.objects.get(
+            user=self.user1.instance, routine=self.routine1.instance
+        )
+        routine_a = FakeRoutine([self.exercise3, self.exercise4])
+        routine_b = FakeRoutine([self.exercise1, self.exercise3, self.exercise4])
+
+        response = self.client.patch(
+            reverse("users-routine-detail", kwargs={"pk": user1_routine.pk}),
+            data=json.dumps(routine_a.request_create()),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mirrored_routine_a = response.json().get("mirrored_routine")
+
+        UsersRoutine.objects.filter(pk=self.user2_routine_written_by_user1.pk).update(
+            mirrored_routine=mirrored_routine_a, need_update=False
+        )
+
+        response = self.client.patch(
+            reverse("users-routine-detail", kwargs={"pk": user1_routine.pk}),
+            data=json.dumps(routine_b.request_create()),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mirrored_routine_b = response.json().get("mirrored_routine")
+        self.assertNotEqual(mirrored_routine_a, mirrored_routine_b)
+
+        response = self.client.patch(
+            reverse("users-routine-detail", kwargs={"pk": user1_routine.pk}),
+            data=json.dumps(routine_a.request_create()),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json().get("mirrored_routine"), mirrored_routine_a)
+
+        routine = Routine.objects.get(pk=self.routine1.instance.pk)
+        self.assertEqual(routine.mirrored_routine.id, mirrored_routine_a)
+        self.assertEqual(
+            set(
+                routine.exercises_in_routine.values_list("mirrored_routine", flat=True)
+            ),
+            {mirrored_routine_a},
+        )
+        self.assertEqual(routine.exercises_in_routine.count(), 2)
+        self.assertFalse(MirroredRoutine.objects.filter(pk=mirrored_routine_b).exists())
+
+    def test_create_users_routine_with_string_exercise_pk(self):
+        """
+        운동 정보의 PK를 문자열로 보내도 루틴이 생성되고, PK로 해석할 수 없는 값은 400을 반환하는지 테스트
+
+        reverse_url: users-routine-list
+        HTTP method: POST
+
+        테스트 시나리오:
+        1. 유저 2가 로그인합니다.
+        2. 운동 정보의 PK를 문자열("1" 형식)로 바꾼 루틴으로 users-routine-list에 POST 요청을 보냅니다.
+        3. 응답 코드가 201이고 요청한 운동들로 루틴이 생성되었는지 확인합니다.
+        4. 운동 정보의 PK를 "abc"로 바꾸어 다시 POST 요청을 보냅니다.
+        5. 응답 코드가 400인지 확인합니다.
+        """
+        self.user2.login(self.client)
+
+        request_data = FakeRoutine([self.exercise1, self.exercise2]).request_create()
+        for exercise_in_routine in request_data["exercises_in_routine"]:
+            exercise_in_routine["exercise"] = str(exercise_in_routine["exercise"])
+
+        response = self.client.post(
+            reverse("users-routine-list"),
+            data=json.dumps(request_data),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [
+                exercise_in_routine["exercise"]["id"]
+                for exercise_in_routine in response.json()["exercises_in_routine"]
+            ],
+            [self.exercise1.instance.id, self.exercise2.instance.id],
+        )
+
+        request_data["exercises_in_routine"][0]["exercise"] = "abc"
+
+        response = self.client.post(
+            reverse("users-routine-list"),
+            data=json.dumps(request_data),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class SubscriberFanOutTestCase(APITestCase):
+    """
+    목적: 루틴 수정 시 구독자들의 need_update를 변경하는 작업에 대한 테스트를 진행합니다.
+
+    Test cases:
+    1. 구독자 수가 기준 이하라면 요청 안에서 모든 구독자의 need_update가 변경되는지 테스트
+    2. 구독자 수가 기준보다 많다면 백그라운드 작업으로 배치 처리되고 진행 상황을 조회할 수 있는지 테스트
+    3. 백그라운드 작업은 트랜잭션 커밋 이후에 예약되고 요청은 즉시 반환되는지 테스트
+    4. 큐에서 사라진 대기 중인 작업이 resume_subscriber_fan_outs 명령어로 완료되는지 테스트
+    5. 실행 중 중단된 작업이 last_processed_id 이후의 구독자부터 이어서 완료되는지 테스트
+    6. 실패한 작업은 다시 실행되고, 진행 중인 작업은 다시 실행되지 않는지 테스트
+    """
+
+    def setUp(self):
+        """
+        초기 설정
+
+        1. 관리자 유저와 운동 2개 생성
+        2. 작성자 유저가 루틴 1개 생성
+        3. 구독자 유저 5명이 루틴을 구독
+        """
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.exercise1 = FakeExercisesInfo()
+        self.exercise1.create_instance(self.admin.instance)
+
+        self.exercise2 = FakeExercisesInfo()
+        self.exercise2.create_instance(self.admin.instance)
+
+        self.author = FakeUser()
+        self.author.create_instance()
+
+        self.routine = FakeRoutine([self.exercise1])
+        self.routine.create_instance(user_instance=self.author.instance)
+
+        self.subscribers = [FakeUser() for _ in range(5)]
+        for subscriber in self.subscribers:
+            subscriber.create_instance()
+            UsersRoutineManagementService(
+                user=subscriber.instance, routine=self.routine.instance
+            ).user_subscribe_routine()
+
+        self.authors_routine = UsersRoutine.objects.get(
+            user=self.author.instance, routine=self.routine.instance
+        )
+
+    def update_routine(self):
+        new_routine = FakeRoutine([self.exercise1, self.exercise2])
+
+        return self.client.patch(
+            reverse("users-routine-detail", kwargs={"pk": self.authors_routine.pk}),
+            data=json.dumps(new_routine.request_create()),
+            content_type="application/json",
+        )
+
+    def test_fan_out_in_request_below_threshold(self):
+        """
+        구독자 수가 기준 이하라면 요청 안에서 모든 구독자의 need_update가 변경되는지 테스트
+
+        reverse_url: users-routine-detail
+        HTTP method: PATCH
+
+        테스트 시나리오:
+        1. 작성자가 로그인하여 루틴을 수정합니다.
+        2. 모든 구독자의 need_update가 True인지 확인합니다.
+        3. 작성자의 need_update는 False인지 확인합니다.
+        4. SubscriberFanOutJob이 생성되지 않았는지 확인합니다.
+        """
+        self.author.login(self.client)
+
+        response = self.update_routine()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(
+            UsersRoutine.objects.filter(
+                routine=self.routine.instance, need_update=False
+            )
+            .exclude(pk=self.authors_routine.pk)
+            .exists()
+        )
+        self.authors_routine.refresh_from_db()
+        self.assertFalse(self.authors_routine.need_update)
+        self.assertFalse(SubscriberFanOutJob.objects.exists())
+
+    @override_settings(
+        SUBSCRIBER_FAN_OUT_SYNC_THRESHOLD=2,
+        SUBSCRIBER_FAN_OUT_BATCH_SIZE=2,
+        BACKGROUND_TASKS_EAGER=True,
+    )
+    def test_fan_out_in_background_above_threshold(self):
+        """
+        구독자 수가 기준보다 많다면 백그라운드 작업으로 배치 처리되고 진행 상황을 조회할 수 있는지 테스트
+
+        reverse_url: users-routine-detail, users-routine-fan-out
+        HTTP method: PATCH, GET
+
+        테스트 시나리오:
+        1. 작성자가 로그인하여 루틴을 수정합니다.
+        2. SubscriberFanOutJob이 완료되었고 처리된 구독자 수가 5인지 확인합니다.
+        3. 모든 구독자의 need_update가 True이고 작성자의 need_update는 False인지 확인합니다.
+        4. /users-routine/<pk>/fan-out/에 GET 요청을 보내 진행 상황을 확인합니다.
+        5. 구독자가 진행 상황을 조회하면 403 에러를 리턴하는지 확인합니다.
+        """
+        self.author.login(self.client)
+
+        response = self.update_routine()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        job = SubscriberFanOutJob.objects.get(routine=self.routine.instance)
+        self.assertEqual(job.status, SubscriberFanOutJob.Status.DONE)
+        self.assertEqual(job.total, len(self.subscribers))
+        self.assertEqual(job.processed, len(self.subscribers))
+
+        self.assertEqual(
+            UsersRoutine.objects.filter(
+                routine=self.routine.instance, need_update=True
+            ).count(),
+            len(self.subscribers),
+        )
+        self.authors_routine.refresh_from_db()
+        self.assertFalse(self.authors_routine.need_update)
+
+        response = self.client.get(
+            reverse("users-routine-fan-out", kwargs={"pk": self.authors_routine.pk})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data.get("status"), SubscriberFanOutJob.Status.DONE)
+        self.assertEqual(data.get("processed"), len(self.subscribers))
+
+        subscriber = self.subscribers[0]
+        subscriber.login(self.client)
+        subscribers_routine = UsersRoutine.objects.get(
+            user=subscriber.instance, routine=self.routine.instance
+        )
+
+        response = self.client.get(
+            reverse("users-routine-fan-out", kwargs={"pk": subscribers_routine.pk})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(SUBSCRIBER_FAN_OUT_SYNC_THRESHOLD=2)
+    def test_fan_out_is_scheduled_on_commit(self):
+        """
+        백그라운드 작업은 트랜잭션 커밋 이후에 예약되고 요청은 즉시 반환되는지 테스트
+
+        reverse_url: users-routine-detail
+        HTTP method: PATCH
+
+        테스트 시나리오:
+        1. 작성자가 로그인하여 루틴을 수정합니다.
+        2. 응답 시점에 SubscriberFanOutJob이 대기 상태인지 확인합니다.
+        3. 구독자들의 need_update가 아직 변경되지 않았는지 확인합니다.
+        4. 커밋 이후 실행될 콜백이 하나 예약되었는지 확인합니다.
+        """
+        self.author.login(self.client)
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            response = self.update_routine()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        job = SubscriberFanOutJob.objects.get(routine=self.routine.instance)
+        self.assertEqual(job.status, SubscriberFanOutJob.Status.PENDING)
+        self.assertEqual(job.processed, 0)
+        self.assertFalse(
+            UsersRoutine.objects.filter(
+                routine=self.routine.instance, need_update=True
+            ).exists()
+        )
+        self.assertEqual(len(callbacks), 1)
+
+    def create_dropped_job(self):
+        """
+        구독자 업데이트 작업을 생성하되 커밋 후 콜백을 실행하지 않아,
+        작업이 큐에 들어가기 전에 프로세스가 종료된 상황을 만들고 작업을 반환
+        """
+        self.author.login(self.client)
+
+        with override_settings(SUBSCRIBER_FAN_OUT_SYNC_THRESHOLD=2):
+            with self.captureOnCommitCallbacks(execute=False):
+                response = self.update_routine()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return SubscriberFanOutJob.objects.get(routine=self.routine.instance)
+
+    def assert_all_subscribers_need_update(self, job):
+        job.refresh_from_db()
+        self.assertEqual(job.status, SubscriberFanOutJob.Status.DONE)
+        self.assertEqual(job.processed, len(self.subscribers))
+        self.assertIsNotNone(job.finished_at)
+        self.assertEqual(
+            UsersRoutine.objects.filter(
+                routine=self.routine.instance, need_update=True
+            ).count(),
+            len(self.subscribers),
+        )
+
+    def test_resume_dropped_pending_job(self):
+        """
+        큐에서 사라진 대기 중인 작업이 resume_subscriber_fan_outs 명령어로 완료되는지 테스트
+
+        테스트 시나리오:
+        1. 작성자가 루틴을 수정하여 작업을 생성하고, 커밋 후 콜백(큐에 넣기)은 실행하지 않습니다.
+        2. 작업이 PENDING이고 구독자의 need_update가 변경되지 않았는지 확인합니다.
+        3. resume_subscriber_fan_outs 명령어를 실행합니다.
+        4. 작업이 완료되고 모든 구독자의 need_update가 True인지 확인합니다.
+        """
+        job = self.create_dropped_job()
+        self.assertEqual(job.status, SubscriberFanOutJob.Status.PENDING)
+        self.assertFalse(
+            UsersRoutine.objects.filter(
+                routine=self.routine.instance, need_update=True
+            ).exists()
+        )
+
+        out = StringIO()
+        call_command("resume_subscriber_fan_outs", stdout=out)
+
+        self.assertIn("Resumed 1 subscriber fan-out jobs (0 failed)", out.getvalue())
+        self.assert_all_subscribers_need_update(job)
+
+    @override_settings(SUBSCRIBER_FAN_OUT_BATCH_SIZE=2)
+    def test_resume_interrupted_running_job(self):
+        """
+        실행 중 중단된 작업이 last_processed_id 이후의 구독자부터 이어서 완료되는지 테스트
+
+        테스트 시나리오:
+        1. 작업을 생성하고, 첫 번째 배치(구독자 2명)까지 처리된 뒤 프로세스가 종료된 상태로 만듭니다.
+           (RUNNING, 마지막 변경이 SUBSCRIBER_FAN_OUT_STALE_AFTER초보다 오래됨)
+        2. resume_subscriber_fan_out_jobs를 실행합니다.
+        3. 처리된 구독자 수가 중복 없이 5이고 모든 구독자의 need_update가 True인지 확인합니다.
+        """
+        job = self.create_dropped_job()
+
+        first_batch = list(
+            UsersRoutine.objects.filter(routine=self.routine.instance)
+            .exclude(pk=self.authors_routine.pk)
+            .order_by("id")
+            .values_list("id", flat=True)[:2]
+        )
+        UsersRoutine.objects.filter(id__in=first_batch).update(need_update=True)
+        SubscriberFanOutJob.objects.filter(id=job.id).update(
+            status=SubscriberFanOutJob.Status.RUNNING,
+            processed=2,
+            last_processed_id=first_batch[-1],
+            updated_at=timezone.now()
+            - timedelta(seconds=settings.SUBSCRIBER_FAN_OUT_STALE_AFTER + 1),
+        )
+
+        self.assertEqual(resume_subscriber_fan_out_jobs(), (1, 0))
+        self.assert_all_subscribers_need_update(job)
+
+    def test_resume_failed_job_but_not_running_job(self):
+        """
+        실패한 작업은 다시 실행되고, 진행 중인 작업은 다시 실행되지 않는지 테스트
+
+        테스트 시나리오:
+        1. 작업을 생성하고 최근에 진행된 RUNNING 상태로 만듭니다.
+        2. resume_subscriber_fan_out_jobs를 실행해도 작업이 실행되지 않는지 확인합니다.
+        3. 작업을 FAILED 상태로 만들고 다시 실행합니다.
+        4. 작업이 완료되고 모든 구독자의 need_update가 True인지 확인합니다.
+        """
+        job = self.create_dropped_job()
+        SubscriberFanOutJob.objects.filter(id=job.id).update(
+            status=SubscriberFanOutJob.Status.RUNNING, updated_at=timezone.now()
+        )
+
+        self.assertEqual(resume_subscriber_fan_out_jobs(), (0, 0))
+        job.refresh_from_db()
+        self.assertEqual(job.status, SubscriberFanOutJob.Status.RUNNING)
+        self.assertEqual(job.processed, 0)
+
+        SubscriberFanOutJob.objects.filter(id=job.id).update(
+            status=SubscriberFanOutJob.Status.FAILED
+        )
+
+        self.assertEqual(resume_subscriber_fan_out_jobs(), (1, 0))
+        self.assert_all_subscribers_need_update(job)
+
+
+class MirroredRoutineCacheTestCase(APITestCase):
+    """
+    목적: MirroredRoutine 스냅샷의 렌더링 결과 캐시에 대한 테스트를 진행합니다.
+
+    Test cases:
+    1. UsersRoutine 생성 시 새 MirroredRoutine의 스냅샷이 캐시에 미리 저장되는지 테스트
+    2. 캐시가 채워진 상태에서 users-routine 목록 조회 시 운동 트리를 다시 조회하지 않는지 테스트
+    3. 운동 정보가 변경되면 캐시가 비워지고 변경된 정보로 다시 렌더링되는지 테스트
+    4. 캐시 크기가 최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거되는지 테스트
+    5. 캐시가 비어 있을 때 users-routine 목록 조회 시 루틴 수와 관계없이 쿼리 수가 일정한지 테스트
+    6. 다른 프로세스에서 운동 정보가 변경되면 카탈로그 버전으로 이 프로세스의 캐시도 무효화되는지 테스트
+    7. 렌더링하는 동안 버전이 바뀌었다면 이전 버전의 렌더링 결과를 저장하지 않는지 테스트
+    """
+
+    def setUp(self):
+        """
+        초기 설정
+
+        1. 관리자 유저와 운동 3개 생성
+        2. 유저 1 생성
+        3. 유저 1이 루틴 3개 생성
+        """
+        mirrored_routine_cache.clear()
+
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.exercises = [FakeExercisesInfo() for _ in range(3)]
+        for exercise in self.exercises:
+            exercise.create_instance(self.admin.instance)
+
+        self.user1 = FakeUser()
+        self.user1.create_instance()
+
+        for _ in range(3):
+            routine = FakeRoutine(self.exercises)
+            routine.create_instance(user_instance=self.user1.instance)
+
+    def test_warm_cache_when_create_users_routine(self):
+        """
+        UsersRoutine 생성 시 새 MirroredRoutine의 스냅샷이 캐시에 미리 저장되는지 테스트
+
+        reverse_url: users-routine-list
+        HTTP method: POST
+
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. users-routine-list에 POST 요청을 보냅니다.
+        3. 생성된 mirrored_routine의 id가 캐시에 있는지 확인합니다.
+        4. 캐시된 스냅샷의 title과 운동 수가 응답과 같은지 확인합니다.
+        """
+        self.user1.login(self.client)
+
+        new_routine = FakeRoutine([self.exercises[0], self.exercises[1]])
+
+        response = self.client.post(
+            reverse("users-routine-list"),
+            data=json.dumps(new_routine.request_create()),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        data = response.json()
+
+        self.assertIn(data.get("mirrored_routine"), mirrored_routine_cache)
+
+        snapshot = mirrored_routine_cache.get(data.get("mirrored_routine"))
+        self.assertEqual(snapshot["title"], data.get("title"))
+        self.assertEqual(len(snapshot["exercises_in_routine"]), 2)
+
+    def test_list_users_routine_from_warm_cache(self):
+        """
+        캐시가 채워진 상태에서 users-routine 목록 조회 시 운동 트리를 다시 조회하지 않는지 테스트
+
+        reverse_url: users-routine-list
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. /users-routine/에 GET 요청을 보내 캐시를 채웁니다.
+        3. 다시 GET 요청을 보내고 실행된 쿼리를 기록합니다.
+        4. 운동 트리 관련 테이블을 조회하는 쿼리가 없는지 확인합니다.
+        5. 두 응답이 같은지 확인합니다.
+        """
+        self.user1.login(self.client)
+
+        first_response = self.client.get(reverse("users-routine-list"))
+
+        with CaptureQueriesContext(connection) as queries:
+            second_response = self.client.get(reverse("users-routine-list"))
+
+        self.assertEqual(second_response.status_code, status.HTTP_200_OK)
+        for query in queries:
+            self.assertNotIn("exerciseinroutine", query["sql"])
+            self.assertNotIn("exercisesinfo", query["sql"])
+
+        self.assertEqual(first_response.json(), second_response.json())
+
+    def test_list_users_routine_from_cold_cache(self):
+        """
+        캐시가 비어 있을 때 users-routine 목록 조회 시 루틴 수와 관계없이 쿼리 수가 일정한지 테스트
+
+        reverse_url: users-routine-list
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 유저 1이 로그인하고 캐시를 비운 뒤 루틴 3개의 목록을 조회하며 쿼리 수를 기록합니다.
+        2. 루틴 7개를 추가로 생성하고 캐시를 비웁니다.
+        3. 루틴 10개의 목록 조회 시 쿼리 수가 같은지 확인합니다.
+        4. 모든 루틴의 운동 트리가 직렬화되고 스냅샷이 캐시에 저장되었는지 확인합니다.
+        """
+        self.user1.login(self.client)
+
+        mirrored_routine_cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("users-routine-list"))
+        self.assertEqual(len(response.json()), 3)
+
+        for _ in range(7):
+            routine = FakeRoutine(self.exercises)
+            routine.create_instance(user_instance=self.user1.instance)
+
+        mirrored_routine_cache.clear()
+        with self.assertNumQueries(len(queries)):
+            response = self.client.get(reverse("users-routine-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(len(data), 10)
+        for users_routine in data:
+            self.assertEqual(len(users_routine["exercises_in_routine"]), 3)
+            self.assertIn(users_routine["mirrored_routine"], mirrored_routine_cache)
+
+    def test_clear_cache_when_exercises_info_changed(self):
+        """
+        운동 정보가 변경되면 캐시가 비워지고 변경된 정보로 다시 렌더링되는지 테스트
+
+        reverse_url: users-routine-list
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 유저 1이 로그인하고 /users-routine/에 GET 요청을 보내 캐시를 채웁니다.
+        2. 운동 정보의 title을 변경합니다.
+        3. 캐시가 비워졌는지 확인합니다.
+        4. 다시 GET 요청을 보내 변경된 title이 응답에 포함되었는지 확인합니다.
+        """
+        self.user1.login(self.client)
+
+        self.client.get(reverse("users-routine-list"))
+        self.assertGreater(len(mirrored_routine_cache), 0)
+
+        exercise = self.exercises[0].instance
+        exercise.title = "변경된 운동 제목"
+        exercise.save()
+
+        self.assertEqual(len(mirrored_routine_cache), 0)
+
+        response = self.client.get(reverse("users-routine-list"))
+
+        titles = [
+            exercise_in_routine["exercise"]["title"]
+            for users_routine in response.json()
+            for exercise_in_routine in users_routine["exercises_in_routine"]
+        ]
+        self.assertIn("변경된 운동 제목", titles)
+
+    def test_evict_least_recently_used_entry(self):
+        """
+        캐시 크기가 최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거되는지 테스트
+
+        테스트 시나리오:
+        1. 최대 크기가 작은 캐시를 생성하고 항목 2개를 저장합니다.
+        2. 첫 번째 항목을 조회하여 최근 사용 항목으로 만듭니다.
+        3. 세 번째 항목을 저장합니다.
+        4. 두 번째 항목만 제거되었는지, 캐시 크기가 최대 크기 이하인지 확인합니다.
+        """
+        cache = RenderedJSONCache(max_bytes=64)
+
+        cache.set(1, {"title": "a" * 10})
+        cache.set(2, {"title": "b" * 10})
+        cache.get(1)
+        cache.set(3, {"title": "c" * 10})
+
+        self.assertIn(1, cache)
+        self.assertNotIn(2, cache)
+        self.assertIn(3, cache)
+        self.assertLessEqual(cache.size, 64)
+
+    def test_clear_cache_when_exercises_info_changed_in_other_process(self):
+        """
+        다른 프로세스에서 운동 정보가 변경되면 카탈로그 버전으로 이 프로세스의 캐시도 무효화되는지 테스트
+
+        reverse_url: users-routine-list
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 유저 1이 로그인하고 /users-routine/에 GET 요청을 보내 캐시를 채웁니다.
+        2. 다른 프로세스를 대신하여 signal 없이 운동 정보의 title을 변경하고,
+           새로 만든 ExercisesCatalog로 카탈로그 버전을 올립니다.
+        3. 이 프로세스의 캐시는 아직 비워지지 않았는지 확인합니다.
+        4. 다시 GET 요청을 보내 변경된 title이 응답에 포함되었는지 확인합니다.
+        """
+        self.user1.login(self.client)
+
+        self.client.get(reverse("users-routine-list"))
+        cached = len(mirrored_routine_cache)
+        self.assertGreater(cached, 0)
+
+        ExercisesInfo.objects.filter(id=self.exercises[0].instance.id).update(
+            title="다른 프로세스에서 변경된 제목"
+        )
+        ExercisesCatalog().bump()
+
+        self.assertEqual(len(mirrored_routine_cache), cached)
+
+        response = self.client.get(reverse("users-routine-list"))
+
+        titles = [
+            exercise_in_routine["exercise"]["title"]
+            for users_routine in response.json()
+            for exercise_in_routine in users_routine["exercises_in_routine"]
+        ]
+        self.assertIn("다른 프로세스에서 변경된 제목", titles)
+
+    def test_skip_set_when_version_changed_while_rendering(self):
+        """
+        렌더링하는 동안 버전이 바뀌었다면 이전 버전의 렌더링 결과를 저장하지 않는지 테스트
+
+        테스트 시나리오:
+        1. 캐시를 버전 1로 동기화하고 버전 1의 항목을 저장합니다.
+        2. 버전 2로 동기화하면 항목이 비워지는지 확인합니다.
+        3. 버전 1에서 렌더링한 항목은 저장되지 않고, 버전 2의 항목은 저장되는지 확인합니다.
+        """
+        cache = RenderedJSONCache(max_bytes=1024)
+
+        cache.sync_version(1)
+        cache.set(1, {"title": "a"}, version=1)
+        self.assertIn(1, cache)
+
+        cache.sync_version(2)
+        self.assertNotIn(1, cache)
+
+        self.assertEqual(cache.set(1, {"title": "a"}, version=1), {"title": "a"})
+        self.assertNotIn(1, cache)
+
+        cache.set(1, {"title": "b"}, version=2)
+        self.assertEqual(cache.get(1), {"title": "b"})
+
+
+class OrphanedRoutineCollectorTestCase(TestCase):
+    """
+    목적: 어디에서도 참조하지 않는 MirroredRoutine 트리를 정리하는 OrphanedRoutineCollector에 대한 테스트를 진행합니다.
+
+    Test cases:
+    1. 고아 MirroredRoutine과 운동 트리가 삭제되고, 삭제된 행 수가 반환되는지 테스트
+    2. 루틴의 현재 스냅샷, 구독 중인 스냅샷, 수행 기록이 있는 스냅샷은 삭제되지 않는지 테스트
+    3. batch_size와 max_batches만큼만 삭제하고, 다음 실행에서 나머지를 삭제하는지 테스트
+    4. collect_orphaned_routines 명령어가 dry-run일 때 삭제하지 않고, 아닐 때 삭제하는지 테스트
+    """
+
+    def setUp(self):
+        """
+        초기 설정
+
+        1. 관리자 유저 생성
+        2. 운동 2개 생성
+        3. 유저 2명 생성
+        """
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.exercises = [FakeExercisesInfo() for _ in range(2)]
+        for exercise in self.exercises:
+            exercise.create_instance(self.admin.instance)
+
+        self.user1 = FakeUser()
+        self.user1.create_instance()
+
+        self.user2 = FakeUser()
+        self.user2.create_instance()
+
+    def create_orphaned_mirrored_routine(self):
+        """
+        원본 루틴과 UsersRoutine이 모두 삭제된 MirroredRoutine을 생성하여 반환
+        """
+        routine = FakeRoutine(self.exercises)
+        routine.create_instance(user_instance=self.user1.instance)
+
+        mirrored_routine = routine.instance.mirrored_routine
+        UsersRoutine.objects.filter(routine=routine.instance).delete()
+        routine.instance.delete()
+
+        return mirrored_routine
+
+    def test_collect_deletes_orphaned_tree(self):
+        """
+        고아 MirroredRoutine과 운동 트리가 삭제되고, 삭제된 행 수가 반환되는지 테스트
+
+        테스트 시나리오:
+        1. 고아 MirroredRoutine 2개를 생성합니다.
+        2. OrphanedRoutineCollector로 정리합니다.
+        3. MirroredRoutine 2개, ExerciseInRoutine 4개, ExerciseInRoutineAttribute 4개가 삭제되었다고 반환되는지 확인합니다.
+        4. 고아 MirroredRoutine과 운동 트리가 DB에 남아있지 않은지 확인합니다.
+        """
+        orphans = [self.create_orphaned_mirrored_routine() for _ in range(2)]
+
+        result = OrphanedRoutineCollector().collect()
+
+        self.assertEqual(result["mirrored_routines"], 2)
+        self.assertEqual(result["exercises_in_routine"], 4)
+        self.assertEqual(result["exercise_attributes"], 4)
+
+        orphan_ids = [orphan.id for orphan in orphans]
+        self.assertFalse(MirroredRoutine.objects.filter(id__in=orphan_ids).exists())
+        self.assertFalse(
+            ExerciseInRoutine.objects.filter(mirrored_routine__in=orphan_ids).exists()
+        )
+        self.assertFalse(
+            ExerciseInRoutineAttribute.objects.filter(
+                exercise_in_routine__mirrored_routine__in=orphan_ids
+            ).exists()
+        )
+
+    def test_collect_keeps_referenced_snapshots(self):
+        """
+        루틴의 현재 스냅샷, 구독 중인 스냅샷, 수행 기록이 있는 스냅샷은 삭제되지 않는지 테스트
+
+        테스트 시나리오:
+        1. 유저 1이 루틴을 생성합니다. (현재 스냅샷)
+        2. 유저 2가 구독 중인 루틴의 원본을 삭제합니다. (구독 중인 스냅샷)
+        3. 고아 MirroredRoutine을 생성하고 수행 기록을 남깁니다. (수행 기록이 있는 스냅샷)
+        4. 고아 MirroredRoutine을 하나 더 생성합니다.
+        5. OrphanedRoutineCollector로 정리합니다.
+        6. 마지막 고아 MirroredRoutine만 삭제되었는지 확인합니다.
+        """
+        current = FakeRoutine(self.exercises)
+        current.create_instance(user_instance=self.user1.instance)
+
+        subscribed = FakeRoutine(self.exercises)
+        subscribed.create_instance(user_instance=self.user1.instance)
+        UsersRoutineManagementService(
+            user=self.user2.instance, routine=subscribed.instance
+        ).user_subscribe_routine()
+        subscribed_mirrored_routine = subscribed.instance.mirrored_routine
+        UsersRoutine.objects.filter(
+            user=self.user1.instance, routine=subscribed.instance
+        ).delete()
+        subscribed.instance.delete()
+
+        streak_mirrored_routine = self.create_orphaned_mirrored_routine()
+        RoutineStreak.objects.create(
+            user=self.user1.instance, mirrored_routine=streak_mirrored_routine
+        )
+
+        orphan = self.create_orphaned_mirrored_routine()
+
+        result = OrphanedRoutineCollector().collect()
+
+        self.assertEqual(result["mirrored_routines"], 1)
+        self.assertFalse(MirroredRoutine.objects.filter(id=orphan.id).exists())
+        self.assertEqual(
+            set(MirroredRoutine.objects.values_list("id", flat=True)),
+            {
+                current.instance.mirrored_routine.id,
+                subscribed_mirrored_routine.id,
+                streak_mirrored_routine.id,
+            },
+        )
+
+    def test_collect_in_bounded_batches(self):
+        """
+        batch_size와 max_batches만큼만 삭제하고, 다음 실행에서 나머지를 삭제하는지 테스트
+
+        테스트 시나리오:
+        1. 고아 MirroredRoutine 3개를 생성합니다.
+        2. batch_size=2, max_batches=1로 정리합니다.
+        3. 배치 1개로 MirroredRoutine 2개만 삭제되었는지 확인합니다.
+        4. 다시 정리했을 때 남은 1개가 삭제되는지 확인합니다.
+        """
+        for _ in range(3):
+            self.create_orphaned_mirrored_routine()
+
+        result = OrphanedRoutineCollector(batch_size=2, max_batches=1).collect()
+
+        self.assertEqual(result["batches"], 1)
+        self.assertEqual(result["mirrored_routines"], 2)
+        self.assertEqual(MirroredRoutine.objects.count(), 1)
+
+        result = OrphanedRoutineCollector(batch_size=2).collect()
+
+        self.assertEqual(result["batches"], 1)
+        self.assertEqual(result["mirrored_routines"], 1)
+        self.assertEqual(MirroredRoutine.objects.count(), 0)
+
+    def test_collect_orphaned_routines_command(self):
+        """
+        collect_orphaned_routines 명령어가 dry-run일 때 삭제하지 않고, 아닐 때 삭제하는지 테스트
+
+        테스트 시나리오:
+        1. 고아 MirroredRoutine 1개를 생성합니다.
+        2. --dry-run으로 명령어를 실행합니다.
+        3. 삭제 대상 행 수가 출력되고, MirroredRoutine이 삭제되지 않았는지 확인합니다.
+        4. 명령어를 실행합니다.
+        5. 삭제된 행 수가 출력되고, MirroredRoutine이 삭제되었는지 확인합니다.
+        """
+        orphan = self.create_orphaned_mirrored_routine()
+
+        out = StringIO()
+        call_command("collect_orphaned_routines", "--dry-run", stdout=out)
+
+        self.assertIn("mirrored_routines=1", out.getvalue())
+        self.assertIn("exercises_in_routine=2", out.getvalue())
+        self.assertTrue(MirroredRoutine.objects.filter(id=orphan.id).exists())
+
+        out = StringIO()
+        call_command("collect_orphaned_routines", "--batch-size", "10", stdout=out)
+
+        self.assertIn("mirrored_routines=1", out.getvalue())
+        self.assertIn("exercise_attributes=2", out.getvalue())
+        self.assertFalse(MirroredRoutine.objects.filter(id=orphan.id).exists())
+
+
+class RoutineBatchSubscriptionTestCase(APITestCase):
+    """
+    목적: 여러 루틴을 한 번에 구독, 구독 취소하는 batch-subscription 엔드포인트에 대한 테스트를 진행합니다.
+
+    Test cases:
+    1. 여러 루틴을 한 번에 구독하고 루틴별 결과를 반환하는지 테스트
+    2. 구독할 루틴 개수와 관계없이 일정한 수의 쿼리가 발생하는지 테스트
+    3. 여러 루틴의 구독을 한 번에 취소하고 루틴별 결과를 반환하는지 테스트
+    4. 잘못된 요청이라면 400을 반환하는지 테스트
+    """
+
+    def setUp(self):
+        """
+        초기 설정:
+
+        1. 관리자 유저, 운동 2개 생성
+        2. 유저 1, 유저 2 생성
+        3. 유저 2가 루틴 10개 생성
+        4. 유저 1이 루틴 1개 생성
+        """
+        cache.clear()
+        mirrored_routine_cache.clear()
+
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.exercise1 = FakeExercisesInfo()
+        self.exercise1.create_instance(self.admin.instance)
+
+        self.exercise2 = FakeExercisesInfo()
+        self.exercise2.create_instance(self.admin.instance)
+
+        self.user1 = FakeUser()
+        self.user1.create_instance()
+
+        self.user2 = FakeUser()
+        self.user2.create_instance()
+
+        self.user2_routines = []
+        for _ in range(10):
+            routine = FakeRoutine([self.exercise1, self.exercise2])
+            routine.create_instance(user_instance=self.user2.instance)
+            self.user2_routines.append(routine.instance)
+
+        self.user1_routine = FakeRoutine([self.exercise1])
+        self.user1_routine.create_instance(user_instance=self.user1.instance)
+
+        self.client.force_authenticate(user=self.user1.instance)
+
+    def batch_subscription(self, subscribe=None, unsubscribe=None):
+        data = {}
+        if subscribe is not None:
+            data["subscribe"] = subscribe
+        if unsubscribe is not None:
+            data["unsubscribe"] = unsubscribe
+        return self.client.post(
+            reverse("routine-batch-subscription"),
+            data=json.dumps(data),
+            content_type="application/json",
+        )
+
+    def test_batch_subscribe(self):
+        """
+        여러 루틴을 한 번에 구독하고 루틴별 결과를 반환하는지 테스트
+
+        reverse_url: routine-batch-subscription
+        HTTP method: POST
+
+        테스트 시나리오:
+        1. 유저 1이 유저 2의 루틴 0을 미리 구독합니다.
+        2. 유저 2의 루틴 0, 1, 2, 유저 1의 루틴, 존재하지 않는 루틴, 삭제된 루틴 3으로 구독 요청을 보냅니다.
+        3. 상태 코드가 200인지 확인합니다.
+        4. 요청한 순서대로 루틴별 결과가 반환되는지 확인합니다.
+        5. 새로 구독한 루틴은 UsersRoutine 정보가 함께 반환되는지 확인합니다.
+        6. 유저 1의 UsersRoutine이 생성되었는지 확인합니다.
+        """
+
+        UsersRoutineManagementService(
+            user=self.user1.instance, routine=self.user2_routines[0]
+        ).user_subscribe_routine()
+
+        deleted_routine = self.user2_routines[3]
+        deleted_routine.is_deleted = True
+        deleted_routine.save()
+
+        routine_ids = [
+            self.user2_routines[0].id,
+            self.user2_routines[1].id,
+            self.user2_routines[2].id,
+            self.user1_routine.instance.id,
+            999999,
+            deleted_routine.id,
+        ]
+
+        response = self.batch_subscription(subscribe=routine_ids)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+
+        self.assertEqual(data["unsubscribe"], [])
+        self.assertEqual(
+            [(result["routine"], result["status"]) for result in data["subscribe"]],
+            list(
+                zip(
+                    routine_ids,
+                    [
+                        "already_subscribed",
+                        "subscribed",
+                        "subscribed",
+                        "own_routine",
+                        "not_found",
+                        "not_found",
+                    ],
+                )
+            ),
+        )
+
+        subscribed = data["subscribe"][1]["users_routine"]
+        self.assertEqual(subscribed["routine"], self.user2_routines[1].id)
+        self.assertEqual(
+            subscribed["mirrored_routine"], self.user2_routines[1].mirrored_routine.id
+        )
+        self.assertEqual(subscribed["title"], self.user2_routines[1].title)
+        self.assertEqual(len(subscribed["exercises_in_routine"]), 2)
+
+        self.assertEqual(
+            set(
+                UsersRoutine.objects.filter(
+                    user=self.user1.instance, is_author=False
+                ).values_list("routine_id", flat=True)
+            ),
+            {routine.id for routine in self.user2_routines[:3]},
+        )
+
+    def test_batch_subscribe_query_count(self):
+        """
+        구독할 루틴 개수와 관계없이 일정한 수의 쿼리가 발생하는지 테스트
+
+        reverse_url: routine-batch-subscription
+        HTTP method: POST
+
+        테스트 시나리오:
+        1. 유저 2의 루틴 2개로 구독 요청을 보내고 쿼리 수를 기록합니다.
+        2. 스냅샷 캐시를 비웁니다.
+        3. 유저 2의 나머지 루틴 8개로 구독 요청을 보내고 쿼리 수를 기록합니다.
+        4. 두 요청의 쿼리 수가 같은지 확인합니다.
+        """
+
+        with CaptureQueriesContext(connection) as small_batch_queries:
+            response = self.batch_subscription(
+                subscribe=[routine.id for routine in self.user2_routines[:2]]
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        mirrored_routine_cache.clear()
+
+        with CaptureQueriesContext(connection) as large_batch_queries:
+            response = self.batch_subscription(
+                subscribe=[routine.id for routine in self.user2_routines[2:]]
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(len(small_batch_queries), len(large_batch_queries))
+        self.assertEqual(
+            UsersRoutine.objects.filter(
+                user=self.user1.instance, is_author=False
+            ).count(),
+            10,
+        )
+
+    def test_batch_unsubscribe(self):
+        """
+        여러 루틴의 구독을 한 번에 취소하고 루틴별 결과를 반환하는지 테스트
+
+        reverse_url: routine-batch-subscription
+        HTTP method: POST
+
+        테스트 시나리오:
+        1. 유저 1이 유저 2의 루틴 0, 1을 구독하고 루틴 0을 월요일 주간 루틴으로 설정합니다.
+        2. 루틴 0, 1, 2, 유저 1의 루틴으로 구독 취소 요청을 보내면서 루틴 4를 구독합니다.
+        3. 상태 코드가 200인지 확인합니다.
+        4. 루틴별 구독 취소 결과가 반환되는지 확인합니다.
+        5. 루틴 0, 1의 구독과 월요일 주간 루틴이 삭제되고, 유저 1의 루틴은 남아있는지 확인합니다.
+        """
+
+        users_routine = UsersRoutineManagementService(
+            user=self.user1.instance, routine=self.user2_routines[0]
+        ).user_subscribe_routine()
+        UsersRoutineManagementService(
+            user=self.user1.instance, routine=self.user2_routines[1]
+        ).user_subscribe_routine()
+        FakeWeeklyRoutine(day_index=0, users_routine=users_routine).create_instance(
+            user_instance=self.user1.instance
+        )
+
+        routine_ids = [
+            self.user2_routines[0].id,
+            self.user2_routines[1].id,
+            self.user2_routines[2].id,
+            self.user1_routine.instance.id,
+        ]
+
+        response = self.batch_subscription(
+            subscribe=[self.user2_routines[4].id], unsubscribe=routine_ids
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+
+        self.assertEqual(data["subscribe"][0]["status"], "subscribed")
+        self.assertEqual(
+            data["unsubscribe"],
+            [
+                {"routine": routine_ids[0], "status": "unsubscribed"},
+                {"routine": routine_ids[1], "status": "unsubscribed"},
+                {"routine": routine_ids[2], "status": "not_subscribed"},
+                {"routine": routine_ids[3], "status": "own_routine"},
+            ],
+        )
+
+        self.assertEqual(
+            set(
+                UsersRoutine.objects.filter(user=self.user1.instance).values_list(
+                    "routine_id", flat=True
+                )
+            ),
+            {self.user1_routine.instance.id, self.user2_routines[4].id},
+        )
+        self.assertFalse(
+            WeeklyRoutine.objects.filter(user=self.user1.instance).exists()
+        )
+
+    def test_batch_subscription_fail_if_invalid_request(self):
+        """
+        잘못된 요청이라면 400을 반환하는지 테스트
+
+        reverse_url: routine-batch-subscription
+        HTTP method: POST
+
+        테스트 시나리오:
+        1. 구독, 구독 취소할 루틴이 없는 요청을 보내고 상태 코드가 400인지 확인합니다.
+        2. 같은 루틴을 구독하면서 구독 취소하는 요청을 보내고 상태 코드가 400인지 확인합니다.
+        3. 최대 개수보다 많은 루틴을 구독하는 요청을 보내고 상태 코드가 400인지 확인합니다.
+        4. 유저 1의 구독이 생성되지 않았는지 확인합니다.
+        """
+
+        response = self.batch_subscription(subscribe=[], unsubscribe=[])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        routine_id = self.user2_routines[0].id
+        response = self.batch_subscription(
+            subscribe=[routine_id], unsubscribe=[routine_id]
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.batch_subscription(
+            subscribe=list(
+                range(1, RoutineBatchSubscriptionSerializer.max_batch_size + 2)
+            )
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertFalse(
+            UsersRoutine.objects.filter(
+                user=self.user1.instance, is_author=False
+            ).exists()
+        )
+
+
+class WeeklyRoutineTestCase(APITestCase):
+    """
+    목적: 유저의 한 주에 대한 루틴을 관리하는 WeeklyRoutine 모델에 대한 테스트를 진행합니다.
+
+    Test cases:
+    1. 유저가 현재 설정된 주간 루틴을 조회하는지 테스트
+    2. 유저가 새로운 정보로 주간 루틴을 생성하는지 테스트
+    3. 이미 루틴을 생성한 유저가 새로운 정보로 주간 루틴을 생성에 실패하는지 테스트
+    4. 잘못된 day_index가 포함된 request로 주간 루틴을 생성에 실패하는지 테스트
+    5. 유저가 주간 루틴을 변경하는것에 성공하는지 테스트
+    6. 유저가 주간 루틴을 삭제하는것에 성공하는지 테스트
+    7. 주간 루틴 변경 시 요일 수와 관계없이 일정한 수의 쿼리가 발생하는지 테스트
+    8. 다른 유저의 UsersRoutine으로 주간 루틴 변경에 실패하는지 테스트
+    9. 중복된 day_index가 포함된 request로 주간 루틴 변경에 실패하는지 테스트
+    10. UsersRoutine의 PK를 문자열로 보내도 주간 루틴을 생성하고 변경하는지 테스트
+    """
+
+    def setUp(self):
+        """
+        초기 설정:
+
+        1. 관리자 유저 생성
+        2. 운동 5개 생성
+        3. 유저 1 생성
+        4. 유저 1이 루틴 4개 생성
+        """
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.exercise1 = FakeExercisesInfo()
+        self.exercise1.create_instance(self.admin.instance)
+
+        self.exercise2 = FakeExercisesInfo()
+        self.exercise2.create_instance(self.admin.instance)
+
+        self.exercise3 = FakeExercisesInfo()
+        self.exercise3.create_instance(self.admin.instance)
+
+        self.exercise4 = FakeExercisesInfo()
+        self.exercise4.create_instance(self.admin.instance)
+
+        self.exercise5 = FakeExercisesInfo()
+        self.exercise5.create_instance(self.admin.instance)
+
+        self.user1 = FakeUser()
+        self.user1.create_instance()
+
+        self.routine1 = FakeRoutine([self.exercise1, self.exercise2])
+        self.routine1.create_instance(user_instance=self.user1.instance)
+
+        self.routine2 = FakeRoutine([self.exercise3, self.exercise4])
+        self.routine2.create_instance(user_instance=self.user1.instance)
+
+        self.routine3 = FakeRoutine([self.exercise1, self.exercise5])
+        self.routine3.create_instance(user_instance=self.user1.instance)
+
+        self.routine4 = FakeRoutine([self.exercise2, self.exercise3])
+        self.routine4.create_instance(user_instance=self.user1.instance)
+
+    def test_get_weekly_routine(self):
+        """
+        유저가 현재 설정된 주간 루틴을 조회하는지 테스트
+
+        reverse_url: weekly-routine
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 유저 1이 현재 생성된 루틴으로 WeeklyRoutine 인스턴스를 생성합니다.
+        2. 유저 1이 로그인합니다.
+        3. /weekly-routine/에 GET 요청을 보냅니다.
+        4. 상태 코드가 200인지 확인합니다.
+        5. 응답의 길이를 확인합니다.
+        6. 응답의 WeeklyRoutine의 id가 유저 1이 생성한 루틴의 id와 같은지 확인합니다.
+        7. 응답의 WeeklyRoutine들의 day_index가 유저 1이 생성한 WeeklyRoutine들의 day_index 순서와 같은지 확인합니다.
+        """
+
+        user1_users_routine_instances = [
+            self.routine3.instance.subscribers.get(user=self.user1.instance),
+            self.routine2.instance.subscribers.get(user=self.user1.instance),
+            self.routine4.instance.subscribers.get(user=self.user1.instance),
+            self.routine1.instance.subscribers.get(user=self.user1.instance),
+        ]
+
+        random_day_indices = [0, 5, 3, 2]
+
+        fake_weekly_routines = [
+            FakeWeeklyRoutine(
+                day_index=random_day_index, users_routine=users_routine_instance
+            )
+            for random_day_index, users_routine_instance in zip(
+                random_day_indices, user1_users_routine_instances
+            )
+        ]
+
+        for fake_weekly_routine in fake_weekly_routines:
+            fake_weekly_routine.create_instance(user_instance=self.user1.instance)
+
+        self.user1.login(self.client)
+
+        response = self.client.get(reverse("weekly-routine"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+
+        self.assertEqual(len(data), len(fake_weekly_routines))
+
+        for fake_weekly_routine, response_weekly_routine in zip(
+            sorted(fake_weekly_routines, key=lambda x: x.instance.day_index), data
+        ):
+            self.assertEqual(
+                fake_weekly_routine.instance.users_routine.id,
+                response_weekly_routine.get("users_routine"),
+            )
+            self.assertEqual(
+                fake_weekly_routine.instance.day_index,
+                response_weekly_routine.get("day_index"),
+            )
+
+    def test_create_weekly_routine_if_weekly_routines_empty(self):
+        """
+        주간 루틴을 보유하지 않은 유저가 새로운 정보로 주간 루틴을 생성하는지 테스트
+
+        reverse_url: weekly-routine
+        HTTP method: POST
+
+        테스트 시나리오:
+        1. 새로운 FakeWeeklyRoutine 배열을 생성합니다.
+        2. 유저 1이 로그인합니다.
+        3. /weekly-routine/에 POST 요청을 보냅니다.
+        4. 상태 코드가 201인지 확인합니다.
+        5. 응답의 길이를 확인합니다.
+        6. 응답의 각 WeeklyRoutine의 day_index가 생성한 FakeWeeklyRoutine의 day_index와 같은지 확인합니다.
+        7. 응답의 각 WeeklyRoutine의 users_routine이 생성한 FakeWeeklyRoutine의 users_routine과 같은지 확인합니다.
+        """
+        user1_users_routine_instances = [
+            self.routine3.instance.subscribers.get(user=self.user1.instance),
+            self.routine2.instance.subscribers.get(user=self.user1.instance),
+            self.routine4.instance.subscribers.get(user=self.user1.instance),
+            self.routine1.instance.subscribers.get(user=self.user1.instance),
+        ]
+
+        random_day_indices = [0, 5, 3, 2]
+
+        fake_weekly_routines = [
+            FakeWeeklyRoutine(
+                day_index=random_day_index, users_routine=users_routine_instance
+            )
+            for random_day_index, users_routine_instance in zip(
+                random_day_indices, user1_users_routine_instances
+            )
+        ]
+
+        self.user1.login(self.client)
+
+        create_request = [
+            fake_weekly_routine.create_request()
+            for fake_weekly_routine in fake_weekly_routines
+        ]
+
+        response = self.client.post(
+            reverse("weekly-routine"),
+            data=json.dumps(create_request),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        data = response.json()
+
+        self.assertEqual(len(data), len(fake_weekly_routines))
+
+        for fake_weekly_routine, response_weekly_routine in zip(
+            sorted(fake_weekly_routines, key=lambda x: x.base_attr.get("day_index")),
+            data,
+        ):
+            self.assertEqual(
+                fake_weekly_routine.users_routine.id,
+                response_weekly_routine.get("users_routine"),
+            )
+            self.assertEqual(
+                fake_weekly_routine.base_attr.get("day_index"),
+                response_weekly_routine.get("day_index"),
+            )
+
+    def test_fail_create_weekly_routine_if_weekly_routines_existed(self):
+        """
+        이미 루틴을 보유한 유저가 새로운 정보로 주간 루틴을 생성하는것을 실패하는지 테스트
+
+        reverse_url: weekly-routine
+        HTTP method: POST
+
+        테스트 시나리오:
+        1. 유저 1이 현재 생성된 루틴으로 WeeklyRoutine 인스턴스를 생성합니다.
+        2. 새로운 FakeWeeklyRoutine 배열을 생성합니다.
+        3. 유저 1이 로그인합니다.
+        4. /weekly-routine/에 POST 요청을 보냅니다.
+        5. 상태 코드가 403인지 확인합니다.
+        """
+
+        user1_users_routine_instances = [
+            self.routine3.instance.subscribers.get(user=self.user1.instance),
+            self.routine2.instance.subscribers.get(user=self.user1.instance),
+            self.routine4.instance.subscribers.get(user=self.user1.instance),
+            self.routine1.instance.subscribers.get(user=self.user1.instance),
+        ]
+
+        random_day_indices1 = [1, 3, 5, 2]
+
+        fake_weekly_routines1 = [
+            FakeWeeklyRoutine(
+                day_index=random_day_index, users_routine=users_routine_instance
+            )
+            for random_day_index, users_routine_instance in zip(
+                random_day_indices1, user1_users_routine_instances
+            )
+        ]
+
+        for fake_weekly_routine in fake_weekly_routines1:
+            fake_weekly_routine.create_instance(user_instance=self.user1.instance)
+
+        random_day_indices2 = [6, 1, 4, 2]
+
+        fake_weekly_routines2 = [
+            FakeWeeklyRoutine(
+                day_index=random_day_index, users_routine=users_routine_instance
+            )
+            for random_day_index, users_routine_instance in zip(
+                random_day_indices2, user1_users_routine_instances
+            )
+        ]
+
+        create_request = [
+            fake_weekly_routine.create_request()
+            for fake_weekly_routine in fake_weekly_routines2
+        ]
+
+        self.user1.login(self.client)
+
+        response = self.client.post(
+            reverse("weekly-routine"),
+            data=json.dumps(create_request),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_fail_create_weekly_routine_if_invalid_day_index(self):
+        """
+        잘못된 day_index가 포함된 request로 주간 루틴을 생성에 실패하는지 테스트
+
+        reverse_url: weekly-routine
+        HTTP method: POST
+
+        테스트 시나리오:
+        1. WeeklyRoutine의 개수를 저장합니다.
+        2. 잘못된 day_index가 포함된 새로운 FakeWeeklyRoutine 배열을 생성합니다.
+        3. 유저 1이 로그인합니다.
+        4. /weekly-routine/에 POST 요청을 보냅니다.
+        5. 상태 코드가 400인지 확인합니다.
+        6. WeeklyRoutine의 개수가 변하지 않았는지 확인합니다.
+        """
+
+        weekly_routine_count = WeeklyRoutine.objects.count()
+
+        user1_users_routine_instances = [
+            self.routine3.instance.subscribers.get(user=self.user1.instance),
+            self.routine2.instance.subscribers.get(user=self.user1.instance),
+            self.routine4.instance.subscribers.get(user=self.user1.instance),
+            self.routine1.instance.subscribers.get(user=self.user1.instance),
+        ]
+
+        wrong_day_indices = [0, 8, 3, 2]
+
+        self.user1.login(self.client)
+
+        create_request = [
+            FakeWeeklyRoutine(
+                day_index=wrong_day_index, users_routine=users_routine_instance
+            ).create_request()
+            for wrong_day_index, users_routine_instance in zip(
+                wrong_day_indices, user1_users_routine_instances
+            )
+        ]
+
+        response = self.client.post(
+            reverse("weekly-routine"),
+            data=create_request,
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertEqual(WeeklyRoutine.objects.count(), weekly_routine_count)
+
+    def test_update_weekly_routine(self):
+        """
+        유저가 주간 루틴을 변경하는것에 성공하는지 테스트
+
+        reverse_url: weekly-routine
+        HTTP method: PUT
+
+        테스트 시나리오:
+        1. 유저 1이 현재 생성된 루틴으로 WeeklyRoutine 인스턴스를 생성합니다.
+        2. 새로운 FakeWeeklyRoutine 배열을 생성합니다.
+        3. 유저 1이 로그인합니다.
+        4. /weekly-routine/에 PUT 요청을 보냅니다.
+        5. 상태 코드가 200인지 확인합니다.
+        6. 응답의 길이가 기존 WeeklyRoutine의 수와 다른지 확인합니다.
+        7. 응답의 길이가 새로운 FakeWeeklyRoutine 배열의 길이와 같은지 확인합니다.
+        8. day_index를 비교하여 변경이 잘 처리되었는지 확인합니다.
+        """
+
+        user1_users_routine_instances = [
+            self.routine3.instance.subscribers.get(user=self.user1.instance),
+            self.routine2.instance.subscribers.get(user=self.user1.instance),
+            self.routine4.instance.subscribers.get(user=self.user1.instance),
+            self.routine1.instance.subscribers.get(user=self.user1.instance),
+        ]
+
+        random_day_indices1 = [1, 3, 5, 2]
+
+        fake_weekly_routines1 = [
+            FakeWeeklyRoutine(
+                day_index=random_day_index, users_routine=users_routine_instance
+            )
+            for random_day_index, users_routine_instance in zip(
+                random_day_indices1, user1_users_routine_instances
+            )
+        ]
+
+        for fake_weekly_routine in fake_weekly_routines1:
+            fake_weekly_routine.create_instance(user_instance=self.user1.instance)
+
+        new_user1_users_routine_instances = [
+            self.routine1.instance.subscribers.get(user=self.user1.instance),
+            self.routine4.instance.subscribers.get(user=self.user1.instance),
+            self.routine2.instance.subscribers.get(user=self.user1.instance),
+        ]
+
+        random_day_indices2 = [1, 5, 4]
+
+        fake_weekly_routines2 = [
+            FakeWeeklyRoutine(
+                day_index=random_day_index, users_routine=users_routine_instance
+            )
+            for random_day_index, users_routine_instance in zip(
+                random_day_indices2, new_user1_users_routine_instances
+            )
+        ]
+
+        self.user1.login(self.client)
+
+        put_request = [
+            fake_weekly_routine.create_request()
+            for fake_weekly_routine in fake_weekly_routines2
+        ]
+
+        response = self.client.put(
+            reverse("weekly-routine"),
+            data=json.dumps(put_request),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+
+        self.assertNotEqual(len(data), len(fake_weekly_routines1))
+        self.assertEqual(len(data), len(fake_weekly_routines2))
+
+        self.assertEqual(WeeklyRoutine.objects.count(), len(fake_weekly_routines2))
+
+        for response_weekly_routine, fake_weekly_routine in zip(
+            data,
+            sorted(fake_weekly_routines2, key=lambda x: x.base_attr.get("day_index")),
+        ):
+            self.assertEqual(
+                response_weekly_routine.get("day_index"),
+                fake_weekly_routine.base_attr.get("day_index"),
+            )
+            self.assertEqual(
+                response_weekly_routine.get("users_routine"),
+                fake_weekly_routine.users_routine.id,
+            )
+
+    def test_delete_weekly_routine(self):
+        """
+        WeeklyRoutine에 대한 delete 테스트
+
+        reverse_url: weekly-routine
+        HTTP method: DELETE
+
+        테스트 시나리오:
+        1. 유저 1이 현재 생성된 루틴으로 WeeklyRoutine 인스턴스를 생성합니다.
+        2. 유저 1이 로그인합니다.
+        3. /weekly-routine/에 DELETE 요청을 보냅니다.
+        4. 상태 코드가 204인지 확인합니다.
+        5. 유저 1이 보유한 WeeklyRoutine이 모두 삭제되었는지 확인합니다.
+        """
+
+        user1_users_routine_instances = [
+            self.routine3.instance.subscribers.get(user=self.user1.instance),
+            self.routine2.instance.subscribers.get(user=self.user1.instance),
+            self.routine4.instance.subscribers.get(user=self.user1.instance),
+            self.routine1.instance.subscribers.get(user=self.user1.instance),
+        ]
+
+        random_day_indices = [1, 3, 5, 2]
+
+        fake_weekly_routines = [
+            FakeWeeklyRoutine(
+                day_index=random_day_index, users_routine=users_routine_instance
+            )
+            for random_day_index, users_routine_instance in zip(
+                random_day_indices, user1_users_routine_instances
+            )
+        ]
+
+        for fake_weekly_routine in fake_weekly_routines:
+            fake_weekly_routine.create_instance(user_instance=self.user1.instance)
+
+        self.user1.login(self.client)
+
+        response = self.client.delete(reverse("weekly-routine"))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertFalse(
+            WeeklyRoutine.objects.filter(user=self.user1.instance).exists()
+        )
+
+    def get_users_routines(self):
+        return [
+            routine.instance.subscribers.get(user=self.user1.instance)
+            for routine in [self.routine1, self.routine2, self.routine3, self.routine4]
+        ]
+
+    def test_update_weekly_routine_query_count(self):
+        """
+        주간 루틴 변경 시 요일 수와 관계없이 일정한 수의 쿼리가 발생하는지 테스트
+
+        reverse_url: weekly-routine
+        HTTP method: PUT
+
+        테스트 시나리오:
+        1. 유저 1이 월, 수요일에 WeeklyRoutine 인스턴스를 생성합니다.
+        2. 유저 1이 로그인합니다.
+        3. 화, 수요일 2개의 요일로 /weekly-routine/에 PUT 요청을 보내고 쿼리 수를 기록합니다. (1개 요일 삭제)
+        4. 나머지 5개의 요일로 /weekly-routine/에 PUT 요청을 보내고 쿼리 수를 기록합니다. (2개 요일 삭제)
+        5. 7개의 요일 전체로 /weekly-routine/에 PUT 요청을 보내고 쿼리 수를 기록합니다. (삭제 없음)
+        6. 요청들의 상태 코드가 200인지 확인합니다.
+        7. 삭제가 있는 두 요청의 쿼리 수가 같고, 삭제가 없는 요청의 쿼리 수가 그 이하인지 확인합니다.
+        8. DB의 주간 루틴이 마지막 요청과 같은지 확인합니다.
+        """
+
+        users_routines = self.get_users_routines()
+
+        for day_index in [0, 2]:
+            FakeWeeklyRoutine(
+                day_index=day_index, users_routine=users_routines[day_index]
+            ).create_instance(user_instance=self.user1.instance)
+
+        self.user1.login(self.client)
+
+        def put_weekly_routine(day_indices):
+            put_request = [
+                {
+                    "day_index": day_index,
+                    "users_routine": users_routines[day_index % 4].id,
+                }
+                for day_index in day_indices
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.put(
+                    reverse("weekly-routine"),
+                    data=json.dumps(put_request),
+                    content_type="application/json",
+                )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(queries)
+
+        two_days_queries = put_weekly_routine([1, 2])
+        five_days_queries = put_weekly_routine([0, 3, 4, 5, 6])
+        seven_days_queries = put_weekly_routine(range(7))
+
+        self.assertEqual(two_days_queries, five_days_queries)
+        self.assertLessEqual(seven_days_queries, two_days_queries)
+
+        self.assertEqual(
+            list(
+                WeeklyRoutine.objects.filter(user=self.user1.instance)
+                .order_by("day_index")
+                .values_list("day_index", "users_routine_id")
+            ),
+            [(day_index, users_routines[day_index % 4].id) for day_index in range(7)],
+        )
+
+    def test_update_weekly_routine_fail_if_not_owned_users_routine(self):
+        """
+        다른 유저의 UsersRoutine으로 주간 루틴 변경에 실패하는지 테스트
+
+        reverse_url: weekly-routine
+        HTTP method: PUT
+
+        테스트 시나리오:
+        1. 유저 1이 WeeklyRoutine 인스턴스를 생성합니다.
+        2. 유저 2를 생성하고 유저 2가 루틴을 생성합니다.
+        3. 유저 1이 로그인합니다.
+        4. 유저 2의 UsersRoutine이 포함된 request로 /weekly-routine/에 PUT 요청을 보냅니다.
+        5. 상태 코드가 400인지 확인합니다.
+        6. 유저 1의 주간 루틴이 변경되지 않았는지 확인합니다.
+        """
+
+        users_routines = self.get_users_routines()
+
+        FakeWeeklyRoutine(day_index=0, users_routine=users_routines[0]).create_instance(
+            user_instance=self.user1.instance
+        )
+
+        user2 = FakeUser()
+        user2.create_instance()
+        user2_routine = FakeRoutine([self.exercise1])
+        user2_routine.create_instance(user_instance=user2.instance)
+        user2_users_routine = user2_routine.instance.subscribers.get(
+            user=user2.instance
+        )
+
+        self.user1.login(self.client)
+
+        put_request = [
+            {"day_index": 1, "users_routine": users_routines[1].id},
+            {"day_index": 2, "users_routine": user2_users_routine.id},
+        ]
+
+        response = self.client.put(
+            reverse("weekly-routine"),
+            data=json.dumps(put_request),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertEqual(
+            list(
+                WeeklyRoutine.objects.filter(user=self.user1.instance).values_list(
+                    "day_index", "users_routine_id"
+                )
+            ),
+            [(0, users_routines[0].id)],
+        )
+
+    def test_update_weekly_routine_fail_if_duplicated_day_index(self):
+        """
+        중복된 day_index가 포함된 request로 주간 루틴 변경에 실패하는지 테스트
+
+        reverse_url: weekly-routine
+        HTTP method: PUT
+
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. day_index가 중복된 request로 /weekly-routine/에 PUT 요청을 보냅니다.
+        3. 상태 코드가 400인지 확인합니다.
+        4. 유저 1의 주간 루틴이 생성되지 않았는지 확인합니다.
+        """
+
+        users_routines = self.get_users_routines()
+
+        self.user1.login(self.client)
+
+        put_request = [
+            {"day_index": 3, "users_routine": users_routines[0].id},
+            {"day_index": 3, "users_routine": users_routines[1].id},
+        ]
+
+        response = self.client.put(
+            reverse("weekly-routine"),
+            data=json.dumps(put_request),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(
+            WeeklyRoutine.objects.filter(user=self.user1.instance).exists()
+        )
+
+    def test_weekly_routine_with_string_users_routine_pk(self):
+        """
+        UsersRoutine의 PK를 문자열로 보내도 주간 루틴을 생성하고 변경하는지 테스트
+
+        reverse_url: weekly-routine
+        HTTP method: POST, PUT
+
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. users_routine을 문자열 PK로 보내 /weekly-routine/에 POST 요청을 보냅니다.
+        3. 상태 코드가 201이고 응답의 users_routine이 요청한 UsersRoutine인지 확인합니다.
+        4. users_routine을 문자열 PK로 보내 /weekly-routine/에 PUT 요청을 보냅니다.
+        5. 상태 코드가 200이고 주간 루틴이 변경되었는지 확인합니다.
+        """
+
+        users_routines = self.get_users_routines()
+
+        self.user1.login(self.client)
+
+        response = self.client.post(
+            reverse("weekly-routine"),
+            data=json.dumps(
+                [{"day_index": 1, "users_routine": str(users_routines[0].id)}]
+            ),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()[0]["users_routine"], users_routines[0].id)
+
+        response = self.client.put(
+            reverse("weekly-routine"),
+            data=json.dumps(
+                [{"day_index": 1, "users_routine": str(users_routines[1].id)}]
+            ),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            WeeklyRoutine.objects.get(
+                user=self.user1.instance, day_index=1
+            ).users_routine_id,
+            users_routines[1].id,
+        )
+
+
+class WeeklyRoutineTodayTestCase(APITestCase):
+    """
+    목적: 오늘 요일의 루틴을 반환하는 weekly-routine/today 엔드포인트에 대한 테스트를 진행합니다.
+
+    Test cases:
+    1. Asia/Seoul 기준 오늘 요일의 루틴을 운동 트리까지 펼쳐서 반환하는지 테스트
+    2. 오늘 요일에 루틴이 없다면 404를 반환하는지 테스트
+    3. 두 번째 요청부터 캐시 버전 조회 외의 쿼리 없이 캐시에서 반환하는지 테스트
+    4. 주간 루틴을 변경하면 캐시가 무효화되는지 테스트
+    5. 루틴을 편집하면 캐시가 무효화되는지 테스트
+    6. 다른 프로세스에서 주간 일정을 무효화하면 DB의 버전으로 이 프로세스의 캐시도 무효화되는지 테스트
+    """
+
+    def setUp(self):
+        """
+        초기 설정:
+
+        1. 캐시 초기화
+        2. 관리자 유저 생성
+        3. 운동 3개 생성
+        4. 유저 1 생성
+        5. 유저 1이 루틴 2개 생성
+        6. 유저 1이 월요일에 루틴 1, 수요일에 루틴 2를 설정
+        """
+        cache.clear()
+        mirrored_routine_cache.clear()
+
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.exercise1 = FakeExercisesInfo()
+        self.exercise1.create_instance(self.admin.instance)
+
+        self.exercise2 = FakeExercisesInfo()
+        self.exercise2.create_instance(self.admin.instance)
+
+        self.exercise3 = FakeExercisesInfo()
+        self.exercise3.create_instance(self.admin.instance)
+
+        self.user1 = FakeUser()
+        self.user1.create_instance()
+
+        self.routine1 = FakeRoutine([self.exercise1, self.exercise2])
+        self.routine1.create_instance(user_instance=self.user1.instance)
+
+        self.routine2 = FakeRoutine([self.exercise3])
+        self.routine2.create_instance(user_instance=self.user1.instance)
+
+        self.users_routine1 = self.routine1.instance.subscribers.get(
+            user=self.user1.instance
+        )
+        self.users_routine2 = self.routine2.instance.subscribers.get(
+            user=self.user1.instance
+        )
+
+        FakeWeeklyRoutine(
+            day_index=0, users_routine=self.users_routine1
+        ).create_instance(user_instance=self.user1.instance)
+        FakeWeeklyRoutine(
+            day_index=2, users_routine=self.users_routine2
+        ).create_instance(user_instance=self.user1.instance)
+
+        self.client.force_authenticate(user=self.user1.instance)
+
+    @freeze_time("2024-05-05 16:00:00")
+    def test_get_today_routine(self):
+        """
+        Asia/Seoul 기준 오늘 요일의 루틴을 운동 트리까지 펼쳐서 반환하는지 테스트
+
+        reverse_url: weekly-routine-today
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. UTC 기준 일요일, Asia/Seoul 기준 월요일인 시각으로 고정합니다.
+        2. /weekly-routine/today/에 GET 요청을 보냅니다.
+        3. 상태 코드가 200인지 확인합니다.
+        4. 날짜와 day_index가 Asia/Seoul 기준 월요일인지 확인합니다.
+        5. 월요일에 설정한 루틴 1의 정보와 운동 트리가 반환되는지 확인합니다.
+        """
+
+        response = self.client.get(reverse("weekly-routine-today"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+
+        self.assertEqual(data["date"], "2024-05-06")
+        self.assertEqual(data["day_index"], 0)
+        self.assertEqual(data["users_routine"], self.users_routine1.id)
+        self.assertEqual(
+            data["mirrored_routine"], self.users_routine1.mirrored_routine_id
+        )
+        self.assertEqual(data["title"], self.routine1.instance.title)
+        self.assertEqual(
+            [
+                exercise_in_routine["exercise"]["id"]
+                for exercise_in_routine in data["exercises_in_routine"]
+            ],
+            [self.exercise1.instance.id, self.exercise2.instance.id],
+        )
+
+    @freeze_time("2024-05-07 03:00:00")
+    def test_get_today_routine_fail_if_no_routine_today(self):
+        """
+        오늘 요일에 루틴이 없다면 404를 반환하는지 테스트
+
+        reverse_url: weekly-routine-today
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. Asia/Seoul 기준 화요일인 시각으로 고정합니다.
+        2. /weekly-routine/today/에 GET 요청을 보냅니다.
+        3. 상태 코드가 404인지 확인합니다.
+        """
+
+        response = self.client.get(reverse("weekly-routine-today"))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @freeze_time("2024-05-08 03:00:00")
+    def test_get_today_routine_from_cache(self):
+        """
+        두 번째 요청부터 캐시 버전 조회 외의 쿼리 없이 캐시에서 반환하는지 테스트
+
+        reverse_url: weekly-routine-today
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. Asia/Seoul 기준 수요일인 시각으로 고정합니다.
+        2. /weekly-routine/today/에 GET 요청을 보냅니다.
+        3. 같은 요청을 다시 보내고 쿼리 수를 기록합니다.
+        4. 두 응답이 같은지 확인합니다.
+        5. 두 번째 요청에서 주간 일정 캐시 버전과 운동 정보 카탈로그 버전 조회 쿼리만 발생했는지 확인합니다.
+        """
+
+        first_response = self.client.get(reverse("weekly-routine-today"))
+        misses = weekly_schedule_cache.misses
+
+        with CaptureQueriesContext(connection) as queries:
+            second_response = self.client.get(reverse("weekly-routine-today"))
+
+        self.assertEqual(first_response.json(), second_response.json())
+        self.assertEqual(
+            second_response.json()["users_routine"], self.users_routine2.id
+        )
+        self.assertEqual(len(queries), 2)
+        self.assertIn("usercacheversion", queries[0]["sql"])
+        self.assertIn("exercisescatalogversion", queries[1]["sql"])
+        self.assertEqual(weekly_schedule_cache.misses, misses)
+
+    @freeze_time("2024-05-08 03:00:00")
+    def test_get_today_routine_after_weekly_routine_update(self):
+        """
+        주간 루틴을 변경하면 캐시가 무효화되는지 테스트
+
+        reverse_url: weekly-routine-today, weekly-routine
+        HTTP method: GET, PUT
+
+        테스트 시나리오:
+        1. Asia/Seoul 기준 수요일인 시각으로 고정합니다.
+        2. /weekly-routine/today/에 GET 요청을 보내 캐시를 채웁니다.
+        3. 수요일에 루틴 1을 설정하도록 /weekly-routine/에 PUT 요청을 보냅니다.
+        4. /weekly-routine/today/에 GET 요청을 보냅니다.
+        5. 변경된 루틴 1이 반환되는지 확인합니다.
+        6. /weekly-routine/에 DELETE 요청을 보낸 뒤 /weekly-routine/today/가 404를 반환하는지 확인합니다.
+        """
+
+        response = self.client.get(reverse("weekly-routine-today"))
+        self.assertEqual(response.json()["users_routine"], self.users_routine2.id)
+
+        response = self.client.put(
+            reverse("weekly-routine"),
+            data=json.dumps(
+                [{"day_index": 2, "users_routine": self.users_routine1.id}]
+            ),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse("weekly-routine-today"))
+        self.assertEqual(response.json()["users_routine"], self.users_routine1.id)
+
+        self.client.delete(reverse("weekly-routine"))
+
+        response = self.client.get(reverse("weekly-routine-today"))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @freeze_time("2024-05-08 03:00:00")
+    def test_get_today_routine_after_routine_edit(self):
+        """
+        루틴을 편집하면 캐시가 무효화되는지 테스트
+
+        reverse_url: weekly-routine-today, users-routine-detail
+        HTTP method: GET, PATCH
+
+        테스트 시나리오:
+        1. Asia/Seoul 기준 수요일인 시각으로 고정합니다.
+        2. /weekly-routine/today/에 GET 요청을 보내 캐시를 채웁니다.
+        3. 수요일의 루틴 2의 운동을 변경하도록 /users-routine/<pk>/에 PATCH 요청을 보냅니다.
+        4. /weekly-routine/today/에 GET 요청을 보냅니다.
+        5. 편집된 루틴의 새 MirroredRoutine과 운동 트리가 반환되는지 확인합니다.
+        """
+
+        self.client.get(reverse("weekly-routine-today"))
+
+        new_routine = FakeRoutine([self.exercise1, self.exercise3])
+
+        response = self.client.patch(
+            reverse("users-routine-detail", kwargs={"pk": self.users_routine2.pk}),
+            data=json.dumps(new_routine.request_create()),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.users_routine2.refresh_from_db()
+
+        data = self.client.get(reverse("weekly-routine-today")).json()
+
+        self.assertEqual(
+            data["mirrored_routine"], self.users_routine2.mirrored_routine_id
+        )
+        self.assertEqual(data["title"], new_routine.base_attr.get("title"))
+        self.assertEqual(
+            [
+                exercise_in_routine["exercise"]["id"]
+                for exercise_in_routine in data["exercises_in_routine"]
+            ],
+            [self.exercise1.instance.id, self.exercise3.instance.id],
+        )
+
+    @freeze_time("2024-05-08 03:00:00")
+    def test_get_today_routine_after_invalidate_from_other_process(self):
+        """
+        다른 프로세스에서 주간 일정을 무효화하면 DB의 버전으로 이 프로세스의 캐시도 무효화되는지 테스트
+
+        reverse_url: weekly-routine-today
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. Asia/Seoul 기준 수요일인 시각으로 고정합니다.
+        2. /weekly-routine/today/에 GET 요청을 보내 캐시를 채웁니다.
+        3. 다른 프로세스를 대신하여 signal 없이 수요일의 루틴을 루틴 1로 변경하고,
+           새로 만든 WeeklyScheduleCache로 무효화합니다.
+        4. 이 프로세스의 캐시에 이전 일정이 남아 있는지 확인합니다.
+        5. /weekly-routine/today/에 GET 요청을 보내 변경된 루틴 1이 반환되는지 확인합니다.
+        """
+        user_id = self.user1.instance.id
+
+        response = self.client.get(reverse("weekly-routine-today"))
+        self.assertEqual(response.json()["users_routine"], self.users_routine2.id)
+
+        old_key = weekly_schedule_cache.make_key(
+            user_id, weekly_schedule_cache.get_version(user_id)
+        )
+        WeeklyRoutine.objects.filter(user_id=user_id, day_index=2).update(
+            users_routine=self.users_routine1
+        )
+        WeeklyScheduleCache(timeout=60).invalidate(user_id)
+
+        self.assertIsNotNone(cache.get(old_key))
+
+        response = self.client.get(reverse("weekly-routine-today"))
+        self.assertEqual(response.json()["users_routine"], self.users_routine1.id)
+
+
+class DashboardTestCase(APITestCase):
+    """
+    목적: 앱 시작 시 필요한 정보를 한 번에 반환하는 dashboard 엔드포인트에 대한 테스트를 진행합니다.
+
+    Test cases:
+    1. 대시보드의 각 섹션이 개별 엔드포인트의 응답과 같은지 테스트
+    2. include로 선택한 섹션만 반환하는지 테스트
+    3. 존재하지 않는 섹션이 include에 포함되면 400을 반환하는지 테스트
+    4. 정보가 없는 유저의 대시보드가 빈 값으로 반환되는지 테스트
+    5. 캐시가 비어 있을 때 루틴 개수와 관계없이 쿼리 수가 query_budget 이하로 일정한지 테스트
+    """
+
+    def setUp(self):
+        """
+        초기 설정:
+
+        1. 캐시 초기화
+        2. 관리자 유저 생성
+        3. 운동 3개 생성
+        4. 유저 1 생성 후 건강 정보, 루틴 2개, 모든 요일의 주간 루틴, 루틴 수행 여부 생성
+        """
+        cache.clear()
+        mirrored_routine_cache.clear()
+
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.exercises = []
+        for _ in range(3):
+            exercise = FakeExercisesInfo()
+            exercise.create_instance(self.admin.instance)
+            self.exercises.append(exercise)
+
+        self.user1 = FakeUser()
+        self.user1.create_instance()
+        self.create_dashboard(self.user1.instance, routine_count=2)
+
+    def create_dashboard(self, user_instance, routine_count):
+        FakeHealthInfo().create_instance(user_instance)
+
+        users_routines = []
+        for _ in range(routine_count):
+            routine = FakeRoutine(self.exercises[:2])
+            routine.create_instance(user_instance=user_instance)
+            users_routines.append(routine.instance.subscribers.get(user=user_instance))
+
+        for day_index in range(7):
+            FakeWeeklyRoutine(
+                day_index=day_index,
+                users_routine=users_routines[day_index % routine_count],
+            ).create_instance(user_instance=user_instance)
+
+        today_users_routine = users_routines[
+            timezone.localdate().weekday() % routine_count
+        ]
+        FakeRoutineStreak(today_users_routine.mirrored_routine).create_instance(
+            user_instance
+        )
+
+    def test_get_dashboard(self):
+        """
+        대시보드의 각 섹션이 개별 엔드포인트의 응답과 같은지 테스트
+
+        reverse_url: dashboard, my-health-info-last, routine-streak-last, weekly-routine, users-routine-list
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. /dashboard/에 GET 요청을 보냅니다.
+        3. 상태 코드가 200인지 확인합니다.
+        4. 각 섹션이 개별 엔드포인트의 응답과 같은지 확인합니다.
+        """
+
+        self.client.force_authenticate(user=self.user1.instance)
+
+        response = self.client.get(reverse("dashboard"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+
+        self.assertEqual(
+            data["health_info"],
+            self.client.get(reverse("my-health-info-last")).json(),
+        )
+        self.assertEqual(
+            data["routine_streak"],
+            self.client.get(reverse("routine-streak-last")).json(),
+        )
+        self.assertEqual(
+            data["weekly_routine"],
+            self.client.get(reverse("weekly-routine")).json(),
+        )
+        self.assertEqual(
+            data["users_routine"],
+            self.client.get(reverse("users-routine-list")).json(),
+        )
+
+    def test_get_dashboard_with_include(self):
+        """
+        include로 선택한 섹션만 반환하는지 테스트
+
+        reverse_url: dashboard
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. include=weekly_routine,health_info로 /dashboard/에 GET 요청을 보냅니다.
+        3. 상태 코드가 200인지 확인합니다.
+        4. 응답에 선택한 섹션만 포함되어 있는지 확인합니다.
+        """
+
+        self.client.force_authenticate(user=self.user1.instance)
+
+        response = self.client.get(
+            reverse("dashboard"), {"include": "weekly_routine,health_info"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.json()), {"weekly_routine", "health_info"})
+
+    def test_get_dashboard_fail_if_invalid_include(self):
+        """
+        존재하지 않는 섹션이 include에 포함되면 400을 반환하는지 테스트
+
+        reverse_url: dashboard
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. 존재하지 않는 섹션이 포함된 include로 /dashboard/에 GET 요청을 보냅니다.
+        3. 상태 코드가 400인지 확인합니다.
+        """
+
+        self.client.force_authenticate(user=self.user1.instance)
+
+        response = self.client.get(
+            reverse("dashboard"), {"include": "health_info,unknown"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_empty_dashboard(self):
+        """
+        정보가 없는 유저의 대시보드가 빈 값으로 반환되는지 테스트
+
+        reverse_url: dashboard
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 새로운 유저를 생성하고 로그인합니다.
+        2. /dashboard/에 GET 요청을 보냅니다.
+        3. 상태 코드가 200인지 확인합니다.
+        4. 건강 정보, 루틴 수행 여부는 None, 주간 루틴, 루틴 목록은 빈 리스트인지 확인합니다.
+        """
+
+        new_user = FakeUser()
+        new_user.create_instance()
+        self.client.force_authenticate(user=new_user.instance)
+
+        response = self.client.get(reverse("dashboard"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            {
+                "health_info": None,
+                "weekly_routine": [],
+                "routine_streak": None,
+                "users_routine": [],
+            },
+        )
+
+    def test_dashboard_query_budget(self):
+        """
+        캐시가 비어 있을 때 루틴 개수와 관계없이 쿼리 수가 query_budget 이하로 일정한지 테스트
+
+        reverse_url: dashboard
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 루틴 5개를 가진 유저 2를 생성합니다.
+        2. 캐시를 비운 뒤 유저 1(루틴 2개)로 /dashboard/에 GET 요청을 보내고 쿼리 수를 기록합니다.
+        3. 캐시를 비운 뒤 유저 2(루틴 5개)로 /dashboard/에 GET 요청을 보내고 쿼리 수를 기록합니다.
+        4. 두 요청의 쿼리 수가 같고 query_budget 이하인지 확인합니다.
+        """
+
+        user2 = FakeUser()
+        user2.create_instance()
+        self.create_dashboard(user2.instance, routine_count=5)
+
+        query_counts = []
+        for user in [self.user1, user2]:
+            cache.clear()
+            mirrored_routine_cache.clear()
+            self.client.force_authenticate(user=user.instance)
+
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(reverse("dashboard"))
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            query_counts.append(len(queries))
+
+        self.assertEqual(query_counts[0], query_counts[1])
+        self.assertLessEqual(query_counts[1], DashboardView.query_budget)
+
+
+class SyncTestCase(APITestCase):
+    """
+    목적: 변경 토큰 이후의 변경분만 반환하는 sync 엔드포인트에 대한 테스트를 진행합니다.
+
+    Test cases:
+    1. 토큰 없이 요청하면 전체 행을 반환하는지 테스트
+    2. 토큰 이후에 생성, 수정, 삭제된 행만 반환하는지 테스트
+    3. 변경분 동기화의 쿼리 수가 전체 기록의 양과 관계없이 일정한지 테스트
+    4. 올바르지 않거나 다른 유저의 토큰이라면 400을 반환하는지 테스트
+    5. 보관 기간보다 오래된 토큰이라면 전체 동기화로 처리하는지 테스트
+    6. 유저가 삭제되면 삭제 기록을 남기지 않는지 테스트
+    """
+
+    def setUp(self):
+        """
+        초기 설정:
+
+        1. 캐시 초기화
+        2. 관리자 유저, 운동 2개 생성
+        3. 유저 1 생성 후 2024-01-01에 건강 정보, 루틴 2개, 주간 루틴 2개, 루틴 수행 여부 생성
+        """
+        cache.clear()
+        mirrored_routine_cache.clear()
+
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.exercise1 = FakeExercisesInfo()
+        self.exercise1.create_instance(self.admin.instance)
+
+        self.exercise2 = FakeExercisesInfo()
+        self.exercise2.create_instance(self.admin.instance)
+
+        self.user1 = FakeUser()
+        self.user1.create_instance()
+
+        with freeze_time("2024-01-01 00:00:00"):
+            self.health_info = FakeHealthInfo().create_instance(self.user1.instance)
+
+            self.routine1 = FakeRoutine([self.exercise1])
+            self.routine1.create_instance(user_instance=self.user1.instance)
+            self.routine2 = FakeRoutine([self.exercise2])
+            self.routine2.create_instance(user_instance=self.user1.instance)
+
+            self.users_routine1 = self.routine1.instance.subscribers.get(
+                user=self.user1.instance
+            )
+            self.users_routine2 = self.routine2.instance.subscribers.get(
+                user=self.user1.instance
+            )
+
+            self.weekly_routine1 = FakeWeeklyRoutine(
+                day_index=0, users_routine=self.users_routine1
+            ).create_instance(user_instance=self.user1.instance)
+            self.weekly_routine2 = FakeWeeklyRoutine(
+                day_index=1, users_routine=self.users_routine2
+            ).create_instance(user_instance=self.user1.instance)
+
+            self.routine_streak = FakeRoutineStreak(
+                self.users_routine1.mirrored_routine
+            ).create_instance(self.user1.instance)
+
+        self.client.force_authenticate(user=self.user1.instance)
+
+    def sync(self, token=None):
+        params = {"token": token} if token else {}
+        response = self.client.get(reverse("sync"), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def get_ids(self, data, key):
+        return sorted(row["id"] for row in data["changes"][key]["updated"])
+
+    @freeze_time("2024-01-02 00:00:00")
+    def test_full_sync(self):
+        """
+        토큰 없이 요청하면 전체 행을 반환하는지 테스트
+
+        reverse_url: sync
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 토큰 없이 /sync/에 GET 요청을 보냅니다.
+        2. full이 True이고 토큰이 반환되는지 확인합니다.
+        3. 모든 모델의 전체 행이 반환되고 삭제된 행은 없는지 확인합니다.
+        4. 각 행이 개별 엔드포인트의 응답에 id가 추가된 형태인지 확인합니다.
+        """
+
+        data = self.sync()
+
+        self.assertTrue(data["full"])
+        self.assertTrue(data["token"])
+
+        self.assertEqual(self.get_ids(data, "health_info"), [self.health_info.id])
+        self.assertEqual(
+            self.get_ids(data, "users_routine"),
+            sorted([self.users_routine1.id, self.users_routine2.id]),
+        )
+        self.assertEqual(
+            self.get_ids(data, "weekly_routine"),
+            sorted([self.weekly_routine1.id, self.weekly_routine2.id]),
+        )
+        self.assertEqual(self.get_ids(data, "routine_streak"), [self.routine_streak.id])
+        for changes in data["changes"].values():
+            self.assertEqual(changes["deleted"], [])
+
+        self.assertEqual(
+            data["changes"]["weekly_routine"]["updated"][0],
+            {
+                "id": self.weekly_routine1.id,
+                "user": self.user1.instance.id,
+                "users_routine": self.users_routine1.id,
+                "day_index": 0,
+            },
+        )
+        self.assertEqual(
+            data["changes"]["routine_streak"]["updated"][0],
+            {
+                "id": self.routine_streak.id,
+                "mirrored_routine": self.users_routine1.mirrored_routine_id,
+                "date": "2024-01-01",
+            },
+        )
+
+    def test_delta_sync(self):
+        """
+        토큰 이후에 생성, 수정, 삭제된 행만 반환하는지 테스트
+
+        reverse_url: sync, weekly-routine, my-health-info-list
+        HTTP method: GET, PUT, POST
+
+        테스트 시나리오:
+        1. 토큰 없이 /sync/에 GET 요청을 보내 토큰을 받습니다.
+        2. 하루 뒤 건강 정보를 생성하고, 주간 루틴을 변경(화요일 변경, 월요일 삭제)합니다.
+        3. 루틴 2의 구독자 need_update를 QuerySet.update()로 변경합니다.
+        4. 받은 토큰으로 /sync/에 GET 요청을 보냅니다.
+        5. full이 False인지 확인합니다.
+        6. 새로 생성, 수정된 행만 updated에, 삭제된 행만 deleted에 포함되었는지 확인합니다.
+        7. 새 토큰으로 다시 요청하면 변경분이 없는지 확인합니다.
+        """
+
+        with freeze_time("2024-01-02 00:00:00"):
+            token = self.sync()["token"]
+
+        with freeze_time("2024-01-03 00:00:00"):
+            response = self.client.post(
+                reverse("my-health-info-list"),
+                data=FakeHealthInfo().request_create(),
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+            response = self.client.put(
+                reverse("weekly-routine"),
+                data=json.dumps(
+                    [{"day_index": 1, "users_routine": self.users_routine1.id}]
+                ),
+                content_type="application/json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            UsersRoutine.objects.filter(id=self.users_routine2.id).update(
+                need_update=True
+            )
+
+        with freeze_time("2024-01-03 01:00:00"):
+            data = self.sync(token)
+
+        self.assertFalse(data["full"])
+
+        new_health_info = HealthInfo.objects.get(
+            user=self.user1.instance, date="2024-01-03"
+        )
+        self.assertEqual(self.get_ids(data, "health_info"), [new_health_info.id])
+        self.assertEqual(data["changes"]["health_info"]["deleted"], [])
+
+        self.assertEqual(
+            self.get_ids(data, "weekly_routine"), [self.weekly_routine2.id]
+        )
+        self.assertEqual(
+            data["changes"]["weekly_routine"]["updated"][0]["users_routine"],
+            self.users_routine1.id,
+        )
+        self.assertEqual(
+            data["changes"]["weekly_routine"]["deleted"], [self.weekly_routine1.id]
+        )
+
+        self.assertEqual(self.get_ids(data, "users_routine"), [self.users_routine2.id])
+        self.assertTrue(data["changes"]["users_routine"]["updated"][0]["need_update"])
+
+        self.assertEqual(data["changes"]["routine_streak"]["updated"], [])
+
+        with freeze_time("2024-01-04 00:00:00"):
+            data = self.sync(data["token"])
+
+        for changes in data["changes"].values():
+            self.assertEqual(changes["updated"], [])
+            self.assertEqual(changes["deleted"], [])
+
+    def test_delta_sync_query_count(self):
+        """
+        변경분 동기화의 쿼리 수가 전체 기록의 양과 관계없이 일정한지 테스트
+
+        reverse_url: sync
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 토큰 없이 /sync/에 GET 요청을 보내 토큰을 받습니다.
+        2. 하루 뒤 받은 토큰으로 /sync/에 GET 요청을 보내고 쿼리 수를 기록합니다.
+        3. 과거 날짜의 건강 정보, 루틴 수행 여부를 30개씩 추가합니다.
+        4. 다시 받은 토큰으로 /sync/에 GET 요청을 보내고 쿼리 수를 기록합니다.
+        5. 두 요청의 쿼리 수가 같고, 변경분이 없는지 확인합니다.
+        """
+
+        with freeze_time("2024-01-02 00:00:00"):
+            token = self.sync()["token"]
+
+        with freeze_time("2024-01-03 00:00:00"):
+            with CaptureQueriesContext(connection) as small_history_queries:
+                self.sync(token)
+
+        for days in range(2, 32):
+            with freeze_time(datetime(2023, 12, 1) - timedelta(days=days)):
+                FakeHealthInfo().create_instance(self.user1.instance)
+                FakeRoutineStreak(self.users_routine1.mirrored_routine).create_instance(
+                    self.user1.instance
+                )
+
+        with freeze_time("2024-01-03 00:00:00"):
+            with CaptureQueriesContext(connection) as large_history_queries:
+                data = self.sync(token)
+
+        self.assertEqual(len(small_history_queries), len(large_history_queries))
+        for changes in data["changes"].values():
+            self.assertEqual(changes["updated"], [])
+
+    def test_sync_fail_if_invalid_token(self):
+        """
+        올바르지 않거나 다른 유저의 토큰이라면 400을 반환하는지 테스트
+
+        reverse_url: sync
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 서명이 올바르지 않은 토큰으로 /sync/에 GET 요청을 보냅니다.
+        2. 상태 코드가 400인지 확인합니다.
+        3. 유저 2가 받은 토큰으로 유저 1이 /sync/에 GET 요청을 보냅니다.
+        4. 상태 코드가 400인지 확인합니다.
+        """
+
+        response = self.client.get(reverse("sync"), {"token": "invalid"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        user2 = FakeUser()
+        user2.create_instance()
+        self.client.force_authenticate(user=user2.instance)
+        user2_token = self.sync()["token"]
+
+        self.client.force_authenticate(user=self.user1.instance)
+        response = self.client.get(reverse("sync"), {"token": user2_token})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_sync_with_expired_token(self):
+        """
+        보관 기간보다 오래된 토큰이라면 전체 동기화로 처리하는지 테스트
+
+        reverse_url: sync
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 토큰 없이 /sync/에 GET 요청을 보내 토큰을 받습니다.
+        2. 루틴 수행 여부를 삭제하고 SYNC_TOMBSTONE_RETENTION_DAYS일 이후로 이동합니다.
+        3. 오래된 삭제 기록을 정리합니다.
+        4. 받은 토큰으로 /sync/에 GET 요청을 보냅니다.
+        5. full이 True이고 전체 행이 반환되는지 확인합니다.
+        """
+
+        with freeze_time("2024-01-02 00:00:00"):
+            token = self.sync()["token"]
+            self.routine_streak.delete()
+
+        with freeze_time(
+            datetime(2024, 1, 3)
+            + timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+        ):
+            call_command("prune_sync_tombstones", stdout=StringIO())
+            self.assertFalse(SyncTombstone.objects.exists())
+
+            data = self.sync(token)
+
+        self.assertTrue(data["full"])
+        self.assertEqual(self.get_ids(data, "health_info"), [self.health_info.id])
+        self.assertEqual(data["changes"]["routine_streak"]["updated"], [])
+
+    def test_user_delete_does_not_record_tombstones(self):
+        """
+        유저가 삭제되면 삭제 기록을 남기지 않는지 테스트
+
+        테스트 시나리오:
+        1. 유저 1의 루틴 수행 여부를 삭제합니다.
+        2. 삭제 기록이 하나 남았는지 확인합니다.
+        3. 유저 1을 삭제합니다.
+        4. 삭제 기록이 남아있지 않은지 확인합니다.
+        """
+
+        self.routine_streak.delete()
+        self.assertEqual(
+            SyncTombstone.objects.filter(
+                user=self.user1.instance, model="routine_streak"
+            ).count(),
+            1,
+        )
+
+        self.user1.instance.delete()
+
+        self.assertFalse(SyncTombstone.objects.exists())
+
+
+class RoutineStreakTestCase(TestCase):
+    """
+    목적: 유저의 루틴 수행 기록을 관리하는 RoutineStreak 모델에 대한 테스트를 진행합니다.
+
+    Test cases:
+    1. 유저가 루틴을 수행한 기록을 조회하는지 테스트
+    2. 유저가 특정 날짜에 수행한 기록의 세부 정보를 조회하는지 테스트
+    3. 유저가 루틴을 수행한 기록을 생성하는지 테스트
+    4. 유저가 이미 루틴을 수행한 상태에서 루틴을 수행한 기록을 생성하려 할 때 실패하는지 테스트
+    5. 유저가 루틴이 등록되지 않은 요일에 루틴을 수행한 기록을 생성하려 할 때 실패하는지 테스트
+    6. 최근 수행 루틴을 조회하는지 테스트
+    7. 허용되지 않은 요청으로 접근 시 405 에러를 반환하는지 테스트
+    8. 루틴 수행 기록 수와 관계없이 목록 조회 쿼리 수가 일정한지 테스트
+    """
+
+    def setUp(self):
+        """
+        초기 설정:
+
+        1. 관리자 유저 생성
+        2. 운동 4개 생성
+        3. 유저 1 생성
+        4. 유저 1이 루틴 5개 생성
+        5. 유저 1은 해당 루틴들로 WeeklyRoutine 생성
+        6. freezegun을 사용해서 과거에서부터 루틴 수행 기록을 생성
+        """
+
+        self.client = APIClient()
+
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.exercises = [FakeExercisesInfo() for _ in range(4)]
+        for exercise in self.exercises:
+            exercise.create_instance(self.admin.instance)
+
+        self.user1 = FakeUser()
+        self.user1.create_instance()
+
+        refresh = RefreshToken.for_user(self.user1.instance)
+        self.access_token = str(refresh.access_token)
+
+        self.routines = [
+            FakeRoutine([self.exercises[0], self.exercises[1]]),
+            FakeRoutine([self.exercises[1], self.exercises[2]]),
+            FakeRoutine([self.exercises[2], self.exercises[3], self.exercises[0]]),
+            FakeRoutine([self.exercises[3]]),
+            FakeRoutine([self.exercises[0], self.exercises[1], self.exercises[2]]),
+        ]
+
+        for routine in self.routines:
+            routine.create_instance(user_instance=self.user1.instance)
+
+        user1_users_routine_instances = [
+            routine.instance.subscribers.get(user=self.user1.instance)
+            for routine in self.routines
+        ]
+
+        self.random_day_indices = [6, 2, 1, 4]
+
+        self.fake_weekly_routines = [
+            FakeWeeklyRoutine(
+                day_index=random_day_index, users_routine=users_routine_instance
+            )
+            for random_day_index, users_routine_instance in zip(
+                self.random_day_indices, user1_users_routine_instances
+            )
+        ]
+
+        for fake_weekly_routine in self.fake_weekly_routines:
+            fake_weekly_routine.create_instance(user_instance=self.user1.instance)
+
+        days = 30
+        start_time = datetime.now() - timedelta(days=days)
+        for i in range(days - 1):
+            with freeze_time(start_time + timedelta(days=i)):
+                day_index = datetime.now().weekday()
+
+                if day_index in self.random_day_indices:
+                    if random.random() < 0.6:
+                        routine_streak = FakeRoutineStreak(
+                            mirrored_routine=self.fake_weekly_routines[
+                                self.random_day_indices.index(day_index)
+                            ].users_routine.mirrored_routine,
+                        )
+                        routine_streak.create_instance(
+                            user_instance=self.user1.instance
+                        )
+
+    def test_get_routine_streak_list(self):
+        """
+        유저가 루틴을 수행한 기록을 조회하는지 테스트
+
+        reverse_url: routine-streak-list
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. /routine-streak/에 GET 요청을 보냅니다.
+        3. 상태 코드가 200인지 확인합니다.
+        4. 응답의 길이가 생성된 RoutineStreak의 수와 같은지 확인합니다.
+        5. 응답의 RoutineStreak의 mirrored_routine이 생성된 RoutineStreak의 mirrored_routine과 같은지 확인합니다.
+        """
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
+
+        response = self.client.get(reverse("routine-streak-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+
+        self.assertEqual(
+            RoutineStreak.objects.filter(user=self.user1.instance).count(), len(data)
+        )
+
+        for routine_streak in RoutineStreak.objects.filter(user=self.user1.instance):
+            self.assertEqual(
+                routine_streak.mirrored_routine.id, data.pop().get("mirrored_routine")
+            )
+
+    def test_get_routine_streak_detail(self):
+        """
+        유저가 특정 날짜에 수행한 기록의 세부 정보를 조회하는지 테스트
+
+        reverse_url: routine-streak-detail
+        HTTP method: GET
+
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. /routine-streak/에 GET 요청을 보냅니다.
+        3. 상태 코드가 200인지 확인합니다.
+        4. 응답의 날짜가 요청한 날짜와 같은지 확인합니다.
+        5. 응답의 mirrored_routine이 요청한 mirrored_routine과 같은지 확인합니다.
+        """
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
+
+        routine_streak = RoutineStreak.objects.filter(user=self.user1.instance).last()
+
+        response = self.client.get(
+            reverse("routine-streak-detail", kwargs={"pk": routine_streak.id})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+
+        self.assertEqual(routine_streak.date.strftime("%Y-%m-%d"), data.get("date"))
+
+        self.assertEqual(
+            routine_streak.mirrored_routine.id, data.get("mirrored_routine")
+        )
+
+    def test_create_routine_streak(self):
+        """
+        유저가 루틴을 수행한 기록을 생성하는지 테스트
+
+        reverse_url: routine-streak-list
+        HTTP method: POST
+
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. /routine-streak/에 POST 요청을 보냅니다.
+        3. 상태 코드가 201인지 확인합니다.
+        4. 응답에 포함된 date가 현재 날짜와 같은지 확인합니다.
+        """
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
+
+        response = self.client.post(
+            reverse("routine-streak-list"),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        data = response.json()
+
+        self.assertEqual(datetime.now().strftime("%Y-%m-%d"), data.get("date"))
+
+    def test_create_routine_streak_fail_if_already_done(self):
+        """
+        유저가 이미 루틴을 수행한 상태에서 루틴을 수행한 기록을 생성하려 할 때 실패하는지 테스트
+
+        reverse_url: routine-streak-list
+        HTTP method: POST
+
+        테스트 시나리오:
+        1. 루틴을 수행한 기록을 생성합니다.
+        2. 유저 1이 로그인합니다.
+        3. /routine-streak/에 POST 요청을 보냅니다.
+        4. 상태 코드가 400인지 확인합니다.
+        """
 
-        create_request = [
-            fake_weekly_routine.create_request()
-            for fake_weekly_routine in fake_weekly_routines2
-        ]
+        now_day_index = datetime.now().weekday()
 
-        self.user1.login(self.client)
+        RoutineStreak.objects.create(
+            user=self.user1.instance,
+            mirrored_routine=self.fake_weekly_routines[
+                self.random_day_indices.index(now_day_index)
+            ].users_routine.mirrored_routine,
+        )
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
 
         response = self.client.post(
-            reverse("weekly-routine"),
-            data=json.dumps(create_request),
-            content_type="application/json",
+            reverse("routine-streak-list"),
         )
 
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
-    def test_fail_create_weekly_routine_if_invalid_day_index(self):
+    @freeze_time(datetime.now() + timedelta(days=1))
+    def test_create_routine_streak_fail_if_invalid_day_index(self):
         """
-        잘못된 day_index가 포함된 request로 주간 루틴을 생성에 실패하는지 테스트
+        유저가 루틴이 등록되지 않은 요일에 루틴을 수행한 기록을 생성하려 할 때 실패하는지 테스트
 
-        reverse_url: weekly-routine
+        reverse_url: routine-streak-list
         HTTP method: POST
 
         테스트 시나리오:
-        1. WeeklyRoutine의 개수를 저장합니다.
-        2. 잘못된 day_index가 포함된 새로운 FakeWeeklyRoutine 배열을 생성합니다.
-        3. 유저 1이 로그인합니다.
-        4. /weekly-routine/에 POST 요청을 보냅니다.
-        5. 상태 코드가 400인지 확인합니다.
-        6. WeeklyRoutine의 개수가 변하지 않았는지 확인합니다.
+        1. 유저 1이 로그인합니다.
+        2. /routine-streak/에 POST 요청을 보냅니다.
+        3. 상태 코드가 400인지 확인합니다.
         """
-
-        weekly_routine_count = WeeklyRoutine.objects.count()
-
-        user1_users_routine_instances = [
-            self.routine3.instance.subscribers.get(user=self.user1.instance),
-            self.routine2.instance.subscribers.get(user=self.user1.instance),
-            self.routine4.instance.subscribers.get(user=self.user1.instance),
-            self.routine1.instance.subscribers.get(user=self.user1.instance),
-        ]
-
-        wrong_day_indices = [0, 8, 3, 2]
-
-        self.user1.login(self.client)
-
-        create_request = [
-            FakeWeeklyRoutine(
-                day_index=wrong_day_index, users_routine=users_routine_instance
-            ).create_request()
-            for wrong_day_index, users_routine_instance in zip(
-                wrong_day_indices, user1_users_routine_instances
-            )
-        ]
+        new_access_token = str(RefreshToken.for_user(self.user1.instance).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {new_access_token}")
 
         response = self.client.post(
-            reverse("weekly-routine"),
-            data=create_request,
-            content_type="application/json",
+            reverse("routine-streak-list"),
         )
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
-        self.assertEqual(WeeklyRoutine.objects.count(), weekly_routine_count)
-
-    def test_update_weekly_routine(self):
+    def test_get_last_routine_streak(self):
         """
-        유저가 주간 루틴을 변경하는것에 성공하는지 테스트
+        최근 수행 루틴을 조회하는지 테스트
 
-        reverse_url: weekly-routine
-        HTTP method: PUT
+        reverse_url: routine-streak-last
+        HTTP method: GET
 
         테스트 시나리오:
-        1. 유저 1이 현재 생성된 루틴으로 WeeklyRoutine 인스턴스를 생성합니다.
-        2. 새로운 FakeWeeklyRoutine 배열을 생성합니다.
-        3. 유저 1이 로그인합니다.
-        4. /weekly-routine/에 PUT 요청을 보냅니다.
-        5. 상태 코드가 200인지 확인합니다.
-        6. 응답의 길이가 기존 WeeklyRoutine의 수와 다른지 확인합니다.
-        7. 응답의 길이가 새로운 FakeWeeklyRoutine 배열의 길이와 같은지 확인합니다.
-        8. day_index를 비교하여 변경이 잘 처리되었는지 확인합니다.
+        1. 유저 1이 로그인합니다.
+        2. /routine-streak-last/에 GET 요청을 보냅니다.
+        3. 상태 코드가 200인지 확인합니다.
+        4. 응답의 date가 RoutineStreak.objects.last().date와 같은지 확인합니다.
         """
 
-        user1_users_routine_instances = [
-            self.routine3.instance.subscribers.get(user=self.user1.instance),
-            self.routine2.instance.subscribers.get(user=self.user1.instance),
-            self.routine4.instance.subscribers.get(user=self.user1.instance),
-            self.routine1.instance.subscribers.get(user=self.user1.instance),
-        ]
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
 
-        random_day_indices1 = [1, 3, 5, 2]
+        response = self.client.get(reverse("routine-streak-last"))
 
-        fake_weekly_routines1 = [
-            FakeWeeklyRoutine(
-                day_index=random_day_index, users_routine=users_routine_instance
-            )
-            for random_day_index, users_routine_instance in zip(
-                random_day_indices1, user1_users_routine_instances
-            )
-        ]
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        for fake_weekly_routine in fake_weekly_routines1:
-            fake_weekly_routine.create_instance(user_instance=self.user1.instance)
+        data = response.json()
 
-        new_user1_users_routine_instances = [
-            self.routine1.instance.subscribers.get(user=self.user1.instance),
-            self.routine4.instance.subscribers.get(user=self.user1.instance),
-            self.routine2.instance.subscribers.get(user=self.user1.instance),
-        ]
+        self.assertEqual(
+            RoutineStreak.objects.filter(user=self.user1.instance)
+            .last()
+            .date.strftime("%Y-%m-%d"),
+            data.get("date"),
+        )
 
-        random_day_indices2 = [1, 5, 4]
+    def test_get_errors_when_not_allowed_methods(self):
+        """
+        허용되지 않은 요청으로 접근 시 405 에러를 반환하는지 테스트
 
-        fake_weekly_routines2 = [
-            FakeWeeklyRoutine(
-                day_index=random_day_index, users_routine=users_routine_instance
-            )
-            for random_day_index, users_routine_instance in zip(
-                random_day_indices2, new_user1_users_routine_instances
-            )
-        ]
+        reverse_url: routine-streak-list, routine-streak-detail, routine-streak-last
+        HTTP method: POST, PUT, PATCH, DELETE
 
-        self.user1.login(self.client)
+        테스트 시나리오:
+        1. 유저 1이 로그인합니다.
+        2. /routine-streak-list, /routine-streak-detail, /routine-streak-last에 POST, PUT, PATCH, DELETE 요청을 보냅니다.
+        3. 상태 코드가 405인지 확인합니다.
+        """
 
-        put_request = [
-            fake_weekly_routine.create_request()
-            for fake_weekly_routine in fake_weekly_routines2
-        ]
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
+
+        routine_streak = RoutineStreak.objects.filter(user=self.user1.instance).last()
 
         response = self.client.put(
-            reverse("weekly-routine"),
-            data=json.dumps(put_request),
-            content_type="application/json",
+            reverse("routine-streak-detail", kwargs={"pk": routine_streak.id})
         )
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
 
-        data = response.json()
+        response = self.client.patch(
+            reverse("routine-streak-detail", kwargs={"pk": routine_streak.id})
+        )
 
-        self.assertNotEqual(len(data), len(fake_weekly_routines1))
-        self.assertEqual(len(data), len(fake_weekly_routines2))
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
 
-        self.assertEqual(WeeklyRoutine.objects.count(), len(fake_weekly_routines2))
+        response = self.client.delete(
+            reverse("routine-streak-detail", kwargs={"pk": routine_streak.id})
+        )
 
-        for response_weekly_routine, fake_weekly_routine in zip(
-            data,
-            sorted(fake_weekly_routines2, key=lambda x: x.base_attr.get("day_index")),
-        ):
-            self.assertEqual(
-                response_weekly_routine.get("day_index"),
-                fake_weekly_routine.base_attr.get("day_index"),
-            )
-            self.assertEqual(
-                response_weekly_routine.get("users_routine"),
-                fake_weekly_routine.users_routine.id,
-            )
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
 
-    def test_delete_weekly_routine(self):
+    def test_list_routine_streak_query_count_is_constant(self):
         """
-        WeeklyRoutine에 대한 delete 테스트
+        루틴 수행 기록 수와 관계없이 목록 조회 쿼리 수가 일정한지 테스트
 
-        reverse_url: weekly-routine
-        HTTP method: DELETE
+        reverse_url: routine-streak-list
+        HTTP method: GET
 
         테스트 시나리오:
-        1. 유저 1이 현재 생성된 루틴으로 WeeklyRoutine 인스턴스를 생성합니다.
-        2. 유저 1이 로그인합니다.
-        3. /weekly-routine/에 DELETE 요청을 보냅니다.
-        4. 상태 코드가 204인지 확인합니다.
-        5. 유저 1이 보유한 WeeklyRoutine이 모두 삭제되었는지 확인합니다.
+        1. 유저 1이 로그인합니다.
+        2. 루틴 수행 기록 목록을 조회하고 쿼리 수를 기록합니다.
+        3. freezegun을 사용해서 과거 1년 동안의 루틴 수행 기록을 추가로 생성합니다.
+        4. 루틴 수행 기록 목록을 다시 조회하고 쿼리 수가 같은지 확인합니다.
+        5. 응답의 mirrored_routine이 해당 요일의 WeeklyRoutine의 mirrored_routine과 같은지 확인합니다.
         """
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
 
-        user1_users_routine_instances = [
-            self.routine3.instance.subscribers.get(user=self.user1.instance),
-            self.routine2.instance.subscribers.get(user=self.user1.instance),
-            self.routine4.instance.subscribers.get(user=self.user1.instance),
-            self.routine1.instance.subscribers.get(user=self.user1.instance),
-        ]
-
-        random_day_indices = [1, 3, 5, 2]
-
-        fake_weekly_routines = [
-            FakeWeeklyRoutine(
-                day_index=random_day_index, users_routine=users_routine_instance
-            )
-            for random_day_index, users_routine_instance in zip(
-                random_day_indices, user1_users_routine_instances
-            )
-        ]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("routine-streak-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        query_count = len(queries)
 
-        for fake_weekly_routine in fake_weekly_routines:
-            fake_weekly_routine.create_instance(user_instance=self.user1.instance)
+        start_time = datetime.now() - timedelta(days=400)
+        for i in range(365):
+            with freeze_time(start_time + timedelta(days=i)):
+                day_index = datetime.now().weekday()
 
-        self.user1.login(self.client)
+                if day_index in self.random_day_indices:
+                    FakeRoutineStreak(
+                        mirrored_routine=self.fake_weekly_routines[
+                            self.random_day_indices.index(day_index)
+                        ].users_routine.mirrored_routine,
+                    ).create_instance(user_instance=self.user1.instance)
 
-        response = self.client.delete(reverse("weekly-routine"))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("routine-streak-list"))
 
-        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), query_count)
 
-        self.assertFalse(
-            WeeklyRoutine.objects.filter(user=self.user1.instance).exists()
+        data = response.json()
+        self.assertEqual(
+            RoutineStreak.objects.filter(user=self.user1.instance).count(), len(data)
         )
 
+        weekly_mirrored_routines = {
+            weekly_routine.day_index: weekly_routine.users_routine.mirrored_routine.id
+            for weekly_routine in WeeklyRoutine.objects.filter(user=self.user1.instance)
+        }
+        for routine_streak in data:
+            day_index = datetime.strptime(routine_streak["date"], "%Y-%m-%d").weekday()
+            self.assertEqual(
+                routine_streak["mirrored_routine"], weekly_mirrored_routines[day_index]
+            )
 
-class RoutineStreakTestCase(TestCase):
+
+class RoutineStreakSummaryTestCase(APITestCase):
     """
-    목적: 유저의 루틴 수행 기록을 관리하는 RoutineStreak 모델에 대한 테스트를 진행합니다.
+    목적: 유저의 루틴 수행 기록 요약을 관리하는 RoutineStreakSummary 모델에 대한 테스트를 진행합니다.
 
     Test cases:
-    1. 유저가 루틴을 수행한 기록을 조회하는지 테스트
-    2. 유저가 특정 날짜에 수행한 기록의 세부 정보를 조회하는지 테스트
-    3. 유저가 루틴을 수행한 기록을 생성하는지 테스트
-    4. 유저가 이미 루틴을 수행한 상태에서 루틴을 수행한 기록을 생성하려 할 때 실패하는지 테스트
-    5. 유저가 루틴이 등록되지 않은 요일에 루틴을 수행한 기록을 생성하려 할 때 실패하는지 테스트
-    6. 최근 수행 루틴을 조회하는지 테스트
-    7. 허용되지 않은 요청으로 접근 시 405 에러를 반환하는지 테스트
+    1. 날짜 목록에서 연속 수행 일수, 최장 연속 수행 일수, 총 수행 일수를 계산하는지 테스트
+    2. 루틴 수행 기록을 생성할 때마다 요약이 점진적으로 갱신되는지 테스트
+    3. 루틴이 등록되지 않은 요일에는 수행 기록과 요약이 생성되지 않는지 테스트
+    4. 요약 조회 시 연속 수행이 끊겼다면 current_streak이 0인지 테스트
+    5. rebuild_routine_streak_summaries 명령어로 전체 기록에서 요약을 다시 계산하는지 테스트
+    6. 요약이 없는 유저에게 이전 수행 기록이 있다면 새 수행 기록 생성 시 전체 기록에서 요약을 계산하는지 테스트
+    7. 요약이 없는 유저에게 이전 수행 기록이 있다면 요약 조회 시 전체 기록에서 요약을 계산하는지 테스트
     """
 
     def setUp(self):
         """
-        초기 설정:
+        초기 설정
 
         1. 관리자 유저 생성
-        2. 운동 4개 생성
-        3. 유저 1 생성
-        4. 유저 1이 루틴 5개 생성
-        5. 유저 1은 해당 루틴들로 WeeklyRoutine 생성
-        6. freezegun을 사용해서 과거에서부터 루틴 수행 기록을 생성
+        2. 운동 2개 생성
+        3. 유저 1, 유저 2 생성
+        4. 유저 1이 루틴을 생성하고 모든 요일에 WeeklyRoutine으로 등록
+        5. 유저 2가 루틴을 생성하고 월요일(0)에만 WeeklyRoutine으로 등록
         """
-
         self.client = APIClient()
 
         self.admin = FakeUser()
         self.admin.create_instance(is_staff=True)
 
-        self.exercises = [FakeExercisesInfo() for _ in range(4)]
+        self.exercises = [FakeExercisesInfo() for _ in range(2)]
         for exercise in self.exercises:
             exercise.create_instance(self.admin.instance)
 
-        self.user1 = FakeUser()
-        self.user1.create_instance()
+        self.user1 = FakeUser()
+        self.user1.create_instance()
+
+        self.user2 = FakeUser()
+        self.user2.create_instance()
+
+        routine1 = FakeRoutine(self.exercises)
+        routine1.create_instance(user_instance=self.user1.instance)
+        users_routine1 = routine1.instance.subscribers.get(user=self.user1.instance)
+        for day_index in range(7):
+            FakeWeeklyRoutine(
+                day_index=day_index, users_routine=users_routine1
+            ).create_instance(user_instance=self.user1.instance)
+
+        routine2 = FakeRoutine(self.exercises)
+        routine2.create_instance(user_instance=self.user2.instance)
+        FakeWeeklyRoutine(
+            day_index=0,
+            users_routine=routine2.instance.subscribers.get(user=self.user2.instance),
+        ).create_instance(user_instance=self.user2.instance)
+
+    def create_routine_streak(self, user, date):
+        """
+        date 날짜에 user로 루틴 수행 기록 생성 요청을 보내고 응답을 반환
+        """
+        self.client.force_authenticate(user=user)
+        with freeze_time(date):
+            return self.client.post(reverse("routine-streak-list"))
+
+    def test_summarize_dates(self):
+        """
+        날짜 목록에서 연속 수행 일수, 최장 연속 수행 일수, 총 수행 일수를 계산하는지 테스트
+
+        테스트 시나리오:
+        1. 3일 연속, 하루 쉬고 2일 연속 수행한 날짜 목록으로 요약을 계산합니다.
+        2. current_streak이 2, longest_streak이 3, total_days가 5인지 확인합니다.
+        3. 빈 날짜 목록의 요약이 모두 0인지 확인합니다.
+        """
+        start = datetime(2024, 5, 1).date()
+        dates = [start + timedelta(days=i) for i in [0, 1, 2, 4, 5]]
 
-        refresh = RefreshToken.for_user(self.user1.instance)
-        self.access_token = str(refresh.access_token)
+        self.assertEqual(
+            RoutineStreakSummaryService.summarize(dates),
+            {
+                "current_streak": 2,
+                "longest_streak": 3,
+                "last_date": dates[-1],
+                "total_days": 5,
+            },
+        )
+        self.assertEqual(
+            RoutineStreakSummaryService.summarize([]),
+            {
+                "current_streak": 0,
+                "longest_streak": 0,
+                "last_date": None,
+                "total_days": 0,
+            },
+        )
 
-        self.routines = [
-            FakeRoutine([self.exercises[0], self.exercises[1]]),
-            FakeRoutine([self.exercises[1], self.exercises[2]]),
-            FakeRoutine([self.exercises[2], self.exercises[3], self.exercises[0]]),
-            FakeRoutine([self.exercises[3]]),
-            FakeRoutine([self.exercises[0], self.exercises[1], self.exercises[2]]),
-        ]
+    def test_update_summary_when_create_routine_streak(self):
+        """
+        루틴 수행 기록을 생성할 때마다 요약이 점진적으로 갱신되는지 테스트
 
-        for routine in self.routines:
-            routine.create_instance(user_instance=self.user1.instance)
+        reverse_url: routine-streak-list, routine-streak-summary
+        HTTP method: POST, GET
 
-        user1_users_routine_instances = [
-            routine.instance.subscribers.get(user=self.user1.instance)
-            for routine in self.routines
+        테스트 시나리오:
+        1. 유저 1이 2024-05-01 ~ 2024-05-03 동안 매일 루틴 수행 기록을 생성합니다.
+        2. 하루를 쉬고 2024-05-05에 루틴 수행 기록을 생성합니다.
+        3. 각 단계마다 요약의 current_streak, longest_streak, total_days가 올바른지 확인합니다.
+        4. 생성된 루틴 수행 기록에 해당 요일의 mirrored_routine이 저장되었는지 확인합니다.
+        5. 2024-05-05에 요약을 조회했을 때 응답이 저장된 요약과 같은지 확인합니다.
+        """
+        expected = [
+            ("2024-05-01", 1, 1, 1),
+            ("2024-05-02", 2, 2, 2),
+            ("2024-05-03", 3, 3, 3),
+            ("2024-05-05", 1, 3, 4),
         ]
 
-        self.random_day_indices = [6, 2, 1, 4]
+        for date, current_streak, longest_streak, total_days in expected:
+            response = self.create_routine_streak(self.user1.instance, date)
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
-        self.fake_weekly_routines = [
-            FakeWeeklyRoutine(
-                day_index=random_day_index, users_routine=users_routine_instance
-            )
-            for random_day_index, users_routine_instance in zip(
-                self.random_day_indices, user1_users_routine_instances
-            )
-        ]
+            summary = RoutineStreakSummary.objects.get(user=self.user1.instance)
+            self.assertEqual(summary.current_streak, current_streak)
+            self.assertEqual(summary.longest_streak, longest_streak)
+            self.assertEqual(summary.total_days, total_days)
+            self.assertEqual(summary.last_date.isoformat(), date)
 
-        for fake_weekly_routine in self.fake_weekly_routines:
-            fake_weekly_routine.create_instance(user_instance=self.user1.instance)
+        routine_streak = RoutineStreak.objects.filter(user=self.user1.instance).first()
+        self.assertEqual(
+            routine_streak.mirrored_routine_id,
+            response.json().get("mirrored_routine"),
+        )
 
-        days = 30
-        start_time = datetime.now() - timedelta(days=days)
-        for i in range(days - 1):
-            with freeze_time(start_time + timedelta(days=i)):
-                day_index = datetime.now().weekday()
+        with freeze_time("2024-05-05"):
+            response = self.client.get(reverse("routine-streak-summary"))
 
-                if day_index in self.random_day_indices:
-                    if random.random() < 0.6:
-                        routine_streak = FakeRoutineStreak(
-                            mirrored_routine=self.fake_weekly_routines[
-                                self.random_day_indices.index(day_index)
-                            ].users_routine.mirrored_routine,
-                        )
-                        routine_streak.create_instance(
-                            user_instance=self.user1.instance
-                        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            {
+                "current_streak": 1,
+                "longest_streak": 3,
+                "last_date": "2024-05-05",
+                "total_days": 4,
+            },
+        )
 
-    def test_get_routine_streak_list(self):
+    def test_not_create_routine_streak_if_no_routine_for_weekday(self):
         """
-        유저가 루틴을 수행한 기록을 조회하는지 테스트
+        루틴이 등록되지 않은 요일에는 수행 기록과 요약이 생성되지 않는지 테스트
 
         reverse_url: routine-streak-list
-        HTTP method: GET
+        HTTP method: POST
 
         테스트 시나리오:
-        1. 유저 1이 로그인합니다.
-        2. /routine-streak/에 GET 요청을 보냅니다.
-        3. 상태 코드가 200인지 확인합니다.
-        4. 응답의 길이가 생성된 RoutineStreak의 수와 같은지 확인합니다.
-        5. 응답의 RoutineStreak의 mirrored_routine이 생성된 RoutineStreak의 mirrored_routine과 같은지 확인합니다.
+        1. 월요일에만 루틴이 등록된 유저 2가 화요일(2024-05-07)에 루틴 수행 기록 생성 요청을 보냅니다.
+        2. 응답 코드가 400인지 확인합니다.
+        3. 루틴 수행 기록과 요약이 생성되지 않았는지 확인합니다.
+        4. 월요일(2024-05-06)에는 루틴 수행 기록이 생성되는지 확인합니다.
         """
+        response = self.create_routine_streak(self.user2.instance, "2024-05-07")
 
-        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
-
-        response = self.client.get(reverse("routine-streak-list"))
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(
+            RoutineStreak.objects.filter(user=self.user2.instance).exists()
+        )
+        self.assertFalse(
+            RoutineStreakSummary.objects.filter(user=self.user2.instance).exists()
+        )
 
-        data = response.json()
+        response = self.create_routine_streak(self.user2.instance, "2024-05-06")
 
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(
-            RoutineStreak.objects.filter(user=self.user1.instance).count(), len(data)
+            RoutineStreakSummary.objects.get(user=self.user2.instance).total_days, 1
         )
 
-        for routine_streak in RoutineStreak.objects.filter(user=self.user1.instance):
-            self.assertEqual(
-                routine_streak.mirrored_routine.id, data.pop().get("mirrored_routine")
-            )
-
-    def test_get_routine_streak_detail(self):
+    def test_get_summary_with_broken_streak(self):
         """
-        유저가 특정 날짜에 수행한 기록의 세부 정보를 조회하는지 테스트
+        요약 조회 시 연속 수행이 끊겼다면 current_streak이 0인지 테스트
 
-        reverse_url: routine-streak-detail
+        reverse_url: routine-streak-summary
         HTTP method: GET
 
         테스트 시나리오:
-        1. 유저 1이 로그인합니다.
-        2. /routine-streak/에 GET 요청을 보냅니다.
-        3. 상태 코드가 200인지 확인합니다.
-        4. 응답의 날짜가 요청한 날짜와 같은지 확인합니다.
-        5. 응답의 mirrored_routine이 요청한 mirrored_routine과 같은지 확인합니다.
+        1. 루틴 수행 기록이 없는 유저 1이 요약을 조회했을 때 모두 0인지 확인합니다.
+        2. 유저 1이 2024-05-01 ~ 2024-05-02 동안 루틴 수행 기록을 생성합니다.
+        3. 2024-05-03에 조회했을 때 current_streak이 2인지 확인합니다.
+        4. 2024-05-04에 조회했을 때 current_streak이 0이고 longest_streak은 2인지 확인합니다.
         """
+        self.client.force_authenticate(user=self.user1.instance)
 
-        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
+        response = self.client.get(reverse("routine-streak-summary"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            {
+                "current_streak": 0,
+                "longest_streak": 0,
+                "last_date": None,
+                "total_days": 0,
+            },
+        )
 
-        routine_streak = RoutineStreak.objects.filter(user=self.user1.instance).last()
+        for date in ["2024-05-01", "2024-05-02"]:
+            self.create_routine_streak(self.user1.instance, date)
 
-        response = self.client.get(
-            reverse("routine-streak-detail", kwargs={"pk": routine_streak.id})
+        with freeze_time("2024-05-03"):
+            response = self.client.get(reverse("routine-streak-summary"))
+        self.assertEqual(response.json().get("current_streak"), 2)
+
+        with freeze_time("2024-05-04"):
+            response = self.client.get(reverse("routine-streak-summary"))
+        self.assertEqual(response.json().get("current_streak"), 0)
+        self.assertEqual(response.json().get("longest_streak"), 2)
+
+    def test_rebuild_routine_streak_summaries_command(self):
+        """
+        rebuild_routine_streak_summaries 명령어로 전체 기록에서 요약을 다시 계산하는지 테스트
+
+        테스트 시나리오:
+        1. 유저 1이 2024-05-01 ~ 2024-05-03, 2024-05-10에 루틴 수행 기록을 생성합니다.
+        2. 유저 1의 요약을 잘못된 값으로 변경하고, 수행 기록이 없는 유저 2의 요약을 생성합니다.
+        3. 명령어를 실행합니다.
+        4. 유저 1의 요약이 전체 기록과 일치하는지 확인합니다.
+        5. 유저 2의 요약이 삭제되었는지 확인합니다.
+        """
+        for date in ["2024-05-01", "2024-05-02", "2024-05-03", "2024-05-10"]:
+            self.create_routine_streak(self.user1.instance, date)
+
+        RoutineStreakSummary.objects.filter(user=self.user1.instance).update(
+            current_streak=0, longest_streak=0, total_days=0, last_date=None
         )
+        RoutineStreakSummary.objects.create(user=self.user2.instance, total_days=3)
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        out = StringIO()
+        call_command(
+            "rebuild_routine_streak_summaries", "--batch-size", "1", stdout=out
+        )
 
-        data = response.json()
+        self.assertIn("Rebuilt 1", out.getvalue())
 
-        self.assertEqual(routine_streak.date.strftime("%Y-%m-%d"), data.get("date"))
+        summary = RoutineStreakSummary.objects.get(user=self.user1.instance)
+        self.assertEqual(summary.current_streak, 1)
+        self.assertEqual(summary.longest_streak, 3)
+        self.assertEqual(summary.total_days, 4)
+        self.assertEqual(summary.last_date.isoformat(), "2024-05-10")
+        self.assertFalse(
+            RoutineStreakSummary.objects.filter(user=self.user2.instance).exists()
+        )
 
-        self.assertEqual(
-            routine_streak.mirrored_routine.id, data.get("mirrored_routine")
+    def create_history_without_summary(self, user, dates):
+        """
+        요약 도입 이전처럼 요약 없이 user의 루틴 수행 기록을 dates 날짜에 생성
+        """
+        mirrored_routine = (
+            UsersRoutine.objects.filter(user=user).first().mirrored_routine
         )
+        for date in dates:
+            with freeze_time(date):
+                FakeRoutineStreak(mirrored_routine=mirrored_routine).create_instance(
+                    user_instance=user
+                )
 
-    def test_create_routine_streak(self):
+        self.assertFalse(RoutineStreakSummary.objects.filter(user=user).exists())
+
+    def test_record_builds_summary_from_existing_history(self):
         """
-        유저가 루틴을 수행한 기록을 생성하는지 테스트
+        요약이 없는 유저에게 이전 수행 기록이 있다면 새 수행 기록 생성 시 전체 기록에서 요약을 계산하는지 테스트
 
         reverse_url: routine-streak-list
         HTTP method: POST
 
         테스트 시나리오:
-        1. 유저 1이 로그인합니다.
-        2. /routine-streak/에 POST 요청을 보냅니다.
-        3. 상태 코드가 201인지 확인합니다.
-        4. 응답에 포함된 date가 현재 날짜와 같은지 확인합니다.
+        1. 요약 없이 유저 1의 2024-05-01 ~ 2024-05-03 수행 기록을 생성합니다.
+        2. 2024-05-04에 수행 기록을 생성하면 current_streak이 4인지 확인합니다. (연속)
+        3. 요약 없이 유저 2의 2024-04-29, 2024-05-06 (월요일) 수행 기록을 생성합니다.
+        4. 2024-05-13 (월요일)에 수행 기록을 생성하면 current_streak이 1, total_days가 3인지 확인합니다. (연속 아님)
+        5. 요약을 지우고 이전 날짜의 수행 기록이 있는 상태에서 기존 날짜 이전의 기록을 생성해도
+           전체 기록과 일치하는지 확인합니다.
         """
+        self.create_history_without_summary(
+            self.user1.instance, ["2024-05-01", "2024-05-02", "2024-05-03"]
+        )
 
-        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
+        response = self.create_routine_streak(self.user1.instance, "2024-05-04")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
-        response = self.client.post(
-            reverse("routine-streak-list"),
+        summary = RoutineStreakSummary.objects.get(user=self.user1.instance)
+        self.assertEqual(summary.current_streak, 4)
+        self.assertEqual(summary.longest_streak, 4)
+        self.assertEqual(summary.total_days, 4)
+        self.assertEqual(summary.last_date.isoformat(), "2024-05-04")
+
+        self.create_history_without_summary(
+            self.user2.instance, ["2024-04-29", "2024-05-06"]
         )
 
+        response = self.create_routine_streak(self.user2.instance, "2024-05-13")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
-        data = response.json()
+        summary = RoutineStreakSummary.objects.get(user=self.user2.instance)
+        self.assertEqual(summary.current_streak, 1)
+        self.assertEqual(summary.longest_streak, 1)
+        self.assertEqual(summary.total_days, 3)
+        self.assertEqual(summary.last_date.isoformat(), "2024-05-13")
 
-        self.assertEqual(datetime.now().strftime("%Y-%m-%d"), data.get("date"))
+        RoutineStreakSummary.objects.filter(user=self.user1.instance).delete()
+        self.create_history_without_summary(self.user1.instance, ["2024-05-10"])
 
-    def test_create_routine_streak_fail_if_already_done(self):
+        response = self.create_routine_streak(self.user1.instance, "2024-05-05")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        summary = RoutineStreakSummary.objects.get(user=self.user1.instance)
+        self.assertEqual(summary.current_streak, 1)
+        self.assertEqual(summary.longest_streak, 5)
+        self.assertEqual(summary.total_days, 6)
+        self.assertEqual(summary.last_date.isoformat(), "2024-05-10")
+
+    def test_get_summary_builds_from_existing_history(self):
         """
-        유저가 이미 루틴을 수행한 상태에서 루틴을 수행한 기록을 생성하려 할 때 실패하는지 테스트
+        요약이 없는 유저에게 이전 수행 기록이 있다면 요약 조회 시 전체 기록에서 요약을 계산하는지 테스트
 
-        reverse_url: routine-streak-list
-        HTTP method: POST
+        reverse_url: routine-streak-summary
+        HTTP method: GET
 
         테스트 시나리오:
-        1. 루틴을 수행한 기록을 생성합니다.
-        2. 유저 1이 로그인합니다.
-        3. /routine-streak/에 POST 요청을 보냅니다.
-        4. 상태 코드가 400인지 확인합니다.
+        1. 요약 없이 유저 1의 2024-05-01 ~ 2024-05-03 수행 기록을 생성합니다.
+        2. 2024-05-03에 요약을 조회하면 current_streak이 3인지 확인합니다.
+        3. 요약이 저장되었는지 확인합니다.
         """
+        self.create_history_without_summary(
+            self.user1.instance, ["2024-05-01", "2024-05-02", "2024-05-03"]
+        )
 
-        now_day_index = datetime.now().weekday()
+        self.client.force_authenticate(user=self.user1.instance)
+        with freeze_time("2024-05-03"):
+            response = self.client.get(reverse("routine-streak-summary"))
 
-        RoutineStreak.objects.create(
-            user=self.user1.instance,
-            mirrored_routine=self.fake_weekly_routines[
-                self.random_day_indices.index(now_day_index)
-            ].users_routine.mirrored_routine,
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            {
+                "current_streak": 3,
+                "longest_streak": 3,
+                "last_date": "2024-05-03",
+                "total_days": 3,
+            },
+        )
+        self.assertEqual(
+            RoutineStreakSummary.objects.get(user=self.user1.instance).total_days, 3
         )
 
-        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
 
-        response = self.client.post(
-            reverse("routine-streak-list"),
-        )
+class HistoryExportTestCase(APITestCase):
+    """
+    목적: 건강 정보, 루틴 수행 기록을 스트리밍으로 내보내는 기능에 대한 테스트를 진행합니다.
 
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    Test cases:
+    1. 내 건강 정보를 CSV로 스트리밍하여 내보내는지 테스트
+    2. 내 루틴 수행 기록을 NDJSON으로 스트리밍하여 내보내는지 테스트
+    3. 전체 유저의 기록은 관리자만 내보낼 수 있는지 테스트
+    4. 잘못된 query parameter로 요청 시 400 에러를 반환하는지 테스트
+    5. export_history 명령어가 파일과 표준 출력으로 기록을 내보내는지 테스트
+    """
 
-    @freeze_time(datetime.now() + timedelta(days=1))
-    def test_create_routine_streak_fail_if_invalid_day_index(self):
+    def setUp(self):
         """
-        유저가 루틴이 등록되지 않은 요일에 루틴을 수행한 기록을 생성하려 할 때 실패하는지 테스트
+        초기 설정
 
-        reverse_url: routine-streak-list
-        HTTP method: POST
+        1. 관리자 유저, 유저 1, 유저 2 생성
+        2. 유저 1, 유저 2의 건강 정보를 3일 동안 생성
+        3. 유저 1이 루틴을 생성하고 모든 요일에 WeeklyRoutine으로 등록
+        4. 유저 1의 루틴 수행 기록을 3일 동안 생성
+        """
+        self.admin = FakeUser()
+        self.admin.create_instance(is_staff=True)
+
+        self.user1 = FakeUser()
+        self.user1.create_instance()
+
+        self.user2 = FakeUser()
+        self.user2.create_instance()
+
+        exercise = FakeExercisesInfo()
+        exercise.create_instance(self.admin.instance)
+        routine = FakeRoutine([exercise])
+        routine.create_instance(user_instance=self.user1.instance)
+        self.mirrored_routine = routine.instance.mirrored_routine
+
+        for day in range(1, 4):
+            with freeze_time(f"2024-05-0{day}"):
+                for user in [self.user1, self.user2]:
+                    FakeHealthInfo().create_instance(user_instance=user.instance)
+                FakeRoutineStreak(
+                    mirrored_routine=self.mirrored_routine
+                ).create_instance(user_instance=self.user1.instance)
+
+    def read_streaming_response(self, response):
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode("utf-8")
+
+    def test_export_my_health_info_as_csv(self):
+        """
+        내 건강 정보를 CSV로 스트리밍하여 내보내는지 테스트
+
+        reverse_url: my-health-info-export
+        HTTP method: GET
 
         테스트 시나리오:
-        1. 유저 1이 로그인합니다.
-        2. /routine-streak/에 POST 요청을 보냅니다.
-        3. 상태 코드가 400인지 확인합니다.
+        1. 유저 1이 CSV 형식으로 건강 정보를 내보냅니다.
+        2. 응답이 스트리밍 응답이고 Content-Type, Content-Disposition이 올바른지 확인합니다.
+        3. 헤더와 유저 1의 건강 정보만 날짜순으로 포함되어 있는지 확인합니다.
+        4. 각 행의 값이 DB의 값과 같은지 확인합니다.
         """
-        new_access_token = str(RefreshToken.for_user(self.user1.instance).access_token)
-        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {new_access_token}")
+        self.client.force_authenticate(user=self.user1.instance)
 
-        response = self.client.post(
-            reverse("routine-streak-list"),
+        response = self.client.get(
+            reverse("my-health-info-export"), {"export_format": "csv"}
         )
 
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn('filename="health_info.csv"', response["Content-Disposition"])
 
-    def test_get_last_routine_streak(self):
+        rows = list(csv.reader(self.read_streaming_response(response).splitlines()))
+        self.assertEqual(rows[0], ["user_id", "date", "age", "height", "weight", "bmi"])
+
+        health_infos = HealthInfo.objects.filter(user=self.user1.instance).order_by(
+            "date"
+        )
+        self.assertEqual(len(rows) - 1, health_infos.count())
+        for row, health_info in zip(rows[1:], health_infos):
+            self.assertEqual(
+                row,
+                [
+                    str(self.user1.instance.id),
+                    health_info.date.isoformat(),
+                    str(health_info.age),
+                    str(health_info.height),
+                    str(health_info.weight),
+                    str(round(health_info.weight / (health_info.height / 100) ** 2, 2)),
+                ],
+            )
+
+    def test_export_my_routine_streak_as_ndjson(self):
         """
-        최근 수행 루틴을 조회하는지 테스트
+        내 루틴 수행 기록을 NDJSON으로 스트리밍하여 내보내는지 테스트
 
-        reverse_url: routine-streak-last
+        reverse_url: routine-streak-export
         HTTP method: GET
 
         테스트 시나리오:
-        1. 유저 1이 로그인합니다.
-        2. /routine-streak-last/에 GET 요청을 보냅니다.
-        3. 상태 코드가 200인지 확인합니다.
-        4. 응답의 date가 RoutineStreak.objects.last().date와 같은지 확인합니다.
+        1. 유저 1이 NDJSON 형식으로 루틴 수행 기록을 내보냅니다.
+        2. Content-Type이 application/x-ndjson인지 확인합니다.
+        3. 각 줄이 JSON 객체이고, 유저 1의 루틴 수행 기록과 같은지 확인합니다.
         """
+        self.client.force_authenticate(user=self.user1.instance)
 
-        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
-
-        response = self.client.get(reverse("routine-streak-last"))
+        response = self.client.get(
+            reverse("routine-streak-export"), {"export_format": "ndjson"}
+        )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
 
-        data = response.json()
-
+        lines = self.read_streaming_response(response).splitlines()
         self.assertEqual(
-            RoutineStreak.objects.filter(user=self.user1.instance)
-            .last()
-            .date.strftime("%Y-%m-%d"),
-            data.get("date"),
+            [json.loads(line) for line in lines],
+            [
+                {
+                    "user_id": self.user1.instance.id,
+                    "date": f"2024-05-0{day}",
+                    "mirrored_routine_id": self.mirrored_routine.id,
+                }
+                for day in range(1, 4)
+            ],
         )
 
-    def test_get_errors_when_not_allowed_methods(self):
+    def test_export_all_users_history_only_by_admin(self):
         """
-        허용되지 않은 요청으로 접근 시 405 에러를 반환하는지 테스트
+        전체 유저의 기록은 관리자만 내보낼 수 있는지 테스트
 
-        reverse_url: routine-streak-list, routine-streak-detail, routine-streak-last
-        HTTP method: POST, PUT, PATCH, DELETE
+        reverse_url: my-health-info-export
+        HTTP method: GET
 
         테스트 시나리오:
-        1. 유저 1이 로그인합니다.
-        2. /routine-streak-list, /routine-streak-detail, /routine-streak-last에 POST, PUT, PATCH, DELETE 요청을 보냅니다.
-        3. 상태 코드가 405인지 확인합니다.
+        1. 유저 1이 scope=all로 요청하면 403 에러를 반환하는지 확인합니다.
+        2. 관리자가 scope=all로 요청하면 모든 유저의 건강 정보가 포함되는지 확인합니다.
         """
+        self.client.force_authenticate(user=self.user1.instance)
+        response = self.client.get(reverse("my-health-info-export"), {"scope": "all"})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
-        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
-
-        routine_streak = RoutineStreak.objects.filter(user=self.user1.instance).last()
+        self.client.force_authenticate(user=self.admin.instance)
+        response = self.client.get(
+            reverse("my-health-info-export"),
+            {"scope": "all", "export_format": "ndjson"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        response = self.client.put(
-            reverse("routine-streak-detail", kwargs={"pk": routine_streak.id})
+        lines = self.read_streaming_response(response).splitlines()
+        self.assertEqual(len(lines), HealthInfo.objects.count())
+        self.assertEqual(
+            {json.loads(line)["user_id"] for line in lines},
+            {self.user1.instance.id, self.user2.instance.id},
         )
 
-        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+    def test_export_with_invalid_params(self):
+        """
+        잘못된 query parameter로 요청 시 400 에러를 반환하는지 테스트
 
-        response = self.client.patch(
-            reverse("routine-streak-detail", kwargs={"pk": routine_streak.id})
-        )
+        reverse_url: my-health-info-export, routine-streak-export
+        HTTP method: GET
 
-        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+        테스트 시나리오:
+        1. 지원하지 않는 형식과 범위로 요청을 보냅니다.
+        2. 응답 코드가 400인지 확인합니다.
+        """
+        self.client.force_authenticate(user=self.user1.instance)
 
-        response = self.client.delete(
-            reverse("routine-streak-detail", kwargs={"pk": routine_streak.id})
+        for url in ["my-health-info-export", "routine-streak-export"]:
+            for params in [{"export_format": "xml"}, {"scope": "others"}]:
+                with self.subTest(url=url, params=params):
+                    response = self.client.get(reverse(url), params)
+                    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_history_command(self):
+        """
+        export_history 명령어가 파일과 표준 출력으로 기록을 내보내는지 테스트
+
+        테스트 시나리오:
+        1. 전체 건강 정보를 CSV 파일로 내보냅니다.
+        2. 파일에 헤더와 모든 건강 정보가 포함되어 있는지 확인합니다.
+        3. 유저 1의 루틴 수행 기록을 NDJSON으로 표준 출력에 내보냅니다.
+        4. 출력에 유저 1의 루틴 수행 기록만 포함되어 있는지 확인합니다.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "health_info.csv")
+            call_command(
+                "export_history",
+                "health_info",
+                "--output",
+                path,
+                "--chunk-size",
+                "2",
+                stderr=StringIO(),
+            )
+
+            with open(path, encoding="utf-8") as output:
+                rows = list(csv.reader(output))
+
+        self.assertEqual(rows[0][0], "user_id")
+        self.assertEqual(len(rows) - 1, HealthInfo.objects.count())
+
+        out = StringIO()
+        call_command(
+            "export_history",
+            "routine_streak",
+            "--format",
+            "ndjson",
+            "--user",
+            str(self.user1.instance.id),
+            stdout=out,
+            stderr=StringIO(),
         )
 
-        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(
+            len(lines), RoutineStreak.objects.filter(user=self.user1.instance).count()
+        )
+        self.assertTrue(
+            all(json.loads(line)["user_id"] == self.user1.instance.id for line in lines)
+        )
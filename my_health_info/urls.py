@@ -2,10 +2,13 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from my_health_info.views import (
+    DashboardView,
     MyHealthInfoViewSet,
     RoutineStreakViewSet,
     RoutineViewSet,
+    SyncView,
     UsersRoutineViewSet,
+    WeeklyRoutineTodayView,
     WeeklyRoutineView,
 )
 
@@ -18,4 +21,11 @@ router.register(r"routine-streak", RoutineStreakViewSet, basename="routine-strea
 urlpatterns = [
     path("", include(router.urls)),
     path("weekly-routine/", WeeklyRoutineView.as_view(), name="weekly-routine"),
+    path(
+        "weekly-routine/today/",
+        WeeklyRoutineTodayView.as_view(),
+        name="weekly-routine-today",
+    ),
+    path("dashboard/", DashboardView.as_view(), name="dashboard"),
+    path("sync/", SyncView.as_view(), name="sync"),
 ]
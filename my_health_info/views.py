@@ -1,6 +1,8 @@
 import datetime
 
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
 from django.utils import timezone
 from rest_framework import status, viewsets
@@ -15,28 +17,89 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from my_health_info.caches import health_info_cache, weekly_schedule_cache
+from my_health_info.exports import HealthInfoExporter, RoutineStreakExporter
 from my_health_info.models import (
     ExerciseInRoutine,
     HealthInfo,
     MirroredRoutine,
     Routine,
     RoutineStreak,
+    RoutineStreakSummary,
+    SubscriberFanOutJob,
     UsersRoutine,
     WeeklyRoutine,
     ExerciseInRoutineAttribute,
 )
 from exercises_info.models import ExercisesInfo
+from exercises_info.serializers import FocusAreaFilterSerializer
+from my_health_info.pagination import (
+    RoutineCursorPagination,
+    RoutineSearchCursorPagination,
+)
 from my_health_info.permissions import IsOwnerOrReadOnly
 from my_health_info.serializers import (
+    DashboardQuerySerializer,
     HealthInfoSerializer,
+    HealthInfoTimeSeriesQuerySerializer,
+    HistoryExportQuerySerializer,
+    RoutineBatchSubscriptionSerializer,
+    RoutineRecommendationQuerySerializer,
+    RoutineSearchQuerySerializer,
     RoutineSerializer,
     RoutineStreakSerializer,
+    RoutineStreakSummarySerializer,
+    SyncQuerySerializer,
     UsersRoutineSerializer,
     WeeklyRoutineSerializer,
     MirroredRoutineSerializer,
     ExerciseInRoutineSerializer,
+    get_mirrored_routine_snapshot,
+    warm_mirrored_routine_snapshots,
+)
+from my_health_info.services import (
+    HealthInfoTimeSeriesService,
+    RoutineBuilderService,
+    RoutineLikeService,
+    RoutineStreakSummaryService,
+    RoutineSubscriptionBatchService,
+    SubscriberFanOutService,
+    UsersRoutineManagementService,
 )
-from my_health_info.services import UsersRoutineManagementService
+from my_health_info.recommendations import routine_vector_index
+from my_health_info.search import routine_search_index
+from my_health_info.sync import DeltaSync
+from my_health_info.tasks import schedule_orphaned_routine_collection
+from utils.enums import FocusAreaEnum
+
+
+def stream_history_export(request, exporter_class):
+    """
+    기록을 CSV 또는 NDJSON으로 스트리밍하는 응답을 반환
+
+    query parameter: export_format(csv, ndjson), scope(me, all)
+
+    1. HistoryExportQuerySerializer로 query parameter 검증
+    2. scope가 all이라면 관리자만 전체 유저의 기록을 내보낼 수 있음
+    3. exporter의 generator로 StreamingHttpResponse를 만들어 반환
+    """
+    query_serializer = HistoryExportQuerySerializer(data=request.query_params)
+    query_serializer.is_valid(raise_exception=True)
+    query = query_serializer.validated_data
+
+    if query["scope"] == "all" and not request.user.is_staff:
+        raise PermissionDenied("Only admins can export all users' history")
+
+    exporter = exporter_class(
+        user=request.user if query["scope"] == "me" else None,
+        export_format=query["export_format"],
+    )
+
+    response = StreamingHttpResponse(
+        exporter.iter_rows(), content_type=exporter.content_type
+    )
+    response["Content-Disposition"] = f'attachment; filename="{exporter.filename}"'
+    return response
 
 
 class MyHealthInfoViewSet(viewsets.ModelViewSet):
@@ -50,6 +113,8 @@ class MyHealthInfoViewSet(viewsets.ModelViewSet):
     - create: POST /my_health_info/my_health_info/
     - retrieve: GET /my_health_info/my_health_info/<pk>/
     - last: GET /my_health_info/my_health_info/last/
+    - time_series: GET /my_health_info/my_health_info/time-series/
+    - export: GET /my_health_info/my_health_info/export/
     """
 
     http_method_names = ["get", "post"]
@@ -66,21 +131,23 @@ class MyHealthInfoViewSet(viewsets.ModelViewSet):
         건강 정보를 리스트로 반환
 
         - 최근 35일간의 건강 정보만 조회 가능
+        - 조회 결과는 유저별로 캐시하고, 건강 정보가 생성되면 무효화
         """
-        queryset = (
-            self.get_queryset()
-            .all()
-            .filter(
-                date__gte=timezone.now() - datetime.timedelta(days=self.days_to_show)
-            )
+        since = timezone.localdate(
+            timezone.now() - datetime.timedelta(days=self.days_to_show)
         )
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        def render():
+            queryset = self.get_queryset().filter(date__gte=since)
+            return list(self.get_serializer(queryset, many=True).data)
+
+        return Response(health_info_cache.get_recent(request.user.id, since, render))
 
     def perform_create(self, serializer):
         """
         새로운 건강 정보 생성
+
+        생성된 건강 정보를 유저의 가장 최근 건강 정보 캐시에 바로 저장 (write-through)
         """
         if HealthInfo.objects.filter(
             user=self.request.user, date=datetime.datetime.now().date()
@@ -89,19 +156,64 @@ class MyHealthInfoViewSet(viewsets.ModelViewSet):
 
         if serializer.is_valid():
             serializer.save(user=self.request.user)
+            health_info_cache.set_last(self.request.user.id, dict(serializer.data))
 
     @action(detail=False, methods=["get"], url_path="last", url_name="last")
     def last(self, request, *args, **kwargs):
         """
         가장 최근의 건강 정보 조회
 
-        사용자의 건강 정보가 없다면 404 에러 반환
+        - 조회 결과는 유저별로 캐시하고, 건강 정보가 생성되면 새 값으로 갱신
+        - 사용자의 건강 정보가 없다면 404 에러 반환
         """
-        queryset = self.get_queryset()
-        if queryset.exists():
-            serializer = self.get_serializer(queryset.first())
-            return Response(serializer.data)
-        raise NotFound("No health info found")
+
+        def render():
+            health_info = self.get_queryset().first()
+            if health_info is None:
+                return None
+            return dict(self.get_serializer(health_info).data)
+
+        data = health_info_cache.get_last(request.user.id, render)
+        if data is None:
+            raise NotFound("No health info found")
+        return Response(data)
+
+    @action(
+        detail=False, methods=["get"], url_path="time-series", url_name="time-series"
+    )
+    def time_series(self, request, *args, **kwargs):
+        """
+        기간 내 건강 정보를 구간별로 집계하여 반환
+
+        query parameter: start, end, bucket(day, week, month), window
+
+        1. HealthInfoTimeSeriesQuerySerializer로 query parameter 검증
+        2. HealthInfoTimeSeriesService로 구간별 몸무게, BMI의 평균, 최솟값, 최댓값, 이동 평균 계산
+        """
+        query_serializer = HealthInfoTimeSeriesQuerySerializer(
+            data=request.query_params
+        )
+        query_serializer.is_valid(raise_exception=True)
+        query = query_serializer.validated_data
+
+        service = HealthInfoTimeSeriesService(user=request.user, **query)
+
+        return Response(
+            {
+                "start": query["start"],
+                "end": query["end"],
+                "bucket": query["bucket"],
+                "window": query["window"],
+                "series": service.build(),
+            }
+        )
+
+    @action(detail=False, methods=["get"], url_path="export", url_name="export")
+    def export(self, request, *args, **kwargs):
+        """
+        건강 정보를 CSV 또는 NDJSON으로 스트리밍하여 내보내기
+        """
+        return stream_history_export(request, HealthInfoExporter)
 
 
 class RoutineViewSet(viewsets.ModelViewSet):
@@ -113,7 +225,13 @@ class RoutineViewSet(viewsets.ModelViewSet):
     functions:
     - list: GET /my_health_info/routine/
     - create: POST /my_health_info/routine/
+    - search: GET /my_health_info/routine/search/?q=
+    - similar: GET /my_health_info/routine/<pk>/similar/
+    - recommended: GET /my_health_info/routine/recommended/
+    - like: POST /my_health_info/routine/<pk>/like/
+    - unlike: POST /my_health_info/routine/<pk>/unlike/
     - subscribe: POST /my_health_info/routine/<pk>/subscribe/
+    - batch_subscription: POST /my_health_info/routine/batch-subscription/
     """
 
     http_method_names = [
@@ -122,13 +240,22 @@ class RoutineViewSet(viewsets.ModelViewSet):
     ]
     serializer_class = RoutineSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
+    pagination_class = RoutineCursorPagination
     ordering_fields = ["like_count"]
 
     def get_queryset(self):
         """
         루틴 정보를 반환, 삭제되지 않은 루틴만 조회
+
+        list, retrieve에서는 직렬화에 필요한 관계를 미리 불러와
+        루틴 개수와 관계없이 일정한 수의 쿼리로 응답한다.
         """
-        return Routine.objects.filter(is_deleted=False)
+        queryset = Routine.objects.filter(is_deleted=False)
+
+        if self.action in ["list", "retrieve", "search"]:
+            queryset = RoutineSerializer.setup_eager_loading(queryset)
+
+        return queryset
 
     def order_queryset(self, queryset):
         """
@@ -168,13 +295,53 @@ class RoutineViewSet(viewsets.ModelViewSet):
         검색어가 없다면 주어진 쿼리셋 그대로 반환
 
         Q 객체를 사용하여 검색어에 해당하는 필드를 필터링
+
+        focus_area가 있다면 루틴에 포함된 운동들의 부위로 필터링
+        (focus_area_match=any: 하나라도 포함, all: 운동들의 부위를 합쳐 모두 포함)
         """
         author__id = self.request.query_params.get("author__id", None)
 
-        if not author__id:
-            return queryset
+        if author__id:
+            queryset = queryset.filter(Q(author__id=author__id))
+
+        if "focus_area" in self.request.query_params:
+            filter_serializer = FocusAreaFilterSerializer(
+                data=self.request.query_params
+            )
+            filter_serializer.is_valid(raise_exception=True)
+
+            queryset = self.filter_focus_areas(
+                queryset,
+                filter_serializer.validated_data["focus_area"],
+                filter_serializer.validated_data["focus_area_match"],
+            )
 
-        queryset = queryset.filter(Q(author__id=author__id))
+        return queryset
+
+    def filter_focus_areas(self, queryset, mask, match):
+        """
+        루틴에 현재 포함된 운동의 focus_area_mask로 루틴을 필터링
+
+        운동 부위 M2M을 JOIN하지 않고, 운동 정보의 focus_area_mask 인덱스를 사용하는 EXISTS 조건으로 필터링한다.
+        all이라면 부위마다 해당 부위를 포함하는 운동이 있는지 확인한다.
+        """
+        masks = (
+            [mask]
+            if match == "any"
+            else [member.bit for member in FocusAreaEnum if member.bit & mask]
+        )
+
+        for bit_mask in masks:
+            queryset = queryset.filter(
+                Exists(
+                    ExerciseInRoutine.objects.filter(
+                        routine=OuterRef("pk"),
+                        exercise__focus_area_mask__in=FocusAreaEnum.matching_masks(
+                            bit_mask
+                        ),
+                    )
+                )
+            )
 
         return queryset
 
@@ -184,15 +351,19 @@ class RoutineViewSet(viewsets.ModelViewSet):
 
         주어진 쿼리셋을 검색어와 ordering에 따라 필터링 및 정렬
 
+        정렬 키 튜플을 커서로 사용하여 한 페이지만 조회하고,
+        다음 페이지 주소는 Link 헤더로 반환
+
         그 후 serializer를 사용하여 데이터 반환
         """
         queryset = self.get_queryset()
         queryset = self.search_queryset(queryset)
         queryset = self.order_queryset(queryset)
 
-        serializer = self.get_serializer(queryset, many=True)
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
 
-        return Response(serializer.data)
+        return self.get_paginated_response(serializer.data)
 
     def retrieve(self, request, *args, **kwargs):
         """
@@ -205,6 +376,119 @@ class RoutineViewSet(viewsets.ModelViewSet):
 
         return Response(serializer.data)
 
+    def perform_create(self, serializer):
+        """
+        새 루틴을 생성하고 검색 인덱스에 추가
+
+        응답은 운동 트리를 미리 불러온 루틴으로 직렬화하여 운동마다 쿼리가 발생하지 않도록 한다.
+        """
+        routine = serializer.save()
+        routine_search_index.update([routine.id])
+
+        serializer.instance = RoutineSerializer.setup_eager_loading(
+            Routine.objects.all()
+        ).get(id=routine.id)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="search",
+        url_name="search",
+        pagination_class=RoutineSearchCursorPagination,
+    )
+    def search(self, request, *args, **kwargs):
+        """
+        루틴 제목, 작성자 username, 루틴에 포함된 운동 제목으로 루틴을 검색
+
+        1. query parameter q를 검증 (n-gram으로 분해할 수 있는 단어가 없다면 400 에러)
+        2. 검색 인덱스로 모든 검색어를 포함하는 루틴만 남기고 search_rank를 추가
+        3. author__id가 있다면 작성자로 한 번 더 필터링
+        4. -search_rank, -id 순으로 정렬하여 커서 기반으로 한 페이지만 반환
+        """
+        query_serializer = RoutineSearchQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        queryset = routine_search_index.filter(
+            self.get_queryset(), query_serializer.validated_data["q"]
+        )
+        queryset = self.search_queryset(queryset)
+        queryset = queryset.order_by(f"-{routine_search_index.rank_annotation}")
+
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=True, methods=["get"], url_path="similar", url_name="similar")
+    def similar(self, request, *args, **kwargs):
+        """
+        주어진 루틴과 운동 구성이 가장 유사한 루틴을 유사도 순으로 반환
+
+        1. 루틴이 없거나 삭제되었다면 404 에러
+        2. 벡터 인덱스를 마지막 동기화 이후 변경된 루틴만큼 갱신
+        3. 코사인 유사도가 높은 루틴 limit개를 similarity와 함께 반환
+        """
+        routine = self.get_object()
+        query_serializer = RoutineRecommendationQuerySerializer(
+            data=request.query_params
+        )
+        query_serializer.is_valid(raise_exception=True)
+
+        routine_vector_index.refresh()
+        ranked = routine_vector_index.similar(
+            routine.id, k=query_serializer.validated_data["limit"]
+        )
+
+        return Response(self.render_ranked_routines(ranked))
+
+    @action(
+        detail=False, methods=["get"], url_path="recommended", url_name="recommended"
+    )
+    def recommended(self, request, *args, **kwargs):
+        """
+        유저가 보유한 루틴들과 운동 구성이 유사한 루틴을 유사도 순으로 반환
+
+        1. 벡터 인덱스를 마지막 동기화 이후 변경된 루틴만큼 갱신
+        2. 보유한 루틴 벡터의 합과 코사인 유사도가 높은 루틴 limit개를 반환
+           (이미 보유한 루틴은 제외하며, 보유한 루틴이 없다면 빈 리스트)
+        """
+        query_serializer = RoutineRecommendationQuerySerializer(
+            data=request.query_params
+        )
+        query_serializer.is_valid(raise_exception=True)
+
+        routine_vector_index.refresh()
+        ranked = routine_vector_index.recommend(
+            request.user, k=query_serializer.validated_data["limit"]
+        )
+
+        return Response(self.render_ranked_routines(ranked))
+
+    def render_ranked_routines(self, ranked):
+        """
+        (루틴 id, 유사도) 리스트의 루틴을 한 번에 조회하여 순서대로 직렬화
+
+        다른 프로세스에서 삭제되어 DB에 없는 루틴은 결과에서 빼고 인덱스에서도 제거한다.
+        """
+        routines = RoutineSerializer.setup_eager_loading(
+            Routine.objects.filter(
+                id__in=[routine_id for routine_id, _ in ranked], is_deleted=False
+            )
+        ).in_bulk()
+
+        routine_vector_index.discard(
+            [routine_id for routine_id, _ in ranked if routine_id not in routines]
+        )
+
+        return [
+            {
+                **self.get_serializer(routines[routine_id]).data,
+                "similarity": round(similarity, 4),
+            }
+            for routine_id, similarity in ranked
+            if routine_id in routines
+        ]
+
     @action(
         detail=True,
         methods=["post"],
@@ -213,18 +497,49 @@ class RoutineViewSet(viewsets.ModelViewSet):
         permission_classes=[IsAuthenticated],
     )
     def like(self, request, *args, **kwargs):
+        """
+        유저가 루틴에 좋아요를 누르는 로직
+
+        1. 루틴과 유저 인스턴스를 가져옴
+        2. RoutineLikeService를 통해 좋아요를 추가하고 좋아요 수를 원자적으로 증가
+        3. 이미 좋아요를 누른 루틴이라면 405 에러 반환
+        4. 변경된 좋아요 수를 반환
+        """
         routine = self.get_object()
-        user = request.user
+        service = RoutineLikeService(user=request.user, routine=routine)
 
-        if routine.liked_users.filter(id=user.id).exists():
-            raise MethodNotAllowed("이미 좋아요를 누른 루틴입니다.")
+        try:
+            like_count = service.like()
+        except ValueError as e:
+            raise MethodNotAllowed(request.method, detail=str(e))
 
-        routine.liked_users.add(user)
-        routine.like_count += 1
+        return Response(data={"like_count": f"{like_count}"}, status=status.HTTP_200_OK)
 
-        return Response(
-            data={"like_count": f"{routine.like_count}"}, status=status.HTTP_200_OK
-        )
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="unlike",
+        url_name="unlike",
+        permission_classes=[IsAuthenticated],
+    )
+    def unlike(self, request, *args, **kwargs):
+        """
+        유저가 루틴의 좋아요를 취소하는 로직
+
+        1. 루틴과 유저 인스턴스를 가져옴
+        2. RoutineLikeService를 통해 좋아요를 삭제하고 좋아요 수를 원자적으로 감소
+        3. 좋아요를 누르지 않은 루틴이라면 405 에러 반환
+        4. 변경된 좋아요 수를 반환
+        """
+        routine = self.get_object()
+        service = RoutineLikeService(user=request.user, routine=routine)
+
+        try:
+            like_count = service.unlike()
+        except ValueError as e:
+            raise MethodNotAllowed(request.method, detail=str(e))
+
+        return Response(data={"like_count": f"{like_count}"}, status=status.HTTP_200_OK)
 
     @action(
         detail=True,
@@ -251,6 +566,52 @@ class RoutineViewSet(viewsets.ModelViewSet):
 
         return Response(data, status=status.HTTP_201_CREATED)
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="batch-subscription",
+        url_name="batch-subscription",
+        permission_classes=[IsAuthenticated],
+    )
+    def batch_subscription(self, request, *args, **kwargs):
+        """
+        유저가 여러 루틴을 한 번에 구독, 구독 취소하는 로직
+
+        1. RoutineBatchSubscriptionSerializer로 구독, 구독 취소할 루틴 id 목록 검증
+        2. RoutineSubscriptionBatchService로 하나의 트랜잭션 안에서 구독, 구독 취소를 일괄 처리
+        3. 구독을 취소한 루틴이 있다면 고아 MirroredRoutine을 정리하는 백그라운드 작업을 예약
+        4. 새로 구독한 UsersRoutine의 스냅샷을 한 번에 렌더링한 뒤 루틴별 결과를 반환
+        """
+        serializer = RoutineBatchSubscriptionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        service = RoutineSubscriptionBatchService(user=request.user)
+        with transaction.atomic():
+            subscribe_results = service.subscribe(
+                serializer.validated_data["subscribe"]
+            )
+            unsubscribe_results = service.unsubscribe(
+                serializer.validated_data["unsubscribe"]
+            )
+
+        if any(result["status"] == "unsubscribed" for result in unsubscribe_results):
+            schedule_orphaned_routine_collection()
+
+        subscribed = [
+            result for result in subscribe_results if "users_routine" in result
+        ]
+        warm_mirrored_routine_snapshots(
+            result["users_routine"].mirrored_routine for result in subscribed
+        )
+        for result in subscribed:
+            result["users_routine"] = UsersRoutineSerializer(
+                result["users_routine"]
+            ).data
+
+        return Response(
+            {"subscribe": subscribe_results, "unsubscribe": unsubscribe_results}
+        )
+
 
 class UsersRoutineViewSet(viewsets.ModelViewSet):
     """
@@ -264,6 +625,7 @@ class UsersRoutineViewSet(viewsets.ModelViewSet):
     - retrieve: GET /my_health_info/users_routine/<pk>/
     - partial_update: PATCH /my_health_info/users_routine/<pk>/
     - destroy: DELETE /my_health_info/users_routine/<pk>/
+    - fan_out: GET /my_health_info/users_routine/<pk>/fan-out/
     - update_routine: PATCH /my_health_info/users_routine/<pk>/update_routine/
     """
 
@@ -275,86 +637,50 @@ class UsersRoutineViewSet(viewsets.ModelViewSet):
         """
         본인이 소유한 루틴 정보를 반환
         """
-        return UsersRoutine.objects.filter(user=self.request.user)
+        return UsersRoutine.objects.filter(user=self.request.user).select_related(
+            "routine", "mirrored_routine"
+        )
 
     def list(self, request, *args, **kwargs):
         """
         유저가 소유한 UsersRoutine 정보를 리스트로 반환
+
+        캐시에 없는 MirroredRoutine 스냅샷은 직렬화 전에 한 번에 렌더링하여
+        프로세스의 캐시가 비어 있어도 운동 트리를 루틴마다 조회하지 않는다.
         """
-        queryset = self.get_queryset()
+        queryset = list(self.get_queryset())
+        warm_mirrored_routine_snapshots(
+            users_routine.mirrored_routine for users_routine in queryset
+        )
         serializer = self.get_serializer(queryset, many=True)
 
         return Response(serializer.data)
 
+    @transaction.atomic
     def perform_create(self, serializer):
         """
         새로운 UsersRoutine 생성
 
         1. 새 Routine 생성
-        2. Routine을 original_routine으로 갖는 새 MirroredRoutine 생성
-        3. 제공받은 ExerciseInRoutine 정보를 이용해 새 ExerciseInRoutine 생성
-        4. 새 UsersRoutine 생성
+        2. RoutineBuilderService로 Routine을 original_routine으로 갖는
+           새 MirroredRoutine과 ExerciseInRoutine들을 일괄 생성
+        3. 새 UsersRoutine 생성
+        4. 검색 인덱스에 새 Routine 추가
         5. Serializer로 UsersRoutine 정보 반환
         """
 
         data = serializer.validated_data
 
+        title = data.pop("title")
+        exercises_in_routine = data.pop("exercises_in_routine")
+
         routine = Routine.objects.create(
             author=self.request.user,
-            title=data["title"],
+            title=title,
         )
 
-        mirrored_routine = MirroredRoutine.objects.create(
-            title=data["title"],
-            author_name=self.request.user.username,
-            original_routine=routine,
-        )
-        data.pop("title")
-        exercises_in_routine = data["exercises_in_routine"]
-
-        for exercise_in_routine in exercises_in_routine:
-
-            exercises_in_routine_obj = ExerciseInRoutine.objects.create(
-                routine=routine,
-                mirrored_routine=mirrored_routine,
-                exercise=exercise_in_routine["exercise"],
-                order=exercise_in_routine["order"],
-            )
-
-            exercise_attr_request = exercise_in_routine.get("exercise_attribute", None)
-            if exercise_attr_request:
-                exercise = exercise_in_routine["exercise"]
-
-                ExerciseInRoutineAttribute.objects.create(
-                    exercise_in_routine=exercises_in_routine_obj,
-                    set_count=(
-                        exercise_attr_request["set_count"]
-                        if exercise.exercises_attribute.need_set
-                        else 0
-                    ),
-                    rep_count=(
-                        exercise_attr_request["rep_count"]
-                        if exercise.exercises_attribute.need_rep
-                        else 0
-                    ),
-                    weight=(
-                        exercise_attr_request["weight"]
-                        if exercise.exercises_attribute.need_weight
-                        else 0
-                    ),
-                    duration=(
-                        exercise_attr_request["duration"]
-                        if exercise.exercises_attribute.need_duration
-                        else 0
-                    ),
-                    speed=(
-                        exercise_attr_request["speed"]
-                        if exercise.exercises_attribute.need_speed
-                        else 0
-                    ),
-                )
-
-        data.pop("exercises_in_routine")
+        builder = RoutineBuilderService(user=self.request.user, routine=routine)
+        mirrored_routine = builder.build_mirrored_routine(title, exercises_in_routine)
 
         serializer.save(
             user=self.request.user,
@@ -363,8 +689,11 @@ class UsersRoutineViewSet(viewsets.ModelViewSet):
             mirrored_routine=mirrored_routine,
         )
 
+        routine_search_index.update([routine.id])
+
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    @transaction.atomic
     def partial_update(self, request, *args, **kwargs):
         """
         UsersRoutine 정보 업데이트
@@ -372,12 +701,16 @@ class UsersRoutineViewSet(viewsets.ModelViewSet):
         1. UsersRoutine 정보를 가져옴
         2. 만약 ExercisesInRoutine 정보가 변경되어야 한다면
         3. Routine에 연결된 MirroredRoutine을 None으로 변경
-        4. 새 MirroredRoutine 생성
-        5. 기존 ExerciseInRoutine에서 routine 정보를 None으로 변경
-        6. 새 ExerciseInRoutine 생성
+        4. 기존 ExerciseInRoutine에서 routine 정보를 None으로 변경
+        5. RoutineBuilderService로 새 MirroredRoutine과 ExerciseInRoutine들을 일괄 생성
+           (내용이 같은 MirroredRoutine이 이미 있다면 재사용)
+        6. 스냅샷 내용이 바뀌지 않았다면 7~9 과정을 생략
         7. UsersRoutine의 mirrored_routine 정보를 새 MirroredRoutine으로 변경
         8. 만약 기존 MirroredRoutine의 구독자가 없다면 삭제
-        9. UsersRoutine의 구독자에게 업데이트 필요 여부를 True로 변경
+        9. SubscriberFanOutService로 UsersRoutine의 구독자에게 업데이트 필요 여부를 True로 변경
+           (구독자가 많다면 백그라운드 작업으로 처리)
+        10. 여기서 정리되지 않은 고아 MirroredRoutine을 정리하는 백그라운드 작업을 예약
+        11. 변경된 제목, 운동으로 검색 인덱스를 갱신
         """
 
         instance = self.get_object()
@@ -393,88 +726,73 @@ class UsersRoutineViewSet(viewsets.ModelViewSet):
         if request.user != instance.routine.author:
             raise PermissionDenied("You are not the author of this routine")
 
-        mirrored_routine = instance.mirrored_routine
-
-        if "title" in data.keys():
-            title = data["title"]
+        title = data.get("title", routine.title)
 
         if exercise_in_routine_data:
             mirrored_routine = routine.mirrored_routine
             mirrored_routine.original_routine = None
             mirrored_routine.save()
-            routine.save()
 
-            new_mirrored_routine = MirroredRoutine.objects.create(
-                title=title,
-                author_name=request.user.username,
-                original_routine=routine,
-            )
+            routine.exercises_in_routine.update(routine=None)
 
-            existing_exercise_in_routines = instance.routine.exercises_in_routine.all()
-            for exercise_in_routine in existing_exercise_in_routines:
-                exercise_in_routine.routine = None
-                exercise_in_routine.save()
+            builder = RoutineBuilderService(user=request.user, routine=routine)
+            new_mirrored_routine = builder.build_mirrored_routine(
+                title, exercise_in_routine_data
+            )
 
-            for exercise_in_routine in exercise_in_routine_data:
+            if new_mirrored_routine.id != mirrored_routine.id:
+                instance.mirrored_routine = new_mirrored_routine
+                instance.save()
 
-                exercises_in_routine_obj = ExerciseInRoutine.objects.create(
-                    routine=routine,
-                    mirrored_routine=new_mirrored_routine,
-                    exercise=exercise_in_routine["exercise"],
-                    order=exercise_in_routine["order"],
-                )
+                if mirrored_routine.mirrored_subscribers.count() == 0:
+                    mirrored_routine.delete()
 
-                exercise_attr_request = exercise_in_routine.get(
-                    "exercise_attribute", None
+                fan_out = SubscriberFanOutService(
+                    routine=routine, excluded_users_routine=instance
                 )
-                if exercise_attr_request:
-                    exercise = exercise_in_routine["exercise"]
-
-                    ExerciseInRoutineAttribute.objects.create(
-                        exercise_in_routine=exercises_in_routine_obj,
-                        set_count=(
-                            exercise_attr_request["set_count"]
-                            if exercise.exercises_attribute.need_set
-                            else 0
-                        ),
-                        rep_count=(
-                            exercise_attr_request["rep_count"]
-                            if exercise.exercises_attribute.need_rep
-                            else 0
-                        ),
-                        weight=(
-                            exercise_attr_request["weight"]
-                            if exercise.exercises_attribute.need_weight
-                            else 0
-                        ),
-                        duration=(
-                            exercise_attr_request["duration"]
-                            if exercise.exercises_attribute.need_duration
-                            else 0
-                        ),
-                        speed=(
-                            exercise_attr_request["speed"]
-                            if exercise.exercises_attribute.need_speed
-                            else 0
-                        ),
-                    )
-
-            instance.mirrored_routine = new_mirrored_routine
-            instance.save()
+                fan_out.fan_out()
 
-            if mirrored_routine.mirrored_subscribers.count() == 0:
-                mirrored_routine.delete()
-
-            for subscriber in instance.routine.subscribers.all():
-                if subscriber != instance:
-                    subscriber.need_update = True
-                    subscriber.save()
+            schedule_orphaned_routine_collection()
 
         routine.title = title
         routine.save()
         serializer.save()
+
+        routine_search_index.update([routine.id])
         return Response(serializer.data)
 
+    @action(detail=True, methods=["get"], url_path="fan-out", url_name="fan-out")
+    def fan_out(self, request, *args, **kwargs):
+        """
+        루틴 수정 후 구독자 업데이트 작업의 진행 상황 조회
+
+        1. UsersRoutine 정보를 가져옴
+        2. 루틴의 작성자가 아니라면 403 에러 반환
+        3. 가장 최근의 SubscriberFanOutJob을 반환, 없다면 404 에러 반환
+        """
+        instance = self.get_object()
+
+        if not instance.is_author:
+            raise PermissionDenied("You are not the author of this routine")
+
+        job = (
+            SubscriberFanOutJob.objects.filter(routine=instance.routine)
+            .order_by("-created_at", "-id")
+            .first()
+        )
+        if job is None:
+            raise NotFound("No fan-out job found")
+
+        return Response(
+            {
+                "status": job.status,
+                "total": job.total,
+                "processed": job.processed,
+                "created_at": job.created_at,
+                "finished_at": job.finished_at,
+            }
+        )
+
     def destroy(self, request, *args, **kwargs):
         """
         UsersRoutine 정보 삭제
@@ -483,6 +801,7 @@ class UsersRoutineViewSet(viewsets.ModelViewSet):
         2. UsersRoutine 정보 삭제
         3. 만약 유저가 루틴의 작성자라면 Routine 삭제
         4. 만약 MirroredRoutine의 구독자가 없다면 MirroredRoutine 삭제
+        5. 여기서 정리되지 않은 고아 MirroredRoutine을 정리하는 백그라운드 작업을 예약
         """
         instance = self.get_object()
 
@@ -497,6 +816,8 @@ class UsersRoutineViewSet(viewsets.ModelViewSet):
         if mirrored_routine.mirrored_subscribers.count() == 0:
             mirrored_routine.delete()
 
+        schedule_orphaned_routine_collection()
+
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -533,64 +854,58 @@ class WeeklyRoutineView(APIView):
         유저의 주간 루틴 정보 생성
 
         1. WeeklyRoutineSerializer를 사용하여 데이터 유효성 검사
-        2. WeeklyRoutine들을 생성
+        2. WeeklyRoutine들을 생성하고 유저의 캐시된 주간 일정을 무효화
         3. 생성된 WeeklyRoutine을 요일 순으로 정렬
         4. 정렬된 WeeklyRoutine을 WeeklyRoutineSerializer를 사용하여 데이터 반환
         """
-        serializer = WeeklyRoutineSerializer(data=request.data, many=True)
+        serializer = WeeklyRoutineSerializer(
+            data=request.data, many=True, context={"request": request}
+        )
         if serializer.is_valid():
             if WeeklyRoutine.objects.filter(user=request.user).exists():
                 raise PermissionDenied("Weekly routine already exists")
             instances = serializer.save(user=request.user)
+            weekly_schedule_cache.invalidate(request.user.id)
             sorted_instances = sorted(instances, key=lambda x: x.day_index)
             sorted_serializer = WeeklyRoutineSerializer(sorted_instances, many=True)
             return Response(sorted_serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @transaction.atomic
     def put(self, request):
         """
         유저의 주간 루틴 정보 업데이트
 
-        1. WeeklyRoutineSerializer를 사용하여 데이터 유효성 검사
-        2. instances에 유저의 주간 루틴 정보를 조회
-        3. 현재 주간 루틴 정보의 요일 인덱스와 새로운 주간 루틴 정보의 요일 인덱스를 비교하여 삭제, 생성, 업데이트할 요일 인덱스 저장
-        4. 업데이트 할 인덱스가 있다면 해당 인덱스의 users_routine 정보를 업데이트
-        5. 삭제할 인덱스가 있다면 인덱스에 해당하는 주간 루틴 정보 삭제
-        6. 생성할 인덱스가 있다면 인덱스에 해당하는 주간 루틴 정보 생성
-        7. 업데이트된 주간 루틴 정보를 요일 순으로 정렬
-        8. 정렬된 주간 루틴 정보를 WeeklyRoutineSerializer를 사용하여 데이터 반환
-        """
-        serializer = WeeklyRoutineSerializer(data=request.data, many=True)
+        1. WeeklyRoutineSerializer를 사용하여 데이터 유효성 검사 (요청한 유저의 UsersRoutine인지 한 번의 쿼리로 확인)
+        2. 새로운 주간 루틴 정보에 없는 요일의 주간 루틴 정보를 한 번에 삭제
+        3. 새로운 주간 루틴 정보를 (user, day_index) 기준으로 한 번에 생성 또는 users_routine 업데이트 (bulk upsert)
+           후 유저의 캐시된 주간 일정을 무효화
+        4. 메모리에 있는 주간 루틴 정보를 요일 순으로 정렬
+        5. 정렬된 주간 루틴 정보를 WeeklyRoutineSerializer를 사용하여 데이터 반환
+        """
+        serializer = WeeklyRoutineSerializer(
+            data=request.data, many=True, context={"request": request}
+        )
         if serializer.is_valid():
-            instances = WeeklyRoutine.objects.filter(user=request.user)
-
-            current_indices = set(instance.day_index for instance in instances)
-            new_indices = set(data["day_index"] for data in serializer.validated_data)
-
-            to_delete = current_indices - new_indices
-            to_create = new_indices - current_indices
-            to_update = current_indices & new_indices
-
-            if to_update:
-                for data in serializer.validated_data:
-                    if data["day_index"] in to_update:
-                        WeeklyRoutine.objects.filter(
-                            user=request.user, day_index=data["day_index"]
-                        ).update(users_routine=data["users_routine"])
-            if to_delete:
-                WeeklyRoutine.objects.filter(
-                    user=request.user, day_index__in=to_delete
-                ).delete()
-            if to_create:
-                for data in serializer.validated_data:
-                    if data["day_index"] in to_create:
-                        WeeklyRoutine.objects.create(
-                            user=request.user,
-                            users_routine=data["users_routine"],
-                            day_index=data["day_index"],
-                        )
-
-            instances = WeeklyRoutine.objects.filter(user=request.user)
+            instances = [
+                WeeklyRoutine(
+                    user=request.user,
+                    users_routine=data["users_routine"],
+                    day_index=data["day_index"],
+                )
+                for data in serializer.validated_data
+            ]
+
+            WeeklyRoutine.objects.filter(user=request.user).exclude(
+                day_index__in=[instance.day_index for instance in instances]
+            ).delete()
+            WeeklyRoutine.objects.bulk_create(
+                instances,
+                update_conflicts=True,
+                unique_fields=["user", "day_index"],
+                update_fields=["users_routine", "updated_at"],
+            )
+            weekly_schedule_cache.invalidate(request.user.id)
 
             sorted_instances = sorted(instances, key=lambda x: x.day_index)
             sorted_serializer = WeeklyRoutineSerializer(sorted_instances, many=True)
@@ -601,14 +916,79 @@ class WeeklyRoutineView(APIView):
         """
         유저의 모든 주간 루틴 정보 삭제
 
-        1. 유저의 주간 루틴 정보를 필터링하여 삭제
+        1. 유저의 주간 루틴 정보를 필터링하여 삭제하고 유저의 캐시된 주간 일정을 무효화
         2. 204 응답 반환
         """
 
         WeeklyRoutine.objects.filter(user=request.user).delete()
+        weekly_schedule_cache.invalidate(request.user.id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class WeeklyRoutineTodayView(APIView):
+    """
+    오늘 요일의 루틴 정보에 대한 View
+
+    url_prefix: /my_health_info/weekly-routine/today/
+
+    functions:
+    - get: GET /my_health_info/weekly-routine/today/
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """
+        오늘 요일(settings.TIME_ZONE 기준)의 루틴을 운동 트리까지 펼쳐서 조회
+
+        1. weekly_schedule_cache에서 유저의 7칸 주간 일정을 가져옴 (없다면 한 번의 쿼리로 생성)
+        2. 오늘 요일에 루틴이 없다면 404 에러 반환
+        3. 오늘 루틴의 MirroredRoutine 스냅샷(title, author_name, 운동 트리)을 캐시에서 읽음
+           (운동 정보 카탈로그 버전이 바뀌었다면 스냅샷 캐시가 비워진 뒤 다시 렌더링)
+        4. 날짜, 요일, UsersRoutine, MirroredRoutine 정보와 스냅샷을 함께 반환
+        """
+        today = timezone.localdate()
+        schedule = weekly_schedule_cache.get_schedule(
+            request.user.id, lambda: self.render_schedule(request.user)
+        )
+
+        slot = schedule[today.weekday()]
+        if slot is None:
+            raise NotFound("No routine scheduled for today")
+
+        snapshot = get_mirrored_routine_snapshot(
+            slot["mirrored_routine"],
+            lambda: MirroredRoutine.objects.get(id=slot["mirrored_routine"]),
+        )
+
+        return Response(
+            {
+                "date": today,
+                "day_index": today.weekday(),
+                "users_routine": slot["users_routine"],
+                "mirrored_routine": slot["mirrored_routine"],
+                "title": snapshot["title"],
+                "author_name": snapshot["author_name"],
+                "exercises_in_routine": snapshot["exercises_in_routine"],
+            }
+        )
+
+    def render_schedule(self, user):
+        """
+        유저의 주간 루틴 정보를 day_index를 인덱스로 하는 7칸 리스트로 반환
+        """
+        schedule = [None] * weekly_schedule_cache.days
+        weekly_routines = WeeklyRoutine.objects.filter(user=user).values_list(
+            "day_index", "users_routine_id", "users_routine__mirrored_routine_id"
+        )
+        for day_index, users_routine_id, mirrored_routine_id in weekly_routines:
+            schedule[day_index] = {
+                "users_routine": users_routine_id,
+                "mirrored_routine": mirrored_routine_id,
+            }
+        return schedule
+
+
 class RoutineStreakViewSet(viewsets.ModelViewSet):
     """
     루틴 수행 여부를 나타내는 ViewSet
@@ -619,6 +999,9 @@ class RoutineStreakViewSet(viewsets.ModelViewSet):
     - list: GET /my_health_info/routine_streak/
     - create: POST /my_health_info/routine_streak/
     - retrieve: GET /my_health_info/routine_streak/<pk>/
+    - last: GET /my_health_info/routine_streak/last/
+    - summary: GET /my_health_info/routine_streak/summary/
+    - export: GET /my_health_info/routine_streak/export/
     """
 
     http_method_names = ["get", "post"]
@@ -642,23 +1025,35 @@ class RoutineStreakViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
+    @transaction.atomic
     def perform_create(self, serializer):
         """
         루틴 수행 여부를 생성
 
         1. serializer에서 validated_data를 가져옴
         2. validated_data에서 user를 현재 유저로 설정
-        3. RoutineStreak을 생성
+        3. 오늘 요일에 등록된 루틴이 없다면 400 에러 반환
+        4. 오늘 요일의 mirrored_routine으로 RoutineStreak을 생성
+        5. RoutineStreakSummaryService로 유저의 루틴 수행 기록 요약을 갱신
         """
         validated_data = serializer.validated_data
         validated_data["user"] = self.request.user
 
-        if RoutineStreak.objects.filter(
-            user=self.request.user, date=datetime.datetime.now().date()
-        ).exists():
+        today = datetime.datetime.now().date()
+        if RoutineStreak.objects.filter(user=self.request.user, date=today).exists():
             raise ValidationError("Routine streak already exists for today")
 
-        serializer.save()
+        weekly_mirrored_routines = serializer.get_weekly_mirrored_routines(
+            self.request.user.id
+        )
+        if today.weekday() not in weekly_mirrored_routines:
+            raise ValidationError("해당 요일의 루틴이 존재하지 않습니다.")
+
+        routine_streak = serializer.save(
+            mirrored_routine_id=weekly_mirrored_routines[today.weekday()]
+        )
+
+        RoutineStreakSummaryService(self.request.user).record(routine_streak.date)
 
     @action(
         detail=False,
@@ -679,3 +1074,177 @@ class RoutineStreakViewSet(viewsets.ModelViewSet):
             serializer = self.get_serializer(queryset.first())
             return Response(serializer.data)
         raise NotFound("No routine streak found")
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="summary",
+        url_name="summary",
+        permission_classes=[IsAuthenticated],
+    )
+    def summary(self, request):
+        """
+        루틴 수행 기록 요약 조회
+
+        1. 유저의 RoutineStreakSummary를 조회, 없다면 전체 수행 기록에서 계산하여 생성
+        2. RoutineStreakSummarySerializer를 사용하여 데이터 반환
+        """
+        summary = RoutineStreakSummary.objects.filter(user=request.user).first()
+        if summary is None:
+            summary = RoutineStreakSummaryService(request.user).rebuild()
+
+        serializer = RoutineStreakSummarySerializer(summary)
+        return Response(serializer.data)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="export",
+        url_name="export",
+        permission_classes=[IsAuthenticated],
+    )
+    def export(self, request):
+        """
+        루틴 수행 기록을 CSV 또는 NDJSON으로 스트리밍하여 내보내기
+        """
+        return stream_history_export(request, RoutineStreakExporter)
+
+
+class DashboardView(APIView):
+    """
+    앱 시작 시 필요한 정보를 한 번에 반환하는 View
+
+    url_prefix: /my_health_info/dashboard/
+
+    functions:
+    - get: GET /my_health_info/dashboard/
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    # 캐시가 모두 비어 있을 때의 최대 쿼리 수 (인증 제외)
+    # 건강 정보 캐시 버전, 건강 정보, 주간 루틴, 루틴 수행 여부, 유저의 루틴, 운동 트리, 운동 부위, 운동 정보 카탈로그 버전
+    query_budget = 8
+
+    def get(self, request):
+        """
+        가장 최근의 건강 정보, 가장 최근의 루틴 수행 여부, 주간 루틴, 유저의 루틴 목록을 한 번에 조회
+
+        query parameter: include(health_info, routine_streak, weekly_routine, users_routine를 쉼표로 구분)
+
+        1. DashboardQuerySerializer로 포함할 섹션 검증 (없다면 전체 섹션)
+        2. health_info: health_info_cache에서 가장 최근의 건강 정보를 읽음 (없다면 None)
+        3. weekly_routine, routine_streak: 주간 루틴을 한 번만 조회하여
+           주간 루틴 응답과 루틴 수행 여부의 요일별 mirrored_routine 계산에 함께 사용
+        4. routine_streak: 가장 최근의 루틴 수행 여부 (없다면 None)
+        5. users_routine: 캐시에 없는 MirroredRoutine 스냅샷을 한 번에 렌더링한 뒤 직렬화
+
+        캐시가 모두 비어 있어도 루틴 개수와 관계없이 쿼리는 최대 query_budget개로 유지된다.
+        """
+        query_serializer = DashboardQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        include = query_serializer.validated_data["include"]
+
+        user = request.user
+        data = {}
+
+        if "health_info" in include:
+            data["health_info"] = health_info_cache.get_last(
+                user.id, lambda: self.render_health_info(user)
+            )
+
+        if "weekly_routine" in include or "routine_streak" in include:
+            weekly_routines = list(
+                WeeklyRoutine.objects.filter(user=user)
+                .select_related("users_routine")
+                .order_by("day_index")
+            )
+
+        if "weekly_routine" in include:
+            data["weekly_routine"] = WeeklyRoutineSerializer(
+                weekly_routines, many=True
+            ).data
+
+        if "routine_streak" in include:
+            data["routine_streak"] = self.render_routine_streak(user, weekly_routines)
+
+        if "users_routine" in include:
+            users_routines = list(
+                UsersRoutine.objects.filter(user=user).select_related(
+                    "routine", "mirrored_routine"
+                )
+            )
+            warm_mirrored_routine_snapshots(
+                users_routine.mirrored_routine for users_routine in users_routines
+            )
+            data["users_routine"] = UsersRoutineSerializer(
+                users_routines, many=True
+            ).data
+
+        return Response(data)
+
+    def render_health_info(self, user):
+        health_info = HealthInfo.objects.filter(user=user).order_by("-date").first()
+        if health_info is None:
+            return None
+        return dict(HealthInfoSerializer(health_info).data)
+
+    def render_routine_streak(self, user, weekly_routines):
+        """
+        가장 최근의 루틴 수행 여부를 직렬화하여 반환
+
+        이미 조회한 주간 루틴으로 요일별 mirrored_routine을 context에 채워,
+        RoutineStreakSerializer가 주간 루틴을 다시 조회하지 않도록 한다.
+        """
+        routine_streak = (
+            RoutineStreak.objects.filter(user=user).order_by("-date").first()
+        )
+        if routine_streak is None:
+            return None
+
+        context = {
+            RoutineStreakSerializer.weekly_mirrored_routines_context_key: {
+                user.id: {
+                    weekly_routine.day_index: weekly_routine.users_routine.mirrored_routine_id
+                    for weekly_routine in weekly_routines
+                }
+            }
+        }
+        return RoutineStreakSerializer(routine_streak, context=context).data
+
+
+class SyncView(APIView):
+    """
+    오프라인 클라이언트를 위한 변경분 동기화 View
+
+    url_prefix: /my_health_info/sync/
+
+    functions:
+    - get: GET /my_health_info/sync/
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """
+        이전 동기화 이후 생성, 수정, 삭제된 건강 정보, 루틴, 주간 루틴, 루틴 수행 여부 조회
+
+        query parameter: token(이전 동기화 응답의 토큰, 없다면 전체 동기화)
+
+        1. SyncQuerySerializer로 query parameter 검증
+        2. DeltaSync로 토큰 이후의 변경분과 새 토큰을 계산
+        3. 토큰이 올바르지 않다면 400 에러 반환
+        """
+        query_serializer = SyncQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        delta_sync = DeltaSync(
+            user=request.user, token=query_serializer.validated_data.get("token")
+        )
+
+        try:
+            data = delta_sync.sync()
+        except ValueError as e:
+            raise ValidationError({"token": str(e)})
+
+        return Response(data)
@@ -2,6 +2,12 @@ from enum import Enum
 
 
 class FocusAreaEnum(Enum):
+    """
+    운동 부위
+
+    정의 순서가 비트 마스크의 비트 위치이므로, 새 부위는 항상 마지막에 추가해야 한다.
+    """
+
     AEROBIC = "유산소"
     CHEST = "가슴"
     BACK = "등"
@@ -13,3 +19,32 @@ class FocusAreaEnum(Enum):
     @classmethod
     def choices(cls):
         return [(member.name, member.value) for member in cls]
+
+    @property
+    def bit(self):
+        return 1 << list(type(self)).index(self)
+
+    @classmethod
+    def to_mask(cls, values):
+        """
+        운동 부위 이름(value) 목록을 비트 마스크로 변환, 없는 이름이 있다면 ValueError 발생
+        """
+        mask = 0
+        for value in values:
+            mask |= cls(value).bit
+        return mask
+
+    @classmethod
+    def matching_masks(cls, mask, match="any"):
+        """
+        주어진 마스크와 일치하는 모든 마스크 값을 반환
+
+        - any: 마스크의 부위 중 하나라도 포함하는 값
+        - all: 마스크의 부위를 모두 포함하는 값
+
+        부위가 7개뿐이므로 가능한 마스크 값은 128개이며,
+        비트 연산 조건을 인덱스를 사용할 수 있는 IN 조건으로 바꾸기 위해 사용한다.
+        """
+        if match == "all":
+            return [value for value in range(1 << len(cls)) if value & mask == mask]
+        return [value for value in range(1 << len(cls)) if value & mask]